@@ -13,7 +13,15 @@ from ansible.errors import AnsibleActionFail
 from ansible.plugins.action import ActionBase, display
 
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import PythonToAnsibleContextFilter, PythonToAnsibleHandler, YamlLoader, cprofile, get_templar
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import (
+    PythonToAnsibleContextFilter,
+    PythonToAnsibleHandler,
+    YamlLoader,
+    cprofile,
+    get_templar,
+    read_structured_config_pickle,
+    write_file,
+)
 
 try:
     from pyavd import get_device_config, get_device_doc
@@ -37,6 +45,7 @@ ARGUMENT_SPEC = {
     "config_filename": {"type": "str"},
     "documentation_filename": {"type": "str"},
     "read_structured_config_from_file": {"type": "bool", "default": True},
+    "read_structured_config_pickle": {"type": "bool", "default": False},
     "validation_mode": {"type": "str", "default": "error"},
     "generate_device_config": {"type": "bool", "default": True},
     "generate_device_doc": {"type": "bool", "default": True},
@@ -80,6 +89,7 @@ class ActionModule(ActionBase):
                 task_vars,
                 validated_args.get("structured_config_filename"),
                 read_structured_config_from_file=validated_args["read_structured_config_from_file"],
+                read_pickle=validated_args["read_structured_config_pickle"],
             )
             LOGGER.debug("Preparing task vars [done].")
 
@@ -116,7 +126,7 @@ class ActionModule(ActionBase):
                         device_config += rendered_custom_templates
                     LOGGER.debug("Rendering config custom templates [done].")
 
-                result["changed"] = self.write_file(device_config, validated_args["config_filename"])
+                result["changed"] = write_file(device_config, validated_args["config_filename"])
                 LOGGER.debug("Rendering configuration [done].")
 
             if validated_args["generate_device_doc"]:
@@ -131,7 +141,7 @@ class ActionModule(ActionBase):
                 if validated_args["device_doc_toc"]:
                     device_doc = add_md_toc(device_doc, skip_lines=3)
 
-                file_changed = self.write_file(device_doc, validated_args["documentation_filename"])
+                file_changed = write_file(device_doc, validated_args["documentation_filename"])
                 result["changed"] = result.get("changed") or file_changed
                 LOGGER.debug("Rendering documentation [done].")
 
@@ -157,7 +167,7 @@ class ActionModule(ActionBase):
         # Converting to json and back to remove any AnsibeUnsafe types
         return json.loads(json.dumps(validated_args))
 
-    def prepare_task_vars(self, task_vars: dict, structured_config_filename: str, *, read_structured_config_from_file: bool) -> dict:
+    def prepare_task_vars(self, task_vars: dict, structured_config_filename: str, *, read_structured_config_from_file: bool, read_pickle: bool = False) -> dict:
         """Read the structured_config and render inline Jinja.
 
         Parameters
@@ -165,6 +175,8 @@ class ActionModule(ActionBase):
             task_vars: Dictionary of task variables
             structured_config_filename: The filename where the structured_config for the device is stored.
             read_structured_config_from_file: Flag to indicate whether or not the structured_config_filname should be read.
+            read_pickle: Flag to indicate whether or not the structured_config should be read from the pickle file
+                next to structured_config_filename if it is up to date.
 
         Returns:
         -------
@@ -176,7 +188,12 @@ class ActionModule(ActionBase):
 
         """
         if read_structured_config_from_file:
-            task_vars.update(read_vars(structured_config_filename))
+            structured_config = read_structured_config_pickle(structured_config_filename) if read_pickle else None
+            if structured_config is None:
+                if read_pickle:
+                    LOGGER.debug("Pickle file for %s is missing or stale, reading the structured config file...", structured_config_filename)
+                structured_config = read_vars(structured_config_filename)
+            task_vars.update(structured_config)
 
         # Read ansible variables and perform templating to support inline jinja2
         for var, value in task_vars.items():
@@ -216,33 +233,6 @@ class ActionModule(ActionBase):
 
         return template(templatefile, task_vars, self.ansible_templar)
 
-    def write_file(self, content: str, filename: str) -> bool:
-        """
-        This function writes the file only if the content has changed.
-
-        Parameters
-        ----------
-            content: The content to write
-            filename: Target filename
-
-        Returns:
-        -------
-            bool: Indicate if the content of filename has changed.
-        """
-        path = Path(filename)
-        if path.exists():
-            if path.read_text(encoding="UTF-8") == content:
-                return False
-
-        else:
-            # Create parent dirs automatically.
-            path.parent.mkdir(mode=0o775, parents=True, exist_ok=True)
-            # Touch file
-            path.touch(mode=0o664)
-
-        path.write_text(content, encoding="UTF-8")
-        return True
-
 
 def setup_module_logging(hostname: str, result: dict) -> None:
     """
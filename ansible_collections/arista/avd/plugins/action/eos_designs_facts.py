@@ -18,11 +18,12 @@ PLUGIN_NAME = "arista.avd.eos_designs_facts"
 
 try:
     from pyavd._eos_designs.eos_designs_facts import EosDesignsFacts
+    from pyavd._eos_designs.fabric_index import FabricIndex
     from pyavd._eos_designs.schema import EosDesigns
     from pyavd._eos_designs.shared_utils import SharedUtils
     from pyavd._errors import AristaAvdError
 except ImportError as e:
-    EosDesignsFacts = EosDesigns = SharedUtils = RaiseOnUse(
+    EosDesignsFacts = EosDesigns = FabricIndex = SharedUtils = RaiseOnUse(
         AnsibleActionFail(
             f"The '{PLUGIN_NAME}' plugin requires the 'pyavd' Python library. Got import error",
             orig_exc=e,
@@ -140,6 +141,9 @@ class ActionModule(ActionBase):
         )
 
         avd_switch_facts = {}
+        fabric_index = FabricIndex(avd_switch_facts)
+        # Models loaded from identical inputs are shared between the devices of this run only.
+        shared_models = {}
         data_validation_errors = 0
         for host in fabric_hosts:
             # Fetch all templated Ansible vars for this host
@@ -159,9 +163,11 @@ class ActionModule(ActionBase):
             # Add reference to dict "avd_switch_facts".
             # This is used to access EosDesignsFacts objects of other switches during rendering of one switch.
             host_hostvars["avd_switch_facts"] = avd_switch_facts
+            # Add reference to the shared "avd_fabric_index" used for lookups across the facts of all switches.
+            host_hostvars["avd_fabric_index"] = fabric_index
 
             # Load input vars into the EosDesigns data class.
-            inputs = EosDesigns._from_dict(host_hostvars, load_custom_structured_config=False)
+            inputs = EosDesigns._from_dict(host_hostvars, load_custom_structured_config=False, shared_models=shared_models)
 
             # Initialize SharedUtils class to be passed to EosDesignsFacts below.
             shared_utils = SharedUtils(hostvars=host_hostvars, inputs=inputs, templar=self.templar, schema=avdschematools.avdschema)
@@ -15,21 +15,45 @@ from ansible.plugins.action import ActionBase, display
 
 from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import RaiseOnUse
 from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
-from ansible_collections.arista.avd.plugins.plugin_utils.utils import get_templar, write_file
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import (
+    IGNORED_VARS,
+    IGNORED_VARS_PREFIXES,
+    get_templar,
+    write_file,
+    write_structured_config_pickle,
+)
 
 PLUGIN_NAME = "arista.avd.eos_designs_structured_config"
 try:
+    from pyavd._build_cache import DeviceBuildCache, FabricIndexRecorder, PeerFactsRecorder
+    from pyavd._eos_designs.fabric_index import FabricIndex
     from pyavd._eos_designs.structured_config import get_structured_config
-    from pyavd._utils import get, merge, strip_null_from_data
+    from pyavd._utils import get, get_template_file_content, merge, strip_null_from_data
     from pyavd._utils import template as templater
 except ImportError as e:
-    get_structured_config = get = merge = RaiseOnUse(
+    get_structured_config = get = get_template_file_content = merge = DeviceBuildCache = FabricIndex = FabricIndexRecorder = PeerFactsRecorder = RaiseOnUse(
         AnsibleActionFail(
             f"The '{PLUGIN_NAME}' plugin requires the 'pyavd' Python library. Got import error",
             orig_exc=e,
         ),
     )
 
+CACHE_IGNORED_ARGS = frozenset(("cache_dir", "cprofile_file", "debug_vars", "debug_vars_file", "mode", "structured_config_pickle"))
+"""Task arguments not affecting the structured config, which are left out of the cache fingerprint."""
+
+
+def get_cache_inputs(task_vars: dict, task_args: dict, custom_template_contents: list[str]) -> dict:
+    """
+    Return the task variables, arguments and custom templates affecting the structured config of the device. Used for the cache fingerprint.
+
+    The content of the custom templates is included, since the template names in the arguments do not change when a template file is edited.
+    """
+    return {
+        "vars": {var: value for var, value in task_vars.items() if var not in IGNORED_VARS and not str(var).startswith(IGNORED_VARS_PREFIXES)},
+        "args": {arg: value for arg, value in task_args.items() if arg not in CACHE_IGNORED_ARGS},
+        "custom_templates": custom_template_contents,
+    }
+
 
 class ActionModule(ActionBase):
     def run(self, tmp: Any = None, task_vars: dict | None = None) -> dict:
@@ -39,8 +63,8 @@ class ActionModule(ActionBase):
         result = super().run(tmp, task_vars)
         del tmp  # tmp no longer has any effect
 
-        cprofile_file = self._task.args.get("cprofile_file")
-        if cprofile_file:
+        profiler = None
+        if self._task.args.get("cprofile_file"):
             profiler = cProfile.Profile()
             profiler.enable()
 
@@ -59,12 +83,35 @@ class ActionModule(ActionBase):
         file_mode = str(self._task.args.get("mode", "0o664"))
         template_output = self._task.args.get("template_output", False)
         validation_mode = self._task.args.get("validation_mode")
+        cache_dir = self._task.args.get("cache_dir")
 
         task_vars["switch"] = get(task_vars, f"avd_switch_facts..{hostname}..switch", separator="..", default={})
 
+        # The cache is only used when the facts of the device are available, since they are part of the fingerprint.
+        avd_facts = {key: task_vars.get(key) or {} for key in ("avd_switch_facts", "avd_topology_peers", "avd_overlay_peers")}
+        cache = DeviceBuildCache(cache_dir) if cache_dir and hostname in avd_facts["avd_switch_facts"] else None
+        if cache is not None:
+            # Calculating the fingerprint before the variables are templated in-place below.
+            # The custom templates are found in the search path of the task like when they are rendered below.
+            templar = get_templar(self, task_vars)
+            custom_template_contents = [get_template_file_content(template_item["template"], templar) for template_item in eos_designs_custom_templates]
+            host_fingerprint = cache.get_host_fingerprint(hostname, get_cache_inputs(task_vars, self._task.args, custom_template_contents), avd_facts)
+            if (cached_data := cache.load(hostname, host_fingerprint, avd_facts)) is not None:
+                output, content = cached_data
+                return self._return_output(result, output, content, filename, file_mode, task_vars, profiler)
+
+        if "avd_switch_facts" in task_vars:
+            # Index of lookups across the facts of all devices, built once for the structured config of this device.
+            task_vars["avd_fabric_index"] = FabricIndex(avd_facts["avd_switch_facts"])
+
+        if cache is not None:
+            # Recording the facts of peer devices read while generating the structured config. Those are stored with the cache entry.
+            task_vars["avd_switch_facts"] = peer_facts_recorder = PeerFactsRecorder(avd_facts["avd_switch_facts"])
+            task_vars["avd_fabric_index"] = FabricIndexRecorder(task_vars["avd_fabric_index"], peer_facts_recorder)
+
         # Read ansible variables and perform templating to support inline jinja2
         for var in task_vars:
-            if str(var).startswith(("ansible", "molecule", "hostvars", "vars", "avd_switch_facts")):
+            if str(var).startswith(("ansible", "molecule", "hostvars", "vars", "avd_switch_facts", "avd_fabric_index")):
                 continue
             if self._templar.is_template(task_vars[var]):
                 # Var contains a jinja2 template.
@@ -153,21 +200,31 @@ class ActionModule(ActionBase):
             with self._templar.set_temporary_context(available_variables=template_vars):
                 output = self._templar.template(output, fail_on_undefined=False)
 
-        # If the argument 'dest' (filename) is set, write the output data to a file.
+        content = None
         if filename:
             # Depending on the file suffix of 'filename' (default: 'json') we will format the data to yaml or just write the output data directly.
             if filename.endswith((".yml", ".yaml")):
-                result["changed"] = write_file(
-                    content=yaml.dump(output, Dumper=AnsibleDumper, indent=2, sort_keys=False, width=130),
-                    filename=filename,
-                    file_mode=file_mode,
-                )
+                content = yaml.dump(output, Dumper=AnsibleDumper, indent=2, sort_keys=False, width=130)
             else:
-                result["changed"] = write_file(
-                    content=json.dumps(output),
-                    filename=filename,
-                    file_mode=file_mode,
-                )
+                content = json.dumps(output)
+
+        if cache is not None and not result.get("msg"):
+            # Only caching the output if there were no validation messages, since those would not be shown on later runs.
+            cache.store(hostname, host_fingerprint, avd_facts, peer_facts_recorder.accessed, (output, content))
+
+        return self._return_output(result, output, content, filename, file_mode, task_vars, profiler)
+
+    def _return_output(
+        self, result: dict, output: dict, content: str | None, filename: str, file_mode: str, task_vars: dict, profiler: cProfile.Profile | None
+    ) -> dict:
+        """Write the formatted output to 'dest' if set and return the result with output as 'ansible_facts'."""
+        # If the argument 'dest' (filename) is set, write the output data to a file.
+        if filename:
+            result["changed"] = write_file(content=content, filename=filename, file_mode=file_mode)
+            # Optionally write the output data to a pickle file next to 'dest', which is faster to load for eos_cli_config_gen.
+            if self._task.args.get("structured_config_pickle") is True:
+                pickle_changed = write_structured_config_pickle(output, content, filename, file_mode)
+                result["changed"] = result["changed"] or pickle_changed
 
         # If 'dest' (filename) is not set, hardcode 'changed' to true, since we don't know if something changed and later tasks may depend on this.
         else:
@@ -176,9 +233,9 @@ class ActionModule(ActionBase):
         result["ansible_facts"] = output
         result["ansible_facts"]["switch"] = task_vars.get("switch")
 
-        if cprofile_file:
+        if profiler:
             profiler.disable()
             stats = pstats.Stats(profiler).sort_stats("cumtime")
-            stats.dump_stats(cprofile_file)
+            stats.dump_stats(self._task.args["cprofile_file"])
 
         return result
@@ -0,0 +1,189 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+from pathlib import Path
+from typing import Any
+
+import yaml
+from ansible.errors import AnsibleActionFail
+from ansible.parsing.yaml.dumper import AnsibleDumper
+from ansible.plugins.action import ActionBase, display
+
+from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import RaiseOnUse
+from ansible_collections.arista.avd.plugins.plugin_utils.schema.avdschematools import AvdSchemaTools
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import IGNORED_VARS, IGNORED_VARS_PREFIXES, ArtifactWriter
+
+PLUGIN_NAME = "arista.avd.fabric_build"
+
+try:
+    from pyavd import build_fabric
+except ImportError as e:
+    build_fabric = RaiseOnUse(
+        AnsibleActionFail(
+            f"The '{PLUGIN_NAME}' plugin requires the 'pyavd' Python library. Got import error",
+            orig_exc=e,
+        ),
+    )
+
+ARGUMENT_SPEC = {
+    "structured_config_dir": {"type": "str"},
+    "structured_config_suffix": {"type": "str", "default": "yml", "choices": ["yml", "yaml", "json"]},
+    "config_dir": {"type": "str"},
+    "documentation_dir": {"type": "str"},
+    "workers": {"type": "int"},
+    "cache_dir": {"type": "str"},
+    "validation_mode": {"type": "str", "default": "error", "choices": ["error", "warning"]},
+    "mode": {"type": "str", "default": "0o664"},
+    "manifest_file": {"type": "str"},
+    "cprofile_file": {"type": "str"},
+}
+
+
+class ActionModule(ActionBase):
+    def run(self, tmp: Any = None, task_vars: dict | None = None) -> dict:
+        if task_vars is None:
+            task_vars = {}
+
+        result = super().run(tmp, task_vars)
+        del tmp  # tmp no longer has any effect
+
+        _, validated_args = self.validate_argument_spec(ARGUMENT_SPEC)
+        # Converting to json and back to remove any AnsibeUnsafe types
+        validated_args = json.loads(json.dumps(validated_args))
+
+        profiler = None
+        if validated_args.get("cprofile_file"):
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        fabric_hosts = self.get_fabric_hosts(task_vars)
+        all_inputs = self.get_all_inputs(fabric_hosts, task_vars["hostvars"], validated_args["validation_mode"], result)
+        if result.get("failed"):
+            # Stop here if any of the devices failed input data validation
+            return result
+
+        documentation_dir = validated_args.get("documentation_dir")
+        try:
+            fabric_build = build_fabric(
+                all_inputs, workers=validated_args.get("workers"), cache_dir=validated_args.get("cache_dir"), documentation=bool(documentation_dir)
+            )
+        except Exception as error:
+            raise AnsibleActionFail(message=str(error)) from error
+
+        structured_config_dir = validated_args.get("structured_config_dir")
+        structured_config_suffix = validated_args["structured_config_suffix"]
+        config_dir = validated_args.get("config_dir")
+        artifacts = []
+        structured_config_errors = 0
+        for hostname, device_build in fabric_build.devices.items():
+            for deprecation_warning in device_build.validation_result.deprecation_warnings:
+                display.warning(f"[{hostname}]: {deprecation_warning}")
+            for validation_error in device_build.validation_result.validation_errors:
+                display.error(f"[{hostname}]: {validation_error}", wrap_text=False)
+                structured_config_errors += 1
+
+            if structured_config_dir:
+                if structured_config_suffix == "json":
+                    content = json.dumps(device_build.structured_config)
+                else:
+                    content = yaml.dump(device_build.structured_config, Dumper=AnsibleDumper, indent=2, sort_keys=False, width=130)
+                artifacts.append((content, Path(structured_config_dir, f"{hostname}.{structured_config_suffix}")))
+
+            if config_dir and device_build.config is not None:
+                artifacts.append((device_build.config, Path(config_dir, f"{hostname}.cfg")))
+
+            if documentation_dir and device_build.documentation is not None:
+                artifacts.append((device_build.documentation, Path(documentation_dir, f"{hostname}.md")))
+
+        with ArtifactWriter(validated_args.get("manifest_file"), file_mode=validated_args["mode"]) as artifact_writer:
+            changed = bool(artifact_writer.write_many(artifacts, workers=validated_args.get("workers")))
+
+        result["changed"] = changed
+        result["cached_hosts"] = fabric_build.cached_hostnames
+        if structured_config_errors:
+            result["failed"] = True
+            result["msg"] = f"{structured_config_errors} errors found during schema validation of the generated structured configurations."
+
+        if profiler:
+            profiler.disable()
+            stats = pstats.Stats(profiler).sort_stats("cumtime")
+            stats.dump_stats(validated_args["cprofile_file"])
+
+        return result
+
+    def get_fabric_hosts(self, task_vars: dict) -> list[str]:
+        """Return the hosts of the Ansible group set in "fabric_name". All hosts in the play must be part of that group."""
+        groups = task_vars.get("groups", {})
+        fabric_name = self._templar.template(task_vars.get("fabric_name", ""))
+        fabric_hosts = groups.get(fabric_name, [])
+        ansible_play_hosts_all = task_vars.get("ansible_play_hosts_all", [])
+
+        if fabric_name is None or not set(ansible_play_hosts_all).issubset(fabric_hosts):
+            msg = (
+                "Invalid/missing 'fabric_name' variable. "
+                "All hosts in the play must have the same 'fabric_name' value "
+                "which must point to an Ansible Group containing the hosts."
+                f"play_hosts: {ansible_play_hosts_all}"
+            )
+            raise AnsibleActionFail(msg)
+
+        return fabric_hosts
+
+    def get_all_inputs(self, fabric_hosts: list[str], hostvars: object, validation_mode: str, result: dict) -> dict[str, dict]:
+        """
+        Fetch hostvars for all hosts and perform data conversion & validation according to the eos_designs schema.
+
+        Parameters
+        ----------
+        fabric_hosts : list
+            List of hostnames
+        hostvars : object
+            Ansible "hostvars" object
+        validation_mode : str
+            Run validation in either "error" or "warning" mode.
+        result : dict
+            Ansible Action result dict which is inplace updated.
+            failure : bool
+            msg : str
+
+        Returns:
+        -------
+        dict
+            hostname1 : dict with converted and validated inputs
+            hostname2 : dict with converted and validated inputs
+            ...
+        """
+        # Load schema tools once with empty host.
+        avdschematools = AvdSchemaTools(
+            hostname="",
+            ansible_display=display,
+            schema_id="eos_designs",
+            validation_mode=validation_mode,
+            plugin_name="arista.avd.eos_designs",
+        )
+
+        all_inputs = {}
+        data_validation_errors = 0
+        for host in fabric_hosts:
+            # Fetch all templated Ansible vars for this host
+            inputs = {var: value for var, value in hostvars.get(host).items() if var not in IGNORED_VARS and not str(var).startswith(IGNORED_VARS_PREFIXES)}
+
+            # Set correct hostname in schema tools and perform conversion and validation
+            avdschematools.hostname = host
+            host_result = avdschematools.convert_and_validate_data(inputs, return_counters=True)
+            data_validation_errors += host_result["validation_errors"]
+            if host_result.get("failed"):
+                result["failed"] = True
+                continue
+
+            all_inputs[host] = inputs
+
+        # Build result message
+        result["msg"] = avdschematools.build_result_message(validation_errors=data_validation_errors)
+
+        return all_inputs
@@ -28,6 +28,15 @@ options:
     description: Flag to indicate if the structured config should be read from a file or not.
     type: bool
     default: true
+  read_structured_config_pickle:
+    description:
+      - Flag to indicate if the structured config should be read from the pickle file written next to the structured config file
+        by `arista.avd.eos_designs_structured_config` with `structured_config_pickle: true`.
+      - The pickle file is only used if it was written by the running PyAVD version from the current content of the structured config file.
+        Otherwise the structured config file is read.
+    required: false
+    default: false
+    type: bool
   generate_device_config:
     description: Flag to generate the device configuration.
     type: bool
@@ -56,6 +56,16 @@ options:
     description: File mode (ex. "0o664") for dest file. See 'ansible.builtin.copy' module for details.
     required: false
     type: str
+  structured_config_pickle:
+    description:
+      - If true, the output facts will also be written to a pickle file next to 'dest' with the suffix '.pickle'.
+      - The pickle file is stamped with the PyAVD version and the digest of the 'dest' file content.
+        When reading the structured configuration, `arista.avd.eos_cli_config_gen` loads the pickle file instead of parsing 'dest'
+        if the stamp matches, which is a lot faster for large structured configurations.
+      - Only applies if 'dest' is set.
+    required: false
+    default: false
+    type: bool
   template_output:
     description:
       - If true, the output data will be run through another jinja2 rendering before returning.
@@ -79,6 +89,19 @@ options:
       - Running cprofile will slow down performance in it self, so only set this while troubleshooting.
     required: false
     type: str
+  cache_dir:
+    description:
+      - Path to a directory used to cache the structured configuration per device between runs. Created if missing.
+      - The cache entry is keyed on a fingerprint of the PyAVD version, the task arguments, the variables and facts of the device,
+        the content of the 'eos_designs_custom_templates' files and the facts of the peer devices read while generating the structured configuration.
+      - When nothing changed, the cached structured configuration is written to 'dest' and returned without generating it again.
+      - Changes to files included by custom templates or read by inline jinja2 or lookups are not detected,
+        so the cache directory must be cleared after such changes.
+      - The source file of each custom 'python_module' set in the inputs is part of the fingerprint. Changes to other modules imported by those are not detected.
+      - Structured configuration generated with validation errors or warnings is not cached.
+        Deprecation warnings for the input variables are only shown when the structured configuration is generated.
+    required: false
+    type: str
 """
 
 EXAMPLES = r"""
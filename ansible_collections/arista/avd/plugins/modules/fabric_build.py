@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+
+DOCUMENTATION = r"""
+---
+module: fabric_build
+version_added: "5.2.0"
+author: Arista Ansible Team (@aristanetworks)
+short_description: Build facts, structured configurations, configurations and documentation for all fabric devices
+description:
+  - |-
+    The `arista.avd.fabric_build` module is an Ansible Action Plugin building all devices of the fabric in one Python process
+    using `pyavd.build_fabric`:
+
+    - Validate the inputs of all devices according to the `eos_designs` schema.
+    - Generate the facts for all devices.
+    - Generate and validate the structured configuration for each device.
+    - Generate the EOS CLI configuration and optionally the device documentation for each device.
+
+    The devices are built in a pool of worker processes and only the final artifacts are written to the given directories.
+    Files are only written if the content has changed. Files are written atomically using a pool of worker threads.
+  - The plugin is designed to `run_once`. The hosts are taken from the Ansible group set in `fabric_name`.
+  - Compared to running `arista.avd.eos_designs` and `arista.avd.eos_cli_config_gen`, the following is not supported
+    since the inputs are handled by PyAVD without Ansible templating;
+    inline Jinja referencing facts or other devices, `eos_designs_custom_templates` and `custom_templates`.
+options:
+  structured_config_dir:
+    description:
+      - Directory for writing the structured configuration of each device as `<hostname>.<structured_config_suffix>`.
+      - The structured configuration is not written if not set.
+    required: false
+    type: str
+  structured_config_suffix:
+    description: File suffix for the structured configuration files.
+    required: false
+    default: "yml"
+    type: str
+    choices: [ "yml", "yaml", "json" ]
+  config_dir:
+    description:
+      - Directory for writing the EOS CLI configuration of each device as `<hostname>.cfg`.
+      - The configuration is not written if not set.
+    required: false
+    type: str
+  documentation_dir:
+    description:
+      - Directory for writing the Markdown documentation of each device as `<hostname>.md`.
+      - The documentation is only generated if set.
+    required: false
+    type: str
+  workers:
+    description:
+      - Number of worker processes used to build the devices.
+      - Defaults to the number of CPUs.
+    required: false
+    type: int
+  cache_dir:
+    description:
+      - Directory for caching the builds of each device.
+      - Devices for which neither the inputs nor the facts of the devices they depend on have changed are loaded from the cache.
+      - The source file of each custom 'python_module' set in the inputs is part of the fingerprint. Changes to other modules imported by those are not detected.
+    required: false
+    type: str
+  validation_mode:
+    description:
+      - Run validation in either "error" or "warning" mode.
+      - Validation will validate the input variables according to the schema.
+      - During validation, messages will be generated with information about the host(s) and key(s) which failed validation.
+      - validation_mode:error will produce error messages and fail the task.
+      - validation_mode:warning will produce warning messages.
+    required: false
+    default: "error"
+    type: str
+    choices: [ "error", "warning" ]
+  mode:
+    description: File mode used for the written files.
+    required: false
+    default: "0o664"
+    type: str
+  manifest_file:
+    description:
+      - Path to a manifest file holding the content digest, size and modification time of each written file.
+      - Files with the same size and modification time as in the manifest are compared to the digest without reading them.
+        Otherwise files are read to compare the content, so it is safe to change or remove the written files.
+      - Should be placed outside of the output directories.
+    required: false
+    type: str
+  cprofile_file:
+    description:
+      - Filename for storing cprofile data used to debug performance issues.
+      - Running cprofile will slow down performance in it self, so only set this while troubleshooting.
+    required: false
+    type: str
+"""
+
+EXAMPLES = r"""
+---
+- name: Build the fabric
+  arista.avd.fabric_build:
+    structured_config_dir: "{{ structured_dir }}"
+    config_dir: "{{ eos_config_dir }}"
+    documentation_dir: "{{ devices_dir }}"
+    cache_dir: "{{ inventory_dir }}/.avd_cache"
+    manifest_file: "{{ inventory_dir }}/.avd_cache/manifest.json"
+  delegate_to: localhost
+  run_once: true
+"""
@@ -10,7 +10,7 @@ from ansible.errors import AnsibleActionFail
 from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import RaiseOnUse
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Iterable
 
     from ansible.utils.display import Display
 
@@ -101,7 +101,7 @@ class AvdSchemaTools:
         """
         Convert & Validate data according to the schema.
 
-        Calls conversion and validation methods and gather resulting messages
+        Converts and validates the data in a single pass and gather resulting messages
 
         Returns dict which can contain either or both of the following keys:
         - failed: <bool>
@@ -111,14 +111,14 @@ class AvdSchemaTools:
         """
         result = {}
 
-        # Perform data conversions
-        validation_errors = self.convert_data(data)
+        # Perform data conversions and validation in a single pass
+        conversion_exceptions, validation_exceptions = self.avdschema.convert_and_validate(data)
+        validation_errors = self.handle_validation_exceptions(conversion_exceptions, "error")
         # All errors raised from conversion are fatal.
         if validation_errors:
             result["failed"] = True
 
-        # Perform validation
-        validation_errors += self.validate_data(data)
+        validation_errors += self.handle_validation_exceptions(validation_exceptions, self.validation_mode)
         if validation_errors and self.validation_mode == "error":
             result["failed"] = True
 
@@ -129,9 +129,9 @@ class AvdSchemaTools:
 
         return result
 
-    def handle_validation_exceptions(self, exceptions: Generator, mode: str | None) -> int:
+    def handle_validation_exceptions(self, exceptions: Iterable, mode: str | None) -> int:
         """
-        Iterate through the Generator of exceptions.
+        Iterate through the Generator or list of exceptions.
 
         This method is actually where the content of the generator gets executed.
 
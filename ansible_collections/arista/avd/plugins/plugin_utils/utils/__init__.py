@@ -3,14 +3,17 @@
 # that can be found in the LICENSE file.
 from ansible_collections.arista.avd.plugins.plugin_utils.pyavd_wrappers import RaiseOnUse
 
+from .artifact_writer import ArtifactWriter
 from .compile_searchpath import compile_searchpath
 from .cprofile_decorator import cprofile
 from .get_templar import get_templar
 from .get_validated_path import get_validated_path
 from .get_validated_value import get_validated_value
+from .ignored_vars import IGNORED_VARS, IGNORED_VARS_PREFIXES
 from .log_message import log_message
 from .python_to_ansible_logging_handler import PythonToAnsibleContextFilter, PythonToAnsibleHandler
-from .write_file import write_file
+from .structured_config_pickle import read_structured_config_pickle, write_structured_config_pickle
+from .write_file import write_bytes_atomic, write_file
 from .yaml_dumper import NoAliasDumper, YamlDumper
 from .yaml_loader import YamlLoader
 
@@ -21,6 +24,9 @@ except ImportError as e:
     default = get = RaiseOnUse(ImportError(f"The 'arista.avd' collection requires the 'pyavd' Python library. Got import error {e}"))
 
 __all__ = [
+    "IGNORED_VARS",
+    "IGNORED_VARS_PREFIXES",
+    "ArtifactWriter",
     "NoAliasDumper",
     "PythonToAnsibleContextFilter",
     "PythonToAnsibleHandler",
@@ -34,5 +40,8 @@ __all__ = [
     "get_validated_path",
     "get_validated_value",
     "log_message",
+    "read_structured_config_pickle",
+    "write_bytes_atomic",
     "write_file",
+    "write_structured_config_pickle",
 ]
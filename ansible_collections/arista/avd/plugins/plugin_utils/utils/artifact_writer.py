@@ -0,0 +1,146 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from .write_file import write_bytes_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+MANIFEST_VERSION = 1
+
+
+class ArtifactWriter:
+    """
+    Write generated artifacts only if the content has changed, using a manifest of content digests.
+
+    The manifest holds the digest of the content along with the size and modification time of each written file.
+    As long as the size and modification time of a file are the same as in the manifest, the file is unchanged
+    since the last write, so the new content is compared to the stored digest without reading the file.
+    Otherwise the file is read and compared like `write_file` does.
+
+    All files are written atomically with `write_bytes_atomic`.
+
+    The manifest is loaded on init and written by `save` or when leaving the context manager.
+    It must only be used by one process at a time, so it is meant for batched writes from a single task, like `run_once` plugins.
+
+    Example:
+    -------
+        with ArtifactWriter(manifest_file) as writer:
+            changed = writer.write_many([(device_config, "intended/configs/leaf1.cfg"), ...])
+    """
+
+    _manifest_file: Path | None
+    _files: dict[str, list]
+    """Digest, size and modification time in nanoseconds of each written file keyed by the absolute path."""
+    _manifest_changed: bool
+    _lock: Lock
+
+    def __init__(self, manifest_file: str | Path | None = None, file_mode: str = "0o664", dir_mode: str = "0o775") -> None:
+        """
+        ArtifactWriter.
+
+        Args:
+            manifest_file: Path to the manifest file. Created if missing. Without a manifest file, unchanged files are always read.
+                The manifest file should not be placed in any of the artifact directories, since it is not an artifact itself.
+            file_mode: File mode for new files.
+            dir_mode: File mode for new directories.
+        """
+        self._manifest_file = Path(manifest_file) if manifest_file else None
+        self._file_mode = file_mode
+        self._dir_mode = dir_mode
+        self._files = {}
+        self._manifest_changed = False
+        self._lock = Lock()
+
+        if self._manifest_file is not None and self._manifest_file.exists():
+            manifest = json.loads(self._manifest_file.read_text(encoding="UTF-8"))
+            # A manifest from another version is ignored and replaced on save.
+            if manifest.get("version") == MANIFEST_VERSION:
+                self._files = manifest["files"]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        self.save()
+
+    def write(self, content: str, filename: str | Path) -> bool:
+        """
+        Write the content to filename only if the content has changed.
+
+        Args:
+            content: The content to write
+            filename: Target filename
+
+        Returns:
+            bool: Indicate if the content of filename has changed.
+        """
+        path = Path(filename)
+        # Not using Path.resolve(), which would query the file system for symlinks.
+        key = os.path.abspath(path)  # noqa: PTH100
+        data = content.encode("UTF-8")
+        digest = sha1(data, usedforsecurity=False).hexdigest()
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        if stat is None:
+            changed = True
+        elif (entry := self._files.get(key)) is not None and entry[1:] == [stat.st_size, stat.st_mtime_ns]:
+            changed = entry[0] != digest
+        else:
+            changed = stat.st_size != len(data) or path.read_bytes() != data
+
+        if changed:
+            write_bytes_atomic(data, path, self._file_mode, self._dir_mode)
+            stat = path.stat()
+
+        new_entry = [digest, stat.st_size, stat.st_mtime_ns]
+        with self._lock:
+            if self._files.get(key) != new_entry:
+                self._files[key] = new_entry
+                self._manifest_changed = True
+
+        return changed
+
+    def write_many(self, artifacts: Iterable[tuple[str, str | Path]], workers: int | None = None) -> list[str]:
+        """
+        Write many artifacts using a pool of worker threads.
+
+        Writing is mostly waiting for the file system, so threads speed up the writes of many files, especially on network storage.
+
+        Args:
+            artifacts: Iterable of tuples with the content and filename of each artifact.
+            workers: Number of worker threads. Defaults to the default of ThreadPoolExecutor.
+
+        Returns:
+            list[str]: Filenames of the artifacts which changed, in the order of the given artifacts.
+        """
+        artifacts = list(artifacts)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            changed = list(executor.map(lambda artifact: self.write(*artifact), artifacts))
+        return [str(filename) for (_, filename), file_changed in zip(artifacts, changed, strict=True) if file_changed]
+
+    def save(self) -> None:
+        """Write the manifest file if any entry has changed."""
+        if self._manifest_file is None or not self._manifest_changed:
+            return
+
+        content = json.dumps({"version": MANIFEST_VERSION, "files": self._files}, sort_keys=True)
+        write_bytes_atomic(content.encode("UTF-8"), self._manifest_file, self._file_mode, self._dir_mode)
+        self._manifest_changed = False
@@ -0,0 +1,15 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+
+IGNORED_VARS = frozenset(("hostvars", "vars", "groups", "omit", "play_hosts", "role_uuid", "avd_switch_facts", "avd_topology_peers", "avd_overlay_peers"))
+"""
+Variables of a host which are not inputs to PyAVD.
+
+These are Ansible magic variables changing between runs or holding the variables of all hosts and facts set by earlier AVD tasks.
+Leaving them out keeps the inputs small and keeps the fingerprints of the build cache stable. The AVD facts are covered by the
+fingerprint of DeviceBuildCache.
+"""
+
+IGNORED_VARS_PREFIXES = ("ansible_", "molecule_")
+"""Prefixes of Ansible and Molecule variables of a host which are not inputs to PyAVD. See IGNORED_VARS."""
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import pickle
+from hashlib import sha1
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from .write_file import write_bytes_atomic
+
+
+class PlainTypesPickler(pickle.Pickler):
+    """
+    Pickler storing subclasses of builtin types as the builtin type.
+
+    Ansible returns data with types like AnsibleUnsafeText or AnsibleMapping. Storing those as plain str, dict etc.
+    makes the unpickled data identical to the data loaded from the YAML or JSON file.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        # Not called for exact instances of the builtin types, so only subclasses are handled here.
+        # Using the dunder methods of the builtin types, since for example str() returns the subclass for AnsibleUnsafeText.
+        if isinstance(obj, str):
+            return str, (str.__str__(obj),)
+        if isinstance(obj, dict):
+            return dict, (dict(obj),)
+        if isinstance(obj, list):
+            return list, (list(obj),)
+        if isinstance(obj, int) and not isinstance(obj, bool):
+            return int, (int.__int__(obj),)
+        if isinstance(obj, float):
+            return float, (float.__float__(obj),)
+        return NotImplemented
+
+
+def get_structured_config_pickle_path(structured_config_filename: str | Path) -> Path:
+    """Return the path of the pickle file stored next to the structured config file."""
+    return Path(structured_config_filename).with_suffix(".pickle")
+
+
+def get_structured_config_stamp(content: str) -> tuple[str, str]:
+    """Return the stamp of the PyAVD version and the digest of the structured config file content."""
+    # pylint: disable=import-outside-toplevel
+    from pyavd import __version__
+
+    # pylint: enable=import-outside-toplevel
+
+    return __version__, sha1(content.encode("UTF-8"), usedforsecurity=False).hexdigest()
+
+
+def write_structured_config_pickle(structured_config: dict, content: str, structured_config_filename: str, file_mode: str = "0o664") -> bool:
+    """
+    Write the structured config as a pickle file next to the structured config file, if the content has changed.
+
+    The pickle is stamped with the PyAVD version and the digest of the structured config file content,
+    so it is only loaded by `read_structured_config_pickle` if it matches the structured config file.
+
+    Parameters
+    ----------
+        structured_config: The structured config as dict
+        content: The content of the structured config file in YAML or JSON format
+        structured_config_filename: The structured config filename
+
+    Returns:
+    -------
+        bool: Indicate if the content of the pickle file has changed.
+    """
+    # The stamp is stored as a separate pickle in front of the structured config, so it can be checked without loading the structured config.
+    buffer = BytesIO()
+    pickle.dump(get_structured_config_stamp(content), buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    PlainTypesPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(structured_config)
+    data = buffer.getvalue()
+
+    path = get_structured_config_pickle_path(structured_config_filename)
+    if path.exists() and path.read_bytes() == data:
+        return False
+
+    # Writing atomically, so a partially written file is never loaded.
+    write_bytes_atomic(data, path, file_mode)
+    return True
+
+
+def read_structured_config_pickle(structured_config_filename: str | Path) -> dict | None:
+    """
+    Return the structured config from the pickle file stored next to the structured config file.
+
+    Returns None if either file is missing or if the pickle was not written by the running PyAVD version from the current structured config file.
+    """
+    path = get_structured_config_pickle_path(structured_config_filename)
+    structured_config_path = Path(structured_config_filename)
+    if not path.exists() or not structured_config_path.exists():
+        return None
+
+    with path.open("rb") as file:
+        if pickle.load(file) != get_structured_config_stamp(structured_config_path.read_text(encoding="UTF-8")):  # noqa: S301
+            return None
+
+        return pickle.load(file)  # noqa: S301
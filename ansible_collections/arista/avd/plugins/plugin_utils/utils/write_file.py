@@ -1,13 +1,19 @@
 # Copyright (c) 2024-2025 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from __future__ import annotations
+
+import os
 from pathlib import Path
+from stat import S_IMODE
 
 
 def write_file(content: str, filename: str, file_mode: str = "0o664", dir_mode: str = "0o775") -> bool:
     """
     This function writes the file only if the content has changed.
 
+    The existing file is only read if it has the same size as the new content.
+
     Parameters
     ----------
         content: The content to write
@@ -18,13 +24,49 @@ def write_file(content: str, filename: str, file_mode: str = "0o664", dir_mode:
         bool: Indicate if the content of filename has changed.
     """
     path = Path(filename)
-    if not path.exists():
+    data = content.encode("UTF-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_bytes_atomic(data, path, file_mode, dir_mode)
+    return True
+
+
+def write_bytes_atomic(data: bytes, path: Path, file_mode: str = "0o664", dir_mode: str = "0o775") -> None:
+    """
+    Write data to a temporary file next to path and rename it to path.
+
+    Readers never see a partially written file. The file mode of an existing file is kept, otherwise file_mode is used as limited by the umask.
+    Missing parent directories are created with dir_mode. If path is a symlink, the target of the symlink is replaced, so the symlink is kept.
+
+    Parameters
+    ----------
+        data: The content to write
+        path: Target path
+        file_mode: File mode for a new file
+        dir_mode: File mode for new parent directories
+    """
+    if path.is_symlink():
+        path = path.resolve()
+
+    try:
+        mode = S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
         # Create parent dirs automatically.
         path.parent.mkdir(mode=int(dir_mode, 8), parents=True, exist_ok=True)
-        # Touch file
-        path.touch(mode=int(file_mode, 8))
-    elif path.read_text(encoding="UTF-8") == content:
-        return False
+        mode = None
 
-    path.write_text(content, encoding="UTF-8")
-    return True
+    # Including the process ID, since Ansible may write the same file from multiple forks.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        # Creating the file with os.open, so the umask is applied to the mode of a new file.
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, int(file_mode, 8)), "wb") as file:
+            file.write(data)
+        if mode is not None:
+            tmp_path.chmod(mode)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import yaml
+from ansible.parsing.dataloader import DataLoader
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+from ansible.plugins.loader import connection_loader
+from ansible.template import Templar
+
+from ansible_collections.arista.avd.plugins.action import eos_designs_structured_config
+from ansible_collections.arista.avd.plugins.action.eos_designs_structured_config import ActionModule, get_cache_inputs
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import read_structured_config_pickle
+
+pyavd = pytest.importorskip("pyavd")
+
+FABRIC_INPUTS = {
+    "fabric_name": "FABRIC",
+    "spine": {"defaults": {"loopback_ipv4_pool": "10.0.0.0/24", "bgp_as": "65000"}, "nodes": [{"name": "spine1", "id": 1}]},
+    "l3leaf": {
+        "defaults": {
+            "loopback_ipv4_pool": "10.0.1.0/24",
+            "vtep_loopback_ipv4_pool": "10.0.2.0/24",
+            "uplink_ipv4_pool": "10.0.3.0/24",
+            "uplink_switches": ["spine1"],
+            "uplink_interfaces": ["Ethernet1"],
+            "bgp_as": "65001",
+        },
+        "nodes": [{"name": "leaf1", "id": 1, "uplink_switch_interfaces": ["Ethernet1"]}],
+    },
+}
+HOST_TYPES = {"spine1": "spine", "leaf1": "l3leaf"}
+
+
+@pytest.fixture(name="avd_facts", scope="module")
+def fixture_avd_facts() -> dict:
+    all_inputs = {hostname: {**deepcopy(FABRIC_INPUTS), "type": node_type} for hostname, node_type in HOST_TYPES.items()}
+    for inputs in all_inputs.values():
+        pyavd.validate_inputs(inputs)
+    return pyavd.get_avd_facts(all_inputs)
+
+
+def run_action(hostname: str, task_vars: dict, tmp_path: Path, **extra_args: Any) -> dict:
+    loader = DataLoader()
+    task = Task.load(
+        {
+            "action": {
+                "module": "arista.avd.eos_designs_structured_config",
+                "args": {"dest": str(tmp_path / f"{hostname}.yml"), "cache_dir": str(tmp_path / "cache"), **extra_args},
+            },
+        },
+        loader=loader,
+    )
+    action = ActionModule(
+        task=task,
+        connection=connection_loader.get("local", PlayContext(), None),
+        play_context=PlayContext(),
+        loader=loader,
+        templar=Templar(loader=loader),
+        shared_loader_obj=None,
+    )
+    with patch.object(eos_designs_structured_config, "get_structured_config", wraps=eos_designs_structured_config.get_structured_config) as mocked:
+        result = action.run(task_vars=deepcopy(task_vars))
+    result["generated"] = mocked.called
+    return result
+
+
+def test_structured_config_cache(avd_facts: dict, tmp_path: Path) -> None:
+    task_vars = {**deepcopy(FABRIC_INPUTS), "type": "l3leaf", "inventory_hostname": "leaf1", "omit": "__omit_place_holder__1", **deepcopy(avd_facts)}
+
+    first_result = run_action("leaf1", task_vars, tmp_path)
+    assert first_result["generated"] is True
+    assert first_result["changed"] is True
+    assert tmp_path.joinpath("cache", "leaf1.pickle").exists()
+    content = tmp_path.joinpath("leaf1.yml").read_text(encoding="UTF-8")
+
+    # Ignored magic variables are changing between runs.
+    task_vars["omit"] = "__omit_place_holder__2"
+    cached_result = run_action("leaf1", task_vars, tmp_path)
+    assert cached_result["generated"] is False
+    assert cached_result["changed"] is False
+    assert cached_result["ansible_facts"]["router_bgp"] == first_result["ansible_facts"]["router_bgp"]
+    assert tmp_path.joinpath("leaf1.yml").read_text(encoding="UTF-8") == content
+
+    # Removed output file is written again from the cache.
+    tmp_path.joinpath("leaf1.yml").unlink()
+    cached_result = run_action("leaf1", task_vars, tmp_path)
+    assert cached_result["generated"] is False
+    assert tmp_path.joinpath("leaf1.yml").read_text(encoding="UTF-8") == content
+
+    # Changed facts of the uplink peer read while generating the structured config.
+    task_vars["avd_switch_facts"]["spine1"]["switch"]["bgp_as"] = "65100"
+    changed_facts_result = run_action("leaf1", task_vars, tmp_path)
+    assert changed_facts_result["generated"] is True
+    assert "65100" in tmp_path.joinpath("leaf1.yml").read_text(encoding="UTF-8")
+
+    # Changed inputs of the device.
+    task_vars["l3leaf"]["defaults"]["bgp_as"] = "65002"
+    changed_inputs_result = run_action("leaf1", task_vars, tmp_path)
+    assert changed_inputs_result["generated"] is True
+    assert run_action("leaf1", task_vars, tmp_path)["generated"] is False
+
+
+def test_structured_config_pickle(avd_facts: dict, tmp_path: Path) -> None:
+    task_vars = {**deepcopy(FABRIC_INPUTS), "type": "l3leaf", "inventory_hostname": "leaf1", **deepcopy(avd_facts)}
+
+    run_action("leaf1", task_vars, tmp_path, structured_config_pickle=True)
+    structured_config = yaml.safe_load(tmp_path.joinpath("leaf1.yml").read_text(encoding="UTF-8"))
+    assert read_structured_config_pickle(tmp_path / "leaf1.yml") == structured_config
+
+    # The pickle is also written when the structured config is loaded from the cache.
+    tmp_path.joinpath("leaf1.pickle").unlink()
+    cached_result = run_action("leaf1", task_vars, tmp_path, structured_config_pickle=True)
+    assert cached_result["generated"] is False
+    assert cached_result["changed"] is True
+    assert read_structured_config_pickle(tmp_path / "leaf1.yml") == structured_config
+
+
+def test_structured_config_cache_custom_templates(avd_facts: dict, tmp_path: Path) -> None:
+    """Editing a custom template file must invalidate the cache entry, even though the task arguments are unchanged."""
+    tmp_path.joinpath("templates").mkdir()
+    custom_template = tmp_path.joinpath("templates", "custom.j2")
+    custom_template.write_text("router_bgp:\n  bgp:\n    default:\n      ipv4_unicast: false\n", encoding="UTF-8")
+    task_vars = {**deepcopy(FABRIC_INPUTS), "type": "l3leaf", "inventory_hostname": "leaf1", "ansible_search_path": [str(tmp_path)], **deepcopy(avd_facts)}
+    extra_args = {"eos_designs_custom_templates": [{"template": "custom.j2"}]}
+
+    assert run_action("leaf1", task_vars, tmp_path, **extra_args)["generated"] is True
+    assert run_action("leaf1", task_vars, tmp_path, **extra_args)["generated"] is False
+
+    custom_template.write_text("router_bgp:\n  bgp:\n    default:\n      ipv4_unicast: true\n", encoding="UTF-8")
+    changed_template_result = run_action("leaf1", task_vars, tmp_path, **extra_args)
+    assert changed_template_result["generated"] is True
+    assert changed_template_result["ansible_facts"]["router_bgp"]["bgp"]["default"]["ipv4_unicast"] is True
+
+
+def test_get_cache_inputs() -> None:
+    task_vars = {"fabric_name": "FABRIC", "ansible_play_hosts": ["leaf1"], "omit": "__omit_place_holder__1", "hostvars": {}, "avd_switch_facts": {}}
+    task_args = {"dest": "leaf1.yml", "template_output": True, "cache_dir": "cache", "cprofile_file": "leaf1.prof"}
+    assert get_cache_inputs(task_vars, task_args, ["custom template"]) == {
+        "vars": {"fabric_name": "FABRIC"},
+        "args": {"dest": "leaf1.yml", "template_output": True},
+        "custom_templates": ["custom template"],
+    }
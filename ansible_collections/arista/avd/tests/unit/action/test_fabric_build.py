@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from ansible.errors import AnsibleActionFail
+from ansible.parsing.dataloader import DataLoader
+from ansible.playbook.play_context import PlayContext
+from ansible.playbook.task import Task
+from ansible.plugins.loader import connection_loader
+from ansible.template import Templar
+
+from ansible_collections.arista.avd.plugins.action import fabric_build
+from ansible_collections.arista.avd.plugins.action.fabric_build import ActionModule
+
+pyavd = pytest.importorskip("pyavd")
+
+from pyavd.api.fabric_build import DeviceBuild, FabricBuild  # noqa: E402
+
+FABRIC_INPUTS = {
+    "fabric_name": "FABRIC",
+    "spine": {"defaults": {"loopback_ipv4_pool": "10.0.0.0/24", "bgp_as": "65000"}, "nodes": [{"name": "spine1", "id": 1}]},
+}
+HOSTNAMES = ["spine1", "spine2"]
+
+
+def get_task_vars() -> dict:
+    hostvars = {
+        hostname: {**deepcopy(FABRIC_INPUTS), "type": "spine", "inventory_hostname": hostname, "ansible_host": "192.0.2.1", "avd_switch_facts": {}}
+        for hostname in HOSTNAMES
+    }
+    return {"fabric_name": "FABRIC", "groups": {"FABRIC": HOSTNAMES}, "ansible_play_hosts_all": HOSTNAMES, "hostvars": hostvars}
+
+
+def get_fabric_build(validation_result: pyavd.ValidationResult | None = None) -> FabricBuild:
+    return FabricBuild(
+        avd_facts={},
+        devices={
+            hostname: DeviceBuild(
+                structured_config={"hostname": hostname},
+                validation_result=validation_result or pyavd.ValidationResult(failed=False),
+                config=None if validation_result else f"hostname {hostname}\n",
+            )
+            for hostname in HOSTNAMES
+        },
+        cached_hostnames=["spine2"],
+    )
+
+
+def run_action(task_vars: dict, build_fabric: MagicMock, tmp_path: Path, **extra_args: Any) -> tuple[dict, MagicMock]:
+    loader = DataLoader()
+    task = Task.load(
+        {
+            "action": {
+                "module": "arista.avd.fabric_build",
+                "args": {"structured_config_dir": str(tmp_path / "structured_configs"), "config_dir": str(tmp_path / "configs"), **extra_args},
+            },
+        },
+        loader=loader,
+    )
+    action = ActionModule(
+        task=task,
+        connection=connection_loader.get("local", PlayContext(), None),
+        play_context=PlayContext(),
+        loader=loader,
+        templar=Templar(loader=loader),
+        shared_loader_obj=None,
+    )
+    with patch.object(fabric_build, "build_fabric", build_fabric), patch.object(fabric_build, "ArtifactWriter") as artifact_writer:
+        artifact_writer.return_value.__enter__.return_value.write_many.return_value = [str(tmp_path / "configs" / "spine1.cfg")]
+        result = action.run(task_vars=task_vars)
+    return result, artifact_writer
+
+
+def test_fabric_build(tmp_path: Path) -> None:
+    build_fabric = MagicMock(return_value=get_fabric_build())
+    result, artifact_writer = run_action(get_task_vars(), build_fabric, tmp_path, workers=2, manifest_file=str(tmp_path / "manifest.json"))
+
+    assert result.get("failed") is not True
+    assert result["changed"] is True
+    assert result["cached_hosts"] == ["spine2"]
+
+    all_inputs = build_fabric.call_args.args[0]
+    assert list(all_inputs) == HOSTNAMES
+    # Ansible variables and AVD facts are left out of the inputs.
+    assert "ansible_host" not in all_inputs["spine1"]
+    assert "avd_switch_facts" not in all_inputs["spine1"]
+    assert build_fabric.call_args.kwargs == {"workers": 2, "cache_dir": None, "documentation": False}
+
+    artifact_writer.assert_called_once_with(str(tmp_path / "manifest.json"), file_mode="0o664")
+    (artifacts,) = artifact_writer.return_value.__enter__.return_value.write_many.call_args.args
+    assert [filename for _, filename in artifacts] == [
+        tmp_path / "structured_configs" / "spine1.yml",
+        tmp_path / "configs" / "spine1.cfg",
+        tmp_path / "structured_configs" / "spine2.yml",
+        tmp_path / "configs" / "spine2.cfg",
+    ]
+    assert artifacts[1][0] == "hostname spine1\n"
+
+
+def test_fabric_build_failed_validation(tmp_path: Path) -> None:
+    """Devices failing validation of the structured config fail the task, without writing the device configuration."""
+    validation_result = pyavd.ValidationResult(failed=True, validation_errors=["Invalid structured config"])
+    result, artifact_writer = run_action(get_task_vars(), MagicMock(return_value=get_fabric_build(validation_result)), tmp_path)
+
+    assert result["failed"] is True
+    assert result["msg"] == "2 errors found during schema validation of the generated structured configurations."
+    (artifacts,) = artifact_writer.return_value.__enter__.return_value.write_many.call_args.args
+    assert [filename for _, filename in artifacts] == [tmp_path / "structured_configs" / "spine1.yml", tmp_path / "structured_configs" / "spine2.yml"]
+
+
+def test_fabric_build_error(tmp_path: Path) -> None:
+    with pytest.raises(AnsibleActionFail, match="Build failed"):
+        run_action(get_task_vars(), MagicMock(side_effect=RuntimeError("Build failed")), tmp_path)
+
+
+def test_fabric_build_invalid_fabric_name(tmp_path: Path) -> None:
+    task_vars = get_task_vars()
+    task_vars["ansible_play_hosts_all"] = [*HOSTNAMES, "other"]
+    build_fabric = MagicMock()
+    with pytest.raises(AnsibleActionFail, match="Invalid/missing 'fabric_name' variable"):
+        run_action(task_vars, build_fabric, tmp_path)
+    build_fabric.assert_not_called()
@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import ArtifactWriter, write_file
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def umask_022() -> Generator[None]:
+    old_umask = os.umask(0o022)
+    yield
+    os.umask(old_umask)
+
+
+@pytest.mark.usefixtures("umask_022")
+def test_write_file(tmp_path: Path) -> None:
+    filename = tmp_path / "configs" / "leaf1.cfg"
+    assert write_file("hostname leaf1\n", str(filename)) is True
+    # The umask is applied to the mode of new files.
+    assert oct(filename.stat().st_mode & 0o777) == "0o644"
+    assert write_file("hostname leaf1\n", str(filename)) is False
+    # The mode of existing files is kept.
+    filename.chmod(0o600)
+    assert write_file("hostname leaf2\n", str(filename)) is True
+    assert oct(filename.stat().st_mode & 0o777) == "0o600"
+    assert filename.read_text(encoding="UTF-8") == "hostname leaf2\n"
+    # No temporary files are left behind.
+    assert [path.name for path in filename.parent.iterdir()] == ["leaf1.cfg"]
+
+
+def test_write_file_symlink(tmp_path: Path) -> None:
+    """The target of a symlink is written, keeping the symlink."""
+    target = tmp_path / "leaf1.cfg"
+    target.write_text("hostname leaf1\n", encoding="UTF-8")
+    link = tmp_path / "link.cfg"
+    link.symlink_to(target)
+    assert write_file("hostname leaf2\n", str(link)) is True
+    assert link.is_symlink()
+    assert target.read_text(encoding="UTF-8") == "hostname leaf2\n"
+
+
+def test_artifact_writer(tmp_path: Path) -> None:
+    manifest_file = tmp_path / "manifest.json"
+    artifacts = [(f"hostname leaf{index}\n", tmp_path / "configs" / f"leaf{index}.cfg") for index in range(10)]
+
+    with ArtifactWriter(manifest_file) as writer:
+        assert writer.write_many(artifacts, workers=4) == [str(filename) for _, filename in artifacts]
+    assert manifest_file.exists()
+
+    # Unchanged files are compared to the manifest without reading them.
+    with patch.object(Path, "read_bytes", side_effect=AssertionError("File must not be read")), ArtifactWriter(manifest_file) as writer:
+        assert writer.write_many(artifacts) == []
+
+    # Files changed or removed outside of the writer are detected.
+    leaf1_config = tmp_path / "configs" / "leaf1.cfg"
+    leaf1_config.write_text("hostname changed\n", encoding="UTF-8")
+    (tmp_path / "configs" / "leaf2.cfg").unlink()
+    with ArtifactWriter(manifest_file) as writer:
+        assert writer.write_many(artifacts) == [str(tmp_path / "configs" / "leaf1.cfg"), str(tmp_path / "configs" / "leaf2.cfg")]
+        assert writer.write("hostname leaf3-new\n", tmp_path / "configs" / "leaf3.cfg") is True
+    assert leaf1_config.read_text(encoding="UTF-8") == "hostname leaf1\n"
+
+    # Touched files with unchanged content are read to compare them.
+    os.utime(leaf1_config, ns=(0, 0))
+    with ArtifactWriter(manifest_file) as writer:
+        assert writer.write("hostname leaf1\n", leaf1_config) is False
+        assert writer.write("hostname leaf3-new\n", tmp_path / "configs" / "leaf3.cfg") is False
@@ -0,0 +1,40 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from ansible.parsing.yaml.objects import AnsibleMapping
+from ansible.utils.unsafe_proxy import AnsibleUnsafeText
+
+from ansible_collections.arista.avd.plugins.plugin_utils.utils import read_structured_config_pickle, write_structured_config_pickle
+
+pyavd = pytest.importorskip("pyavd")
+
+
+def test_structured_config_pickle(tmp_path: Path) -> None:
+    structured_config = {"hostname": AnsibleUnsafeText("leaf1"), "router_bgp": AnsibleMapping({"as": "65001"}), "vlans": [{"id": 10}]}
+    content = yaml.safe_dump({"hostname": "leaf1", "router_bgp": {"as": "65001"}, "vlans": [{"id": 10}]})
+    filename = tmp_path / "leaf1.yml"
+    filename.write_text(content, encoding="UTF-8")
+
+    assert read_structured_config_pickle(filename) is None
+    assert write_structured_config_pickle(structured_config, content, str(filename)) is True
+    assert tmp_path.joinpath("leaf1.pickle").exists()
+    assert write_structured_config_pickle(structured_config, content, str(filename)) is False
+
+    # Ansible types are stored as the plain builtin types, like when reading the YAML file.
+    loaded = read_structured_config_pickle(filename)
+    assert loaded == yaml.safe_load(content)
+    assert type(loaded["hostname"]) is str
+    assert type(loaded["router_bgp"]) is dict
+
+    # A different PyAVD version makes the pickle stale.
+    with patch.object(pyavd, "__version__", "0.0.0"):
+        assert read_structured_config_pickle(filename) is None
+
+    # Changing the structured config file makes the pickle stale.
+    filename.write_text(content.replace("65001", "65002"), encoding="UTF-8")
+    assert read_structured_config_pickle(filename) is None
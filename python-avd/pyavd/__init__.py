@@ -1,8 +1,9 @@
 # Copyright (c) 2023-2025 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from .build_fabric import build_fabric
 from .get_avd_facts import get_avd_facts
-from .get_device_config import get_device_config
+from .get_device_config import get_device_config, get_device_configs
 from .get_device_doc import get_device_doc
 from .get_device_structured_config import get_device_structured_config
 from .get_fabric_documentation import get_fabric_documentation
@@ -22,8 +23,10 @@ __version__ = "5.2.0.dev2"
 
 __all__ = [
     "ValidationResult",
+    "build_fabric",
     "get_avd_facts",
     "get_device_config",
+    "get_device_configs",
     "get_device_doc",
     "get_device_structured_config",
     "get_fabric_documentation",
@@ -0,0 +1,218 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from functools import cache
+from hashlib import sha256
+from importlib.util import find_spec
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dump, load
+from typing import TYPE_CHECKING, Any
+
+from pyavd._utils import fingerprint
+
+if TYPE_CHECKING:
+    from pyavd._eos_designs.fabric_index import FabricIndex
+
+
+class PeerFactsRecorder(Mapping):
+    """
+    Read-only view of "avd_switch_facts" recording the hostnames of all facts being read.
+
+    Used in place of "avd_switch_facts" during structured config generation to learn which peer facts
+    a device depends on. Those are read through `SharedUtils.get_peer_facts` using `get()`, which in turn calls `.get()` on this mapping.
+    """
+
+    def __init__(self, avd_switch_facts: dict) -> None:
+        self._avd_switch_facts = avd_switch_facts
+        self.accessed: set[str] = set()
+
+    def __getitem__(self, key: str) -> dict:
+        self.accessed.add(key)
+        return self._avd_switch_facts[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._avd_switch_facts)
+
+    def __len__(self) -> int:
+        return len(self._avd_switch_facts)
+
+
+class FabricIndexRecorder:
+    """
+    View of a FabricIndex shared by all devices, recording the hostnames of all facts each lookup depends on in a PeerFactsRecorder.
+
+    Used in place of "avd_fabric_index" during structured config generation together with the PeerFactsRecorder, since the shared index
+    reads the facts directly and not through the recorder of the device.
+    Lookups across the fabric depend on the facts of all devices. The list of hostnames is covered by the host fingerprint.
+    """
+
+    def __init__(self, fabric_index: FabricIndex, peer_facts_recorder: PeerFactsRecorder) -> None:
+        self._fabric_index = fabric_index
+        self._peer_facts_recorder = peer_facts_recorder
+
+    def _record_all(self) -> None:
+        self._peer_facts_recorder.accessed.update(self._fabric_index.hostnames)
+
+    @property
+    def hostnames(self) -> frozenset[str]:
+        return self._fabric_index.hostnames
+
+    def get_downstream_switches(self, hostname: str) -> list[str]:
+        self._record_all()
+        return self._fabric_index.get_downstream_switches(hostname)
+
+    @property
+    def vteps(self) -> list[str]:
+        self._record_all()
+        return self._fabric_index.vteps
+
+    @property
+    def vteps_per_dc(self) -> dict[str | None, list[str]]:
+        self._record_all()
+        return self._fabric_index.vteps_per_dc
+
+    @property
+    def mpls_clients(self) -> list[str]:
+        self._record_all()
+        return self._fabric_index.mpls_clients
+
+    def get_vlans(self, hostname: str) -> list[int]:
+        self._peer_facts_recorder.accessed.add(hostname)
+        return self._fabric_index.get_vlans(hostname)
+
+
+def find_python_modules(data: Any) -> set[str]:
+    """Return all values of "python_module" keys found anywhere in the given data."""
+    python_modules = set()
+    if isinstance(data, Mapping):
+        for key, value in data.items():
+            if key == "python_module" and isinstance(value, str):
+                python_modules.add(value)
+            else:
+                python_modules.update(find_python_modules(value))
+    elif isinstance(data, list):
+        for item in data:
+            python_modules.update(find_python_modules(item))
+    return python_modules
+
+
+@cache
+def get_module_source_digest(module_path: str) -> str | None:
+    """
+    Return the digest of the source file of the given Python module or None if the module or source file cannot be found.
+
+    Cached for the life of the process, since a module is also only imported once per process.
+    """
+    try:
+        spec = find_spec(module_path)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None or not Path(spec.origin).is_file():
+        return None
+    return sha256(Path(spec.origin).read_bytes()).hexdigest()
+
+
+@cache
+def get_pyavd_source_digest() -> str:
+    """
+    Return the digest of all files in the PyAVD package.
+
+    Cached for the life of the process, since the modules of PyAVD are also only imported once per process.
+    """
+    package_path = Path(__file__).parents[1]
+    digest = sha256()
+    for path in sorted(package_path.rglob("*")):
+        if "__pycache__" in path.parts or not path.is_file():
+            continue
+        digest.update(str(path.relative_to(package_path)).encode("UTF-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class DeviceBuildCache:
+    """
+    On-disk cache of per-device build artifacts.
+
+    Each entry is stored in a separate file named by the hostname and holds the fingerprint of everything the artifacts were built from:
+    - The host fingerprint covering the PyAVD version, the inputs and own facts of the device, the list of fabric devices,
+      the topology and overlay peers of the device and the source code of PyAVD and of custom Python modules. See `get_host_fingerprint`.
+    - The facts of every peer device read during the build. The names of these peers are stored with the entry,
+      so the same peer facts can be compared on the next run.
+
+    Since the build is deterministic, a device built from identical inputs and identical facts will read the same peer facts,
+    so a matching fingerprint guarantees identical artifacts.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_host_fingerprint(hostname: str, inputs: dict, avd_facts: dict) -> str:
+        """
+        Return fingerprint of the inputs and own facts for one device.
+
+        Must be calculated before the build, in case the build modifies the inputs.
+
+        The code is covered by the PyAVD version and for development versions also by the digest of the PyAVD source files,
+        since the version does not change with the code there. Custom Python modules set as "python_module" anywhere in the inputs,
+        like `templates.ip_addressing.python_module`, are covered by the digest of their source file.
+        Other modules imported by those custom modules are not covered.
+        """
+        # pylint: disable=import-outside-toplevel
+        from pyavd import __version__
+
+        # pylint: enable=import-outside-toplevel
+
+        avd_switch_facts = avd_facts["avd_switch_facts"]
+        return fingerprint(
+            __version__,
+            get_pyavd_source_digest() if "dev" in __version__ else None,
+            {module_path: get_module_source_digest(module_path) for module_path in sorted(find_python_modules(inputs))},
+            hostname,
+            inputs,
+            avd_switch_facts[hostname],
+            list(avd_switch_facts),
+            avd_facts["avd_topology_peers"].get(hostname),
+            avd_facts["avd_overlay_peers"].get(hostname),
+        )
+
+    def load(self, hostname: str, host_fingerprint: str, avd_facts: dict) -> Any | None:
+        """Return the cached data for the device or None if the entry is missing or stale."""
+        entry_path = self._entry_path(hostname)
+        if not entry_path.exists():
+            return None
+
+        with entry_path.open("rb") as file:
+            entry: dict = load(file)  # noqa: S301
+
+        if entry["fingerprint"] != self._get_fingerprint(host_fingerprint, avd_facts, entry["peer_names"]):
+            return None
+
+        return entry["data"]
+
+    def store(self, hostname: str, host_fingerprint: str, avd_facts: dict, peer_names: set[str], data: Any) -> None:
+        """Store data for the device, along with the fingerprint of everything the data was built from."""
+        peer_names = sorted(peer_names)
+        entry = {
+            "fingerprint": self._get_fingerprint(host_fingerprint, avd_facts, peer_names),
+            "peer_names": peer_names,
+            "data": data,
+        }
+        # Writing to a temporary file first, so a partially written entry is never loaded.
+        entry_path = self._entry_path(hostname)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.tmp")
+        with tmp_path.open("wb") as file:
+            dump(entry, file, protocol=HIGHEST_PROTOCOL)
+        tmp_path.replace(entry_path)
+
+    def _entry_path(self, hostname: str) -> Path:
+        return self.cache_dir / f"{hostname}.pickle"
+
+    @staticmethod
+    def _get_fingerprint(host_fingerprint: str, avd_facts: dict, peer_names: list[str]) -> str:
+        avd_switch_facts = avd_facts["avd_switch_facts"]
+        return fingerprint(host_fingerprint, {peer_name: avd_switch_facts.get(peer_name) for peer_name in peer_names})
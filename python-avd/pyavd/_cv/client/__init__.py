@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import ssl
-from typing import TYPE_CHECKING
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
 
-from grpclib.client import Channel
-from requests import JSONDecodeError, get, post
+from requests import ConnectionError as RequestsConnectionError
+from requests import JSONDecodeError, Response, request
 
 from .change_control import ChangeControlMixin
+from .channel_pool import ChannelPool
+from .concurrency import AdaptiveConcurrencyLimiter
 from .configlet import ConfigletMixin
 from .exceptions import CVClientException
 from .inventory import InventoryMixin
@@ -25,6 +28,8 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self
 
+LOGGER = getLogger(__name__)
+
 
 class CVClient(
     ChangeControlMixin,
@@ -36,15 +41,17 @@ class CVClient(
     UtilsMixin,
     WorkspaceMixin,
 ):
-    _channel: Channel | None = None
+    _channel_pool: ChannelPool | None = None
     _metadata: dict
     _servers: list[str]
     _port: int
+    _connections_per_server: int
     _verify_certs: bool
     _token: str | None
     _username: str | None
     _password: str | None
     _cv_version: CvVersion | None = None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter
 
     def __init__(
         self,
@@ -54,6 +61,7 @@ class CVClient(
         password: str | None = None,
         port: int = 443,
         verify_certs: bool = True,
+        connections_per_server: int = 2,
     ) -> None:
         """
         CVClient is a high-level API library for using CloudVision Resource APIs.
@@ -66,8 +74,10 @@ class CVClient(
             token: Token defined in CloudVision under service-accounts.
             username: Username to use for authentication if token is not set.
             password: Password to use for authentication if token is not set.
-            port: TCP port to use for the connection.
+            port: TCP port to use for the gRPC and REST connections.
             verify_certs: Disables SSL certificate verification if set to False. Not recommended for production.
+            connections_per_server: Number of gRPC connections to open to each server. \
+                API calls are spread over the connections to all servers, skipping servers which recently failed with a connection error.
         """
         if isinstance(servers, list):
             self._servers = servers
@@ -75,10 +85,12 @@ class CVClient(
             self._servers = [servers]
 
         self._port = port
+        self._connections_per_server = connections_per_server
         self._token = token
         self._username = username
         self._password = password
         self._verify_certs = verify_certs
+        self._concurrency_limiter = AdaptiveConcurrencyLimiter()
 
     async def __aenter__(self) -> Self:
         """Using asynchronous context manager since grpclib must be initialized inside an asyncio loop."""
@@ -86,12 +98,11 @@ class CVClient(
         return self
 
     async def __aexit__(self, _exc_type: type[BaseException] | None, _exc_val: BaseException | None, _exc_tb: TracebackType | None) -> None:
-        self._channel.close()
-        self._channel = None
+        self._channel_pool.close()
+        self._channel_pool = None
 
     def _connect(self) -> None:
         # TODO: Verify connection
-        # TODO: Handle multinode clusters
 
         # Ensure that the default ssl context is initialized before doing any requests.
         ssl_context = self._ssl_context()
@@ -101,8 +112,8 @@ class CVClient(
 
         self._set_version()
 
-        if self._channel is None:
-            self._channel = Channel(host=self._servers[0], port=self._port, ssl=ssl_context)
+        if self._channel_pool is None:
+            self._channel_pool = ChannelPool(self._servers, port=self._port, ssl=ssl_context, connections_per_server=self._connections_per_server)
 
         self._metadata = {"authorization": "Bearer " + self._token}
 
@@ -129,8 +140,6 @@ class CVClient(
         Uses username/password for authenticating via REST.
 
         Sets the session token into self._token to be used for gRPC channel.
-
-        TODO: Handle multinode clusters
         """
         if self._token:
             return
@@ -140,8 +149,9 @@ class CVClient(
             raise CVClientException(msg)
 
         try:
-            response = post(  # noqa: S113 TODO: Add configurable timeout
-                "https://" + self._servers[0] + "/cvpservice/login/authenticate.do",
+            response = self._rest_request(
+                "POST",
+                "/cvpservice/login/authenticate.do",
                 auth=(self._username, self._password),
                 verify=self._verify_certs,
                 json={},
@@ -157,16 +167,15 @@ class CVClient(
         Fetch the CloudVision version via REST and set self._cv_version.
 
         This version is used to decide which APIs to use later.
-
-        TODO: Handle multinode clusters
         """
         if not self._token:
             msg = "Unable to get version from CloudVision server. Missing token."
             raise CVClientException(msg)
 
         try:
-            response = get(  # noqa: S113 TODO: Add configurable timeout
-                "https://" + self._servers[0] + "/cvpservice/cvpInfo/getCvpInfo.do",
+            response = self._rest_request(
+                "GET",
+                "/cvpservice/cvpInfo/getCvpInfo.do",
                 headers={"Authorization": f"Bearer {self._token}"},
                 verify=self._verify_certs,
                 json={},
@@ -176,3 +185,17 @@ class CVClient(
         except (KeyError, JSONDecodeError) as e:
             msg = f"Unable to get version from CloudVision server. Got {response.text}"
             raise CVClientException(msg) from e
+
+    def _rest_request(self, method: str, path: str, **kwargs: Any) -> Response:
+        """
+        Send a REST request to the first server of the cluster responding.
+
+        Servers are tried in the given order, moving on to the next server on connection errors.
+        """
+        for server in self._servers[:-1]:
+            try:
+                return request(method, f"https://{server}:{self._port}{path}", **kwargs)  # noqa: S113 TODO: Add configurable timeout
+            except RequestsConnectionError as e:  # noqa: PERF203 Moving on to the next server is the purpose of the loop.
+                LOGGER.warning("CVClient: Unable to connect to CloudVision server '%s'. Trying the next server. Got %s", server, e)
+
+        return request(method, f"https://{self._servers[-1]}:{self._port}{path}", **kwargs)  # noqa: S113 TODO: Add configurable timeout
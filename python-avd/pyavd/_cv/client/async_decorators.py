@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, get_origin
 
 from pyavd._utils import batch
 
+from .channel_pool import is_connection_error
 from .constants import CVAAS_VERSION_STRING
 from .exceptions import CVMessageSizeExceeded
 from .versioning import CvVersion
@@ -17,9 +18,64 @@ from .versioning import CvVersion
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from . import CVClient
+
 LOGGER = getLogger(__name__)
 
 
+def limit_concurrency(func: Callable) -> Callable:
+    """
+    Decorator used to run the method within a slot of the concurrency limiter of the CVClient instance.
+
+    The latency of the method is averaged separately from other methods, using the name of the method as key.
+
+    The decorator will only work in CVClient class methods since it expects the _concurrency_limiter attribute on 'self'.
+    When combined with grpc_msg_size_handler, this decorator must be applied first, so each split call is limited individually.
+    When combined with channel_failover, this decorator must be applied last, so retries on other servers are done within the same slot.
+    """
+
+    @wraps(func)
+    async def wrapper_limit_concurrency(self: CVClient, *args: Any, **kwargs: Any) -> Any:
+        async with self._concurrency_limiter.slot(func.__name__):
+            return await func(self, *args, **kwargs)
+
+    return wrapper_limit_concurrency
+
+
+def channel_failover(func: Callable) -> Callable:
+    """
+    Decorator used to pass a channel from the channel pool of the CVClient instance to the method in the keyword-only argument 'channel'.
+
+    If the method fails with a connection error, the server of the channel is marked as unhealthy in the channel pool and the method is called again
+    with a channel to another server. This continues until no healthy servers are left.
+
+    The 'channel' argument is removed from the signature of the decorated method, so it cannot be given by the caller.
+
+    The decorator will only work in CVClient class methods since it expects the _channel_pool attribute on 'self'.
+    """
+    func_signature = signature(func)
+    if "channel" not in func_signature.parameters:
+        msg = f"channel_failover decorator is unable to bind to the function '{func.__name__}'. Expected a keyword-only argument 'channel'."
+        raise TypeError(msg)
+
+    @wraps(func)
+    async def wrapper_channel_failover(self: CVClient, *args: Any, **kwargs: Any) -> Any:
+        while True:
+            channel = await self._channel_pool.get_channel()
+            try:
+                return await func(self, *args, channel=channel, **kwargs)
+            except Exception as e:
+                if not is_connection_error(e) or not self._channel_pool.mark_channel_failed(channel):
+                    raise
+                LOGGER.info("wrapper_channel_failover: Retrying '%s' on another server after connection error: %s", func.__name__, e)
+
+    # Used by inspect.signature() for the wrapper and any other decorators applied on top of it, like grpc_msg_size_handler.
+    wrapper_channel_failover.__signature__ = func_signature.replace(
+        parameters=[parameter for name, parameter in func_signature.parameters.items() if name != "channel"],
+    )
+    return wrapper_channel_failover
+
+
 def grpc_msg_size_handler(list_field: str) -> Callable:
     def decorator_grpc_msg_size_handler(func: Callable) -> Callable:
         func_signature = signature(func)
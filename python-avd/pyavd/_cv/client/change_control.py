@@ -24,6 +24,7 @@ from pyavd._cv.api.arista.changecontrol.v1 import (
     FlagConfig,
 )
 
+from .async_decorators import channel_failover
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
@@ -31,6 +32,7 @@ if TYPE_CHECKING:
     from datetime import datetime
 
     from aristaproto import _DateTime
+    from grpclib.client import Channel
 
     from . import CVClient
 
@@ -49,11 +51,14 @@ class ChangeControlMixin:
 
     workspace_api_version: Literal["v1"] = "v1"
 
+    @channel_failover
     async def get_change_control(
         self: CVClient,
         change_control_id: str,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ChangeControl:
         """
         Get Change Control using arista.changecontrol.v1.ChangeControlService.GetOne API.
@@ -70,7 +75,7 @@ class ChangeControlMixin:
             key=ChangeControlKey(id=change_control_id),
             time=time,
         )
-        client = ChangeControlServiceStub(self._channel)
+        client = ChangeControlServiceStub(channel)
 
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
@@ -79,12 +84,15 @@ class ChangeControlMixin:
 
         return response.value
 
+    @channel_failover
     async def set_change_control(
         self: CVClient,
         change_control_id: str,
         name: str | None = None,
         description: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ChangeControlConfigSetResponse:
         """
         Set Change Control details using arista.changecontrol.v1.ChangeControlConfigService.Set API.
@@ -105,7 +113,7 @@ class ChangeControlMixin:
                 change=ChangeConfig(name=name, notes=description),
             ),
         )
-        client = ChangeControlConfigServiceStub(self._channel)
+        client = ChangeControlConfigServiceStub(channel)
 
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
@@ -114,12 +122,15 @@ class ChangeControlMixin:
 
         return response.value
 
+    @channel_failover
     async def approve_change_control(
         self: CVClient,
         change_control_id: str,
         timestamp: _DateTime,
         description: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ApproveConfig:
         """
         Get Change Control using arista.changecontrol.v1.ChangeControlService.GetOne API.
@@ -142,7 +153,7 @@ class ChangeControlMixin:
                 version=timestamp,
             ),
         )
-        client = ApproveConfigServiceStub(self._channel)
+        client = ApproveConfigServiceStub(channel)
 
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
@@ -151,11 +162,14 @@ class ChangeControlMixin:
 
         return response.value
 
+    @channel_failover
     async def start_change_control(
         self: CVClient,
         change_control_id: str,
         description: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ChangeControlConfig:
         """
         Set Change Control details using arista.changecontrol.v1.ChangeControlConfigService.Set API.
@@ -174,7 +188,7 @@ class ChangeControlMixin:
                 start=FlagConfig(value=True, notes=description),
             ),
         )
-        client = ChangeControlConfigServiceStub(self._channel)
+        client = ChangeControlConfigServiceStub(channel)
 
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
@@ -183,11 +197,14 @@ class ChangeControlMixin:
 
         return response.value
 
+    @channel_failover
     async def wait_for_change_control_state(
         self: CVClient,
         cc_id: str,
         state: Literal["completed", "unspecified", "running", "scheduled"],
         timeout: float = 3600.0,
+        *,
+        channel: Channel,
     ) -> ChangeControl:
         """
         Monitor a Change control using arista.changecontrol.v1.ChangeControlService.Subscribe API for a response to the given cc_id.
@@ -209,7 +226,7 @@ class ChangeControlMixin:
                 ),
             ],
         )
-        client = ChangeControlServiceStub(self._channel)
+        client = ChangeControlServiceStub(channel)
         try:
             responses = client.subscribe(request, metadata=self._metadata, timeout=timeout)
             async for response in responses:
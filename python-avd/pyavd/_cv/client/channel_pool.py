@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from asyncio import wait_for
+from logging import getLogger
+from socket import gaierror
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from grpclib.client import Channel
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+
+if TYPE_CHECKING:
+    import ssl
+
+LOGGER = getLogger(__name__)
+
+
+def is_connection_error(exception: BaseException) -> bool:
+    """Return True if the exception indicates that the server could not be reached, so the call can be retried on another server."""
+    if isinstance(exception, (ConnectionError, gaierror, StreamTerminatedError)):
+        return True
+    return isinstance(exception, GRPCError) and exception.status == Status.UNAVAILABLE
+
+
+class ChannelPool:
+    """
+    Pool of gRPC channels spreading API calls over all servers of a CloudVision cluster and several HTTP/2 connections per server.
+
+    Channels are handed out round-robin. A server is marked unhealthy when an API call fails with a connection error,
+    and its channels are skipped until `failure_cooldown` seconds have passed. After that the server is probed by connecting the next channel
+    to it within `probe_timeout` seconds, before it is used again. A failed probe starts a new cooldown.
+    If all servers are unhealthy, the server which has been unhealthy the longest is used without probing.
+    """
+
+    servers: list[str]
+    failure_cooldown: float
+    probe_timeout: float
+    _channels: list[tuple[str, Channel]]
+    _server_by_channel: dict[int, str]
+    """Server of each channel keyed by id() of the channel."""
+    _unhealthy_until: dict[str, float]
+    """Monotonic time until which the server is considered unhealthy. Only servers which have failed and not passed a probe since are present."""
+    _next_index: int
+
+    def __init__(
+        self,
+        servers: list[str],
+        port: int,
+        ssl: ssl.SSLContext | bool,
+        connections_per_server: int = 2,
+        failure_cooldown: float = 30.0,
+        probe_timeout: float = 5.0,
+    ) -> None:
+        if connections_per_server < 1:
+            msg = f"The number of connections per server must be at least 1. Got {connections_per_server}."
+            raise ValueError(msg)
+
+        self.servers = servers
+        self.failure_cooldown = failure_cooldown
+        self.probe_timeout = probe_timeout
+        # Interleaving the servers, so consecutive calls go to different servers.
+        self._channels = [(server, Channel(host=server, port=port, ssl=ssl)) for _ in range(connections_per_server) for server in servers]
+        self._server_by_channel = {id(channel): server for server, channel in self._channels}
+        self._unhealthy_until = {}
+        self._next_index = 0
+
+    async def get_channel(self) -> Channel:
+        """Return the next channel to a healthy server, probing servers whose cooldown has passed."""
+        for _ in range(len(self._channels)):
+            server, channel = self._channels[self._next_index]
+            self._next_index = (self._next_index + 1) % len(self._channels)
+            if server not in self._unhealthy_until:
+                return channel
+            if self._unhealthy_until[server] <= monotonic() and await self._probe(server, channel):
+                return channel
+
+        # All servers are unhealthy, so trying the server which should recover first.
+        server = min(self.servers, key=lambda server: self._unhealthy_until.get(server, 0.0))
+        return next(channel for channel_server, channel in self._channels if channel_server == server)
+
+    async def _probe(self, server: str, channel: Channel) -> bool:
+        """Return True if the channel could connect to the server, putting the server back in the pool."""
+        # Starting a new cooldown during the probe, so concurrent calls skip the server instead of probing it again.
+        self._unhealthy_until[server] = monotonic() + self.failure_cooldown
+        try:
+            # Establishing the HTTP/2 connection of the channel, the same way grpclib does before sending the first request.
+            await wait_for(channel.__connect__(), timeout=self.probe_timeout)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            LOGGER.warning("ChannelPool: CloudVision server '%s' is still unreachable: %s", server, e)
+            return False
+
+        self._unhealthy_until.pop(server, None)
+        LOGGER.info("ChannelPool: CloudVision server '%s' is reachable again.", server)
+        return True
+
+    def mark_channel_failed(self, channel: Channel) -> bool:
+        """
+        Mark the server of the given channel as unhealthy.
+
+        Returns:
+            True if any other server is still considered healthy or is due to be probed, so the API call can be retried.
+        """
+        if (server := self._server_by_channel.get(id(channel))) is None:
+            return False
+
+        now = monotonic()
+        self._unhealthy_until[server] = now + self.failure_cooldown
+        LOGGER.warning("ChannelPool: Marked CloudVision server '%s' as unhealthy for %s seconds after a connection error.", server, self.failure_cooldown)
+        return any(self._unhealthy_until.get(other_server, 0.0) <= now for other_server in self.servers)
+
+    def close(self) -> None:
+        for _, channel in self._channels:
+            channel.close()
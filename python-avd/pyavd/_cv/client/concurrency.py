@@ -0,0 +1,172 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from asyncio.exceptions import TimeoutError as AsyncioTimeoutError
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from .exceptions import CVTimeoutError
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from collections.abc import AsyncIterator
+
+LOGGER = getLogger(__name__)
+
+OVERLOAD_GRPC_STATUSES = (Status.RESOURCE_EXHAUSTED, Status.UNAVAILABLE, Status.DEADLINE_EXCEEDED)
+"""GRPC statuses indicating that CloudVision is overloaded or rate limiting the calls."""
+
+# Set while the current task is holding a slot, so nested calls to limited methods do not wait for another slot.
+_HOLDING_SLOT: ContextVar[bool] = ContextVar("_HOLDING_SLOT", default=False)
+
+
+def is_overload_error(exception: BaseException) -> bool:
+    """Return True if the exception indicates that CloudVision is overloaded or rate limiting the calls."""
+    if isinstance(exception, (CVTimeoutError, AsyncioTimeoutError)):
+        return True
+    return isinstance(exception, GRPCError) and exception.status in OVERLOAD_GRPC_STATUSES
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limit the number of concurrent API calls to CloudVision, adapting the limit to the observed latency and errors.
+
+    A new call is started as soon as any call finishes, so the number of calls in flight stays at the limit as long as there are calls waiting.
+
+    The limit is adapted using additive increase / multiplicative decrease:
+    - Every call finishing without an increase in latency raises the limit by 1/limit, so the limit grows by about one per full window of calls.
+    - When the short-term average latency exceeds the long-term average latency by more than `latency_tolerance`,
+      the limit is multiplied by `backoff_factor`. The averages are kept per key given to `slot()`, like the name of the API method,
+      since different RPCs have very different latencies. A streaming call or a large request must not look like increased latency of the others.
+    - Errors indicating that CloudVision is overloaded or rate limiting the calls halve the limit.
+    The limit is decreased at most once per window of calls, so the calls already in flight do not cause repeated decreases.
+    """
+
+    initial_limit: int
+    min_limit: int
+    max_limit: int
+    latency_tolerance: float
+    backoff_factor: float
+    _limit: float
+    _in_flight: int
+    _waiters: deque[Future]
+    _short_latency: dict[str, float]
+    """Exponentially weighted moving average of the latency per key, following changes quickly."""
+    _long_latency: dict[str, float]
+    """Exponentially weighted moving average of the latency per key, following changes slowly."""
+    _calls_since_decrease: int
+
+    def __init__(self, initial_limit: int = 20, min_limit: int = 1, max_limit: int = 64, latency_tolerance: float = 2.0, backoff_factor: float = 0.75) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = f"Invalid concurrency limits. Expected 1 <= min_limit <= initial_limit <= max_limit. Got {min_limit}, {initial_limit}, {max_limit}."
+            raise ValueError(msg)
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_factor = backoff_factor
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters = deque()
+        self._short_latency = {}
+        self._long_latency = {}
+        self._calls_since_decrease = initial_limit
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """
+        Wait for a free slot and hold it for the duration of the context.
+
+        The time spent in the context is used as the latency of the call and any exception is inspected for overload errors.
+        Nested use from the same task reuses the slot already held.
+
+        Parameters:
+            key: Key of the average latency to compare the latency of the call with. Use the same key for calls to the same RPC.
+        """
+        if _HOLDING_SLOT.get():
+            yield
+            return
+
+        await self._acquire()
+        token = _HOLDING_SLOT.set(True)
+        start = perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._on_error(e)
+            raise
+        else:
+            self._on_success(key, perf_counter() - start)
+        finally:
+            _HOLDING_SLOT.reset(token)
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    async def _acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                # Pass on the wake up to another waiter in case this waiter was cancelled after being woken up.
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def _wake_waiters(self) -> None:
+        free_slots = self.limit - self._in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    def _on_success(self, key: str, latency: float) -> None:
+        self._calls_since_decrease += 1
+        if key not in self._short_latency:
+            self._short_latency[key] = self._long_latency[key] = latency
+        else:
+            self._short_latency[key] += 0.3 * (latency - self._short_latency[key])
+            self._long_latency[key] += 0.05 * (latency - self._long_latency[key])
+
+        if self._short_latency[key] > self.latency_tolerance * self._long_latency[key]:
+            self._decrease(self.backoff_factor, "increased latency")
+        else:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _on_error(self, exception: BaseException) -> None:
+        self._calls_since_decrease += 1
+        if is_overload_error(exception):
+            self._decrease(0.5, f"overload error '{type(exception).__name__}'")
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        if self._calls_since_decrease < self.limit:
+            return
+
+        self._limit = max(self.min_limit, self._limit * factor)
+        self._calls_since_decrease = 0
+        LOGGER.info("AdaptiveConcurrencyLimiter: Decreased the limit of concurrent calls to %s due to %s.", self.limit, reason)
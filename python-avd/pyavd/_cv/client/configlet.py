@@ -25,19 +25,21 @@ from pyavd._cv.api.arista.configlet.v1 import (
     ConfigletKey,
     ConfigletServiceStub,
     ConfigletStreamRequest,
+    Filter,
     MatchPolicy,
 )
 from pyavd._cv.api.arista.time import TimeBounds
 from pyavd._cv.api.fmp import RepeatedString
-from pyavd._utils import batch
 
-from .async_decorators import LimitCvVersion, grpc_msg_size_handler
+from .async_decorators import LimitCvVersion, channel_failover, grpc_msg_size_handler, limit_concurrency
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from grpclib.client import Channel
+
     from . import CVClient
 
 ASSIGNMENT_MATCH_POLICY_MAP = {
@@ -45,7 +47,6 @@ ASSIGNMENT_MATCH_POLICY_MAP = {
     "match_all": MatchPolicy.MATCH_ALL,
     None: MatchPolicy.UNSPECIFIED,
 }
-PARALLEL_COROUTINES = 20
 
 LOGGER = getLogger(__name__)
 
@@ -55,12 +56,16 @@ class ConfigletMixin:
 
     configlet_api_version: Literal["v1"] = "v1"
 
+    @limit_concurrency
+    @channel_failover
     async def get_configlet_containers(
         self: CVClient,
         workspace_id: str,
         container_ids: list[str] | None = None,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[ConfigletAssignment]:
         """
         Get Configlet Containers (a.k.a. Assignments) using arista.configlet.v1.ConfigletAssignmentServiceStub.GetAll API.
@@ -83,7 +88,7 @@ class ConfigletMixin:
         else:
             request.partial_eq_filter.append(ConfigletAssignment(key=ConfigletAssignmentKey(workspace_id=workspace_id)))
 
-        client = ConfigletAssignmentServiceStub(self._channel)
+        client = ConfigletAssignmentServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             configlet_assignments = [response.value async for response in responses]
@@ -92,6 +97,8 @@ class ConfigletMixin:
 
         return configlet_assignments
 
+    @limit_concurrency
+    @channel_failover
     async def set_configlet_container(
         self: CVClient,
         workspace_id: str,
@@ -103,6 +110,8 @@ class ConfigletMixin:
         child_assignment_ids: list[str] | None = None,
         match_policy: Literal["match_first", "match_all"] = "match_all",
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ConfigletAssignmentConfig:
         """
         Create/update a Configlet Container (a.k.a. Assignment) using arista.configlet.v1.ConfigletAssignmentServiceStub.Set API.
@@ -128,7 +137,7 @@ class ConfigletMixin:
                 match_policy=ASSIGNMENT_MATCH_POLICY_MAP.get(match_policy or "match_all"),
             ),
         )
-        client = ConfigletAssignmentConfigServiceStub(self._channel)
+        client = ConfigletAssignmentConfigServiceStub(channel)
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -138,11 +147,15 @@ class ConfigletMixin:
 
     @LimitCvVersion(min_ver="2024.2.0")
     @grpc_msg_size_handler("containers")
+    @limit_concurrency
+    @channel_failover
     async def set_configlet_containers(
         self: CVClient,
         workspace_id: str,
         containers: list[tuple[str, str | None, str | None, list[str] | None, str | None, list[str] | None, str | None]],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[ConfigletAssignmentKey]:
         """
         Create/update a Configlet Container (a.k.a. Assignment) using arista.configlet.v1.ConfigletAssignmentServiceStub.SetSome API.
@@ -170,7 +183,7 @@ class ConfigletMixin:
                 for container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy in containers
             ],
         )
-        client = ConfigletAssignmentConfigServiceStub(self._channel)
+        client = ConfigletAssignmentConfigServiceStub(channel)
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout)
             assignment_keys = [response.key async for response in responses]
@@ -188,7 +201,7 @@ class ConfigletMixin:
         timeout: float = DEFAULT_API_TIMEOUT,
     ) -> list[ConfigletAssignmentKey]:
         """
-        Create batches of containers and do parallel calls to set_configlet_container for each batch.
+        Do concurrent calls to set_configlet_container for each container.
 
         Parameters:
             workspace_id: Unique identifier of the Workspace for which the information is fetched.
@@ -214,25 +227,23 @@ class ConfigletMixin:
             for container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy in containers
         ]
 
-        configlet_configs = []
-
-        LOGGER.info("set_configlet_containers: Deploying %s configlet assignments / containers in batches of %s.", len(coroutines), PARALLEL_COROUTINES)
-        for index, batch_coroutines in enumerate(batch(coroutines, PARALLEL_COROUTINES), start=1):
-            LOGGER.info("set_configlet_containers: Batch %s", index)
-            configlet_configs.extend(await gather(*batch_coroutines))
-
-        return [
-            await self.set_configlet_container(
-                workspace_id, container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy, timeout
-            )
-            for container_id, display_name, description, configlet_ids, query, child_assignment_ids, match_policy in containers
-        ]
+        # The number of concurrent calls is limited by the concurrency limiter of the client.
+        LOGGER.info(
+            "set_configlet_containers: Deploying %s configlet assignments / containers with up to %s concurrent calls.",
+            len(coroutines),
+            self._concurrency_limiter.limit,
+        )
+        return list(await gather(*coroutines))
 
+    @limit_concurrency
+    @channel_failover
     async def delete_configlet_container(
         self: CVClient,
         workspace_id: str,
         assignment_id: str,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ConfigletAssignmentConfig:
         """
         Delete a Configlet Container (a.k.a. Assignment) using arista.configlet.v1.ConfigletAssignmentServiceStub.Set API.
@@ -250,7 +261,7 @@ class ConfigletMixin:
                 remove=True,
             ),
         )
-        client = ConfigletAssignmentConfigServiceStub(self._channel)
+        client = ConfigletAssignmentConfigServiceStub(channel)
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -259,12 +270,17 @@ class ConfigletMixin:
         return response.value
 
     @grpc_msg_size_handler("configlet_ids")
+    @limit_concurrency
+    @channel_failover
     async def get_configlets(
         self: CVClient,
         workspace_id: str,
         configlet_ids: list[str] | None = None,
         time: datetime | None = None,
+        include_body: bool = False,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[Configlet]:
         """
         Get Configlets using arista.configlet.v1.ConfigletServiceStub.GetAll API.
@@ -275,19 +291,20 @@ class ConfigletMixin:
             workspace_id: Unique identifier of the Workspace for which the information is fetched. Use "" for mainline.
             configlet_ids: Unique identifiers for Configlets. If not set the function will return all configlets.
             time: Timestamp from which the information is fetched. `now()` if not set.
+            include_body: Also return the body of the Configlets. Use the digest to compare the content without transferring the body.
             timeout: Timeout in seconds.
 
         Returns:
             List of matching Configlet objects.
         """
-        request = ConfigletStreamRequest(partial_eq_filter=[], time=TimeBounds(start=None, end=time))
+        request = ConfigletStreamRequest(partial_eq_filter=[], filter=Filter(include_body=include_body), time=TimeBounds(start=None, end=time))
         if configlet_ids:
             for configlet_id in configlet_ids:
                 request.partial_eq_filter.append(Configlet(key=ConfigletKey(workspace_id=workspace_id, configlet_id=configlet_id)))
         else:
             request.partial_eq_filter.append(Configlet(key=ConfigletKey(workspace_id=workspace_id)))
 
-        client = ConfigletServiceStub(self._channel)
+        client = ConfigletServiceStub(channel)
 
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
@@ -297,6 +314,8 @@ class ConfigletMixin:
 
         return configlets
 
+    @limit_concurrency
+    @channel_failover
     async def set_configlet(
         self: CVClient,
         workspace_id: str,
@@ -305,6 +324,8 @@ class ConfigletMixin:
         description: str | None = None,
         body: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ConfigletConfig:
         """
         Create/update a Configlet using arista.configlet.v1.ConfigletServiceStub.Set API.
@@ -328,7 +349,7 @@ class ConfigletMixin:
                 body=body,
             ),
         )
-        client = ConfigletConfigServiceStub(self._channel)
+        client = ConfigletConfigServiceStub(channel)
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -336,6 +357,8 @@ class ConfigletMixin:
 
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def set_configlet_from_file(
         self: CVClient,
         workspace_id: str,
@@ -344,6 +367,8 @@ class ConfigletMixin:
         display_name: str | None = None,
         description: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> ConfigletConfig:
         """
         Create/update a Configlet using arista.configlet.v1.ConfigletServiceStub.Set API.
@@ -367,7 +392,7 @@ class ConfigletMixin:
                 body=Path(file).read_text(encoding="UTF-8"),
             ),
         )
-        client = ConfigletConfigServiceStub(self._channel)
+        client = ConfigletConfigServiceStub(channel)
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -377,11 +402,15 @@ class ConfigletMixin:
 
     @LimitCvVersion(min_ver="2024.2.0")
     @grpc_msg_size_handler("configlets")
+    @limit_concurrency
+    @channel_failover
     async def set_configlets_from_files(
         self: CVClient,
         workspace_id: str,
         configlets: list[tuple[str, str]],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[ConfigletKey]:
         """
         Create/update multiple Configlets using arista.configlet.v1.ConfigletServiceStub.SetSome API.
@@ -405,7 +434,7 @@ class ConfigletMixin:
                     body=Path(file).read_text(encoding="UTF-8"),
                 )
             )
-        client = ConfigletConfigServiceStub(self._channel)
+        client = ConfigletConfigServiceStub(channel)
 
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout)
@@ -425,7 +454,7 @@ class ConfigletMixin:
         timeout: float = DEFAULT_API_TIMEOUT,
     ) -> list[ConfigletKey]:
         """
-        Create batches of configlets and do parallel calls to set_configlet_from_file for each batch.
+        Do concurrent calls to set_configlet_from_file for each configlet.
 
         Parameters:
             workspace_id: Unique identifier of the Workspace for which the information is fetched.
@@ -447,19 +476,20 @@ class ConfigletMixin:
             for configlet_id, display_name, description, file in configlets
         ]
 
-        configlet_configs = []
-
-        LOGGER.info("set_configlets_from_files: Deploying %s configlets in batches of %s.", len(coroutines), PARALLEL_COROUTINES)
-        for index, batch_coroutines in enumerate(batch(coroutines, PARALLEL_COROUTINES), start=1):
-            LOGGER.info("set_configlets_from_files: Batch %s", index)
-            configlet_configs.extend(await gather(*batch_coroutines))
+        # The number of concurrent calls is limited by the concurrency limiter of the client.
+        LOGGER.info("set_configlets_from_files: Deploying %s configlets with up to %s concurrent calls.", len(coroutines), self._concurrency_limiter.limit)
+        return list(await gather(*coroutines))
 
     @grpc_msg_size_handler("configlet_ids")
+    @limit_concurrency
+    @channel_failover
     async def delete_configlets(
         self: CVClient,
         workspace_id: str,
         configlet_ids: list[str],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[ConfigletKey]:
         """
         Delete a Configlet using arista.configlet.v1.ConfigletServiceStub.SetSome API.
@@ -480,7 +510,7 @@ class ConfigletMixin:
                     remove=True,
                 ),
             )
-        client = ConfigletConfigServiceStub(self._channel)
+        client = ConfigletConfigServiceStub(channel)
 
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout)
@@ -8,12 +8,15 @@ from typing import TYPE_CHECKING, Literal
 from pyavd._cv.api.arista.inventory.v1 import Device, DeviceKey, DeviceServiceStub, DeviceStreamRequest
 from pyavd._cv.api.arista.time import TimeBounds
 
+from .async_decorators import channel_failover
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from grpclib.client import Channel
+
     from . import CVClient
 
 
@@ -22,11 +25,14 @@ class InventoryMixin:
 
     inventory_api_version: Literal["v1"] = "v1"
 
+    @channel_failover
     async def get_inventory_devices(
         self: CVClient,
         devices: list[tuple[str, str, str]] | None = None,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[Device]:
         """
         Get Devices using arista.inventory.v1.DeviceService.GetAll API.
@@ -51,7 +57,7 @@ class InventoryMixin:
                         hostname=hostname,
                     ),
                 )
-        client = DeviceServiceStub(self._channel)
+        client = DeviceServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             inventory_devices = [response.value async for response in responses]
@@ -29,12 +29,15 @@ from pyavd._cv.api.arista.studio.v1 import (
 from pyavd._cv.api.arista.time import TimeBounds
 from pyavd._cv.api.fmp import RepeatedString
 
+from .async_decorators import channel_failover, limit_concurrency
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import CVResourceNotFound, get_cv_client_exception
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from grpclib.client import Channel
+
     from . import CVClient
 
 LOGGER = getLogger(__name__)
@@ -47,12 +50,16 @@ class StudioMixin:
 
     studio_api_version: Literal["v1"] = "v1"
 
+    @limit_concurrency
+    @channel_failover
     async def get_studio(
         self: CVClient,
         studio_id: str,
         workspace_id: str,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> Studio:
         """
         Get Studio definition using arista.studio.v1.StudioService.GetOne.
@@ -75,7 +82,7 @@ class StudioMixin:
             key=StudioKey(studio_id=studio_id, workspace_id=workspace_id),
             time=time,
         )
-        client = StudioServiceStub(self._channel)
+        client = StudioServiceStub(channel)
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -101,7 +108,7 @@ class StudioMixin:
             ],
             time=TimeBounds(start=None, end=time),
         )
-        client = StudioConfigServiceStub(self._channel)
+        client = StudioConfigServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             async for _response in responses:
@@ -117,7 +124,7 @@ class StudioMixin:
             key=StudioKey(studio_id=studio_id, workspace_id=""),
             time=time,
         )
-        client = StudioServiceStub(self._channel)
+        client = StudioServiceStub(channel)
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -125,6 +132,8 @@ class StudioMixin:
 
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def get_studio_inputs(
         self: CVClient,
         studio_id: str,
@@ -132,6 +141,8 @@ class StudioMixin:
         default_value: Any = None,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> Any:
         """
         Get Studio Inputs using arista.studio.v1.InputsService.GetAll and arista.studio.v1.InputsConfigServer.GetAll APIs.
@@ -159,7 +170,7 @@ class StudioMixin:
             ],
             time=time,
         )
-        client = InputsServiceStub(self._channel)
+        client = InputsServiceStub(channel)
         studio_inputs = {}
         try:
             # We use get_all since inputs can be larger than the maximum message size.
@@ -194,7 +205,7 @@ class StudioMixin:
             ],
             time=time,
         )
-        client = InputsConfigServiceStub(self._channel)
+        client = InputsConfigServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             async for _response in responses:
@@ -214,7 +225,7 @@ class StudioMixin:
             ],
             time=time,
         )
-        client = InputsServiceStub(self._channel)
+        client = InputsServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             async for response in responses:
@@ -231,6 +242,8 @@ class StudioMixin:
 
         return studio_inputs or default_value
 
+    @limit_concurrency
+    @channel_failover
     async def get_studio_inputs_with_path(
         self: CVClient,
         studio_id: str,
@@ -239,6 +252,8 @@ class StudioMixin:
         default_value: Any = None,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> Any:
         """
         Get Studio Inputs for a specific path using arista.studio.v1.InputsService.GetOne and arista.studio.v1.InputsConfigServer.GetAll APIs.
@@ -267,7 +282,7 @@ class StudioMixin:
             ),
             time=time,
         )
-        client = InputsServiceStub(self._channel)
+        client = InputsServiceStub(channel)
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -297,7 +312,7 @@ class StudioMixin:
             ),
             time=time,
         )
-        client = InputsConfigServiceStub(self._channel)
+        client = InputsConfigServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             async for _response in responses:
@@ -317,7 +332,7 @@ class StudioMixin:
             ),
             time=time,
         )
-        client = InputsServiceStub(self._channel)
+        client = InputsServiceStub(channel)
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:  # pylint: disable=broad-exception-caught
@@ -331,6 +346,8 @@ class StudioMixin:
             return json.loads(response.value.inputs)
         return default_value
 
+    @limit_concurrency
+    @channel_failover
     async def set_studio_inputs(
         self: CVClient,
         studio_id: str,
@@ -338,6 +355,8 @@ class StudioMixin:
         inputs: Any,
         input_path: list[str] | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> InputsConfig:
         """
         Set Studio Inputs using arista.studio.v1.InputsConfigService.Set API.
@@ -364,7 +383,7 @@ class StudioMixin:
                 inputs=json.dumps(inputs),
             ),
         )
-        client = InputsConfigServiceStub(self._channel)
+        client = InputsConfigServiceStub(channel)
         try:
             response = await client.set(request, metadata=self._metadata, timeout=timeout)
         except Exception as e:
@@ -428,11 +447,15 @@ class StudioMixin:
             )
         return topology_inputs
 
+    @limit_concurrency
+    @channel_failover
     async def set_topology_studio_inputs(
         self: CVClient,
         workspace_id: str,
         device_inputs: list[tuple[str, str, str]],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[InputsKey]:
         """
         Set Topology Studio Inputs using arista.studio.v1.InputsConfigService.Set API.
@@ -495,7 +518,7 @@ class StudioMixin:
             )
 
         input_keys = []
-        client = InputsConfigServiceStub(self._channel)
+        client = InputsConfigServiceStub(channel)
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout + len(request.values) * 0.1)
             input_keys = [response.key async for response in responses]
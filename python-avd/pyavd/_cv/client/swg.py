@@ -18,10 +18,13 @@ from pyavd._cv.api.arista.swg.v1 import (
     SwgKey,
 )
 
+from .async_decorators import channel_failover
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
 if TYPE_CHECKING:
+    from grpclib.client import Channel
+
     from . import CVClient
 
 LOGGER = getLogger(__name__)
@@ -37,12 +40,15 @@ class SwgMixin:
 
     swg_api_version: Literal["v1"] = "v1"
 
+    @channel_failover
     async def set_swg_device(
         self: CVClient,
         device_id: str,
         service: Literal["zscaler"],
         location: str,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> tuple[datetime, EndpointConfig]:
         """
         Set SWG Endpoints using arista.swg.v1.EndpointStatusService.Set API.
@@ -63,7 +69,7 @@ class SwgMixin:
                 address=location,
             ),
         )
-        client = EndpointConfigServiceStub(self._channel)
+        client = EndpointConfigServiceStub(channel)
 
         try:
             LOGGER.info("set_swg_device: Setting location for '%s': %s", device_id, location)
@@ -73,12 +79,15 @@ class SwgMixin:
 
         return response.time, response.value
 
+    @channel_failover
     async def wait_for_swg_endpoint_status(
         self: CVClient,
         device_id: str,
         service: Literal["zscaler"],
         start_time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> EndpointStatus:
         """
         Subscribe and wait for one SWG Endpoint using arista.swg.v1.EndpointStatusService.Subscribe API.
@@ -101,7 +110,7 @@ class SwgMixin:
                 ),
             ],
         )
-        client = EndpointStatusServiceStub(self._channel)
+        client = EndpointStatusServiceStub(channel)
 
         try:
             responses = client.subscribe(request, metadata=self._metadata, timeout=timeout)
@@ -26,13 +26,18 @@ from pyavd._cv.api.arista.tag.v2 import (
     TagStreamRequest,
 )
 from pyavd._cv.api.arista.time import TimeBounds
+from pyavd._utils import batch
 
+from .async_decorators import channel_failover, grpc_msg_size_handler, limit_concurrency
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from datetime import datetime
 
+    from grpclib.client import Channel
+
     from . import CVClient
 
 ELEMENT_TYPE_MAP = {
@@ -48,6 +53,9 @@ CREATOR_TYPE_MAP = {
     None: CreatorType.UNSPECIFIED,
 }
 
+TAG_ASSIGNMENTS_PAGE_SIZE = 100
+"""Number of devices for which tag assignments are fetched per page in `stream_tag_assignments`."""
+
 
 class TagMixin:
     """Only to be used as mixin on CVClient class."""
@@ -55,13 +63,18 @@ class TagMixin:
     tags_api_version: Literal["v2"] = "v2"
     # TODO: Ensure the to document that we only support v2 of this api - hence only the CV versions supporting that.
 
+    @limit_concurrency
+    @channel_failover
     async def get_tags(
         self: CVClient,
         workspace_id: str,
         element_type: Literal["device", "interface"] | None = None,
         creator_type: Literal["user", "system", "external"] | None = None,
         time: datetime | None = None,
+        labels: list[str] | None = None,
         timeout: float = 30.0,
+        *,
+        channel: Channel,
     ) -> list[Tag]:
         """
         Get Tags using arista.tag.v2.TagServiceStub.GetAll arista.tag.v2.TagConfigServiceStub.GetAll APIs.
@@ -74,6 +87,7 @@ class TagMixin:
             element_type: Optionally filter tags on type.
             creator_type: Optionally filter tags on creator type.
             time: Timestamp from which the information is fetched. `now()` if not set.
+            labels: Optionally filter tags on labels. The filtering is done by the server.
             timeout: Timeout in seconds.
 
         TODO: Consider if we should add sub_type.
@@ -82,55 +96,66 @@ class TagMixin:
             List of Tag objects.
         """
         request = TagStreamRequest(
-            partial_eq_filter=Tag(
-                # Notice the "" for workspace, since we are fetching mainline.
-                key=TagKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type]),
-                creator_type=CREATOR_TYPE_MAP[creator_type],
-            ),
+            partial_eq_filter=[
+                Tag(
+                    # Notice the "" for workspace, since we are fetching mainline.
+                    key=TagKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type], label=label),
+                    creator_type=CREATOR_TYPE_MAP[creator_type],
+                )
+                for label in labels or [None]
+            ],
             time=TimeBounds(start=None, end=time),
         )
-        client = TagServiceStub(self._channel)
+        client = TagServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
-            tags = [response.value async for response in responses]
+            # Tags keyed by (element_type, label, value) so the workspace changes can be played back without scanning the list.
+            tags = {(response.value.key.element_type, response.value.key.label, response.value.key.value): response.value async for response in responses}
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '' (main), Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
         # Now tags contain all mainline tags.
         if workspace_id == "" or creator_type in ["system", "external"]:
-            return tags
+            return list(tags.values())
 
         # Next up fetch the tags config from the workspace if workspace is not "".
         request = TagConfigStreamRequest(
-            partial_eq_filter=TagConfig(
-                # This time fetch for the actual workspace we are interested in.
-                key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type]),
-            ),
+            partial_eq_filter=[
+                TagConfig(
+                    # This time fetch for the actual workspace we are interested in.
+                    key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type], label=label),
+                )
+                for label in labels or [None]
+            ],
             time=TimeBounds(start=None, end=time),
         )
-        client = TagConfigServiceStub(self._channel)
+        client = TagConfigServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
             async for response in responses:
                 tag_config = response.value
-
-                # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag.
-                tag = Tag(key=tag_config.key, creator_type=CreatorType.USER)
+                tag_index = (tag_config.key.element_type, tag_config.key.label, tag_config.key.value)
                 if tag_config.remove:
-                    self._remove_item_from_list(tag, tags, self._match_tags)
+                    # Ignore if the tag is not present. This happens if you add a tag in a workspace and then remove it again.
+                    tags.pop(tag_index, None)
                 else:
-                    self._upsert_item_in_list(tag, tags, self._match_tags)
+                    # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag.
+                    tags[tag_index] = Tag(key=tag_config.key, creator_type=CreatorType.USER)
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '{workspace_id}', Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
-        return tags
+        return list(tags.values())
 
+    @limit_concurrency
+    @channel_failover
     async def set_tags(
         self: CVClient,
         workspace_id: str,
         tags: list[tuple[str, str]],
         element_type: Literal["device", "interface"],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[TagKey]:
         """
         Set Tags using arista.tag.v2.TagConfigServiceStub.SetSome API.
@@ -159,7 +184,7 @@ class TagMixin:
                 ),
             )
 
-        client = TagConfigServiceStub(self._channel)
+        client = TagConfigServiceStub(channel)
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout + len(request.values) * 0.1)
             # Recreating a full tag object. Since we just created it, it *must* be a user created tag.
@@ -169,82 +194,155 @@ class TagMixin:
 
         return tag_keys
 
+    @grpc_msg_size_handler("device_ids")
+    @limit_concurrency
+    @channel_failover
     async def get_tag_assignments(
         self: CVClient,
         workspace_id: str,
         element_type: Literal["device", "interface"] | None = None,
         creator_type: Literal["user", "system", "external"] | None = None,
         time: datetime | None = None,
+        labels: list[str] | None = None,
+        device_ids: list[str] | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[TagAssignment]:
         """
-        Get Tags using arista.tag.v2.TagAssignmentServiceStub.GetAll arista.tag.v2.TagAssignmentConfigServiceStub.GetAll APIs.
+        Get Tag assignments using arista.tag.v2.TagAssignmentServiceStub.GetAll arista.tag.v2.TagAssignmentConfigServiceStub.GetAll APIs.
 
         The TagAssignment GetAll API for the workspace does not return anything from mainline and does not return deletions in the workspace.
         So to produce the workspace tag assignments we need to fetch mainline and then "play back" each config change from the workspace.
+        The config changes of the workspace are fetched first and indexed, so they can be applied while receiving the mainline tag assignments.
+
+        Filters for labels and device IDs are combined, so only assignments matching one of the labels *and* one of the devices are returned.
+        Only one of the filters is sent to the server, so the request grows with the number of devices and not with labels times devices.
+        If device IDs are given, the server filters on those and the labels are filtered here. Otherwise the server filters on the labels.
+        If the request exceeds the gRPC message size, it is split into smaller requests for fewer devices.
 
         Parameters:
             workspace_id: Unique identifier of the Workspace for which the information is fetched.
             element_type: Optionally filter tag assignments on tag type.
             creator_type: Optionally filter tag assignments on tag creator type.
             time: Timestamp from which the information is fetched. `now()` if not set.
+            labels: Optionally filter tag assignments on tag labels.
+            device_ids: Optionally filter tag assignments on device IDs. Must be given as a list, but may be empty.
             timeout: Timeout in seconds.
 
         TODO: Consider if we should add sub_type.
 
         Returns:
-            Workspace object matching the workspace_id
+            List of TagAssignment objects.
         """
+        filter_keys = [(None, device_id) for device_id in device_ids] if device_ids else [(label, None) for label in labels or [None]]
+        client_labels = set(labels) if labels and device_ids else None
+
+        # Workspace changes keyed by (element_type, label, value, device_id, interface_id). Value is None for removed assignments.
+        workspace_tag_assignments: dict[tuple, TagAssignment | None] = {}
+        if workspace_id != "" and creator_type not in ["system", "external"]:
+            request = TagAssignmentConfigStreamRequest(
+                partial_eq_filter=[
+                    TagAssignmentConfig(
+                        key=TagAssignmentKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type], label=label, device_id=device_id),
+                    )
+                    for label, device_id in filter_keys
+                ],
+                time=TimeBounds(start=None, end=time),
+            )
+            client = TagAssignmentConfigServiceStub(channel)
+            try:
+                responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
+                async for response in responses:
+                    tag_assignment_config = response.value
+                    if client_labels is not None and tag_assignment_config.key.label not in client_labels:
+                        continue
+                    # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag assignment.
+                    workspace_tag_assignments[self._get_tag_assignment_index(tag_assignment_config)] = (
+                        None if tag_assignment_config.remove else TagAssignment(key=tag_assignment_config.key, tag_creator_type=CreatorType.USER)
+                    )
+            except Exception as e:
+                raise get_cv_client_exception(e, f"Workspace ID '{workspace_id}', Element Type '{element_type}', Creator Type '{creator_type}'") or e
+
         request = TagAssignmentStreamRequest(
-            partial_eq_filter=TagAssignment(
-                # Notice the "" for workspace, since we are fetching mainline.
-                key=TagAssignmentKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type]),
-                tag_creator_type=CREATOR_TYPE_MAP[creator_type],
-            ),
+            partial_eq_filter=[
+                TagAssignment(
+                    # Notice the "" for workspace, since we are fetching mainline.
+                    key=TagAssignmentKey(workspace_id="", element_type=ELEMENT_TYPE_MAP[element_type], label=label, device_id=device_id),
+                    tag_creator_type=CREATOR_TYPE_MAP[creator_type],
+                )
+                for label, device_id in filter_keys
+            ],
             time=TimeBounds(start=None, end=time),
         )
-        client = TagAssignmentServiceStub(self._channel)
+        client = TagAssignmentServiceStub(channel)
         try:
             responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
-            tag_assignments = [response.value async for response in responses]
+            # Assignments changed in the workspace are added below.
+            tag_assignments = [
+                response.value
+                async for response in responses
+                if (client_labels is None or response.value.key.label in client_labels)
+                and self._get_tag_assignment_index(response.value) not in workspace_tag_assignments
+            ]
         except Exception as e:
             raise get_cv_client_exception(e, f"Workspace ID '' (main), Element Type '{element_type}', Creator Type '{creator_type}'") or e
 
-        # Now tags contain all mainline tags.
-        if workspace_id == "" or creator_type in ["system", "external"]:
-            return tag_assignments
+        tag_assignments.extend(tag_assignment for tag_assignment in workspace_tag_assignments.values() if tag_assignment is not None)
+        return tag_assignments
 
-        # Next up fetch the tags config from the workspace if workspace is not "".
-        request = TagAssignmentConfigStreamRequest(
-            partial_eq_filter=TagAssignmentConfig(
-                # This time fetch for the actual workspace we are interested in.
-                key=TagKey(workspace_id=workspace_id, element_type=ELEMENT_TYPE_MAP[element_type]),
-            ),
-            time=TimeBounds(start=None, end=time),
-        )
-        client = TagAssignmentConfigServiceStub(self._channel)
-        try:
-            responses = client.get_all(request, metadata=self._metadata, timeout=timeout)
-            async for response in responses:
-                tag_assignment_config = response.value
+    async def stream_tag_assignments(
+        self: CVClient,
+        workspace_id: str,
+        element_type: Literal["device", "interface"] | None = None,
+        creator_type: Literal["user", "system", "external"] | None = None,
+        time: datetime | None = None,
+        labels: list[str] | None = None,
+        device_ids: list[str] | None = None,
+        timeout: float = DEFAULT_API_TIMEOUT,
+    ) -> AsyncIterator[TagAssignment]:
+        """
+        Yield Tag assignments page by page, fetching each page with `get_tag_assignments` for up to TAG_ASSIGNMENTS_PAGE_SIZE devices.
 
-                # Recreating a full tag object. Since this was in the workspace, it *must* be a user created tag assignment.
-                tag_assignment = TagAssignment(key=tag_assignment_config.key, tag_creator_type=CreatorType.USER)
-                if tag_assignment_config.remove:
-                    self._remove_item_from_list(tag_assignment, tag_assignments, self._match_tag_assignments)
-                else:
-                    self._upsert_item_in_list(tag_assignment, tag_assignments, self._match_tag_assignments)
-        except Exception as e:
-            raise get_cv_client_exception(e, f"Workspace ID '{workspace_id}', Element Type '{element_type}', Creator Type '{creator_type}'") or e
+        Each page is fetched within its own slot of the concurrency limiter and yielded after releasing the slot,
+        so the consumer can process one page while other calls run, and never runs while holding the slot.
+        Without device IDs, all tag assignments are fetched as a single page.
 
-        return tag_assignments
+        Parameters:
+            workspace_id: Unique identifier of the Workspace for which the information is fetched.
+            element_type: Optionally filter tag assignments on tag type.
+            creator_type: Optionally filter tag assignments on tag creator type.
+            time: Timestamp from which the information is fetched. `now()` if not set.
+            labels: Optionally filter tag assignments on tag labels.
+            device_ids: Optionally filter tag assignments on device IDs.
+            timeout: Timeout in seconds per page.
+
+        Yields:
+            TagAssignment objects.
+        """
+        for page_device_ids in batch(device_ids, TAG_ASSIGNMENTS_PAGE_SIZE) if device_ids else [[]]:
+            page = await self.get_tag_assignments(
+                workspace_id=workspace_id,
+                element_type=element_type,
+                creator_type=creator_type,
+                time=time,
+                labels=labels,
+                device_ids=page_device_ids,
+                timeout=timeout,
+            )
+            for tag_assignment in page:
+                yield tag_assignment
 
+    @limit_concurrency
+    @channel_failover
     async def set_tag_assignments(
         self: CVClient,
         workspace_id: str,
         tag_assignments: list[tuple[str, str, str, str | None]],
         element_type: Literal["device", "interface"],
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> list[TagAssignment]:
         """
         Set Tags using arista.tag.v2.TagConfigServiceStub.SetSome API.
@@ -275,7 +373,7 @@ class TagMixin:
                 ),
             )
 
-        client = TagAssignmentConfigServiceStub(self._channel)
+        client = TagAssignmentConfigServiceStub(channel)
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout + len(request.values) * 0.1)
             tag_assignment_keys = [response.key async for response in responses]
@@ -284,12 +382,16 @@ class TagMixin:
 
         return tag_assignment_keys
 
+    @limit_concurrency
+    @channel_failover
     async def delete_tag_assignments(
         self: CVClient,
         workspace_id: str,
         tag_assignments: list[tuple[str, str, str, str | None]],
         element_type: Literal["device", "interface"],
         timeout: float = 30.0,
+        *,
+        channel: Channel,
     ) -> list[TagAssignmentKey]:
         """
         Set Tags using arista.tag.v2.TagConfigServiceStub.SetSome API.
@@ -321,7 +423,7 @@ class TagMixin:
                 ),
             )
 
-        client = TagAssignmentConfigServiceStub(self._channel)
+        client = TagAssignmentConfigServiceStub(channel)
         try:
             responses = client.set_some(request, metadata=self._metadata, timeout=timeout + len(request.values) * 0.1)
             tag_assignment_keys = [response.key async for response in responses]
@@ -331,19 +433,7 @@ class TagMixin:
         return tag_assignment_keys
 
     @staticmethod
-    def _match_tags(a: Tag, b: Tag) -> bool:
-        """Match up the properties of two tags without looking at the Workspace and Creator Type fields."""
-        return all([a.key.element_type == b.key.element_type, a.key.label == b.key.label, a.key.value == b.key.value])
-
-    @staticmethod
-    def _match_tag_assignments(a: TagAssignment, b: TagAssignment) -> bool:
-        """Match up the properties of two tag assignments without looking at the Workspace and Creator Type fields."""
-        return all(
-            [
-                a.key.element_type == b.key.element_type,
-                a.key.label == b.key.label,
-                a.key.value == b.key.value,
-                a.key.device_id == b.key.device_id,
-                a.key.interface_id == b.key.interface_id,
-            ],
-        )
+    def _get_tag_assignment_index(tag_assignment: TagAssignment | TagAssignmentConfig) -> tuple:
+        """Return a tuple identifying the tag assignment without looking at the Workspace and Creator Type fields."""
+        key = tag_assignment.key
+        return (key.element_type, key.label, key.value, key.device_id, key.interface_id)
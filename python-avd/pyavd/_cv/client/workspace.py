@@ -22,12 +22,15 @@ from pyavd._cv.api.arista.workspace.v1 import (
     WorkspaceStreamRequest,
 )
 
+from .async_decorators import channel_failover, limit_concurrency
 from .constants import DEFAULT_API_TIMEOUT
 from .exceptions import get_cv_client_exception
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    from grpclib.client import Channel
+
     from . import CVClient
 
 LOGGER = getLogger(__name__)
@@ -47,11 +50,15 @@ class WorkspaceMixin:
 
     workspace_api_version: Literal["v1"] = "v1"
 
+    @limit_concurrency
+    @channel_failover
     async def get_workspace(
         self: CVClient,
         workspace_id: str,
         time: datetime | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> Workspace:
         """
         Get Workspace using arista.workspace.v1.WorkspaceService.GetOne API.
@@ -70,7 +77,7 @@ class WorkspaceMixin:
             ),
             time=time,
         )
-        client = WorkspaceServiceStub(self._channel)
+        client = WorkspaceServiceStub(channel)
 
         try:
             response = await client.get_one(request, metadata=self._metadata, timeout=timeout)
@@ -79,12 +86,16 @@ class WorkspaceMixin:
 
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def create_workspace(
         self: CVClient,
         workspace_id: str,
         display_name: str | None = None,
         description: str | None = None,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> WorkspaceConfig:
         """
         Create Workspace using arista.workspace.v1.WorkspaceConfigService.Set API.
@@ -105,14 +116,18 @@ class WorkspaceMixin:
                 description=description,
             ),
         )
-        client = WorkspaceConfigServiceStub(self._channel)
+        client = WorkspaceConfigServiceStub(channel)
         response = await client.set(request, metadata=self._metadata, timeout=timeout)
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def abandon_workspace(
         self: CVClient,
         workspace_id: str,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> WorkspaceConfig:
         """
         Abandon Workspace using arista.workspace.v1.WorkspaceConfigService.Set API.
@@ -133,14 +148,18 @@ class WorkspaceMixin:
                 ),
             ),
         )
-        client = WorkspaceConfigServiceStub(self._channel)
+        client = WorkspaceConfigServiceStub(channel)
         response = await client.set(request, metadata=self._metadata, timeout=timeout)
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def build_workspace(
         self: CVClient,
         workspace_id: str,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> WorkspaceConfig:
         """
         Request a build of the Workspace using arista.workspace.v1.WorkspaceConfigService.Set API.
@@ -161,14 +180,18 @@ class WorkspaceMixin:
                 ),
             ),
         )
-        client = WorkspaceConfigServiceStub(self._channel)
+        client = WorkspaceConfigServiceStub(channel)
         response = await client.set(request, metadata=self._metadata, timeout=timeout)
         return response.value
 
+    @limit_concurrency
+    @channel_failover
     async def delete_workspace(
         self: CVClient,
         workspace_id: str,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> WorkspaceKey:
         """
         Delete Workspace using arista.workspace.v1.WorkspaceConfigService.Delete API.
@@ -181,15 +204,19 @@ class WorkspaceMixin:
             WorkspaceConfig object after being set including any server-generated values.
         """
         request = WorkspaceConfigDeleteRequest(key=WorkspaceKey(workspace_id=workspace_id))
-        client = WorkspaceConfigServiceStub(self._channel)
+        client = WorkspaceConfigServiceStub(channel)
         response = await client.delete(request, metadata=self._metadata, timeout=timeout)
         return response.key
 
+    @limit_concurrency
+    @channel_failover
     async def submit_workspace(
         self: CVClient,
         workspace_id: str,
         force: bool = False,
         timeout: float = DEFAULT_API_TIMEOUT,
+        *,
+        channel: Channel,
     ) -> WorkspaceConfig:
         """
         Request submission of the Workspace using arista.workspace.v1.WorkspaceConfigService.Set API.
@@ -209,16 +236,19 @@ class WorkspaceMixin:
                 request_params=RequestParams(request_id=f"req-{uuid4()}"),
             ),
         )
-        client = WorkspaceConfigServiceStub(self._channel)
+        client = WorkspaceConfigServiceStub(channel)
         response = await client.set(request, metadata=self._metadata, timeout=timeout)
         LOGGER.debug("submit_workspace: Got response to submission: %s", response.value)
         return response.value
 
+    @channel_failover
     async def wait_for_workspace_response(
         self: CVClient,
         workspace_id: str,
         request_id: str,
         timeout: float = 3600.0,
+        *,
+        channel: Channel,
     ) -> tuple[Response, Workspace]:
         """
         Monitor a Workspace using arista.workspace.v1.WorkspaceService.Subscribe API for a response to the given request_id.
@@ -240,7 +270,7 @@ class WorkspaceMixin:
                 ),
             ],
         )
-        client = WorkspaceServiceStub(self._channel)
+        client = WorkspaceServiceStub(channel)
         try:
             responses = client.subscribe(request, metadata=self._metadata, timeout=timeout)
             async for response in responses:
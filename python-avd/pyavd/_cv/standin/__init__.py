@@ -0,0 +1,232 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Local stand-in for the CloudVision APIs used by the `deploy_to_cv` workflow.
+
+Only meant for tests and benchmarks. Resources are kept in memory and workspaces and change controls complete right away.
+"""
+
+from __future__ import annotations
+
+import json
+import ssl
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe, sleep
+from collections import Counter
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from threading import Thread
+from typing import TYPE_CHECKING, Any
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.api.arista.inventory.v1 import Device, DeviceKey, StreamingStatus
+from pyavd._cv.api.arista.studio.v1 import Inputs, InputsKey
+from pyavd._cv.api.fmp import RepeatedString
+from pyavd._cv.client.studio import TOPOLOGY_STUDIO_ID
+
+from .protocol import StandInServer, generate_self_signed_certificate
+from .services import get_services
+from .store import ResourceStore
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+INVENTORY_SERVICE = "arista.inventory.v1.DeviceService"
+INPUTS_SERVICE = "arista.studio.v1.InputsService"
+
+
+class CVStandIn:
+    """
+    In-process stand-in for a CloudVision cluster, serving the workspace, configlet, tag, studio, inventory and change control APIs.
+
+    gRPC and the REST endpoints used by CVClient are served with TLS on the same port for each of the given hosts,
+    using a self-signed certificate, so CVClient must be used with `verify_certs=False`.
+    The servers run in their own event loop in a separate thread, since CVClient calls the REST API synchronously.
+
+    Use CVStandIn as a context manager like:
+        `with CVStandIn(latency=0.01) as standin:`
+
+    Resources should be added before making API calls. Latency and errors can be changed at any time to simulate a loaded or failing cluster.
+    """
+
+    hosts: list[str]
+    port: int
+    cv_version: str
+    latency: float
+    """Seconds to wait before answering any API call."""
+    latency_per_item: float
+    """Additional seconds to wait for each resource set or returned by the API call."""
+    error_rate: float
+    """Ratio of API calls failing with `error_status`."""
+    error_status: Status
+    max_concurrent_calls: int | None
+    """API calls above this number of concurrent calls fail with RESOURCE_EXHAUSTED, like a rate limiting cluster."""
+    call_counts: Counter[str]
+    """Number of API calls per RPC like 'arista.tag.v2.TagConfigService/SetSome'."""
+    _stores: dict[str, ResourceStore]
+    _servers: list[StandInServer]
+    _loop: AbstractEventLoop | None
+    _thread: Thread | None
+    _in_flight: int
+    _random: Random
+
+    def __init__(
+        self,
+        hosts: list[str] | None = None,
+        port: int = 0,
+        cv_version: str = "2024.3.0",
+        latency: float = 0.0,
+        latency_per_item: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: Status = Status.UNAVAILABLE,
+        max_concurrent_calls: int | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Create a stand-in listening on the given hosts once started.
+
+        Parameters:
+            hosts: IP addresses or hostnames to listen on, one per simulated cluster node. Defaults to ["127.0.0.1"].
+            port: TCP port to listen on for all hosts. A free port is chosen if 0.
+            cv_version: CloudVision version returned by the REST API.
+            latency: Seconds to wait before answering any API call.
+            latency_per_item: Additional seconds to wait for each resource set or returned by the API call.
+            error_rate: Ratio of API calls failing with `error_status`.
+            error_status: gRPC status of the injected errors.
+            max_concurrent_calls: API calls above this number of concurrent calls fail with RESOURCE_EXHAUSTED.
+            seed: Seed for the random injection of errors.
+        """
+        self.hosts = hosts or ["127.0.0.1"]
+        self.port = port
+        self.cv_version = cv_version
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_concurrent_calls = max_concurrent_calls
+        self.call_counts = Counter()
+        self._stores = {}
+        self._servers = []
+        self._loop = None
+        self._thread = None
+        self._in_flight = 0
+        self._random = Random(seed)  # noqa: S311 Not used for cryptography.
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, _exc_type: type[BaseException] | None, _exc_val: BaseException | None, _exc_tb: TracebackType | None) -> None:
+        self.close()
+
+    def get_store(self, service: str) -> ResourceStore:
+        """Return the store of the given service like 'arista.inventory.v1.DeviceService', creating it if needed."""
+        return self._stores.setdefault(service, ResourceStore())
+
+    def add_devices(self, devices: list[tuple[str, str, str]]) -> None:
+        """
+        Add streaming devices to the Inventory and the mainline Inventory & Topology Studio.
+
+        Parameters:
+            devices: List of tuples with the format (<serial number>, <hostname>, <system mac address>).
+        """
+        inventory = self.get_store(INVENTORY_SERVICE)
+        for serial_number, hostname, system_mac_address in devices:
+            inventory.set(
+                Device(
+                    key=DeviceKey(device_id=serial_number),
+                    hostname=hostname,
+                    system_mac_address=system_mac_address,
+                    streaming_status=StreamingStatus.ACTIVE,
+                )
+            )
+
+        topology_key = InputsKey(studio_id=TOPOLOGY_STUDIO_ID, workspace_id="", path=RepeatedString(values=[]))
+        topology_inputs = json.loads(resource[0].inputs) if (resource := self.get_store(INPUTS_SERVICE).get(topology_key)) is not None else {"devices": []}
+        topology_inputs["devices"].extend(
+            {
+                "inputs": {"device": {"hostname": hostname, "macAddress": system_mac_address, "modelName": "", "interfaces": []}},
+                "tags": {"query": f"device:{serial_number}"},
+            }
+            for serial_number, hostname, system_mac_address in devices
+        )
+        self.get_store(INPUTS_SERVICE).set(Inputs(key=topology_key, inputs=json.dumps(topology_inputs)))
+
+    def start(self) -> None:
+        """Start the event loop thread and listen on all hosts."""
+        self._loop = new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, name="CVStandIn", daemon=True)
+        self._thread.start()
+        run_coroutine_threadsafe(self._start_servers(), self._loop).result()
+
+    def close(self) -> None:
+        """Stop listening, cancel all running API calls and stop the event loop thread."""
+        run_coroutine_threadsafe(self._close_servers(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    async def _start_servers(self) -> None:
+        certificate, private_key = generate_self_signed_certificate(self.hosts)
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        # The certificate chain can only be loaded from files.
+        with TemporaryDirectory() as tmp_dir:
+            certificate_file = Path(tmp_dir, "cert.pem")
+            private_key_file = Path(tmp_dir, "key.pem")
+            certificate_file.write_bytes(certificate)
+            private_key_file.write_bytes(private_key)
+            ssl_context.load_cert_chain(certificate_file, private_key_file)
+        ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+
+        services = get_services(self)
+        for host in self.hosts:
+            server = StandInServer(services, self._handle_rest_request)
+            await server.start(host, self.port, ssl=ssl_context)
+            self._servers.append(server)
+            # All hosts must use the same port, since CVClient uses one port for all servers.
+            self.port = server._server.sockets[0].getsockname()[1]
+
+    async def _close_servers(self) -> None:
+        for server in self._servers:
+            server.close()
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers = []
+
+    async def simulate_call(self, rpc: str, items: int = 1) -> None:
+        """
+        Count the API call and apply the configured latency and errors.
+
+        Raises:
+            GRPCError: If the API call is rate limited or randomly selected to fail.
+        """
+        self.call_counts[rpc] += 1
+        if self.max_concurrent_calls is not None and self._in_flight >= self.max_concurrent_calls:
+            msg = f"Rate limited at {self.max_concurrent_calls} concurrent calls"
+            raise GRPCError(Status.RESOURCE_EXHAUSTED, msg)
+
+        self._in_flight += 1
+        try:
+            await sleep(self.latency + self.latency_per_item * items)
+        finally:
+            self._in_flight -= 1
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            msg = f"Injected error for {rpc}"
+            raise GRPCError(self.error_status, msg)
+
+    def _handle_rest_request(self, method: str, path: str, _body: bytes) -> tuple[int, Any]:
+        """Return a tuple of (<HTTP status>, <JSON payload>) for the REST endpoints used by CVClient."""
+        self.call_counts[f"{method} {path}"] += 1
+        if method == "GET" and path == "/cvpservice/cvpInfo/getCvpInfo.do":
+            return 200, {"version": self.cv_version}
+        if method == "POST" and path == "/cvpservice/login/authenticate.do":
+            return 200, {"sessionId": "standin-session"}
+        return 404, {"errorMessage": f"Unknown endpoint {method} {path}"}
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+import json
+from asyncio import BaseProtocol, BaseTransport, Protocol, Transport
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from ipaddress import ip_address
+from typing import TYPE_CHECKING, Any
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+from grpclib.server import Server
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+    from grpclib._typing import IServable
+
+
+def generate_self_signed_certificate(hosts: list[str]) -> tuple[bytes, bytes]:
+    """Return a tuple of (<PEM certificate>, <PEM private key>) for a self-signed certificate valid for the given hosts."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "cv-standin")])
+    alternative_names = []
+    for host in hosts:
+        try:
+            alternative_names.append(x509.IPAddress(ip_address(host)))
+        except ValueError:  # noqa: PERF203 Only a few hosts.
+            alternative_names.append(x509.DNSName(host))
+
+    now = datetime.now(timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName(alternative_names), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    return (
+        certificate.public_bytes(serialization.Encoding.PEM),
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()),
+    )
+
+
+class RestProtocol(Protocol):
+    """Minimal HTTP/1.1 server protocol handling a single JSON request per connection."""
+
+    _handler: Callable[[str, str, bytes], tuple[int, Any]]
+    _transport: Transport | None
+    _buffer: bytes
+
+    def __init__(self, handler: Callable[[str, str, bytes], tuple[int, Any]]) -> None:
+        self._handler = handler
+        self._transport = None
+        self._buffer = b""
+
+    def connection_made(self, transport: BaseTransport) -> None:
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        head, separator, body = self._buffer.partition(b"\r\n\r\n")
+        if not separator:
+            return
+
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")
+        headers = {name.strip().lower(): value.strip() for name, _, value in (line.partition(":") for line in header_lines)}
+        if len(body) < int(headers.get("content-length", 0)):
+            return
+
+        method, path, _version = request_line.split(" ", 2)
+        status, payload = self._handler(method, path, body)
+        content = json.dumps(payload).encode()
+        self._transport.write(
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(content)}\r\nConnection: close\r\n\r\n".encode()
+            + content
+        )
+        self._transport.close()
+
+
+class AlpnDispatchProtocol(Protocol):
+    """
+    Protocol passing each TLS connection on to the gRPC server or the REST server depending on the negotiated ALPN protocol.
+
+    CloudVision serves both gRPC over HTTP/2 and REST over HTTP/1.1 on the same port.
+    """
+
+    _grpc_protocol_factory: Callable[[], BaseProtocol]
+    _rest_handler: Callable[[str, str, bytes], tuple[int, Any]]
+    _protocol: Protocol | None
+
+    def __init__(self, grpc_protocol_factory: Callable[[], BaseProtocol], rest_handler: Callable[[str, str, bytes], tuple[int, Any]]) -> None:
+        self._grpc_protocol_factory = grpc_protocol_factory
+        self._rest_handler = rest_handler
+        self._protocol = None
+
+    def connection_made(self, transport: BaseTransport) -> None:
+        ssl_object = transport.get_extra_info("ssl_object")
+        if ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2":
+            self._protocol = self._grpc_protocol_factory()
+        else:
+            self._protocol = RestProtocol(self._rest_handler)
+        self._protocol.connection_made(transport)
+
+    def data_received(self, data: bytes) -> None:
+        self._protocol.data_received(data)
+
+    def eof_received(self) -> bool | None:
+        return self._protocol.eof_received()
+
+    def pause_writing(self) -> None:
+        self._protocol.pause_writing()
+
+    def resume_writing(self) -> None:
+        self._protocol.resume_writing()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if self._protocol is not None:
+            self._protocol.connection_lost(exc)
+
+
+class StandInServer(Server):
+    """gRPC server also answering REST requests on the same port."""
+
+    _rest_handler: Callable[[str, str, bytes], tuple[int, Any]]
+
+    def __init__(self, handlers: Collection[IServable], rest_handler: Callable[[str, str, bytes], tuple[int, Any]]) -> None:
+        super().__init__(handlers)
+        self._rest_handler = rest_handler
+
+    def _protocol_factory(self) -> AlpnDispatchProtocol:  # type: ignore[override]
+        return AlpnDispatchProtocol(super()._protocol_factory, self._rest_handler)
@@ -0,0 +1,391 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any
+
+from aristaproto.grpc.grpclib_server import ServiceBase
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.api.arista.changecontrol import v1 as changecontrol_v1
+from pyavd._cv.api.arista.changecontrol.v1 import (
+    ApproveConfig,
+    ApproveConfigServiceBase,
+    Change,
+    ChangeControl,
+    ChangeControlConfig,
+    ChangeControlConfigServiceBase,
+    ChangeControlKey,
+    ChangeControlStatus,
+    Flag,
+)
+from pyavd._cv.api.arista.configlet import v1 as configlet_v1
+from pyavd._cv.api.arista.configlet.v1 import (
+    Configlet,
+    ConfigletConfig,
+    ConfigletConfigServiceBase,
+    ConfigletKey,
+    ConfigletServiceBase,
+    ConfigletStreamRequest,
+)
+from pyavd._cv.api.arista.inventory import v1 as inventory_v1
+from pyavd._cv.api.arista.studio import v1 as studio_v1
+from pyavd._cv.api.arista.subscriptions import Operation
+from pyavd._cv.api.arista.tag import v2 as tag_v2
+from pyavd._cv.api.arista.tag.v2 import CreatorType, Tag, TagAssignment, TagAssignmentConfig, TagAssignmentKey, TagConfig, TagKey
+from pyavd._cv.api.arista.workspace import v1 as workspace_v1
+from pyavd._cv.api.arista.workspace.v1 import (
+    Request,
+    Response,
+    Responses,
+    ResponseStatus,
+    Workspace,
+    WorkspaceConfig,
+    WorkspaceConfigServiceBase,
+    WorkspaceKey,
+    WorkspaceState,
+)
+from pyavd._cv.api.fmp import RepeatedString
+
+from .store import matches_partial_eq_filter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from aristaproto import Message
+
+    from . import CVStandIn
+    from .store import ResourceStore
+
+API_MODULES = (changecontrol_v1, configlet_v1, inventory_v1, studio_v1, tag_v2, workspace_v1)
+"""Generated API modules for which all services are served by the stand-in."""
+
+WORKSPACE_SERVICE = "arista.workspace.v1.WorkspaceService"
+CHANGE_CONTROL_SERVICE = "arista.changecontrol.v1.ChangeControlService"
+CONFIGLET_SERVICE = "arista.configlet.v1.ConfigletService"
+TAG_SERVICE = "arista.tag.v2.TagService"
+TAG_CONFIG_SERVICE = "arista.tag.v2.TagConfigService"
+TAG_ASSIGNMENT_SERVICE = "arista.tag.v2.TagAssignmentService"
+TAG_ASSIGNMENT_CONFIG_SERVICE = "arista.tag.v2.TagAssignmentConfigService"
+
+
+class ResourceService:
+    """
+    Generic in-memory implementation of the standard resource API methods.
+
+    Only to be used as mixin on a generated `<Resource>ServiceBase` class.
+    Resources are kept in the ResourceStore of the service, so state services like `TagService` only return what was
+    given to `CVStandIn` directly or set by the hooks of other services, while config services like `TagConfigService` store what the client sets.
+    """
+
+    _standin: CVStandIn
+    _name: str
+    """Full name of the service like 'arista.tag.v2.TagService'."""
+    _store: ResourceStore
+    _reply_types: dict[str, type[Message]]
+    """Reply message type for each RPC name like 'GetOne'."""
+
+    def __init__(self, standin: CVStandIn) -> None:
+        self._standin = standin
+        self._reply_types = {}
+        for path, handler in self.__mapping__().items():
+            self._name, rpc = path.strip("/").split("/")
+            self._reply_types[rpc] = handler.reply_type
+        self._store = standin.get_store(self._name)
+
+    def _on_set(self, value: Message) -> None:
+        """Hook called after a resource has been set. Used to update related resources in other services."""
+
+    def _on_delete(self, key: Message) -> None:
+        """Hook called after a resource has been deleted. Used to update related resources in other services."""
+
+    def _stream_replies(self, rpc: str, resources: list[tuple[Message, datetime]], operation: Operation) -> list[Message]:
+        reply_type = self._reply_types[rpc]
+        return [reply_type(value=value, time=time, type=operation) for value, time in resources]
+
+    async def get_one(self, request: Any) -> Message:
+        await self._standin.simulate_call(f"{self._name}/GetOne")
+        if (resource := self._store.get(request.key)) is None:
+            msg = f"Resource not found: {request.key}"
+            raise GRPCError(Status.NOT_FOUND, msg)
+        value, time = resource
+        return self._reply_types["GetOne"](value=value, time=time)
+
+    async def get_some(self, request: Any) -> AsyncIterator[Message]:
+        await self._standin.simulate_call(f"{self._name}/GetSome", len(request.keys))
+        for key in request.keys:
+            if (resource := self._store.get(key)) is None:
+                yield self._reply_types["GetSome"](error=f"Resource not found: {key}")
+                continue
+            value, time = resource
+            yield self._reply_types["GetSome"](value=value, time=time)
+
+    async def get_all(self, request: Any) -> AsyncIterator[Message]:
+        resources = self._store.find(request.partial_eq_filter)
+        await self._standin.simulate_call(f"{self._name}/GetAll", len(resources))
+        for reply in self._stream_replies("GetAll", resources, Operation.INITIAL):
+            yield reply
+
+    async def subscribe(self, request: Any) -> AsyncIterator[Message]:
+        # Subscribing before fetching the initial resources, so no updates are lost in between.
+        queue = self._store.subscribe()
+        try:
+            resources = self._store.find(request.partial_eq_filter)
+            await self._standin.simulate_call(f"{self._name}/Subscribe", len(resources))
+            for reply in self._stream_replies("Subscribe", resources, Operation.INITIAL):
+                yield reply
+            yield self._reply_types["Subscribe"](type=Operation.INITIAL_SYNC_COMPLETE)
+
+            while True:
+                value, time = await queue.get()
+                if not request.partial_eq_filter or any(matches_partial_eq_filter(value, partial_eq_filter) for partial_eq_filter in request.partial_eq_filter):
+                    yield self._reply_types["Subscribe"](value=value, time=time, type=Operation.UPDATED)
+        finally:
+            self._store.unsubscribe(queue)
+
+    async def set(self, request: Any) -> Message:
+        await self._standin.simulate_call(f"{self._name}/Set")
+        time = self._store.set(request.value)
+        self._on_set(request.value)
+        return self._reply_types["Set"](value=request.value, time=time)
+
+    async def set_some(self, request: Any) -> AsyncIterator[Message]:
+        await self._standin.simulate_call(f"{self._name}/SetSome", len(request.values))
+        for value in request.values:
+            self._store.set(value)
+            self._on_set(value)
+            yield self._reply_types["SetSome"](key=value.key)
+
+    async def delete(self, request: Any) -> Message:
+        await self._standin.simulate_call(f"{self._name}/Delete")
+        if not self._store.delete(request.key):
+            msg = f"Resource not found: {request.key}"
+            raise GRPCError(Status.NOT_FOUND, msg)
+        self._on_delete(request.key)
+        return self._reply_types["Delete"](key=request.key, time=datetime.now(timezone.utc))
+
+    async def delete_some(self, request: Any) -> AsyncIterator[Message]:
+        await self._standin.simulate_call(f"{self._name}/DeleteSome", len(request.keys))
+        for key in request.keys:
+            if not self._store.delete(key):
+                yield self._reply_types["DeleteSome"](key=key, error=f"Resource not found: {key}")
+                continue
+            self._on_delete(key)
+            yield self._reply_types["DeleteSome"](key=key)
+
+
+class WorkspaceConfigService(ResourceService, WorkspaceConfigServiceBase):
+    """Also maintains the state of the Workspace, responding to build, submit and abandon requests right away."""
+
+    def _on_set(self, value: WorkspaceConfig) -> None:
+        workspaces = self._standin.get_store(WORKSPACE_SERVICE)
+        if (resource := workspaces.get(value.key)) is not None:
+            workspace = Workspace().parse(bytes(resource[0]))
+        else:
+            workspace = Workspace(key=value.key, state=WorkspaceState.PENDING, responses=Responses(values={}), cc_ids=RepeatedString(values=[]))
+
+        if value.display_name is not None:
+            workspace.display_name = value.display_name
+        if value.description is not None:
+            workspace.description = value.description
+
+        if value.request in (Request.START_BUILD, Request.SUBMIT, Request.SUBMIT_FORCE, Request.ABANDON):
+            request_id = value.request_params.request_id
+            if value.request == Request.START_BUILD:
+                workspace.last_build_id = request_id
+            elif value.request == Request.ABANDON:
+                workspace.state = WorkspaceState.ABANDONED
+            else:
+                workspace.state = WorkspaceState.SUBMITTED
+                workspace.cc_ids.values.append(self._create_change_control(workspace))
+                self._merge_configlets(workspace.key.workspace_id)
+                self._merge_tags(workspace.key.workspace_id)
+            workspace.responses.values[request_id] = Response(status=ResponseStatus.SUCCESS)
+
+        workspaces.set(workspace)
+
+    def _on_delete(self, key: WorkspaceKey) -> None:
+        self._standin.get_store(WORKSPACE_SERVICE).delete(key)
+
+    def _create_change_control(self, workspace: Workspace) -> str:
+        change_control_id = f"cc-{workspace.key.workspace_id}"
+        self._standin.get_store(CHANGE_CONTROL_SERVICE).set(
+            ChangeControl(
+                key=ChangeControlKey(id=change_control_id),
+                change=Change(name=f"Change for Workspace {workspace.key.workspace_id}", notes="", time=datetime.now(timezone.utc)),
+                approve=Flag(value=False),
+                start=Flag(value=False),
+                status=ChangeControlStatus.UNSPECIFIED,
+            )
+        )
+        return change_control_id
+
+    def _merge_configlets(self, workspace_id: str) -> None:
+        """Merge the Configlets changed in the Workspace into mainline."""
+        configlets = self._standin.get_store(CONFIGLET_SERVICE)
+        for configlet, _time in configlets.find([Configlet(key=ConfigletKey(workspace_id=workspace_id))]):
+            configlets.set(get_configlet_in_workspace(configlet, ""))
+
+    def _merge_tags(self, workspace_id: str) -> None:
+        """Merge the Tags and Tag assignments changed in the Workspace into the mainline state."""
+        tags = self._standin.get_store(TAG_SERVICE)
+        for tag_config, _time in self._standin.get_store(TAG_CONFIG_SERVICE).find([TagConfig(key=TagKey(workspace_id=workspace_id))]):
+            key = tag_config.key
+            # Creating new keys instead of copying, since (de)serializing messages is slow.
+            tag = Tag(key=TagKey(workspace_id="", element_type=key.element_type, label=key.label, value=key.value), creator_type=CreatorType.USER)
+            if tag_config.remove:
+                tags.delete(tag.key)
+            else:
+                tags.set(tag)
+
+        tag_assignments = self._standin.get_store(TAG_ASSIGNMENT_SERVICE)
+        for tag_assignment_config, _time in self._standin.get_store(TAG_ASSIGNMENT_CONFIG_SERVICE).find(
+            [TagAssignmentConfig(key=TagAssignmentKey(workspace_id=workspace_id))]
+        ):
+            key = tag_assignment_config.key
+            tag_assignment = TagAssignment(
+                key=TagAssignmentKey(
+                    workspace_id="",
+                    element_type=key.element_type,
+                    label=key.label,
+                    value=key.value,
+                    device_id=key.device_id,
+                    interface_id=key.interface_id,
+                    element_sub_type=key.element_sub_type,
+                ),
+                tag_creator_type=CreatorType.USER,
+            )
+            if tag_assignment_config.remove:
+                tag_assignments.delete(tag_assignment.key)
+            else:
+                tag_assignments.set(tag_assignment)
+
+
+class ConfigletService(ResourceService, ConfigletServiceBase):
+    """
+    Returns mainline Configlets for Workspaces unless changed in the Workspace, like CloudVision does for configlets.
+
+    Like CloudVision, GetAll does not return the body unless requested with the filter.
+    """
+
+    def _find(self, request: ConfigletStreamRequest) -> list[tuple[Configlet, datetime]]:
+        found = {(configlet.key.workspace_id, configlet.key.configlet_id): (configlet, time) for configlet, time in self._store.find(request.partial_eq_filter)}
+
+        mainline_filters_by_workspace: dict[str, list[Configlet]] = {}
+        for partial_eq_filter in request.partial_eq_filter:
+            if workspace_id := partial_eq_filter.key.workspace_id:
+                mainline_filter = Configlet().parse(bytes(partial_eq_filter))
+                mainline_filter.key.workspace_id = ""
+                mainline_filters_by_workspace.setdefault(workspace_id, []).append(mainline_filter)
+        for workspace_id, mainline_filters in mainline_filters_by_workspace.items():
+            for configlet, time in self._store.find(mainline_filters):
+                if (workspace_id, configlet.key.configlet_id) not in found:
+                    found[(workspace_id, configlet.key.configlet_id)] = (get_configlet_in_workspace(configlet, workspace_id), time)
+
+        if request.filter.include_body:
+            return list(found.values())
+
+        resources = []
+        for configlet, time in found.values():
+            configlet_without_body = Configlet().parse(bytes(configlet))
+            configlet_without_body.body = None
+            resources.append((configlet_without_body, time))
+        return resources
+
+    async def get_all(self, request: ConfigletStreamRequest) -> AsyncIterator[Message]:
+        resources = self._find(request)
+        await self._standin.simulate_call(f"{self._name}/GetAll", len(resources))
+        for reply in self._stream_replies("GetAll", resources, Operation.INITIAL):
+            yield reply
+
+
+class ConfigletConfigService(ResourceService, ConfigletConfigServiceBase):
+    """Also maintains the state of the Configlet in the Workspace, including the digest of the body."""
+
+    def _on_set(self, value: ConfigletConfig) -> None:
+        configlets = self._standin.get_store(CONFIGLET_SERVICE)
+        now = datetime.now(timezone.utc)
+        if (resource := configlets.get(value.key)) is not None:
+            configlet = Configlet().parse(bytes(resource[0]))
+        elif (resource := configlets.get(ConfigletKey(workspace_id="", configlet_id=value.key.configlet_id))) is not None:
+            configlet = get_configlet_in_workspace(resource[0], value.key.workspace_id)
+        else:
+            configlet = Configlet(key=ConfigletKey(workspace_id=value.key.workspace_id, configlet_id=value.key.configlet_id), created_at=now)
+
+        if value.display_name is not None:
+            configlet.display_name = value.display_name
+        if value.description is not None:
+            configlet.description = value.description
+        if value.body is not None:
+            body = value.body.encode("UTF-8")
+            configlet.body = value.body
+            configlet.digest = sha256(body).hexdigest()
+            configlet.size = len(body)
+        configlet.last_modified_at = now
+        configlets.set(configlet)
+
+
+def get_configlet_in_workspace(configlet: Configlet, workspace_id: str) -> Configlet:
+    """Return a copy of the given Configlet with the Workspace ID changed. Use "" for mainline."""
+    configlet = Configlet().parse(bytes(configlet))
+    configlet.key.workspace_id = workspace_id
+    return configlet
+
+
+class ChangeControlConfigService(ResourceService, ChangeControlConfigServiceBase):
+    """Also maintains the state of the Change Control. Started Change Controls are completed right away."""
+
+    def _on_set(self, value: ChangeControlConfig) -> None:
+        change_controls = self._standin.get_store(CHANGE_CONTROL_SERVICE)
+        if (resource := change_controls.get(value.key)) is None:
+            return
+
+        change_control = ChangeControl().parse(bytes(resource[0]))
+        if value.change.name is not None or value.change.notes is not None:
+            change_control.change.name = value.change.name
+            change_control.change.notes = value.change.notes
+            change_control.change.time = datetime.now(timezone.utc)
+        if value.start.value:
+            change_control.start = Flag(value=True, notes=value.start.notes)
+            change_control.status = ChangeControlStatus.COMPLETED
+
+        change_controls.set(change_control)
+
+
+class ApproveConfigService(ResourceService, ApproveConfigServiceBase):
+    """Also maintains the approval in the state of the Change Control."""
+
+    def _on_set(self, value: ApproveConfig) -> None:
+        change_controls = self._standin.get_store(CHANGE_CONTROL_SERVICE)
+        if (resource := change_controls.get(value.key)) is None:
+            return
+
+        change_control = ChangeControl().parse(bytes(resource[0]))
+        change_control.approve = Flag(value=value.approve.value, notes=value.approve.notes)
+        change_controls.set(change_control)
+
+
+SPECIAL_SERVICES: dict[type[ServiceBase], type[ResourceService]] = {
+    WorkspaceConfigServiceBase: WorkspaceConfigService,
+    ChangeControlConfigServiceBase: ChangeControlConfigService,
+    ApproveConfigServiceBase: ApproveConfigService,
+    ConfigletServiceBase: ConfigletService,
+    ConfigletConfigServiceBase: ConfigletConfigService,
+}
+
+
+def get_services(standin: CVStandIn) -> list[ServiceBase]:
+    """Return instances of all services of the API modules served by the stand-in."""
+    services = []
+    for module in API_MODULES:
+        for service_base in vars(module).values():
+            if not isinstance(service_base, type) or not issubclass(service_base, ServiceBase) or service_base is ServiceBase:
+                continue
+            if (service_class := SPECIAL_SERVICES.get(service_base)) is None:
+                service_class = type(service_base.__name__.removesuffix("Base"), (ResourceService, service_base), {})
+            services.append(service_class(standin))
+    return services
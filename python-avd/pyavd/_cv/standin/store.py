@@ -0,0 +1,181 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from asyncio import Queue
+from dataclasses import fields
+from datetime import datetime, timezone
+from functools import cache
+from typing import TYPE_CHECKING
+
+from aristaproto import Message
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+UNSET_TIME = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"""Value of timestamp fields which are not set."""
+
+
+@cache
+def _get_filter_fields(message_type: type[Message]) -> tuple[tuple[str, bool], ...]:
+    """Return tuples of (<field name>, <is wrapped or optional>) for all fields of the given message type."""
+    return tuple(
+        (field.name, bool(field.metadata["aristaproto"].wraps or field.metadata["aristaproto"].optional))
+        for field in fields(message_type)
+        if "aristaproto" in field.metadata
+    )
+
+
+def _is_set(value: object, wrapped: bool) -> bool:
+    """
+    Return True if the field value is set.
+
+    Wrapped and optional fields are set when not None. Messages are set when they were given or received on the wire.
+    Other fields are set when different from the default value, since proto3 cannot tell the difference on the wire.
+    """
+    if wrapped:
+        return value is not None
+    if isinstance(value, Message):
+        return value._serialized_on_wire
+    if isinstance(value, datetime):
+        return value != UNSET_TIME
+    return bool(value)
+
+
+def matches_partial_eq_filter(value: Message, partial_eq_filter: Message) -> bool:
+    """Return True if all fields set in the partial_eq_filter have the same value in the given value. Nested messages are compared recursively."""
+    for name, wrapped in _get_filter_fields(type(partial_eq_filter)):
+        filter_value = getattr(partial_eq_filter, name)
+        if not _is_set(filter_value, wrapped):
+            continue
+        field_value = getattr(value, name)
+        if isinstance(filter_value, Message):
+            if field_value is None or not matches_partial_eq_filter(field_value, filter_value):
+                return False
+        elif field_value != filter_value:
+            return False
+    return True
+
+
+def _get_set_fields(partial_eq_filter: Message, prefix: tuple[str, ...] = ()) -> tuple[tuple[tuple[str, ...], ...], tuple]:
+    """
+    Return a tuple of (<paths of the fields set in the filter>, <values of those fields>) with nested messages flattened.
+
+    Lists are converted to tuples so the values can be hashed.
+    """
+    field_paths = []
+    field_values = []
+    for name, wrapped in _get_filter_fields(type(partial_eq_filter)):
+        filter_value = getattr(partial_eq_filter, name)
+        if not _is_set(filter_value, wrapped):
+            continue
+        if isinstance(filter_value, Message):
+            nested_paths, nested_values = _get_set_fields(filter_value, (*prefix, name))
+            field_paths.extend(nested_paths)
+            field_values.extend(nested_values)
+            continue
+        field_paths.append((*prefix, name))
+        field_values.append(_hashable(filter_value))
+    return tuple(field_paths), tuple(field_values)
+
+
+def _get_field_values(value: Message, field_paths: tuple[tuple[str, ...], ...]) -> tuple:
+    """Return the values of the given field paths. Values below unset nested messages are returned as None."""
+    field_values = []
+    for field_path in field_paths:
+        field_value = value
+        for name in field_path:
+            field_value = getattr(field_value, name, None)
+        field_values.append(_hashable(field_value))
+    return tuple(field_values)
+
+
+def _hashable(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return value
+
+
+def is_complete_key(key: Message) -> bool:
+    """Return True if all fields of the given key are set, so the key identifies exactly one resource."""
+    return all(_is_set(getattr(key, name), wrapped) for name, wrapped in _get_filter_fields(type(key)))
+
+
+class ResourceStore:
+    """
+    In-memory store of the resources of one API service.
+
+    Resources are keyed by their serialized key message. Setting a resource replaces any existing resource with the same key,
+    and notifies all subscribers.
+    """
+
+    _resources: dict[bytes, tuple[Message, datetime]]
+    _subscribers: set[Queue[tuple[Message, datetime]]]
+
+    def __init__(self) -> None:
+        self._resources = {}
+        self._subscribers = set()
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def get(self, key: Message) -> tuple[Message, datetime] | None:
+        """Return a tuple of (<resource>, <time of last modification>) for the given key or None if not found."""
+        return self._resources.get(bytes(key))
+
+    def set(self, value: Message) -> datetime:
+        """Store the given resource and return the time of the modification."""
+        time = datetime.now(timezone.utc)
+        self._resources[bytes(value.key)] = (value, time)
+        for subscriber in self._subscribers:
+            subscriber.put_nowait((value, time))
+        return time
+
+    def delete(self, key: Message) -> bool:
+        """Remove the resource with the given key. Returns False if the resource was not found."""
+        return self._resources.pop(bytes(key), None) is not None
+
+    def find(self, partial_eq_filters: Iterable[Message]) -> list[tuple[Message, datetime]]:
+        """
+        Return tuples of (<resource>, <time of last modification>) for all resources matching any of the given filters.
+
+        All resources are returned if no filters are given.
+        Filters with a complete key are looked up directly. Other filters are grouped by the fields they set,
+        so each group is matched in one pass over the resources instead of one pass per filter.
+        """
+        partial_eq_filters = list(partial_eq_filters)
+        if not partial_eq_filters:
+            return list(self._resources.values())
+
+        found: dict[bytes, tuple[Message, datetime]] = {}
+        filter_groups: dict[tuple[tuple[str, ...], ...], set[tuple]] = {}
+        for partial_eq_filter in partial_eq_filters:
+            key = getattr(partial_eq_filter, "key", None)
+            if key is not None and is_complete_key(key):
+                key_bytes = bytes(key)
+                if (resource := self._resources.get(key_bytes)) is not None and matches_partial_eq_filter(resource[0], partial_eq_filter):
+                    found[key_bytes] = resource
+                continue
+
+            field_paths, field_values = _get_set_fields(partial_eq_filter)
+            filter_groups.setdefault(field_paths, set()).add(field_values)
+
+        for field_paths, filter_values in filter_groups.items():
+            for key_bytes, resource in self._resources.items():
+                if key_bytes not in found and _get_field_values(resource[0], field_paths) in filter_values:
+                    found[key_bytes] = resource
+
+        return list(found.values())
+
+    def subscribe(self) -> Queue[tuple[Message, datetime]]:
+        """Return a queue receiving a tuple of (<resource>, <time of last modification>) for every resource set after this call."""
+        queue: Queue[tuple[Message, datetime]] = Queue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: Queue[tuple[Message, datetime]]) -> None:
+        self._subscribers.discard(queue)
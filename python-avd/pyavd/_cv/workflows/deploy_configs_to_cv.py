@@ -3,7 +3,9 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from hashlib import sha256
 from logging import getLogger
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,9 +26,7 @@ async def deploy_configs_to_cv(configs: list[CVEosConfig], result: DeployToCvRes
     Deploy given configs using "Static Configlet Studio".
 
     - Create/verify a single configuration container named "AVD Configurations".
-    - Upload Configlets and assign to devices.
-
-    TODO: See if this can be optimized to check if the configlets are already in place and correct. A hash would have been nice.
+    - Upload changed Configlets and assign to devices. Configs already on CloudVision with the same content are added to unchanged.
     """
     LOGGER.info("deploy_configs_to_cv: %s", len(configs))
 
@@ -43,31 +43,57 @@ async def deploy_configs_to_cv(configs: list[CVEosConfig], result: DeployToCvRes
     if not todo_configs:
         return
 
-    # First create all configlets in parallel coroutines.
-    await deploy_configlets_to_cv(todo_configs, result.workspace.id, cv_client)
-    # Next create all containers in parallel coroutines.
+    # First create all changed configlets in parallel coroutines.
+    deployed_configs, unchanged_configs = await deploy_configlets_to_cv(todo_configs, result.workspace.id, cv_client)
+    # Next create all containers in parallel coroutines. Also for unchanged configlets, since the assignments may be missing.
     await deploy_configlet_containers_to_cv(todo_configs, result.workspace.id, cv_client)
 
-    result.deployed_configs.extend(todo_configs)
+    result.deployed_configs.extend(deployed_configs)
+    result.unchanged_configs.extend(unchanged_configs)
+    LOGGER.info("deploy_configs_to_cv: %s unchanged configs already up to date on CloudVision.", len(unchanged_configs))
 
 
-async def deploy_configlets_to_cv(configs: list[CVEosConfig], workspace_id: str, cv_client: CVClient) -> None:
+async def deploy_configlets_to_cv(configs: list[CVEosConfig], workspace_id: str, cv_client: CVClient) -> tuple[list[CVEosConfig], list[CVEosConfig]]:
     """
-    Bluntly setting configs like nothing was there. Only create missing containers.
+    Upload configlets which are missing or different on CloudVision.
+
+    The sha256 digest of each local config is compared to the digest of the existing configlet, which CloudVision returns without the body.
 
-    TODO: Fetch config checksums for existing configs and only upload what is needed.
+    Returns:
+        Tuple of (<deployed configs>, <unchanged configs>).
     """
-    configlets = [
-        (
-            f"{CONFIGLET_ID_PREFIX}{config.device.serial_number}",
+    configlets_by_id = {
+        f"{CONFIGLET_ID_PREFIX}{config.device.serial_number}": (
+            config,
             config.configlet_name or f"{CONFIGLET_NAME_PREFIX}{config.device.hostname}",
             f"Configuration created and uploaded by AVD for {config.device.hostname}",
-            config.file,
         )
         for config in configs
-    ]
-    LOGGER.info("deploy_configs_to_cv: Deploying %s configlets.", len(configlets))
-    await cv_client.set_configlets_from_files(workspace_id=workspace_id, configlets=configlets)
+    }
+    existing_configlets = await cv_client.get_configlets(workspace_id=workspace_id, configlet_ids=list(configlets_by_id))
+    # Create dict keyed by configlet id with value of tuple containing key configlet parameters. Used later to detect changes.
+    existing_configlets_by_id = {
+        cv_configlet.key.configlet_id: (cv_configlet.display_name, cv_configlet.description, cv_configlet.digest) for cv_configlet in existing_configlets
+    }
+
+    deployed_configs = []
+    unchanged_configs = []
+    update_configlets = []
+    for configlet_id, (config, display_name, description) in configlets_by_id.items():
+        # Hashing the body as it would be uploaded by set_configlets_from_files.
+        digest = sha256(Path(config.file).read_text(encoding="UTF-8").encode("UTF-8")).hexdigest()
+        if existing_configlets_by_id.get(configlet_id) == (display_name, description, digest):
+            unchanged_configs.append(config)
+            continue
+        deployed_configs.append(config)
+        update_configlets.append((configlet_id, display_name, description, config.file))
+
+    LOGGER.info("deploy_configs_to_cv: %s configlets are unchanged on CloudVision.", len(unchanged_configs))
+    if update_configlets:
+        LOGGER.info("deploy_configs_to_cv: Deploying %s configlets.", len(update_configlets))
+        await cv_client.set_configlets_from_files(workspace_id=workspace_id, configlets=update_configlets)
+
+    return deployed_configs, unchanged_configs
 
 
 async def get_existing_device_container_ids_from_root_container(workspace_id: str, cv_client: CVClient) -> list[str]:
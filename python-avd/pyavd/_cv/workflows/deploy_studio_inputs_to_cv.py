@@ -7,8 +7,6 @@ from asyncio import gather
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from pyavd._utils import batch
-
 if TYPE_CHECKING:
     from pyavd._cv.client import CVClient
 
@@ -47,10 +45,8 @@ async def deploy_studio_inputs_to_cv(studio_inputs: list[CVStudioInputs], result
         for studio_input in studio_inputs
     ]
 
-    # Deploy studio inputs in parallel in batches of 20.
-    LOGGER.info("deploy_studio_inputs_to_cv: Deploying %s Studio Inputs in batches of 20.", len(studio_inputs_coroutines))
-    for index, coroutines in enumerate(batch(studio_inputs_coroutines, 20), start=1):
-        LOGGER.info("deploy_studio_inputs_to_cv: Batch %s", index)
-        await gather(*coroutines)
+    # Deploy studio inputs concurrently. The number of concurrent calls is limited by the concurrency limiter of the client.
+    LOGGER.info("deploy_studio_inputs_to_cv: Deploying %s Studio Inputs.", len(studio_inputs_coroutines))
+    await gather(*studio_inputs_coroutines)
 
     result.deployed_studio_inputs.extend(studio_inputs)
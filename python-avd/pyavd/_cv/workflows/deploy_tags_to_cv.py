@@ -3,12 +3,16 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from asyncio import gather
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from .models import CVDeviceTag, CVInterfaceTag, CVWorkspace
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    from pyavd._cv.api.arista.tag.v2 import TagAssignment
     from pyavd._cv.client import CVClient
 
 LOGGER = getLogger(__name__)
@@ -35,10 +39,6 @@ async def deploy_tags_to_cv(
       - Always remove other tag assignments with the same label as given tags.
       - TODO: Remove deassociated tags if they are no longer associated with any device.
 
-    TODO: Refactor CVDeviceTag / CVInterfaceTag to produce a stable hash so we can use it with set() methods.
-          Then improve logic below using sets.
-
-
     In-place updates skipped_tags, deployed_tags, removed_tags, warnings so they can be given directly from the results object.
     """
     LOGGER.info("deploy_tags_to_cv: %s", len(tags))
@@ -57,82 +57,56 @@ async def deploy_tags_to_cv(
     if not todo_tags:
         return
 
-    # Get existing interface tags. Use this to only add the missing. We will *not* remove any tags. (Assignment are removed later)
+    # Get existing tags with the labels we need. Use this to only add the missing. We will *not* remove any tags. (Assignment are removed later)
     LOGGER.info("deploy_tags_to_cv: Getting existing tags")
-    existing_tags = await cv_client.get_tags(workspace_id=workspace.id, element_type=tag_type, creator_type="user")
-    existing_tags_tuples = [(tag.key.label, tag.key.value) for tag in existing_tags]
+    existing_tags = await cv_client.get_tags(
+        workspace_id=workspace.id, element_type=tag_type, creator_type="user", labels=list(dict.fromkeys(tag.label for tag in todo_tags))
+    )
+    existing_tags_tuples = {(tag.key.label, tag.key.value) for tag in existing_tags}
     LOGGER.info("deploy_tags_to_cv: Got %s tags", len(existing_tags_tuples))
-    tags_to_add = [tag for tag in todo_tags if (tag.label, tag.value) not in existing_tags_tuples]
+    tags_to_add = list(dict.fromkeys((tag.label, tag.value) for tag in todo_tags if (tag.label, tag.value) not in existing_tags_tuples))
     LOGGER.info("deploy_tags_to_cv: Creating %s tags", len(tags_to_add))
     if tags_to_add:
-        await cv_client.set_tags(workspace_id=workspace.id, tags=[(tag.label, tag.value) for tag in tags_to_add], element_type=tag_type)
+        await cv_client.set_tags(workspace_id=workspace.id, tags=tags_to_add, element_type=tag_type)
 
-    # Remove entries with no assignment from TODO: and add to deployed.
-    deployed_tags.extend(tag for tag in todo_tags if tag.device is None)
-    todo_tags = [tag for tag in todo_tags if tag.device is not None]
+    # Entries with no assignment are deployed now.
+    assigned_tags = [tag for tag in todo_tags if tag.device is not None]
+    if not assigned_tags:
+        deployed_tags.extend(todo_tags)
+        return
 
     # At this point we know that all tags are present in the workspace, so we can start assigning them where we need it.
-    LOGGER.info("deploy_tags_to_cv: Getting existing tag assignments")
-    cv_existing_assignments = await cv_client.get_tag_assignments(workspace_id=workspace.id, element_type=tag_type, creator_type="user")
-    # Build list of tuples with existing tag assignments
-    existing_assignments = [
-        (
-            assignment.key.label,
-            assignment.key.value,
-            assignment.key.device_id,
-            str(assignment.key.interface_id).rsplit("@", maxsplit=1)[0] if assignment.key.interface_id is not None else None,
-        )
-        for assignment in cv_existing_assignments
-    ]
-    LOGGER.info("deploy_tags_to_cv: Got %s tag assignments", len(existing_assignments))
-
-    # Move all existing assignments from TODO: to deployed.
-    deployed_tags.extend(tag for tag in todo_tags if (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) in existing_assignments)
-    todo_tags = [tag for tag in todo_tags if (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) not in existing_assignments]
-
-    if todo_tags:
-        LOGGER.info("deploy_tags_to_cv: Creating %s tag assignments", len(todo_tags))
-        await cv_client.set_tag_assignments(
-            workspace_id=workspace.id,
-            tag_assignments=[(tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) for tag in todo_tags],
-            element_type=tag_type,
-        )
-
-    # Move all TODO: to deployed.
-    deployed_tags.extend(todo_tags)
-
-    # Now we start removing assignments depending on strict_tags or not.
-
-    # Build set of tuples for deployed tags.
-    deployed_tags_tuples = {
-        (tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)) for tag in deployed_tags if tag.device is not None
-    }
-
-    # Build set of serial numbers for devices
-    devices_by_serial_number = {tag.device.serial_number: tag.device for tag in deployed_tags if tag.device is not None}
-
-    # If strict, we remove any assignments not specified in the inputs.
-    # If not strict, we remove any assignments with the same labels but not specified in the inputs.
-    if strict:
-        assignments_to_unassign = [
-            (label, value, device_serial_number, interface)
-            for label, value, device_serial_number, interface in existing_assignments
-            if device_serial_number in devices_by_serial_number and (label, value, device_serial_number, interface) not in deployed_tags_tuples
-        ]
-    else:
-        # Build set of tag labels we have assigned so we know which ones to remove.
-        deployed_tags_labels = {tag_tuple[0] for tag_tuple in deployed_tags_tuples}
-        assignments_to_unassign = [
-            (label, value, device_serial_number, interface)
-            for label, value, device_serial_number, interface in existing_assignments
-            if device_serial_number in devices_by_serial_number
-            and label in deployed_tags_labels
-            and (label, value, device_serial_number, interface) not in deployed_tags_tuples
-        ]
-
+    # Build dict of tuples for the tag assignments to deploy. Also gives us the device and interface objects for removed assignments below.
+    tags_by_assignment = {(tag.label, tag.value, tag.device.serial_number, getattr(tag, "interface", None)): tag for tag in assigned_tags}
+    devices_by_serial_number = {tag.device.serial_number: tag.device for tag in assigned_tags}
+
+    # If strict, we remove any assignments not specified in the inputs, so we need all assignments of the devices.
+    # If not strict, we remove any assignments with the same labels but not specified in the inputs, so we only need those labels.
+    LOGGER.info("deploy_tags_to_cv: Reconciling tag assignments")
+    existing_assignments = cv_client.stream_tag_assignments(
+        workspace_id=workspace.id,
+        element_type=tag_type,
+        creator_type="user",
+        labels=None if strict else list(dict.fromkeys(tag.label for tag in assigned_tags)),
+        device_ids=list(devices_by_serial_number),
+    )
+    assignments_to_assign = []
+    assignments_to_unassign = []
+    async for delta, assignment in reconcile_tag_assignments(existing_assignments, list(tags_by_assignment), strict):
+        (assignments_to_assign if delta == "add" else assignments_to_unassign).append(assignment)
+
+    coroutines = []
+    if assignments_to_assign:
+        LOGGER.info("deploy_tags_to_cv: Creating %s tag assignments", len(assignments_to_assign))
+        coroutines.append(cv_client.set_tag_assignments(workspace_id=workspace.id, tag_assignments=assignments_to_assign, element_type=tag_type))
     if assignments_to_unassign:
         LOGGER.info("deploy_tags_to_cv: Deleting %s tag assignments", len(assignments_to_unassign))
-        await cv_client.delete_tag_assignments(workspace_id=workspace.id, tag_assignments=assignments_to_unassign, element_type=tag_type)
+        coroutines.append(cv_client.delete_tag_assignments(workspace_id=workspace.id, tag_assignments=assignments_to_unassign, element_type=tag_type))
+    # Additions and removals never touch the same assignment, so they can be done concurrently.
+    await gather(*coroutines)
+
+    # All tags are now either already assigned or assigned above.
+    deployed_tags.extend(todo_tags)
 
     if tag_type == "interface":
         removed_tags.extend(
@@ -144,3 +118,41 @@ async def deploy_tags_to_cv(
             CVDeviceTag(label=label, value=value, device=devices_by_serial_number[serial_number])
             for label, value, serial_number, interface in assignments_to_unassign
         )
+
+
+async def reconcile_tag_assignments(
+    existing_assignments: AsyncIterable[TagAssignment],
+    assignments: list[tuple[str, str, str, str | None]],
+    strict: bool,
+) -> AsyncIterator[tuple[Literal["add", "remove"], tuple[str, str, str, str | None]]]:
+    """
+    Compare existing tag assignments with the tag assignments to deploy and yield the changes needed.
+
+    Existing assignments are consumed as they are streamed from CloudVision, so removals are yielded right away.
+    Additions are yielded once all existing assignments have been seen, in the order of the given assignments.
+    Each existing assignment is looked up in sets, so the cost is linear in the number of assignments.
+
+    Parameters:
+        existing_assignments: Existing tag assignments in the workspace.
+        assignments: Tag assignments to deploy as tuples of (<tag_label>, <tag_value>, <device_id/serial_number>, <interface_name | None>).
+        strict: Remove all other assignments from the devices, instead of only the ones with the same labels.
+
+    Yields:
+        Tuples of ("add" | "remove", <tag assignment tuple>).
+    """
+    deployed_assignments = set(assignments)
+    # Keeping the order of the assignments.
+    missing_assignments = dict.fromkeys(assignments)
+    device_ids = {device_id for _label, _value, device_id, _interface in assignments}
+    labels = {label for label, _value, _device_id, _interface in assignments}
+
+    async for existing_assignment in existing_assignments:
+        key = existing_assignment.key
+        assignment = (key.label, key.value, key.device_id, key.interface_id.rsplit("@", maxsplit=1)[0] if key.interface_id is not None else None)
+        if assignment in deployed_assignments:
+            missing_assignments.pop(assignment, None)
+        elif key.device_id in device_ids and (strict or key.label in labels):
+            yield "remove", assignment
+
+    for assignment in missing_assignments:
+        yield "add", assignment
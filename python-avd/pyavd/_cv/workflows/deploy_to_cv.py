@@ -3,14 +3,20 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from asyncio import Task, create_task, gather
+from contextlib import contextmanager
+from functools import partial
 from logging import getLogger
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from pyavd._cv.client import CVClient
 from pyavd._cv.client.exceptions import CVClientException
+from pyavd._cv.client.studio import TOPOLOGY_STUDIO_ID
 
 from .create_workspace_on_cv import create_workspace_on_cv
-from .deploy_configs_to_cv import deploy_configs_to_cv
-from .deploy_cv_pathfinder_metadata_to_cv import deploy_cv_pathfinder_metadata_to_cv
+from .deploy_configs_to_cv import STATIC_CONFIGLET_STUDIO_ID, deploy_configs_to_cv
+from .deploy_cv_pathfinder_metadata_to_cv import CV_PATHFINDER_METADATA_STUDIO_ID, deploy_cv_pathfinder_metadata_to_cv
 from .deploy_studio_inputs_to_cv import deploy_studio_inputs_to_cv
 from .deploy_tags_to_cv import deploy_tags_to_cv
 from .finalize_change_control_on_cv import finalize_change_control_on_cv
@@ -29,9 +35,53 @@ from .models import (
 )
 from .verify_devices_on_cv import verify_devices_on_cv
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
 LOGGER = getLogger(__name__)
 
 
+@contextmanager
+def timed_stage(name: str, stage_timings: dict[str, float]) -> Iterator[None]:
+    """Store the wall time spent in the context as the timing of the given stage. Not stored if the stage fails."""
+    start = perf_counter()
+    yield
+    stage_timings[name] = perf_counter() - start
+    LOGGER.info("deploy_to_cv: Stage '%s' finished in %.3f seconds.", name, stage_timings[name])
+
+
+async def run_stages(stages: dict[str, tuple[Callable[[], Awaitable[None]], set[str]]], stage_timings: dict[str, float]) -> None:
+    """
+    Run the given stages concurrently, starting each stage once all of its prerequisites have finished.
+
+    Args:
+        stages: Dict keyed by stage name, with a tuple of the coroutine function to run and the set of names of prerequisite stages.
+            Stages must be given after their prerequisites.
+        stage_timings: Dict where the wall time of each finished stage is stored.
+
+    Raises:
+        The first exception raised by any stage. All other stages are cancelled first.
+    """
+    tasks: dict[str, Task] = {}
+
+    async def run_stage(name: str, stage: Callable[[], Awaitable[None]], prerequisites: list[Task]) -> None:
+        await gather(*prerequisites)
+        with timed_stage(name, stage_timings):
+            await stage()
+
+    for name, (stage, prerequisites) in stages.items():
+        tasks[name] = create_task(run_stage(name, stage, [tasks[prerequisite] for prerequisite in prerequisites]))
+
+    try:
+        await gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        # Wait for the cancelled tasks, so they do not continue to change the workspace after the error.
+        await gather(*tasks.values(), return_exceptions=True)
+        raise
+
+
 async def deploy_to_cv(
     cloudvision: CloudVision,
     workspace: CVWorkspace | None = None,
@@ -127,68 +177,106 @@ async def deploy_to_cv(
     if cv_pathfinder_metadata is None:
         cv_pathfinder_metadata = []
     try:
-        async with CVClient(servers=cloudvision.servers, token=cloudvision.token, verify_certs=cloudvision.verify_certs) as cv_client:
+        async with CVClient(servers=cloudvision.servers, token=cloudvision.token, port=cloudvision.port, verify_certs=cloudvision.verify_certs) as cv_client:
             # Create workspace
-            await create_workspace_on_cv(workspace=result.workspace, cv_client=cv_client)
-
-            try:
-                # Verify devices exist and update CVDevice objects with _exists_on_cv.
-                # Depending on skip_missing_devices we will raise or skip missing devices.
-                # Since verify_devices will silently return if _exists_on_cv is already set,
-                # we can just send all the items even if we have duplicate device objects.
-                await verify_devices_on_cv(
-                    devices=(
-                        [tag.device for tag in device_tags if tag.device is not None]
-                        + [tag.device for tag in interface_tags if tag.device is not None]
-                        + [config.device for config in configs if config.device is not None]
-                    ),
-                    workspace_id=result.workspace.id,
-                    skip_missing_devices=skip_missing_devices,
-                    warnings=result.warnings,
-                    cv_client=cv_client,
-                )
-
-                # Deploy device tags
-                await deploy_tags_to_cv(
-                    tags=device_tags,
-                    workspace=result.workspace,
-                    strict=strict_tags,
-                    skipped_tags=result.skipped_device_tags,
-                    deployed_tags=result.deployed_device_tags,
-                    removed_tags=result.removed_device_tags,
-                    cv_client=cv_client,
-                )
+            with timed_stage("create_workspace", result.stage_timings):
+                await create_workspace_on_cv(workspace=result.workspace, cv_client=cv_client)
 
-                # Deploy interface tags
-                await deploy_tags_to_cv(
-                    tags=interface_tags,
-                    workspace=result.workspace,
-                    strict=strict_tags,
-                    skipped_tags=result.skipped_interface_tags,
-                    deployed_tags=result.deployed_interface_tags,
-                    removed_tags=result.removed_interface_tags,
-                    cv_client=cv_client,
-                )
-
-                # Deploy configs
-                await deploy_configs_to_cv(
-                    configs=configs,
-                    result=result,
-                    cv_client=cv_client,
-                )
+            # Studio Inputs are deployed after other stages updating the same studios, to get the same result as running the stages in sequence.
+            studio_ids = {studio_input.studio_id for studio_input in studio_inputs}
+            studio_inputs_prerequisites = set()
+            if TOPOLOGY_STUDIO_ID in studio_ids:
+                studio_inputs_prerequisites.add("verify_devices")
+            if STATIC_CONFIGLET_STUDIO_ID in studio_ids:
+                studio_inputs_prerequisites.add("deploy_configs")
+            cv_pathfinder_metadata_prerequisites = {"verify_devices"}
+            if CV_PATHFINDER_METADATA_STUDIO_ID in studio_ids:
+                cv_pathfinder_metadata_prerequisites.add("deploy_studio_inputs")
 
-                # Deploy Studio Inputs
-                await deploy_studio_inputs_to_cv(
-                    studio_inputs=studio_inputs,
-                    result=result,
-                    cv_client=cv_client,
-                )
-
-                # Deploy CV Pathfinder metadata
-                await deploy_cv_pathfinder_metadata_to_cv(
-                    cv_pathfinder_metadata=cv_pathfinder_metadata,
-                    result=result,
-                    cv_client=cv_client,
+            try:
+                # The stages are run concurrently once their prerequisites are done.
+                # All stages working on devices must wait for verify_devices to identify the devices.
+                await run_stages(
+                    {
+                        # Verify devices exist and update CVDevice objects with _exists_on_cv.
+                        # Depending on skip_missing_devices we will raise or skip missing devices.
+                        # Since verify_devices will silently return if _exists_on_cv is already set,
+                        # we can just send all the items even if we have duplicate device objects.
+                        "verify_devices": (
+                            partial(
+                                verify_devices_on_cv,
+                                devices=(
+                                    [tag.device for tag in device_tags if tag.device is not None]
+                                    + [tag.device for tag in interface_tags if tag.device is not None]
+                                    + [config.device for config in configs if config.device is not None]
+                                ),
+                                workspace_id=result.workspace.id,
+                                skip_missing_devices=skip_missing_devices,
+                                warnings=result.warnings,
+                                cv_client=cv_client,
+                            ),
+                            set(),
+                        ),
+                        # Deploy device tags
+                        "deploy_device_tags": (
+                            partial(
+                                deploy_tags_to_cv,
+                                tags=device_tags,
+                                workspace=result.workspace,
+                                strict=strict_tags,
+                                skipped_tags=result.skipped_device_tags,
+                                deployed_tags=result.deployed_device_tags,
+                                removed_tags=result.removed_device_tags,
+                                cv_client=cv_client,
+                            ),
+                            {"verify_devices"},
+                        ),
+                        # Deploy interface tags
+                        "deploy_interface_tags": (
+                            partial(
+                                deploy_tags_to_cv,
+                                tags=interface_tags,
+                                workspace=result.workspace,
+                                strict=strict_tags,
+                                skipped_tags=result.skipped_interface_tags,
+                                deployed_tags=result.deployed_interface_tags,
+                                removed_tags=result.removed_interface_tags,
+                                cv_client=cv_client,
+                            ),
+                            {"verify_devices"},
+                        ),
+                        # Deploy configs
+                        "deploy_configs": (
+                            partial(
+                                deploy_configs_to_cv,
+                                configs=configs,
+                                result=result,
+                                cv_client=cv_client,
+                            ),
+                            {"verify_devices"},
+                        ),
+                        # Deploy Studio Inputs
+                        "deploy_studio_inputs": (
+                            partial(
+                                deploy_studio_inputs_to_cv,
+                                studio_inputs=studio_inputs,
+                                result=result,
+                                cv_client=cv_client,
+                            ),
+                            studio_inputs_prerequisites,
+                        ),
+                        # Deploy CV Pathfinder metadata
+                        "deploy_cv_pathfinder_metadata": (
+                            partial(
+                                deploy_cv_pathfinder_metadata_to_cv,
+                                cv_pathfinder_metadata=cv_pathfinder_metadata,
+                                result=result,
+                                cv_client=cv_client,
+                            ),
+                            cv_pathfinder_metadata_prerequisites,
+                        ),
+                    },
+                    result.stage_timings,
                 )
 
             except CVClientException as e:
@@ -201,7 +289,8 @@ async def deploy_to_cv(
                 result.workspace.state = "abandoned"
                 return result
 
-            await finalize_workspace_on_cv(workspace=result.workspace, cv_client=cv_client)
+            with timed_stage("finalize_workspace", result.stage_timings):
+                await finalize_workspace_on_cv(workspace=result.workspace, cv_client=cv_client)
 
             # Create/update CVChangeControl object with ID created by workspace.
             if result.workspace.change_control_id is not None:
@@ -214,7 +303,8 @@ async def deploy_to_cv(
             # TODO: Remove once we are done with testing (?)
             # Run, Delete or run and wait for Change Control if the workspace created one.
             if result.change_control is not None and result.change_control.id is not None:
-                await finalize_change_control_on_cv(change_control=result.change_control, cv_client=cv_client)
+                with timed_stage("finalize_change_control", result.stage_timings):
+                    await finalize_change_control_on_cv(change_control=result.change_control, cv_client=cv_client)
 
     except CVClientException as e:
         result.errors.append(e)
@@ -14,6 +14,7 @@ class CloudVision:
     servers: str | list[str]
     token: str
     verify_certs: bool = True
+    port: int = 443
 
 
 @dataclass
@@ -121,12 +122,20 @@ class DeployToCvResult:
     deployed_studio_inputs: list[CVStudioInputs] = field(default_factory=list)
     deployed_cv_pathfinder_metadata: list[CVPathfinderMetadata] = field(default_factory=list)
     skipped_configs: list[CVEosConfig] = field(default_factory=list)
+    """Configs skipped because the device is missing from CloudVision."""
+    unchanged_configs: list[CVEosConfig] = field(default_factory=list)
+    """Configs not uploaded because the configlet on CloudVision already has the same content."""
     skipped_device_tags: list[CVDeviceTag] = field(default_factory=list)
     skipped_interface_tags: list[CVInterfaceTag] = field(default_factory=list)
     skipped_cv_pathfinder_metadata: list[CVPathfinderMetadata] = field(default_factory=list)
     removed_configs: list[str] = field(default_factory=list)
     removed_device_tags: list[CVDeviceTag] = field(default_factory=list)
     removed_interface_tags: list[CVInterfaceTag] = field(default_factory=list)
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    """
+    Wall time in seconds spent in each stage of the workflow, in the order the stages finished.
+    Stages without dependencies between them run concurrently, so the timings may overlap.
+    """
 
 
 @dataclass
@@ -3,6 +3,7 @@
 # that can be found in the LICENSE file.
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
@@ -29,12 +30,7 @@ class AvdFacts:
 
         Using MRO, which is the same way Python resolves attributes.
         """
-        keys = []
-        for c in cls.mro():
-            c_keys = [key for key in c.__dict__ if key not in keys]
-            keys.extend(c_keys)
-
-        return keys
+        return list(cls._get_key_index().all_keys)
 
     @classmethod
     def keys(cls) -> list[str]:
@@ -44,16 +40,27 @@ class AvdFacts:
         Actually the returned list are the names of attributes not starting with "_" and using cached_property class.
         The "_" check is added to allow support for "internal" cached_properties storing temporary values.
         """
-        return [key for key in cls._keys() if not key.startswith("_") and isinstance(getattr(cls, key), cached_property)]
+        return list(cls._get_key_index().keys)
 
     @classmethod
     def internal_keys(cls) -> list[str]:
         """Return a list containing the names of attributes starting with "_" and using cached_property class."""
-        return [key for key in cls._keys() if key.startswith("_") and isinstance(getattr(cls, key), cached_property)]
+        return list(cls._get_key_index().internal_keys)
+
+    @classmethod
+    def _get_key_index(cls) -> AvdFactsKeyIndex:
+        """
+        Return the key index of the class.
+
+        The index is built on the first call for each class, since the attributes of the classes do not change after the classes are created.
+        """
+        if (key_index := _KEY_INDEXES.get(cls)) is None:
+            key_index = _KEY_INDEXES[cls] = AvdFactsKeyIndex.from_class(cls)
+        return key_index
 
     def get(self, key: str, default_value: Any = None) -> Any:
         """Emulate the builtin dict .get method."""
-        if key in self.keys():
+        if key in self._get_key_index().key_set:
             return getattr(self, key)
         return default_value
 
@@ -65,8 +72,36 @@ class AvdFacts:
         If the value is not cached, it will be resolved by the attribute function first.
         Empty values are removed from the returned data.
         """
-        return {key: getattr(self, key) for key in self.keys() if getattr(self, key) is not None}
+        return {key: value for key in self._get_key_index().keys if (value := getattr(self, key)) is not None}
 
     def clear_cache(self) -> None:
-        for key in self.keys() + self.internal_keys():
+        key_index = self._get_key_index()
+        for key in key_index.keys + key_index.internal_keys:
             self.__dict__.pop(key, None)
+
+
+@dataclass(frozen=True)
+class AvdFactsKeyIndex:
+    """Names of the attributes of an AvdFacts class, computed once per class."""
+
+    all_keys: tuple[str, ...]
+    """All class attributes including those of base Classes and Mixins in MRO order."""
+    keys: tuple[str, ...]
+    """Names of the cached_property attributes not starting with "_"."""
+    key_set: frozenset[str]
+    """Same as keys for fast lookups."""
+    internal_keys: tuple[str, ...]
+    """Names of the cached_property attributes starting with "_"."""
+
+    @classmethod
+    def from_class(cls, facts_class: type[AvdFacts]) -> AvdFactsKeyIndex:
+        # Using a dict to keep the order of first occurrence while skipping keys overridden in subclasses.
+        all_keys = tuple(dict.fromkeys(key for c in facts_class.mro() for key in c.__dict__))
+        cached_properties = [key for key in all_keys if isinstance(getattr(facts_class, key), cached_property)]
+        keys = tuple(key for key in cached_properties if not key.startswith("_"))
+        internal_keys = tuple(key for key in cached_properties if key.startswith("_"))
+        return cls(all_keys=all_keys, keys=keys, key_set=frozenset(keys), internal_keys=internal_keys)
+
+
+_KEY_INDEXES: dict[type[AvdFacts], AvdFactsKeyIndex] = {}
+"""Key index per AvdFacts class. Populated by AvdFacts._get_key_index()."""
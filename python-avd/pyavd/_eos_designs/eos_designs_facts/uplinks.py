@@ -156,7 +156,7 @@ class UplinksMixin:
 
             uplink_switch = uplink_switches[uplink_index]
             uplink_switch_interface = uplink_switch_interfaces[uplink_index]
-            if uplink_switch is None or uplink_switch not in self.shared_utils.all_fabric_devices:
+            if uplink_switch is None or uplink_switch not in self.shared_utils.fabric_index.hostnames:
                 # Invalid uplink_switch. Skipping.
                 continue
 
@@ -139,9 +139,9 @@ class VlansMixin:
 
         vlans = set()
         trunk_groups = set()
-        for fabric_switch in self.shared_utils.all_fabric_devices:
+        for fabric_switch in self.shared_utils.fabric_index.get_downstream_switches(self.shared_utils.hostname):
             fabric_switch_facts: EosDesignsFacts = self.shared_utils.get_peer_facts(fabric_switch, required=True)
-            if fabric_switch_facts.shared_utils.uplink_type == "port-channel" and self.shared_utils.hostname in fabric_switch_facts.uplink_peers:
+            if fabric_switch_facts.shared_utils.uplink_type == "port-channel":
                 fabric_switch_endpoint_vlans, fabric_switch_endpoint_trunk_groups = fabric_switch_facts._endpoint_vlans_and_trunk_groups
                 vlans.update(fabric_switch_endpoint_vlans)
                 trunk_groups.update(fabric_switch_endpoint_trunk_groups)
@@ -12,6 +12,7 @@ from pyavd._eos_designs.avdfacts import AvdFacts
 from pyavd._utils import default, get, get_item, get_networks_from_pool
 from pyavd.j2filters import natural_sort
 
+from .address_index import AddressIndex
 from .topology import Topology
 
 if TYPE_CHECKING:
@@ -217,14 +218,31 @@ class FabricDocumentationFacts(AvdFacts):
 
     def render_networks_as_list(self, networks: list[T_Network], addresses: list[T_Network]) -> list:
         """Helper function to build IP pool data for a list of pools."""
-        return natural_sort([self.get_network_data(network, addresses) for network in networks], sort_key="network")
+        address_index = AddressIndex(addresses)
+        return natural_sort([self.get_network_data(network, address_index) for network in networks], sort_key="network")
 
-    def get_network_data(self, network: T_Network, addresses: list[T_Network]) -> dict:
-        """Helper function to build IP pool data for one IP pool."""
+    def get_network_data(self, network: T_Network, address_index: AddressIndex) -> dict:
+        """
+        Helper function to build IP pool data for one IP pool.
+
+        Besides the size and usage, the free blocks of the pool are returned as the largest possible networks.
+        The fragmentation is the percentage of free addresses outside of the largest free block,
+        so 0 means that all free addresses can be allocated as one block.
+        """
         size = self.get_network_size(network)
-        used = self.count_addresses_in_network(network, addresses)
+        used = address_index.count(network)
+        free_blocks = address_index.get_free_blocks(network)
+        free = sum(free_block.num_addresses for free_block in free_blocks)
+        largest_free_block = max((free_block.num_addresses for free_block in free_blocks), default=0)
         # rounding up on 100 * percent and then divide by 100 to give 11.22% rounded up on last decimal.
-        return {"network": network, "size": size, "used": used, "used_percent": (ceil((100 * used / size) * 100) / 100)}
+        return {
+            "network": network,
+            "size": size,
+            "used": used,
+            "used_percent": (ceil((100 * used / size) * 100) / 100),
+            "free_blocks": free_blocks,
+            "fragmentation_percent": (ceil((100 * (free - largest_free_block) / free) * 100) / 100) if free else 0,
+        }
 
     def get_network_size(self, network: IPv4Network | IPv6Network) -> int:
         """
@@ -237,7 +255,7 @@ class FabricDocumentationFacts(AvdFacts):
 
     def count_addresses_in_network(self, network: T_Network, addresses: list[T_Network]) -> int:
         """Helper function to count the number of addresses that fall within the given IP pool."""
-        return len([True for address in addresses if address.subnet_of(network)])
+        return AddressIndex(addresses).count(network)
 
     @cached_property
     def all_connected_endpoints(self) -> dict[str, list]:
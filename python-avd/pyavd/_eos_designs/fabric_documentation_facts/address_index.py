@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from ipaddress import summarize_address_range
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from ipaddress import IPv4Network, IPv6Network
+
+
+class AddressIndex:
+    """
+    Index of IP addresses as sorted integer intervals, so the addresses within a network are found with bisect.
+
+    Each address is given as a network like `10.0.0.0/31` for an interface IP `10.0.0.1/31`, and covers the interval of that network.
+    Addresses are kept per IP version, since a network can only contain addresses of the same version.
+    """
+
+    _starts: dict[int, list[int]]
+    """Sorted first integer address of each interval per IP version."""
+    _ends: dict[int, list[int]]
+    """Last integer address of each interval per IP version, in the same order as _starts."""
+
+    def __init__(self, addresses: Iterable[IPv4Network | IPv6Network]) -> None:
+        intervals: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+        for address in addresses:
+            intervals[address.version].append((int(address.network_address), int(address.broadcast_address)))
+
+        self._starts = {}
+        self._ends = {}
+        for version, version_intervals in intervals.items():
+            version_intervals.sort()
+            self._starts[version] = [start for start, _ in version_intervals]
+            self._ends[version] = [end for _, end in version_intervals]
+
+    def _get_range(self, network: IPv4Network | IPv6Network) -> tuple[int, int]:
+        """Return the indexes of the first and past the last interval starting within the given network."""
+        starts = self._starts[network.version]
+        return bisect_left(starts, int(network.network_address)), bisect_right(starts, int(network.broadcast_address))
+
+    def count(self, network: IPv4Network | IPv6Network) -> int:
+        """Return the number of addresses within the given network."""
+        first, last = self._get_range(network)
+        # Intervals are aligned networks, so an interval starting within the network is also ending within the network,
+        # unless it is larger than the network. Then it must start at the first address of the network.
+        network_end = int(network.broadcast_address)
+        ends = self._ends[network.version]
+        at_network_start = bisect_right(self._starts[network.version], int(network.network_address), first, last)
+        return last - first - sum(1 for index in range(first, at_network_start) if ends[index] > network_end)
+
+    def get_free_blocks(self, network: IPv4Network | IPv6Network) -> list[IPv4Network | IPv6Network]:
+        """Return the largest possible networks covering all addresses of the given network not used by any address in the index."""
+        first, last = self._get_range(network)
+        starts = self._starts[network.version]
+        ends = self._ends[network.version]
+        address_type = type(network.network_address)
+        free_blocks = []
+        next_free = int(network.network_address)
+        network_end = int(network.broadcast_address)
+        for index in range(first, last):
+            if starts[index] > next_free:
+                free_blocks.extend(summarize_address_range(address_type(next_free), address_type(starts[index] - 1)))
+            next_free = max(next_free, ends[index] + 1)
+        if next_free <= network_end:
+            free_blocks.extend(summarize_address_range(address_type(next_free), address_type(network_end)))
+        return free_blocks
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyavd._utils import get
+from pyavd.j2filters import range_expand
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .eos_designs_facts import EosDesignsFacts
+
+
+def is_mpls_client(facts: EosDesignsFacts | dict) -> bool:
+    """Return True if the facts are of an MPLS overlay client, either by mpls_overlay_role or as an EVPN client using MPLS."""
+    return facts.get("mpls_overlay_role") == "client" or (facts.get("evpn_role") == "client" and get(facts, "overlay.evpn_mpls") is True)
+
+
+class FabricIndex:
+    """
+    Reverse lookups across the facts of all devices in the fabric.
+
+    Used in place of looping over all fabric devices and reading the facts of each of them for every device.
+    The index is created once per fabric and set as "avd_fabric_index" in the hostvars of all devices, so each lookup is only built once.
+    During the facts phase it is created along with "avd_switch_facts". During the structured config phase it is created by the caller
+    of the structured config generation, like `build_fabric`.
+
+    Works with both "avd_switch_facts" holding EosDesignsFacts instances during the facts phase
+    and "avd_switch_facts" holding rendered facts during the structured config phase.
+    All lookups are built lazily on first use.
+    """
+
+    _avd_switch_facts: Mapping[str, dict]
+    _vlans: dict[str, list[int]]
+
+    def __init__(self, avd_switch_facts: Mapping[str, dict]) -> None:
+        self._avd_switch_facts = avd_switch_facts
+        self._vlans = {}
+
+    def _get_facts(self, hostname: str) -> EosDesignsFacts | dict:
+        return self._avd_switch_facts[hostname]["switch"]
+
+    @cached_property
+    def hostnames(self) -> frozenset[str]:
+        """Hostnames of all fabric devices."""
+        return frozenset(self._avd_switch_facts)
+
+    @cached_property
+    def _downstream_switches(self) -> dict[str, list[str]]:
+        downstream_switches = {}
+        for hostname in self._avd_switch_facts:
+            for uplink_peer in self._get_facts(hostname).get("uplink_peers") or []:
+                downstream_switches.setdefault(uplink_peer, []).append(hostname)
+        return downstream_switches
+
+    def get_downstream_switches(self, hostname: str) -> list[str]:
+        """Return the hostnames of all devices with the given device as uplink peer in the order of the fabric devices."""
+        return self._downstream_switches.get(hostname, [])
+
+    @cached_property
+    def vteps(self) -> list[str]:
+        """Hostnames of all devices with a VTEP IP in the order of the fabric devices."""
+        return [hostname for hostname in self._avd_switch_facts if self._get_facts(hostname).get("vtep_ip") is not None]
+
+    @cached_property
+    def vteps_per_dc(self) -> dict[str | None, list[str]]:
+        """Hostnames of all devices with a VTEP IP per dc_name in the order of the fabric devices."""
+        vteps_per_dc = {}
+        for hostname in self.vteps:
+            vteps_per_dc.setdefault(self._get_facts(hostname).get("dc_name"), []).append(hostname)
+        return vteps_per_dc
+
+    @cached_property
+    def mpls_clients(self) -> list[str]:
+        """Hostnames of all MPLS overlay clients in the order of the fabric devices."""
+        return [hostname for hostname in self._avd_switch_facts if is_mpls_client(self._get_facts(hostname))]
+
+    def get_vlans(self, hostname: str) -> list[int]:
+        """Return the expanded list of VLANs of the given device."""
+        if (vlans := self._vlans.get(hostname)) is None:
+            vlans = self._vlans[hostname] = [int(vlan) for vlan in range_expand(self._get_facts(hostname).get("vlans", []))]
+        return vlans
@@ -40,7 +40,8 @@ class FilteredTenantsMixin:
             for original_tenant in network_services_key.value:
                 if original_tenant.name not in filter_tenants and "all" not in filter_tenants:
                     continue
-                tenant = original_tenant._deepcopy()
+                # Copy-on-write since the loaded inputs can be shared between devices. Nested models are thawed when changed below.
+                tenant = original_tenant._thawed()
                 tenant.l2vlans = self.filtered_l2vlans(tenant)
                 tenant.vrfs = self.filtered_vrfs(tenant)
                 filtered_tenants.append(tenant)
@@ -90,6 +91,8 @@ class FilteredTenantsMixin:
         filtered_l2vlans = tenant.l2vlans._filtered(
             lambda l2vlan: self.is_accepted_vlan(l2vlan) and bool("all" in self.filter_tags or set(l2vlan.tags).intersection(self.filter_tags))
         )
+        # Copy-on-write since the loaded l2vlans can be shared between devices.
+        filtered_l2vlans = EosDesigns._DynamicKeys.DynamicNetworkServicesItem.NetworkServicesItem.L2vlans(l2vlan._thawed() for l2vlan in filtered_l2vlans)
         # Set tenant on all l2vlans TODO: avoid this.
         for l2vlan in filtered_l2vlans:
             l2vlan._tenant = tenant.name
@@ -142,7 +145,7 @@ class FilteredTenantsMixin:
             return accepted_vlans
 
         uplink_switches = unique(self.uplink_switches)
-        uplink_switches = [uplink_switch for uplink_switch in uplink_switches if uplink_switch in self.all_fabric_devices]
+        uplink_switches = [uplink_switch for uplink_switch in uplink_switches if uplink_switch in self.fabric_index.hostnames]
         for uplink_switch in uplink_switches:
             uplink_switch_facts = self.get_peer_facts(uplink_switch, required=True)
             uplink_switch_vlans = uplink_switch_facts.get("vlans", [])
@@ -191,11 +194,12 @@ class FilteredTenantsMixin:
         """
         filtered_vrfs = EosDesigns._DynamicKeys.DynamicNetworkServicesItem.NetworkServicesItem.Vrfs()
 
-        for vrf in tenant.vrfs._natural_sorted():
-            if not self.is_accepted_vrf(vrf):
+        for original_vrf in tenant.vrfs._natural_sorted():
+            if not self.is_accepted_vrf(original_vrf):
                 continue
 
-            # Copying original_vrf
+            # Copy-on-write of the original vrf
+            vrf = original_vrf._thawed()
             vrf._tenant = tenant.name
 
             vrf.bgp_peers = vrf.bgp_peers._filtered(lambda bgp_peer: self.hostname in bgp_peer.nodes)._natural_sorted(sort_key="ip_address")
@@ -286,8 +290,12 @@ class FilteredTenantsMixin:
             merged_svi = svi._deepinherited(
                 svi_profile._cast_as(EosDesigns._DynamicKeys.DynamicNetworkServicesItem.NetworkServicesItem.VrfsItem.SvisItem, ignore_extra_keys=True)
             )
+        elif self.hostname in svi.nodes:
+            # Copy since the node specific SVI is merged in-place below.
+            merged_svi = svi._deepcopy()
         else:
-            merged_svi = svi
+            # Copy-on-write since the loaded inputs can be shared between devices.
+            merged_svi = svi._thawed()
 
         # Merge node specific SVI over the general SVI data.
         if self.hostname in merged_svi.nodes:
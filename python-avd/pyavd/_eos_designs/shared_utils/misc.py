@@ -6,6 +6,7 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+from pyavd._eos_designs.fabric_index import FabricIndex
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError, AristaAvdMissingVariableError
 from pyavd._utils import default, get
 from pyavd.j2filters import range_expand
@@ -30,6 +31,17 @@ class MiscMixin:
         avd_switch_facts: dict = get(self.hostvars, "avd_switch_facts", required=True)
         return list(avd_switch_facts.keys())
 
+    @cached_property
+    def fabric_index(self: SharedUtils) -> FabricIndex:
+        """
+        Index of lookups across the facts of all fabric devices. See FabricIndex.
+
+        Shared by all devices when set as "avd_fabric_index" in the hostvars. Otherwise created for this device only.
+        """
+        if (fabric_index := self.hostvars.get("avd_fabric_index")) is not None:
+            return fabric_index
+        return FabricIndex(get(self.hostvars, "avd_switch_facts", required=True))
+
     @cached_property
     def hostname(self: SharedUtils) -> str:
         """Hostname set based on inventory_hostname variable. TODO: Get a proper attribute on the class instead of gleaning from the regular inputs."""
@@ -42,7 +54,7 @@ class MiscMixin:
     @cached_property
     def filter_tags(self: SharedUtils) -> list:
         """Return filter.tags + group if defined."""
-        filter_tags = self.node_config.filter.tags
+        filter_tags = list(self.node_config.filter.tags)
         if self.group is not None:
             filter_tags.append(self.group)
         return filter_tags
@@ -13,6 +13,66 @@ if TYPE_CHECKING:
     from . import SharedUtils
 
 
+class NodeTypeIndex:
+    """
+    Lookups in one node type config, shared by all devices using the same node type config.
+
+    The loaded node type configs are shared between devices with identical inputs, so the index is built once for all of them.
+    See `get_node_type_index`.
+    """
+
+    node_type_config: EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes
+    node_groups: dict[str, EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodeGroupsItem]
+    """Node group per hostname. If a hostname is in multiple node groups, the first one is used."""
+    _inherited_node_groups: dict[str, EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem]
+
+    def __init__(self, node_type_config: EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes) -> None:
+        self.node_type_config = node_type_config
+        self.node_groups = {}
+        for node_group in node_type_config.node_groups:
+            for node in node_group.nodes:
+                self.node_groups.setdefault(node.name, node_group)
+        self._inherited_node_groups = {}
+
+    @cached_property
+    def defaults(self) -> EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem:
+        """The node type defaults as NodesItem. Frozen, since it is shared between devices."""
+        return self.node_type_config.defaults._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True)._freeze()
+
+    def get_inherited_node_group(self, node_group: str) -> EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem:
+        """
+        Return the node group config inheriting from the node type defaults as NodesItem.
+
+        Frozen, since it is shared between devices. Built on the first call for each node group.
+        """
+        if (inherited_node_group := self._inherited_node_groups.get(node_group)) is None:
+            inherited_node_group = (
+                self.node_type_config.node_groups[node_group]
+                ._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True)
+                ._deepcopy()
+            )
+            inherited_node_group._deepinherit(self.defaults)
+            self._inherited_node_groups[node_group] = inherited_node_group._freeze()
+        return inherited_node_group
+
+
+def get_node_type_index(node_type_config: EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes) -> NodeTypeIndex:
+    """
+    Return the NodeTypeIndex for the given node type config.
+
+    For frozen node type configs shared between devices, the index is created on the first call and stored as the private attribute
+    "_node_type_index" on the node type config, so it is reused for as long as the node type config is shared.
+    """
+    if not node_type_config._frozen:
+        return NodeTypeIndex(node_type_config)
+
+    # A copy of the node type config can carry the index of the original, so the index is only used if built from this instance.
+    if (node_type_index := getattr(node_type_config, "_node_type_index", None)) is None or node_type_index.node_type_config is not node_type_config:
+        node_type_index = NodeTypeIndex(node_type_config)
+        node_type_config._node_type_index = node_type_index
+    return node_type_index
+
+
 class NodeConfigMixin:
     """
     Mixin Class providing a subset of SharedUtils.
@@ -39,6 +99,11 @@ class NodeConfigMixin:
         msg = f"'type' is set to '{self.type}', for which node configs should use the key '{node_type_key}'. '{node_type_key}' was not found."
         raise AristaAvdInvalidInputsError(msg)
 
+    @cached_property
+    def node_type_index(self: SharedUtils) -> NodeTypeIndex:
+        """Lookups in the node type config, shared by all devices using the same node type config."""
+        return get_node_type_index(self.node_type_config)
+
     @cached_property
     def node_group_config(self: SharedUtils) -> EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodeGroupsItem | None:
         """
@@ -46,11 +111,7 @@ class NodeConfigMixin:
 
         Used by MLAG and WAN HA logic to find out who our MLAG / WAN HA peer is.
         """
-        for node_group in self.node_type_config.node_groups:
-            if self.hostname in node_group.nodes:
-                return node_group
-
-        return None
+        return self.node_type_index.node_groups.get(self.hostname)
 
     @cached_property
     def node_config(self: SharedUtils) -> EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem:
@@ -63,21 +124,25 @@ class NodeConfigMixin:
                 <node_type_key>.node_groups.[<node_group>].nodes.[<node>] ->
                     <node_type_key>.nodes.[<node>]
         """
+        # Inheritance updates nested objects in-place, including objects inherited from an earlier level.
+        # All levels except the last are copied, since the loaded inputs can be shared between devices.
+        # The last level is the node group inheriting from the defaults, which is built once per node group and shared.
         node_config = (
-            self.node_type_config.nodes[self.hostname]
+            self.node_type_config.nodes[self.hostname]._deepcopy()
             if self.hostname in self.node_type_config.nodes
             else EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem()
         )
 
-        if self.node_group_config is not None:
-            node_config._deepinherit(
-                self.node_group_config.nodes[self.hostname]._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True)
-            )
-            node_config._deepinherit(self.node_group_config._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True))
+        if self.node_group_config is None:
+            node_config._deepinherit(self.node_type_index.defaults)
+            return node_config
 
         node_config._deepinherit(
-            self.node_type_config.defaults._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True)
+            self.node_group_config.nodes[self.hostname]
+            ._cast_as(EosDesigns._DynamicKeys.DynamicNodeTypesItem.NodeTypes.NodesItem, ignore_extra_keys=True)
+            ._deepcopy()
         )
+        node_config._deepinherit(self.node_type_index.get_inherited_node_group(self.node_group_config.group))
 
         return node_config
 
@@ -7,7 +7,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
-from pyavd._utils import get, template_var
+from pyavd._utils import Undefined, get, template_var
 
 if TYPE_CHECKING:
     from typing import TypeVar
@@ -76,7 +76,10 @@ class UtilsMixin:
             # Notice reuse of the same variable with the merged content.
             port_profile = port_profile._deepinherited(parent_profile)
 
-        delattr(port_profile, "parent_profile")
+        if port_profile._get_defined_attr("parent_profile") is not Undefined:
+            # Copy-on-write since the loaded inputs can be shared between devices.
+            port_profile = port_profile._thawed()
+            delattr(port_profile, "parent_profile")
         return port_profile
 
     def get_merged_adapter_settings(self: SharedUtils, adapter_or_network_port_settings: ADAPTER_SETTINGS) -> ADAPTER_SETTINGS:
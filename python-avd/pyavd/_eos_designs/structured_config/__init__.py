@@ -63,6 +63,7 @@ def get_structured_config(
     templar: object | None = None,
     *,
     validate: bool = True,
+    shared_models: dict | None = None,
 ) -> dict:
     """
     Generate structured_config for a device.
@@ -78,6 +79,8 @@ def get_structured_config(
             The templar to use for rendering templates.
         validate:
             Optional flag to disable validation for the input schema.
+        shared_models:
+            Optional dict of input models shared with other devices built in the same run. See EosDesignsRootModel._from_dict.
 
     Returns:
         The structured_config as a dict
@@ -90,7 +93,7 @@ def get_structured_config(
             return {}
 
     # Load input vars into the EosDesigns data class.
-    inputs = EosDesigns._from_dict(vars)
+    inputs = EosDesigns._from_dict(vars, shared_models=shared_models)
 
     # Initialize SharedUtils class to be passed to each python_module below.
     shared_utils = SharedUtils(hostvars=vars, inputs=inputs, templar=templar, schema=input_schema_tools.avdschema)
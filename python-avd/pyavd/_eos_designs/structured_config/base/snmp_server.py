@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
 from pyavd._errors import AristaAvdError, AristaAvdInvalidInputsError
-from pyavd._utils import strip_null_from_data
+from pyavd._utils import Undefined, strip_null_from_data
 from pyavd.j2filters import natural_sort, snmp_hash
 
 from .utils import UtilsMixin
@@ -195,7 +195,8 @@ class SnmpServerMixin(UtilsMixin):
                 vrfs.remove("default")
                 # Add host without VRF field
                 add_host = output_host._deepcopy()
-                delattr(add_host, "vrf")
+                if add_host._get_defined_attr("vrf") is not Undefined:
+                    delattr(add_host, "vrf")
                 snmp_hosts.append(add_host)
 
             # Add host with VRF field.
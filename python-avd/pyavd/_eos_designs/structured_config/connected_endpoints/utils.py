@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import re
+from copy import copy
 from functools import cached_property
 from hashlib import sha256
 from typing import TYPE_CHECKING, Literal
@@ -76,10 +77,12 @@ class UtilsMixin:
                     filtered_adapters.append(adapter_settings)
 
                 if filtered_adapters:
-                    # The object was deepcopied inside "get_merged_adapter_settings" so we can modify it here.
-                    connected_endpoint.adapters = filtered_adapters
-                    connected_endpoint._type = self.inputs.connected_endpoints_keys[connected_endpoints_key.key].type
-                    filtered_connected_endpoints.append(connected_endpoint)
+                    # The adapters were deepcopied inside "get_merged_adapter_settings".
+                    # The endpoint itself is copied since the loaded inputs can be shared between devices.
+                    filtered_connected_endpoint = copy(connected_endpoint)
+                    filtered_connected_endpoint.adapters = filtered_adapters
+                    filtered_connected_endpoint._type = self.inputs.connected_endpoints_keys[connected_endpoints_key.key].type
+                    filtered_connected_endpoints.append(filtered_connected_endpoint)
 
         return filtered_connected_endpoints
 
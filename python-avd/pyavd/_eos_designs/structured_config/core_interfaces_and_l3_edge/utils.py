@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, TypeVar
 from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
 from pyavd._eos_designs.schema import EosDesigns
 from pyavd._errors import AristaAvdInvalidInputsError, AristaAvdMissingVariableError
-from pyavd._utils import default, get_ip_from_pool
+from pyavd._utils import default, get_ip_pool
 
 if TYPE_CHECKING:
     from . import AvdStructuredConfigCoreInterfacesAndL3Edge
@@ -84,7 +84,10 @@ class UtilsMixin:
                 return p2p_link
 
             p2p_link.ip.extend(
-                [f"{get_ip_from_pool(ip_pool.ipv4_pool, ip_pool.prefix_size, p2p_link.id - 1, host_offset)}/{ip_pool.prefix_size}" for host_offset in [0, 1]]
+                [
+                    f"{ip_address}/{ip_pool.prefix_size}"
+                    for ip_address in get_ip_pool(ip_pool.ipv4_pool).allocate(ip_pool.prefix_size, [(p2p_link.id - 1, 0), (p2p_link.id - 1, 1)])
+                ]
             )
 
         return p2p_link
@@ -106,7 +106,7 @@ class VlansMixin(UtilsMixin):
             "tenant": vlan._tenant,
         }
         if self.inputs.enable_trunk_groups:
-            trunk_groups = vlan.trunk_groups
+            trunk_groups = list(vlan.trunk_groups)
             if self.shared_utils.only_local_vlan_trunk_groups:
                 trunk_groups = list(self._local_endpoint_trunk_groups.intersection(trunk_groups))
             if self.shared_utils.mlag:
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 from pyavd._errors import AristaAvdInvalidInputsError
 from pyavd._utils import append_if_not_duplicate, default, unique
-from pyavd.j2filters import natural_sort, range_expand
+from pyavd.j2filters import natural_sort
 
 from .utils import UtilsMixin
 
@@ -282,17 +282,14 @@ class VxlanInterfaceMixin(UtilsMixin):
             msg = "'dc_name' is required with 'overlay_her_flood_list_scope: dc'"
             raise AristaAvdInvalidInputsError(msg)
 
-        for peer in self.shared_utils.all_fabric_devices:
+        fabric_index = self.shared_utils.fabric_index
+        peers = fabric_index.vteps_per_dc.get(self.inputs.dc_name, []) if overlay_her_flood_list_scope == "dc" else fabric_index.vteps
+        for peer in peers:
             if peer == self.shared_utils.hostname:
                 continue
 
             peer_facts = self.shared_utils.get_peer_facts(peer, required=True)
-
-            if overlay_her_flood_list_scope == "dc" and peer_facts.get("dc_name") != self.inputs.dc_name:
-                continue
-
-            if (vtep_ip := peer_facts.get("vtep_ip")) is None:
-                continue
+            vtep_ip = peer_facts["vtep_ip"]
 
             if not self.inputs.overlay_her_flood_list_per_vni:
                 # Use common flood list
@@ -300,10 +297,8 @@ class VxlanInterfaceMixin(UtilsMixin):
                 continue
 
             # Use flood lists per vlan
-            peer_vlans = peer_facts.get("vlans", [])
-            peer_vlans_list = range_expand(peer_vlans)
-            for vlan in peer_vlans_list:
-                overlay_her_flood_lists.setdefault(int(vlan), []).append(vtep_ip)
+            for vlan in fabric_index.get_vlans(peer):
+                overlay_her_flood_lists.setdefault(vlan, []).append(vtep_ip)
 
         return overlay_her_flood_lists
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+from pyavd._eos_designs.fabric_index import is_mpls_client
 from pyavd._errors import AristaAvdError
 from pyavd._utils import get, strip_empties_from_dict
 from pyavd.j2filters import natural_sort
@@ -113,7 +114,7 @@ class UtilsMixin:
         return self.shared_utils.mpls_overlay_role == "server" or (self.shared_utils.evpn_role == "server" and self.shared_utils.overlay_evpn_mpls)
 
     def _is_peer_mpls_client(self: AvdStructuredConfigOverlay, peer_facts: dict) -> bool:
-        return peer_facts.get("mpls_overlay_role") == "client" or (peer_facts.get("evpn_role") == "client" and get(peer_facts, "overlay.evpn_mpls") is True)
+        return is_mpls_client(peer_facts)
 
     def _is_peer_mpls_server(self: AvdStructuredConfigOverlay, peer_facts: dict) -> bool:
         return peer_facts.get("mpls_overlay_role") == "server" or (peer_facts.get("evpn_role") == "server" and get(peer_facts, "overlay.evpn_mpls") is True)
@@ -161,16 +162,13 @@ class UtilsMixin:
             return {}
 
         mpls_mesh_pe = {}
-        for fabric_switch in self.shared_utils.all_fabric_devices:
+        for fabric_switch in self.shared_utils.fabric_index.mpls_clients:
             if self._mpls_route_reflectors is not None and fabric_switch in self._mpls_route_reflectors:
                 continue
             if fabric_switch == self.shared_utils.hostname:
                 continue
 
             peer_facts = self.shared_utils.get_peer_facts(fabric_switch, required=True)
-            if self._is_peer_mpls_client(peer_facts) is not True:
-                continue
-
             self._append_peer(mpls_mesh_pe, fabric_switch, peer_facts)
 
         return mpls_mesh_pe
@@ -124,5 +124,17 @@ class StructuredConfigGenerator(AvdFacts):
 
     @classmethod
     def structured_config_methods(cls) -> list[Callable[[Self], None]]:
-        """Return the list of methods decorated with 'structured_config_contributor'."""
-        return [method for key in cls._keys() if getattr(method := getattr(cls, key), "_is_structured_config_contributor", False)]
+        """
+        Return the list of methods decorated with 'structured_config_contributor'.
+
+        The list is built on the first call for each class.
+        """
+        if (methods := _STRUCTURED_CONFIG_METHODS.get(cls)) is None:
+            methods = _STRUCTURED_CONFIG_METHODS[cls] = tuple(
+                method for key in cls._get_key_index().all_keys if getattr(method := getattr(cls, key), "_is_structured_config_contributor", False)
+            )
+        return list(methods)
+
+
+_STRUCTURED_CONFIG_METHODS: dict[type[StructuredConfigGenerator], tuple[Callable, ...]] = {}
+"""Methods decorated with 'structured_config_contributor' per StructuredConfigGenerator class."""
@@ -60,11 +60,12 @@ class DhcpServersMixin(UtilsMixin):
         if not (cvp_instance_ips := self.inputs.cvp_instance_ips):
             return None
 
-        if "arista.io" in cvp_instance_ips[0]:
-            clean_cvaas_fqdn = re.sub(r"https:\/\/|www\.|apiserver\.", "", cvp_instance_ips[0])
-            cvp_instance_ips[0] = f"www.{clean_cvaas_fqdn}"
+        cvp_instance_ip = cvp_instance_ips[0]
+        if "arista.io" in cvp_instance_ip:
+            clean_cvaas_fqdn = re.sub(r"https:\/\/|www\.|apiserver\.", "", cvp_instance_ip)
+            cvp_instance_ip = f"www.{clean_cvaas_fqdn}"
 
-        return f"https://{cvp_instance_ips[0]}/ztp/bootstrap"
+        return f"https://{cvp_instance_ip}/ztp/bootstrap"
 
     @cached_property
     def _ntp_servers(self: AvdStructuredConfigUnderlay) -> dict | None:
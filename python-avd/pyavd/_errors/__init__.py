@@ -1,6 +1,7 @@
 # Copyright (c) 2023-2025 Arista Networks, Inc.
 # Use of this source code is governed by the Apache License 2.0
 # that can be found in the LICENSE file.
+from __future__ import annotations
 
 
 class AristaAvdError(Exception):
@@ -8,6 +9,11 @@ class AristaAvdError(Exception):
         self.message = message
         super().__init__(self.message)
 
+    def __reduce__(self) -> tuple:
+        # The default exception pickling calls __init__ with 'self.args', which does not match the signature of most subclasses.
+        # Restore the instance state directly instead, so errors can be passed between worker processes.
+        return (_restore_error, (self.__class__, self.args, self.__dict__))
+
     def _json_path_to_string(self, json_path: list[str | int]) -> str:
         path = ""
         for index, elem in enumerate(json_path):
@@ -100,3 +106,11 @@ class AristaAvdDuplicateDataError(AristaAvdError):
             f"Found duplicate objects with conflicting data while generating configuration for {context}. {context_item_a} conflicts with {context_item_b}."
         )
         super().__init__(self.message)
+
+
+def _restore_error(cls: type[AristaAvdError], args: tuple, state: dict) -> AristaAvdError:
+    """Recreate an AristaAvdError instance from pickled state without calling __init__."""
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+    return error
@@ -0,0 +1,606 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from collections import ChainMap
+from functools import lru_cache
+from hashlib import sha256
+from pickle import loads
+from re import compile as re_compile
+from re import fullmatch
+from typing import TYPE_CHECKING, Any
+
+from pyavd._errors import AvdDeprecationWarning, AvdValidationError
+from pyavd._utils import content_digest, get_all, get_all_with_path, get_indices_of_duplicate_items, pickled
+from pyavd._utils.get_ip_from_pool import (
+    FULLMATCH_IP_POOLS_AND_RANGES_PATTERN,
+    FULLMATCH_IPV4_POOLS_AND_RANGES_PATTERN,
+    FULLMATCH_IPV6_POOLS_AND_RANGES_PATTERN,
+)
+
+from .avddataconverter import AvdDataConverter
+from .store import create_store
+from .utils import get_instance_with_defaults
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    # The path is passed as nested tuples of (parent_path, key) and only converted to a list when an error is raised.
+    Path = tuple | None
+    Validator = Callable[..., None]
+    FusedValidator = Callable[[Any, Path, dict | None, "_FusedState"], list | None]
+
+TYPE_CHECKS = {
+    "int": int,
+    "str": str,
+    "bool": bool,
+    "dict": (dict, ChainMap),
+    "list": list,
+}
+
+FORMAT_CHECKS = {
+    "ip_pool": (
+        FULLMATCH_IP_POOLS_AND_RANGES_PATTERN,
+        "The value '{instance}' is not a valid IP pool (Expecting one or more comma separated prefixes "
+        "(like 10.10.10.0/24 or 2001:db8::/64) or ranges (like 10.10.10.10-10.10.10.20 or 2001:db8::-2001:db8::ffff).",
+    ),
+    "ipv4_pool": (
+        FULLMATCH_IPV4_POOLS_AND_RANGES_PATTERN,
+        "The value '{instance}' is not a valid IPv4 pool (Expecting one or more comma separated prefixes "
+        "(like 10.10.10.0/24) or ranges (like 10.10.10.10-10.10.10.20).",
+    ),
+    "ipv6_pool": (
+        FULLMATCH_IPV6_POOLS_AND_RANGES_PATTERN,
+        "The value '{instance}' is not a valid IPv6 pool (Expecting one or more comma separated prefixes "
+        "(like 2001:db8::/64) or ranges (like 2001:db8::-2001:db8::ffff).",
+    ),
+    "mac": (
+        r"([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}|([0-9a-fA-F]{4}[:\.]){2}[0-9a-fA-F]{4}",
+        "The value '{instance}' is not a valid MAC address (Expecting bytes separated by colons like 01:23:45:67:89:AB).",
+    ),
+}
+"""Formats validated by AvdValidator. The IP address formats are not validated for performance reasons."""
+
+MEMO_MAX_ENTRIES = 1024
+"""Maximum number of top-level keys for which the result of convert_and_validate is kept for reuse."""
+
+
+def _path_to_list(path: Path) -> list[str | int]:
+    """Convert the nested path tuples to a list of path elements."""
+    elements = []
+    while path is not None:
+        path, element = path
+        elements.append(element)
+    elements.reverse()
+    return elements
+
+
+def _reads_parent_dict(schema: dict) -> bool:
+    """
+    Return True if the conversion of the schema node reads the dict holding the node.
+
+    The deprecation checks if the new key is set in the parent dict. List items are converted with the parent dict of the list,
+    so the same applies to deprecations on the items of lists.
+    """
+    while schema is not None:
+        if "deprecation" in schema:
+            return True
+        schema = schema.get("items")
+    return False
+
+
+def _error(message: str, path: Path) -> AvdValidationError:
+    return AvdValidationError(message, path=_path_to_list(path))
+
+
+class _FusedState:
+    """State shared by all nodes during one run of AvdCompiledValidator.convert_and_validate."""
+
+    __slots__ = ("aliased", "conversions", "memo_hits", "visited")
+
+    def __init__(self) -> None:
+        self.conversions: list[AvdDeprecationWarning] = []
+        # Ids of all dicts and lists visited. Used to detect containers shared between multiple places in the data.
+        self.visited: set[int] = set()
+        self.aliased = False
+        # Values and content digests of top-level keys where the memoized result was used.
+        self.memo_hits: list[tuple[Any, bytes]] = []
+
+
+class AvdCompiledValidator:
+    """
+    Schema validator producing the same validation errors in the same order as AvdValidator.
+
+    Instead of walking the schema for every instance, each schema node is compiled into a closure running only the checks relevant
+    for that node. Nodes are compiled on first use and kept for the lifetime of the validator, so parts of the schema never seen
+    in the data are never compiled.
+
+    Errors are collected in a list instead of being passed through a chain of generators,
+    and the data path is only built when an error is raised.
+
+    The validator can also run the data conversion of AvdDataConverter in the same traversal, see `convert_and_validate`.
+    """
+
+    def __init__(self, schema: dict) -> None:
+        self.schema = schema
+        # Compiled validators keyed by the id of the schema node. One dict per value of "relaxed_validation" in effect for the node.
+        # The schema is kept as an attribute so the ids cannot be reused.
+        self._compiled: dict[bool, dict[int, Validator]] = {False: {}, True: {}}
+        self._fused: dict[bool, dict[int, FusedValidator]] = {False: {}, True: {}}
+        self._converter = AvdDataConverter(schema)
+        # Results of convert_and_validate for top-level keys keyed by (key, id of schema, content digest of the value).
+        # Holds (conversion messages, validation errors, digest of the converted value, pickled converted value or None if unchanged).
+        self._memo: dict[tuple[str, int, bytes], tuple[list, list, bytes, bytes | None]] = {}
+        self._root_fused: FusedValidator | None = None
+
+    def validate(self, instance: Any) -> Generator[AvdValidationError, None, None]:
+        errors: list[AvdValidationError] = []
+        self._get_validator(self.schema, relaxed_validation=False)(instance, None, errors)
+        yield from errors
+
+    def convert_and_validate(self, instance: Any) -> tuple[list[AvdDeprecationWarning], list[AvdValidationError]]:
+        """
+        Convert the data in-place and validate the converted data in a single traversal.
+
+        Returns the same conversion messages and validation errors in the same order as running
+        `AvdDataConverter.convert_data` followed by `validate` on the converted data.
+
+        Each node is converted and validated bottom-up. The data of a node can only be changed by the conversion of the node itself,
+        so the validation errors of child nodes are kept and reused when validating the parent node.
+        If the same dict or list is found in multiple places in the data, the conversion of one place could change the data of
+        another place after it was validated. In that case the converted data is validated again from the top.
+
+        The results for each top-level dict or list are kept for the lifetime of the validator, keyed by a digest of the content
+        before and after the conversion. Inputs shared by many devices, like tenants defined in group_vars, are then only converted
+        and validated once. When the content matches the content before a previous conversion, the value is replaced by a copy of
+        the converted value.
+
+        Returns:
+            Tuple of the conversion messages and the validation errors.
+        """
+        if self._root_fused is None:
+            self._root_fused = self._compile_fused(self.schema, relaxed_validation=False, memo=self._memo)
+
+        state = _FusedState()
+        errors = self._root_fused(instance, None, None, state)
+        # Reused results are only valid if the data was not changed by the conversion of another key sharing the same objects.
+        if errors is None or state.aliased or any(content_digest(value) != digest for value, digest in state.memo_hits):
+            errors = []
+            self._get_validator(self.schema, relaxed_validation=False)(instance, None, errors)
+        return state.conversions, errors
+
+    def _get_validator(self, schema: dict, *, relaxed_validation: bool) -> Validator:
+        if (validator := self._compiled[relaxed_validation].get(id(schema))) is None:
+            validator = self._compiled[relaxed_validation][id(schema)] = self._compile(schema, relaxed_validation=relaxed_validation)
+        return validator
+
+    def _compile(self, schema: dict, *, relaxed_validation: bool) -> Validator:
+        """
+        Compile one schema node into a validator closure.
+
+        The closure takes the arguments (instance, path, errors) and appends any validation errors to the list "errors".
+
+        Schemas with "dynamic_valid_values" take the resolved list of valid values as an optional fourth argument, since it can only
+        be resolved from the parent dict.
+        """
+        schema_type = schema["type"]
+        if (python_type := TYPE_CHECKS.get(schema_type)) is None:
+            msg = f"Unable to check type '{schema_type}'"
+
+            def unsupported_type_validator(*_args: Any) -> None:
+                raise NotImplementedError(msg)
+
+            return unsupported_type_validator
+
+        checks: list[Validator | None] = [check for _schema_key, check in self._compile_checks(schema, relaxed_validation=relaxed_validation)]
+        type_error_message = "Invalid type '{type_name}'. Expected a '" + schema_type + "'."
+
+        if "dynamic_valid_values" not in schema:
+            static_checks = tuple(checks)
+
+            def validator(instance: Any, path: Path, errors: list) -> None:
+                if not isinstance(instance, python_type):
+                    errors.append(_error(type_error_message.format(type_name=type(instance).__name__), path))
+                    return
+                for check in static_checks:
+                    check(instance, path, errors)
+
+            return validator
+
+        if None not in checks:
+            # AvdValidator adds "valid_values" to a copy of the schema, so the check runs last unless "valid_values" was already set.
+            checks.append(None)
+        dynamic_checks = tuple(checks)
+        if (static_valid_values := schema.get("valid_values")) is not None:
+            valid_values_check = self._compile_check("valid_values", static_valid_values, schema, relaxed_validation=relaxed_validation)
+            static_checks = tuple(valid_values_check if check is None else check for check in checks)
+        else:
+            static_checks = tuple(check for check in checks if check is not None)
+
+        def dynamic_valid_values_validator(instance: Any, path: Path, errors: list, valid_values: list | None = None) -> None:
+            if not isinstance(instance, python_type):
+                errors.append(_error(type_error_message.format(type_name=type(instance).__name__), path))
+                return
+            if valid_values is None:
+                # Validated without a parent dict, so "dynamic_valid_values" is not resolved.
+                for check in static_checks:
+                    check(instance, path, errors)
+                return
+            for check in dynamic_checks:
+                if check is not None:
+                    check(instance, path, errors)
+                elif instance not in valid_values:
+                    errors.append(_error(f"'{instance}' is not one of {valid_values}", path))
+
+        return dynamic_valid_values_validator
+
+    def _get_fused(self, schema: dict, *, relaxed_validation: bool) -> FusedValidator:
+        if (fused := self._fused[relaxed_validation].get(id(schema))) is None:
+            fused = self._fused[relaxed_validation][id(schema)] = self._compile_fused(schema, relaxed_validation=relaxed_validation)
+        return fused
+
+    def _compile_fused(self, schema: dict, *, relaxed_validation: bool, memo: dict | None = None) -> FusedValidator:
+        """
+        Compile one schema node into a closure converting and validating the node in one pass.
+
+        The closure takes the arguments (instance, path, parent_dict, state).
+        It first performs the same in-place conversions as AvdDataConverter.convert_data, in the same order, while recursing into
+        child keys and items. The conversion messages are appended to "state.conversions".
+        Then the converted instance is validated, reusing the validation errors returned for child keys and items.
+
+        Returns the list of validation errors for the instance or None if the instance is None.
+
+        If "memo" is given, the results for child keys with a dict or list value are stored in and reused from "memo".
+        Keys with "deprecation" on the key or on list items are not memoized, since the deprecation depends on the other keys of the instance.
+        """
+        converter = self._converter
+        get_fused = self._get_fused
+        items = schema.get("items")
+        keys = schema.get("keys")
+        dynamic_keys = list(schema_dynamic_keys.items()) if (schema_dynamic_keys := schema.get("dynamic_keys")) else None
+        deprecation = schema.get("deprecation")
+        # Child keys are validated with the "relaxed_validation" of this schema, while items inherit it from the parent.
+        keys_relaxed_validation = relaxed_validation if (schema_relaxed_validation := schema.get("relaxed_validation")) is None else schema_relaxed_validation
+        keys_fused = self._fused[keys_relaxed_validation]
+        # Used to only convert keys set in the instance, while still converting them in the order of the schema.
+        key_positions = {key: position for position, key in enumerate(keys)} if keys else {}
+
+        validator = self._get_validator(schema, relaxed_validation=relaxed_validation)
+        python_type = TYPE_CHECKS.get(schema["type"])
+        if python_type is None or "dynamic_valid_values" in schema or (items is None and keys is None and dynamic_keys is None):
+            node_validator = None
+        else:
+            type_error_message = "Invalid type '{type_name}'. Expected a '" + schema["type"] + "'."
+            checks = tuple(
+                (check, schema_key in ("keys", "dynamic_keys", "items"))
+                for schema_key, check in self._compile_checks(schema, relaxed_validation=relaxed_validation)
+            )
+
+            def node_validator(instance: Any, path: Path, errors: list, buffers: dict) -> None:
+                if not isinstance(instance, python_type):
+                    errors.append(_error(type_error_message.format(type_name=type(instance).__name__), path))
+                    return
+                for check, uses_buffers in checks:
+                    if uses_buffers:
+                        check(instance, path, errors, buffers)
+                    else:
+                        check(instance, path, errors)
+
+        def convert_key(instance: dict, key: str, childschema: dict, path: Path, state: _FusedState) -> tuple | None:
+            if "convert_types" in childschema:
+                converter.convert_types(childschema["convert_types"], instance, key, childschema, None)
+            if childschema.get("convert_to_lower_case") and isinstance(instance[key], str):
+                instance[key] = instance[key].lower()
+            value = instance[key]
+            if (child_fused := keys_fused.get(id(childschema))) is None:
+                child_fused = get_fused(childschema, relaxed_validation=keys_relaxed_validation)
+
+            if memo is None or not isinstance(value, (dict, list)) or _reads_parent_dict(childschema) or (digest := content_digest(value)) is None:
+                if (errors := child_fused(value, (path, key), instance, state)) is None:
+                    return None
+                return (childschema, value, errors)
+
+            if (memoized := memo.get((key, id(childschema), digest))) is not None:
+                conversions, errors, converted_digest, pickled_converted_value = memoized
+                if pickled_converted_value is not None:
+                    value = instance[key] = loads(pickled_converted_value)  # noqa: S301 pickled by this validator.
+                state.conversions.extend(conversions)
+                state.memo_hits.append((value, converted_digest))
+                return (childschema, value, errors)
+
+            conversions_start = len(state.conversions)
+            errors = child_fused(value, (path, key), instance, state)
+            if not state.aliased and (pickled_converted_value := pickled(value)) is not None:
+                converted_digest = sha256(pickled_converted_value).digest()
+                conversions = state.conversions[conversions_start:]
+                memoized_keys = {(key, id(childschema), converted_digest): (conversions, errors, converted_digest, None)}
+                if converted_digest != digest:
+                    memoized_keys[(key, id(childschema), digest)] = (conversions, errors, converted_digest, pickled_converted_value)
+                for memo_key, memoized in memoized_keys.items():
+                    if len(memo) >= MEMO_MAX_ENTRIES:
+                        del memo[next(iter(memo))]
+                    memo[memo_key] = memoized
+            return (childschema, value, errors)
+
+        def fused(instance: Any, path: Path, parent_dict: dict | None, state: _FusedState) -> list | None:
+            # Buffers of (childschema, child value, validation errors) per key or index.
+            buffers = {}
+            if isinstance(instance, (dict, list)):
+                if id(instance) in state.visited:
+                    state.aliased = True
+                state.visited.add(id(instance))
+
+            if items is not None and isinstance(instance, list):
+                item_fused = get_fused(items, relaxed_validation=relaxed_validation)
+                for index, item in enumerate(instance):
+                    if "convert_types" in items:
+                        converter.convert_types(items["convert_types"], instance, index, items, None)
+                    if items.get("convert_to_lower_case") and isinstance(item, str):
+                        instance[index] = item.lower()
+                    # Like AvdDataConverter we recurse with the item from before the conversion above.
+                    if (item_errors := item_fused(item, (path, index), parent_dict, state)) is not None:
+                        buffers[index] = (items, item, item_errors)
+
+            if isinstance(instance, dict):
+                if keys is not None:
+                    for key in sorted([key for key in instance if key in key_positions], key=key_positions.__getitem__):
+                        buffers[key] = convert_key(instance, key, keys[key], path, state)
+
+                if dynamic_keys is not None:
+                    resolved_dynamic_keys = {}
+                    for dynamic_key, childschema in dynamic_keys:
+                        instance_with_defaults = get_instance_with_defaults(instance, dynamic_key, schema)
+                        for resolved_key in get_all(instance_with_defaults, dynamic_key):
+                            resolved_dynamic_keys.setdefault(resolved_key, childschema)
+                    for key, childschema in resolved_dynamic_keys.items():
+                        if key not in instance:
+                            continue
+                        buffer = convert_key(instance, key, childschema, path, state)
+                        # A key converted with both the regular and the dynamic schema may have changed after the first validation.
+                        buffers[key] = None if key in buffers else buffer
+
+            if deprecation is not None:
+                state.conversions.extend(converter.deprecation(deprecation, instance, schema, _path_to_list(path), parent_dict))
+
+            if instance is None:
+                return None
+            errors = []
+            if node_validator is None:
+                validator(instance, path, errors)
+            else:
+                node_validator(instance, path, errors, buffers)
+            return errors
+
+        return fused
+
+    def _compile_checks(self, schema: dict, *, relaxed_validation: bool) -> list[tuple[str, Validator | None]]:
+        """
+        Return the schema key and check closure for each schema key needing validation in schema order.
+
+        For schemas with "dynamic_valid_values" the check of "valid_values" is returned as None.
+        """
+        checks: list[tuple[str, Validator | None]] = []
+        for schema_key, schema_value in schema.items():
+            if schema_value is None:
+                continue
+            if schema_key == "valid_values" and "dynamic_valid_values" in schema:
+                # Placeholder for the valid_values check which will use the dynamic valid values if given.
+                checks.append((schema_key, None))
+                continue
+            if (check := self._compile_check(schema_key, schema_value, schema, relaxed_validation=relaxed_validation)) is not None:
+                checks.append((schema_key, check))
+        return checks
+
+    def _compile_check(self, schema_key: str, schema_value: Any, schema: dict, *, relaxed_validation: bool) -> Validator | None:  # noqa: PLR0911
+        """Return a check closure for one schema key or None if the key does not need validation."""
+        match schema_key:
+            case "max":
+
+                def max_check(instance: Any, path: Path, errors: list) -> None:
+                    if instance > schema_value:
+                        errors.append(_error(f"'{instance}' is higher than the allowed maximum of {schema_value}.", path))
+
+                return max_check
+
+            case "min":
+
+                def min_check(instance: Any, path: Path, errors: list) -> None:
+                    if instance < schema_value:
+                        errors.append(_error(f"'{instance}' is lower than the allowed minimum of {schema_value}.", path))
+
+                return min_check
+
+            case "max_length":
+
+                def max_length_check(instance: Any, path: Path, errors: list) -> None:
+                    if len(instance) > schema_value:
+                        errors.append(_error(f"The value is longer ({len(instance)}) than the allowed maximum of {schema_value}.", path))
+
+                return max_length_check
+
+            case "min_length":
+
+                def min_length_check(instance: Any, path: Path, errors: list) -> None:
+                    if len(instance) < schema_value:
+                        errors.append(_error(f"The value is shorter ({len(instance)}) than the allowed minimum of {schema_value}.", path))
+
+                return min_length_check
+
+            case "format":
+                if schema_value not in FORMAT_CHECKS:
+                    return None
+                format_pattern, format_message = FORMAT_CHECKS[schema_value]
+
+                def format_check(instance: Any, path: Path, errors: list) -> None:
+                    if fullmatch(format_pattern, instance) is None:
+                        errors.append(_error(format_message.format(instance=instance), path))
+
+                return format_check
+
+            case "pattern":
+                pattern_match = re_compile(schema_value).match
+
+                def pattern_check(instance: Any, path: Path, errors: list) -> None:
+                    if pattern_match(instance) is None:
+                        errors.append(_error(f"The value '{instance}' is not matching the pattern '{schema_value}'.", path))
+
+                return pattern_check
+
+            case "valid_values":
+
+                def valid_values_check(instance: Any, path: Path, errors: list) -> None:
+                    if instance not in schema_value:
+                        errors.append(_error(f"'{instance}' is not one of {schema_value}", path))
+
+                return valid_values_check
+
+            case "keys":
+                return self._compile_keys_check(schema_value, schema, relaxed_validation=relaxed_validation)
+
+            case "dynamic_keys":
+                if "keys" in schema:
+                    # Dynamic keys are handled by the "keys" check.
+                    return None
+                return self._compile_keys_check({}, schema, relaxed_validation=relaxed_validation)
+
+            case "items":
+                get_validator = self._get_validator
+
+                def items_check(instance: list, path: Path, errors: list, buffers: dict | None = None) -> None:
+                    item_validator = get_validator(schema_value, relaxed_validation=relaxed_validation)
+                    for index, item in enumerate(instance):
+                        if buffers is not None and (buffer := buffers.get(index)) is not None and buffer[1] is item:
+                            errors.extend(buffer[2])
+                            continue
+                        item_validator(item, (path, index), errors)
+
+                return items_check
+
+            case "primary_key":
+                unique_keys_check = None if schema.get("allow_duplicate_primary_key") else self._compile_unique_keys_check([schema_value])
+
+                def primary_key_check(instance: list, path: Path, errors: list) -> None:
+                    if not instance:
+                        return
+                    for index, element in enumerate(instance):
+                        if isinstance(element, (dict, ChainMap)) and element.get(schema_value) is None:
+                            errors.append(_error(f"Primary key '{schema_value}' is not set on list item as required.", (path, index)))
+                    if unique_keys_check is not None:
+                        unique_keys_check(instance, path, errors)
+
+                return primary_key_check
+
+            case "unique_keys":
+                return self._compile_unique_keys_check(schema_value)
+
+            case "$ref":
+
+                def ref_check(*_args: Any) -> None:
+                    msg = "$ref must be resolved before using AvdValidator"
+                    raise NotImplementedError(msg)
+
+                return ref_check
+
+        return None
+
+    def _compile_unique_keys_check(self, unique_keys: list[str]) -> Validator:
+        unique_key_paths = [unique_key.split(".") for unique_key in unique_keys]
+
+        def unique_keys_check(instance: list, path: Path, errors: list) -> None:
+            if not instance:
+                return
+
+            for unique_key_path in unique_key_paths:
+                if not (paths_and_values := tuple(get_all_with_path(instance, unique_key_path))):
+                    continue
+
+                paths, values = zip(*paths_and_values, strict=False)
+                nested = "nested " if len(unique_key_path) > 1 else ""
+                errors.extend(
+                    AvdValidationError(
+                        f"The value '{duplicate_value}' is not unique between all {nested}list items as required.",
+                        path=[*_path_to_list(path), *paths[duplicate_index], unique_key_path[-1]],
+                    )
+                    for duplicate_value, duplicate_indices in get_indices_of_duplicate_items(values)
+                    for duplicate_index in duplicate_indices
+                )
+
+        return unique_keys_check
+
+    def _compile_keys_check(self, keys: dict, schema: dict, *, relaxed_validation: bool) -> Validator:
+        """
+        Compile the validation of the child keys of a dict.
+
+        Validation errors for child keys can be given in the optional "buffers" argument, as returned by the conversion in
+        `_compile_fused`. They are reused if the child schema and value are unchanged.
+
+        Covers the same child key validations as AvdValidator.keys_validator:
+        - Expand dynamic_keys
+        - Validate "allow_other_keys" (default is false)
+        - Validate "required" under child keys
+        - Expand "dynamic_valid_values" under child keys
+        """
+        dynamic_keys = list(schema_dynamic_keys.items()) if (schema_dynamic_keys := schema.get("dynamic_keys")) else None
+        allow_other_keys = schema.get("allow_other_keys", False)
+        if (schema_relaxed_validation := schema.get("relaxed_validation")) is not None:
+            relaxed_validation = schema_relaxed_validation
+        get_validator = self._get_validator
+        compiled = self._compiled[relaxed_validation]
+        # Used to only visit keys set in the instance and required keys, while still visiting them in the order of the schema.
+        key_positions = {key: position for position, key in enumerate(keys)}
+        required_keys = frozenset() if relaxed_validation else frozenset(key for key, childschema in keys.items() if childschema.get("required"))
+
+        def keys_check(instance: dict, path: Path, errors: list, buffers: dict | None = None) -> None:
+            resolved_dynamic_keys = {}
+            if dynamic_keys is not None:
+                for dynamic_key, childschema in dynamic_keys:
+                    instance_with_defaults = get_instance_with_defaults(instance, dynamic_key, schema)
+                    for resolved_key in get_all(instance_with_defaults, dynamic_key):
+                        resolved_dynamic_keys.setdefault(resolved_key, childschema)
+
+            # Visiting keys in the same order as AvdValidator, which iterates over ChainMap(keys, resolved_dynamic_keys).
+            # That is all resolved dynamic keys first, followed by the remaining schema keys in schema order.
+            keys_to_check = [(key, keys.get(key, childschema)) for key, childschema in resolved_dynamic_keys.items()]
+            keys_to_check.extend(
+                (key, keys[key])
+                for key in sorted(required_keys.union(key for key in instance if key in key_positions), key=key_positions.__getitem__)
+                if key not in resolved_dynamic_keys
+            )
+
+            if not allow_other_keys:
+                invalid_keys = ", ".join([key for key in instance if key not in keys and key not in resolved_dynamic_keys and not key.startswith("_")])
+                if invalid_keys:
+                    errors.append(_error(f"Unexpected key(s) '{invalid_keys}' found in dict.", path))
+
+            for key, childschema in keys_to_check:
+                if (value := instance.get(key)) is None:
+                    if childschema.get("required") and not relaxed_validation:
+                        errors.append(_error(f"Required key '{key}' is not set in dict.", path))
+                    continue
+
+                if "dynamic_valid_values" not in childschema:
+                    if buffers is not None and (buffer := buffers.get(key)) is not None and buffer[0] is childschema and buffer[1] is value:
+                        errors.extend(buffer[2])
+                        continue
+                    if (child_validator := compiled.get(id(childschema))) is None:
+                        child_validator = get_validator(childschema, relaxed_validation=relaxed_validation)
+                    child_validator(value, (path, key), errors)
+                    continue
+
+                if (child_validator := compiled.get(id(childschema))) is None:
+                    child_validator = get_validator(childschema, relaxed_validation=relaxed_validation)
+
+                valid_values = list(childschema.get("valid_values", []))
+                for dynamic_valid_value in childschema["dynamic_valid_values"]:
+                    instance_with_defaults = get_instance_with_defaults(instance, dynamic_valid_value, schema)
+                    valid_values.extend(get_all(instance_with_defaults, dynamic_valid_value))
+                child_validator(value, (path, key), errors, valid_values)
+
+        return keys_check
+
+
+@lru_cache
+def get_compiled_validator(schema_id: str) -> AvdCompiledValidator:
+    """Return the AvdCompiledValidator for a schema in the store. Created once per schema id."""
+    return AvdCompiledValidator(create_store()[schema_id])
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyavd._errors import AristaAvdError, AvdSchemaError
 
+from .avdcompiledvalidator import AvdCompiledValidator, get_compiled_validator
 from .avddataconverter import AvdDataConverter
 from .avdvalidator import AvdValidator
 from .store import create_store
@@ -48,6 +49,8 @@ class AvdSchema:
         If none of them are set, a default "dummy" schema will be loaded.
         schema -> schema_id -> DEFAULT_SCHEMA.
 
+        Builtin schemas loaded by ID are validated with a compiled validator, which is created once per schema ID.
+
         Parameters
         ----------
         schema : dict, optional
@@ -66,7 +69,9 @@ class AvdSchema:
 
         self._schema = schema
         try:
-            self._validator = AvdValidator(schema)
+            self._validator: AvdValidator | AvdCompiledValidator = (
+                get_compiled_validator(schema_id) if schema is self.store.get(schema_id) else AvdValidator(schema)
+            )
             self._dataconverter = AvdDataConverter(schema)
         except Exception as e:
             msg = "An error occurred during creation of the validator"
@@ -78,6 +83,20 @@ class AvdSchema:
     def convert(self, data: Any) -> Generator:
         yield from self._dataconverter.convert_data(data)
 
+    def convert_and_validate(self, data: Any) -> tuple[list, list]:
+        """
+        Convert data in-place and validate the converted data.
+
+        Builtin schemas are converted and validated in a single traversal of the data.
+
+        Returns:
+            Tuple of the conversion messages and the validation errors. Identical to the output of "convert" followed by "validate".
+        """
+        if isinstance(self._validator, AvdCompiledValidator):
+            return self._validator.convert_and_validate(data)
+        conversions = list(self.convert(data))
+        return conversions, list(self.validate(data))
+
     def subschema(self, datapath: list) -> dict:
         """
         Takes datapath elements as a list and returns the subschema for this datapath.
@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from typing import TYPE_CHECKING, Literal
+from copy import copy, deepcopy
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
     from .type_vars import T_AvdBase
 
+FROZEN_INTERNAL_ATTRIBUTES = frozenset(("_items", "_created_from_null", "_block_inheritance", "_frozen_dicts"))
+"""Internal attributes holding data, which cannot be changed on frozen instances."""
+
 
 class AvdBase(ABC):
     """Base class used for schema-based data classes holding data loaded from AVD inputs."""
@@ -34,6 +37,55 @@ class AvdBase(ABC):
     _block_inheritance: bool = False
     """Flag to block inheriting further if we at some point inherited from a class with _created_from_null set."""
 
+    _frozen: bool = False
+    """
+    Flag to say if this instance is shared, for example between devices, so it must not be changed in-place.
+
+    Set recursively by _freeze(). Any attempt to change the data of a frozen instance raises a TypeError.
+    Plain dicts held by a frozen instance are returned as copies, so changing those does not change the frozen instance.
+    Internal attributes like "_context" can still be set, since they are not part of the data.
+    Copies made with copy(), deepcopy() or pickle are not frozen, so _thawed() and _deepcopy() return instances which can be changed.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen and name in FROZEN_INTERNAL_ATTRIBUTES:
+            self._raise_frozen(name)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen and name in FROZEN_INTERNAL_ATTRIBUTES:
+            self._raise_frozen(name)
+        object.__delattr__(self, name)
+
+    def __getstate__(self) -> dict:
+        """Returns the state used by copy, deepcopy and pickle. The _frozen flag is left out, so copies can be changed."""
+        if not self._frozen:
+            return self.__dict__
+        state = self.__dict__.copy()
+        del state["_frozen"]
+        return state
+
+    def _raise_frozen(self, name: str) -> None:
+        msg = (
+            f"Unable to change '{name}' on '{type(self).__name__}' since it is frozen and can be shared. "
+            "Use '_thawed()' or '_deepcopy()' to get an instance which can be changed."
+        )
+        raise TypeError(msg)
+
+    def _freeze(self) -> Self:
+        """Mark this instance and all nested models as frozen, so they can be shared without being changed in-place. Returns the instance."""
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def _thawed(self) -> Self:
+        """
+        Return an instance which can be changed in-place (copy-on-write).
+
+        If the instance is not frozen, the instance itself is returned. Otherwise a shallow copy is returned.
+        Nested models are still frozen and shared with the original, so they must also be thawed before being changed.
+        """
+        return copy(self) if self._frozen else self
+
     def _deepcopy(self) -> Self:
         """Return a copy including all nested models."""
         return deepcopy(self)
@@ -90,6 +90,8 @@ class AvdIndexedList(Sequence[T_AvdModel], Generic[T_PrimaryKey, T_AvdModel], Av
         return self._items[key]
 
     def __setitem__(self, key: T_PrimaryKey, value: T_AvdModel) -> None:
+        if self._frozen:
+            self._raise_frozen("_items")
         self._items[key] = value
 
     def get(self, key: T_PrimaryKey, default: T | UndefinedType = Undefined) -> T_AvdModel | T | UndefinedType:
@@ -107,11 +109,15 @@ class AvdIndexedList(Sequence[T_AvdModel], Generic[T_PrimaryKey, T_AvdModel], Av
     def obtain(self, key: T_PrimaryKey) -> T_AvdModel:
         """Return item with given primary key, autocreating if missing."""
         if key not in self._items:
+            if self._frozen:
+                self._raise_frozen("_items")
             item_type = cast(T_AvdModel, self._item_type)
             self._items[key] = item_type._from_dict({self._primary_key: key})
         return self._items[key]
 
     def append(self, item: T_AvdModel, ignore_fields: tuple[str, ...] = ()) -> None:
+        if self._frozen:
+            self._raise_frozen("_items")
         if (primary_key := getattr(item, self._primary_key)) in self._items:
             # Found existing entry using the same primary key. Ignore if it is the exact same content.
             if item._compare(existing_item := self._items[primary_key], ignore_fields):
@@ -142,6 +148,26 @@ class AvdIndexedList(Sequence[T_AvdModel], Generic[T_PrimaryKey, T_AvdModel], Av
         for item in items:
             self.append(item)
 
+    def _freeze(self) -> Self:
+        """Mark this instance and all nested models as frozen, so they can be shared without being changed in-place. Returns the instance."""
+        if not self._frozen:
+            object.__setattr__(self, "_frozen", True)
+            [item._freeze() for item in self._items.values()]
+        return self
+
+    def _thawed(self) -> Self:
+        """
+        Return an instance which can be changed in-place (copy-on-write).
+
+        If the instance is not frozen, the instance itself is returned. Otherwise a copy of the list is returned.
+        Nested models are still frozen and shared with the original, so they must also be thawed before being changed.
+        """
+        if not self._frozen:
+            return self
+        new_instance = super()._thawed()
+        new_instance._items = self._items.copy()
+        return new_instance
+
     def _strip_empties(self) -> None:
         """In-place update the instance to remove data matching the given strip_values."""
         [item._strip_empties() for item in self._items.values()]
@@ -192,6 +218,9 @@ class AvdIndexedList(Sequence[T_AvdModel], Generic[T_PrimaryKey, T_AvdModel], Av
             msg = f"Unable to merge type '{type(other)}' into '{cls}'"
             raise TypeError(msg)
 
+        if self._frozen:
+            self._raise_frozen("_deepmerge")
+
         if self._created_from_null or other._created_from_null:
             # Clear the flag and set list_merge to replace so we overwrite with data from other below.
             self._created_from_null = other._created_from_null
@@ -242,6 +271,9 @@ class AvdIndexedList(Sequence[T_AvdModel], Generic[T_PrimaryKey, T_AvdModel], Av
             msg = f"Unable to inherit from type '{type(other)}' into '{cls}'"
             raise TypeError(msg)
 
+        if self._frozen:
+            self._raise_frozen("_deepinherit")
+
         if self._created_from_null or self._block_inheritance:
             # Null always wins, so no inheritance.
             return
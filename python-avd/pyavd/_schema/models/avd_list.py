@@ -89,16 +89,22 @@ class AvdList(Sequence[T_ItemType], Generic[T_ItemType], AvdBase):
         return self._items[index]
 
     def __setitem__(self, index: int, value: T_ItemType) -> None:
+        if self._frozen:
+            self._raise_frozen("_items")
         self._items[index] = value
 
     def get(self, index: int, default: T | UndefinedType = Undefined) -> T_ItemType | T | UndefinedType:
         return self._items[index] if index < len(self._items) else default
 
     def append(self, item: T_ItemType) -> None:
+        if self._frozen:
+            self._raise_frozen("_items")
         self._items.append(item)
 
     def append_unique(self, item: T_ItemType) -> None:
         """Append the item if not there already. Otherwise ignore."""
+        if self._frozen:
+            self._raise_frozen("_items")
         if item not in self._items:
             self._items.append(item)
 
@@ -113,8 +119,32 @@ class AvdList(Sequence[T_ItemType], Generic[T_ItemType], AvdBase):
             return new_item
 
     def extend(self, items: Iterable[T_ItemType]) -> None:
+        if self._frozen:
+            self._raise_frozen("_items")
         self._items.extend(items)
 
+    def _freeze(self) -> Self:
+        """Mark this instance and all nested models as frozen, so they can be shared without being changed in-place. Returns the instance."""
+        if not self._frozen:
+            object.__setattr__(self, "_frozen", True)
+            if issubclass(self._item_type, AvdBase):
+                items = cast(list[AvdBase], self._items)
+                [item._freeze() for item in items]
+        return self
+
+    def _thawed(self) -> Self:
+        """
+        Return an instance which can be changed in-place (copy-on-write).
+
+        If the instance is not frozen, the instance itself is returned. Otherwise a copy of the list is returned.
+        Nested models are still frozen and shared with the original, so they must also be thawed before being changed.
+        """
+        if not self._frozen:
+            return self
+        new_instance = super()._thawed()
+        new_instance._items = self._items.copy()
+        return new_instance
+
     def _strip_empties(self) -> None:
         """In-place update the instance to remove data matching the given strip_values."""
         if issubclass(self._item_type, AvdBase):
@@ -184,6 +214,9 @@ class AvdList(Sequence[T_ItemType], Generic[T_ItemType], AvdBase):
             msg = f"Unable to merge type '{type(other)}' into '{cls}'"
             raise TypeError(msg)
 
+        if self._frozen:
+            self._raise_frozen("_deepmerge")
+
         if self._created_from_null or other._created_from_null:
             # Set the flag to the value of other and set list_merge to replace so we overwrite with data from other below.
             self._created_from_null = other._created_from_null
@@ -6,12 +6,13 @@ from __future__ import annotations
 from collections.abc import Mapping
 from copy import deepcopy
 from logging import getLogger
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
 from pyavd._schema.coerce_type import coerce_type
 from pyavd._utils import Undefined, UndefinedType, merge
 
-from .avd_base import AvdBase
+from .avd_base import FROZEN_INTERNAL_ATTRIBUTES, AvdBase
 from .avd_indexed_list import AvdIndexedList
 
 if TYPE_CHECKING:
@@ -36,6 +37,12 @@ class AvdModel(AvdBase):
     """Map of field name to original dict key. Used when fields have the field_ prefix to get the original key."""
     _key_to_field_map: ClassVar[dict[str, str]] = {}
     """Map of dict key to field name. Used when the key is names with a reserved keyword or mixed case. E.g. `Vxlan1` or `as`."""
+    _frozen_dicts: Mapping[str, dict] = MappingProxyType({})
+    """
+    Values of dict fields on frozen instances. Set by _freeze().
+
+    The values are moved out of the instance dict, so reading the field goes through __getattr__, which returns a copy.
+    """
 
     @classmethod
     def _load(cls, data: Mapping) -> Self:
@@ -115,17 +122,57 @@ class AvdModel(AvdBase):
         """
         [setattr(self, arg, arg_value) for arg, arg_value in kwargs.items() if arg_value is not Undefined]
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen and (name in self._fields or name in FROZEN_INTERNAL_ATTRIBUTES):
+            self._raise_frozen(name)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen and (name in self._fields or name in FROZEN_INTERNAL_ATTRIBUTES):
+            self._raise_frozen(name)
+        object.__delattr__(self, name)
+
+    def __getstate__(self) -> dict:
+        """Returns the state used by copy, deepcopy and pickle. Dict fields of frozen instances are put back as copies, since copies can be changed."""
+        state = super().__getstate__()
+        if frozen_dicts := state.pop("_frozen_dicts", None):
+            state.update(deepcopy(frozen_dicts))
+        return state
+
+    def _freeze(self) -> Self:
+        """
+        Mark this instance and all nested models as frozen, so they can be shared without being changed in-place. Returns the instance.
+
+        Dict fields are moved to _frozen_dicts, so only copies of those are returned.
+        """
+        if not self._frozen:
+            object.__setattr__(self, "_frozen", True)
+            [value._freeze() for value in self.__dict__.values() if isinstance(value, AvdBase)]
+            if frozen_dicts := {field: value for field, value in self.__dict__.items() if field in self._fields and self._fields[field]["type"] is dict}:
+                [object.__delattr__(self, field) for field in frozen_dicts]
+                object.__setattr__(self, "_frozen_dicts", frozen_dicts)
+        return self
+
     def __getattr__(self, name: str) -> Any:
         """
         Resolves the default value for a field, set the default value on the attribute and return the value.
 
         We only get here if the attribute is not set already, and next call will skip this since the attribute is set.
+        For frozen instances the default value is returned without setting the attribute.
         """
         if name not in self._fields:
             msg = f"'{type(self).__name__}' object has no attribute '{name}'"
             raise AttributeError(msg)
 
+        if name in self._frozen_dicts:
+            return deepcopy(self._frozen_dicts[name])
+
         default_value = self._get_field_default_value(name)
+        if self._frozen:
+            # The default value is not stored on a frozen instance, since that would change the data seen by others sharing the instance.
+            # It is frozen to make sure it is not changed in-place, since such changes would be lost.
+            return default_value._freeze() if isinstance(default_value, AvdBase) else default_value
+
         setattr(self, name, default_value)
         return default_value
 
@@ -141,6 +188,8 @@ class AvdModel(AvdBase):
         try:
             return self.__getattribute__(name)
         except AttributeError:
+            if name in self._frozen_dicts:
+                return deepcopy(self._frozen_dicts[name])
             return Undefined
 
     def __repr__(self) -> str:
@@ -262,6 +311,9 @@ class AvdModel(AvdBase):
             msg = f"Unable to merge type '{type(other)}' into '{cls}'"
             raise TypeError(msg)
 
+        if self._frozen:
+            self._raise_frozen("_deepmerge")
+
         for field, field_info in cls._fields.items():
             if other._created_from_null and self._get_defined_attr(field) is not Undefined:
                 # Force the field back to unset if other is a "null" class.
@@ -310,6 +362,9 @@ class AvdModel(AvdBase):
             msg = f"Unable to inherit from type '{type(other)}' into '{cls}'"
             raise TypeError(msg)
 
+        if self._frozen:
+            self._raise_frozen("_deepinherit")
+
         if self._created_from_null or self._block_inheritance:
             # Null always wins, so no inheritance.
             return
@@ -5,13 +5,16 @@ from __future__ import annotations
 
 from collections import ChainMap
 from collections.abc import Iterator, Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._schema.coerce_type import coerce_type
 from pyavd._schema.store import create_store
 from pyavd._schema.utils import get_instance_with_defaults
-from pyavd._utils import get_all
+from pyavd._utils import content_digest, get_all
 
+from .avd_base import AvdBase
+from .avd_indexed_list import AvdIndexedList
 from .avd_list import AvdList
 from .avd_model import AvdModel
 
@@ -21,9 +24,44 @@ if TYPE_CHECKING:
 SKIP_KEYS = ["custom_structured_configuration_list_merge", "custom_structured_configuration_prefix"]
 
 
+def _coerce_shared(value: Any, target_type: type, shared_models: dict[tuple[type, bytes], Any]) -> Any:
+    """
+    Return coerce_type(value, target_type), reusing a model from shared_models if previously loaded from identical data.
+
+    Inputs like tenants or node type definitions are typically identical for many devices, so they are only loaded once.
+    For lists of dicts, each item is also reused on its own, so lists only differing in a few items, still share the other items.
+
+    The returned models are shared between devices, so they are frozen to prevent changes in-place. See AvdBase._freeze().
+
+    Args:
+        value: The value to load.
+        target_type: The type to load the value into.
+        shared_models: Models loaded so far keyed by (model class, content digest of the data they were loaded from).
+            New models are added in-place.
+    """
+    if not isinstance(value, (dict, list)) or not issubclass(target_type, AvdBase) or (digest := content_digest(value)) is None:
+        return coerce_type(value, target_type)
+
+    if (loaded_model := shared_models.get((target_type, digest))) is None:
+        if isinstance(value, list) and issubclass(target_type, (AvdIndexedList, AvdList)) and issubclass(target_type._item_type, AvdModel):
+            loaded_model = target_type([_coerce_shared(item, target_type._item_type, shared_models) for item in value])
+        else:
+            loaded_model = coerce_type(value, target_type)
+        if isinstance(loaded_model, AvdBase):
+            loaded_model._freeze()
+        shared_models[(target_type, digest)] = loaded_model
+    return loaded_model
+
+
 class EosDesignsRootModel(AvdModel):
     @classmethod
-    def _from_dict(cls: type[EosDesigns], data: Mapping, keep_extra_keys: bool = False, load_custom_structured_config: bool = True) -> EosDesigns:
+    def _from_dict(
+        cls: type[EosDesigns],
+        data: Mapping,
+        keep_extra_keys: bool = False,
+        load_custom_structured_config: bool = True,
+        shared_models: dict[tuple[type, bytes], Any] | None = None,
+    ) -> EosDesigns:
         """
         Returns a new instance loaded with the data from the given dict.
 
@@ -34,6 +72,10 @@ class EosDesignsRootModel(AvdModel):
         Furthermore the EosDesignsRootModel will also load `custom_structured_configuration_prefix` and search for any keys prefixed with those. Found keys
         will be loaded into the `_custom_structured_configurations` model.
 
+        When shared_models is given, dicts and lists found directly under the root or under dynamic keys are loaded once per unique content
+        and the loaded models are shared with all other devices loading identical data with the same shared_models.
+        Shared models are frozen, so any attempt to change them in-place raises a TypeError. See AvdBase._freeze().
+
         Args:
             data: A mapping containing the EosDesigns input data to be loaded.
             keep_extra_keys: Store all unknown keys in the _custom_data dict and include it again in the output of _to_dict().
@@ -41,6 +83,8 @@ class EosDesignsRootModel(AvdModel):
             load_custom_structured_config: Some custom structured config contains inline Jinja templates relying on variables produced by EosDesignsFacts.
                 To avoid such templates breaking the type checks, we can skip loading custom_structured_configuration during the facts phase by setting this
                 to False.
+            shared_models: Optional dict of models shared between all devices loaded during the same run, like one call of `get_avd_facts`.
+                Must be a new empty dict for each run, so models are never shared across runs.
 
         TODO: AVD6.0.0 remove the keep_extra_keys option so we no longer support custom keys without _ in structured config
         """
@@ -48,7 +92,11 @@ class EosDesignsRootModel(AvdModel):
             msg = f"Expecting 'data' as a 'Mapping' when loading data into '{cls.__name__}'. Got '{type(data)}"
             raise TypeError(msg)
 
-        root_data = {"_dynamic_keys": cls._get_dynamic_keys(data)}
+        root_data = {"_dynamic_keys": cls._get_dynamic_keys(data, shared_models)}
+        if shared_models is not None:
+            for key, value in data.items():
+                if isinstance(value, (dict, list)) and (field := cls._get_field_name(key)):
+                    root_data[key] = _coerce_shared(value, cls._fields[field]["type"], shared_models)
         if load_custom_structured_config:
             root_data["_custom_structured_configurations"] = cls._CustomStructuredConfigurations(cls._get_csc_items(data))
 
@@ -79,7 +127,7 @@ class EosDesignsRootModel(AvdModel):
                 yield cls._CustomStructuredConfigurationsItem(key=key, value=EosCliConfigGen._from_dict({key[prefix_length:]: data[key]}))
 
     @classmethod
-    def _get_dynamic_keys(cls: type[EosDesigns], data: Mapping) -> EosDesigns._DynamicKeys:
+    def _get_dynamic_keys(cls: type[EosDesigns], data: Mapping, shared_models: dict[tuple[type, bytes], Any] | None = None) -> EosDesigns._DynamicKeys:
         """
         Returns the DynamicKeys object which holds a list for each dynamic key.
 
@@ -100,6 +148,7 @@ class EosDesignsRootModel(AvdModel):
         for dynamic_key_map in cls._DynamicKeys._dynamic_key_maps:
             dynamic_keys_path: str = dynamic_key_map["dynamic_keys_path"]
             model_key_list: list = dynamic_keys_dict.setdefault(dynamic_key_map["model_key"], [])
+            value_type = cls._DynamicKeys._fields[dynamic_key_map["model_key"]]["type"]._item_type._fields["value"]["type"]
 
             # TODO: Improve the fetch of default. We need to store the default value somewhere, since this is executed before __init__ of EosDesigns.
             data_with_default = get_instance_with_defaults(data, dynamic_keys_path, schema)
@@ -110,6 +159,8 @@ class EosDesignsRootModel(AvdModel):
                     # Do not add missing key or None.
                     continue
 
+                if shared_models is not None:
+                    value = _coerce_shared(value, value_type, shared_models)
                 model_key_list.append({"key": dynamic_key, "value": value})
 
         # TODO: Just create to proper data models instead of using coerce type.
@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+
+class LazyClass:
+    """
+    Descriptor for a nested class of a root model, where the class is defined in a separate module.
+
+    The module is imported when the class is accessed the first time, after which the descriptor is replaced by the class itself.
+    This avoids creating the many thousand generated classes when importing the schema package, since most runs only use a few of them.
+    """
+
+    __slots__ = ("module", "name", "owner")
+
+    module: str
+    """Module name relative to the module of the owner class. Example: "._ethernet_interfaces"."""
+    name: str
+    """Name of the class in the module and the owner class."""
+    owner: type
+    """Class where the descriptor is assigned."""
+
+    def __init__(self, module: str) -> None:
+        self.module = module
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: object, owner: type | None = None) -> type:
+        return self.load()
+
+    def load(self) -> type:
+        """Import the module and replace the descriptor with the class on the owner."""
+        cls = getattr(import_module(self.module, package=self.owner.__module__), self.name)
+        setattr(self.owner, self.name, cls)
+        return cls
+
+
+class LazyFieldInfo(dict):
+    """
+    Field info used in the _fields ClassVar for fields using a LazyClass as type.
+
+    The "type" key is only set when it is read the first time, which will import the module of the class.
+    """
+
+    __slots__ = ("lazy_class",)
+
+    def __init__(self, lazy_class: LazyClass, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.lazy_class = lazy_class
+
+    def __missing__(self, key: str) -> Any:
+        if key != "type":
+            raise KeyError(key)
+
+        self["type"] = field_type = self.lazy_class.load()
+        return field_type
+
+    def __eq__(self, other: object) -> bool:
+        # Load the type before comparing, since it would be missing from the dict.
+        self["type"]
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        self["type"]
+        return super().__ne__(other)
@@ -6,12 +6,13 @@ from .batch import batch
 from .compare_dicts import compare_dicts
 from .default import default
 from .ensure_type import ensure_type
+from .fingerprint import content_digest, fingerprint, pickled
 from .format_string import AvdStringFormatter
 from .get import get, get_v2
 from .get_all import get_all, get_all_with_path
 from .get_indices_of_duplicate_items import get_indices_of_duplicate_items
 from .get_ip_from_ip_prefix import get_ip_from_ip_prefix
-from .get_ip_from_pool import get_ip_from_pool, get_ipv4_networks_from_pool, get_ipv6_networks_from_pool, get_networks_from_pool
+from .get_ip_from_pool import IpPool, get_ip_from_pool, get_ip_pool, get_ipv4_networks_from_pool, get_ipv6_networks_from_pool, get_networks_from_pool
 from .get_item import get_item
 from .groupby import groupby, groupby_obj
 from .load_python_class import load_python_class
@@ -19,35 +20,41 @@ from .merge import merge
 from .replace_or_append_item import replace_or_append_item
 from .short_esi_to_route_target import short_esi_to_route_target
 from .strip_empties import strip_empties_from_dict, strip_empties_from_list, strip_null_from_data
-from .template import template
+from .template import get_template_file_content, template
 from .template_var import template_var
 from .undefined import Undefined, UndefinedType
 from .unique import unique
 
 __all__ = [
     "AvdStringFormatter",
+    "IpPool",
     "Undefined",
     "UndefinedType",
     "append_if_not_duplicate",
     "batch",
     "compare_dicts",
+    "content_digest",
     "default",
     "ensure_type",
+    "fingerprint",
     "get",
     "get_all",
     "get_all_with_path",
     "get_indices_of_duplicate_items",
     "get_ip_from_ip_prefix",
     "get_ip_from_pool",
+    "get_ip_pool",
     "get_ipv4_networks_from_pool",
     "get_ipv6_networks_from_pool",
     "get_item",
     "get_networks_from_pool",
+    "get_template_file_content",
     "get_v2",
     "groupby",
     "groupby_obj",
     "load_python_class",
     "merge",
+    "pickled",
     "replace_or_append_item",
     "short_esi_to_route_target",
     "strip_empties_from_dict",
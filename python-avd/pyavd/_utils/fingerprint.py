@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from hashlib import sha256
+from json import dumps
+from pickle import HIGHEST_PROTOCOL, PicklingError
+from pickle import dumps as pickle_dumps
+from typing import Any
+
+
+def fingerprint(*data: Any) -> str:
+    """
+    Returns a stable SHA256 hex digest of the given data.
+
+    The data is serialized as JSON without sorting keys, so the fingerprint changes if the order of keys changes.
+    This is on purpose since the order of the input data affects the order of the generated outputs.
+    Values not supported by JSON are serialized using their repr().
+    """
+    return sha256(dumps(data, default=repr, separators=(",", ":")).encode("UTF-8")).hexdigest()
+
+
+def content_digest(data: Any) -> bytes | None:
+    """
+    Returns a SHA256 digest of the exact content of the given data or None if the data cannot be pickled.
+
+    Unlike fingerprint(), the data is pickled, so values of different types like 1, "1" and True give different digests.
+    Used to find identical data loaded for multiple devices.
+    """
+    if (pickled_data := pickled(data)) is None:
+        return None
+    return sha256(pickled_data).digest()
+
+
+def pickled(data: Any) -> bytes | None:
+    """Returns the pickled data or None if the data cannot be pickled."""
+    try:
+        return pickle_dumps(data, protocol=HIGHEST_PROTOCOL)
+    except (PicklingError, TypeError, AttributeError, RecursionError):
+        return None
@@ -3,8 +3,8 @@
 # that can be found in the LICENSE file.
 import ipaddress
 import re
-from collections.abc import Iterator
-from functools import partial
+from collections.abc import Iterable, Iterator
+from functools import lru_cache, partial
 
 from pyavd._errors import AristaAvdError
 from pyavd._utils import ensure_type
@@ -28,6 +28,139 @@ FULLMATCH_IPV4_POOLS_AND_RANGES_PATTERN = re.compile(r"((" + LAZY_IPV4_PREFIX_PA
 FULLMATCH_IPV6_POOLS_AND_RANGES_PATTERN = re.compile(r"((" + LAZY_IPV6_PREFIX_PATTERN + r"|" + LAZY_IPV6_RANGE_PATTERN + r")([,\ ]+|$))+")
 
 
+class IpPool:
+    """
+    IP pool(s) and/or IP range(s) parsed once, for getting many IP addresses from it with integer arithmetic.
+
+    The "pool" string is lazily evaluated, so an invalid IP address may be allowed if we never need to parse it.
+    E.g. if you ask for offset 1 and the first pool is valid, but the pool for offset 256 is invalid.
+    The networks parsed so far are kept, so the string is only parsed once no matter how many addresses are requested.
+
+    Use `get_ip_pool` to get a cached instance for a pool string.
+    """
+
+    pool: str
+    _networks: list[tuple[int, int, int, type[ipaddress.IPv4Address | ipaddress.IPv6Address]]]
+    """Tuples of (<first address as integer>, <prefix length>, <number of addresses>, <address class>) for the networks parsed so far."""
+    _network_iterator: Iterator[ipaddress.IPv4Network | ipaddress.IPv6Network] | None
+    _error: AristaAvdError | None
+    """Error raised while parsing the pool string. Raised again every time the parsing would continue."""
+
+    def __init__(self, pool: str) -> None:
+        self.pool = pool
+        self._networks = []
+        self._network_iterator = get_networks_from_pool(pool)
+        self._error = None
+
+    def _iter_networks(self) -> Iterator[tuple[int, int, int, type[ipaddress.IPv4Address | ipaddress.IPv6Address]]]:
+        """Yield the parsed networks, parsing more of the pool string as needed."""
+        yield from self._networks
+        while self._network_iterator is not None:
+            try:
+                network = next(self._network_iterator)
+            except StopIteration:  # noqa: PERF203 Only raised once per pool string.
+                self._network_iterator = None
+            except AristaAvdError as e:
+                self._network_iterator = None
+                self._error = e
+            else:
+                parsed_network = (int(network.network_address), network.prefixlen, network.num_addresses, type(network.network_address))
+                self._networks.append(parsed_network)
+                yield parsed_network
+
+        if self._error is not None:
+            raise self._error
+
+    def _get_subnet(self, prefixlen: int, subnet_offset: int) -> tuple[int, int, type[ipaddress.IPv4Address | ipaddress.IPv6Address]]:
+        """Return a tuple of (<first address as integer>, <number of addresses>, <address class>) for the subnet at the given offset."""
+        remaining_subnet_offset = subnet_offset
+        for network_address, network_prefixlen, network_size, address_class in self._iter_networks():
+            prefixlen_diff = prefixlen - network_prefixlen
+
+            # Since _pools_from_str may generate multiple smaller networks when given a range, this will fail if the first or last
+            # IP does not match the subnet boundaries.
+            if prefixlen_diff < 0:
+                msg = (
+                    f"Invalid IP pool(s) '{self.pool}'. Each pool and range must be larger than the prefix length of each subnet: {prefixlen}."
+                    "IP ranges must also start and end on proper subnet boundaries for this prefix length size."
+                )
+                raise AristaAvdError(msg)
+
+            subnet_size = network_size >> prefixlen_diff
+            if (remaining_subnet_offset + 1) * subnet_size > network_size:
+                # This pool does not have enough addresses to allocate the requested offset. Subtract the size and try the next pool.
+                remaining_subnet_offset -= 1 << prefixlen_diff
+                continue
+
+            # Everything went well so we can take a subnet from this pool.
+            return network_address + remaining_subnet_offset * subnet_size, subnet_size, address_class
+
+        msg = f"Unable to get {subnet_offset + 1} /{prefixlen} subnets from pool {self.pool}"
+        raise AristaAvdError(msg)
+
+    def _get_ip_from_subnet(self, subnet: tuple[int, int, type[ipaddress.IPv4Address | ipaddress.IPv6Address]], prefixlen: int, ip_offset: int) -> str:
+        subnet_address, subnet_size, address_class = subnet
+        # A regular subnet skips the network address. A linknet (/31 or /127) or a single IP (/32 or /128) does not.
+        index = ip_offset + 1 if subnet_size > 2 else ip_offset
+        # Raise if we hit the broadcast address of a regular subnet. >= because ip_offset is 0-based.
+        hits_broadcast = subnet_size > 2 and ip_offset >= subnet_size - 2
+        # Negative offsets count from the end of the subnet like indexing an ipaddress network.
+        if index < 0:
+            index += subnet_size
+        if hits_broadcast or not 0 <= index < subnet_size:
+            msg = f"Unable to get {ip_offset + 1} hosts in subnet {address_class(subnet_address)}/{prefixlen} taken from pool {self.pool}"
+            raise AristaAvdError(msg)
+
+        return str(address_class(subnet_address + index))
+
+    def get_ip(self, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
+        """
+        Return one IP address from a subnet of the given prefix length size from the pool.
+
+        Args:
+            prefixlen: Prefix length for subnet to fetch from the pool
+            subnet_offset: Offset this many subnets of 'prefixlen' size into the pool.
+            ip_offset: Offset this many IP addresses into the subnet to get the IP.
+
+        Returns:
+            IP address without mask
+
+        Raises:
+            AristaAvdError: If the pool string is invalid or if the requested offset is not available in the pool.
+        """
+        return self._get_ip_from_subnet(self._get_subnet(prefixlen, subnet_offset), prefixlen, ip_offset)
+
+    def allocate(self, prefixlen: int, offsets: Iterable[tuple[int, int]]) -> list[str]:
+        """
+        Return IP addresses for many offsets into subnets of the given prefix length size from the pool.
+
+        Each subnet is only located once, so getting both ends of a P2P link or all hosts of a subnet is cheaper than calling get_ip for each.
+
+        Args:
+            prefixlen: Prefix length for subnets to fetch from the pool
+            offsets: Tuples of (<subnet_offset>, <ip_offset>) as described for get_ip.
+
+        Returns:
+            IP addresses without mask in the order of the offsets.
+
+        Raises:
+            AristaAvdError: If the pool string is invalid or if any of the requested offsets is not available in the pool.
+        """
+        subnets = {}
+        ip_addresses = []
+        for subnet_offset, ip_offset in offsets:
+            if (subnet := subnets.get(subnet_offset)) is None:
+                subnet = subnets[subnet_offset] = self._get_subnet(prefixlen, subnet_offset)
+            ip_addresses.append(self._get_ip_from_subnet(subnet, prefixlen, ip_offset))
+        return ip_addresses
+
+
+@lru_cache
+def get_ip_pool(pool: str) -> IpPool:
+    """Return a cached IpPool for the given pool string, so each string is only parsed once."""
+    return IpPool(pool)
+
+
 def get_ip_from_pool(pool: str, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
     """
     get_ip_from_pool returns one IP address from a subnet of the given prefix length size from the given pool.
@@ -47,53 +180,7 @@ def get_ip_from_pool(pool: str, prefixlen: int, subnet_offset: int, ip_offset: i
     Raises:
         AristaAvdError: If the pool string is invalid or if the requested offset is not available in the pool.
     """
-    subnet = None
-    remaining_subnet_offset = subnet_offset
-    for pool_network in get_networks_from_pool(pool):
-        # Storing these since they involve calculations:
-        pool_network_size = pool_network.num_addresses
-        prefixlen_diff = prefixlen - pool_network.prefixlen
-
-        # Since _pools_from_str may generate multiple smaller networks when given a range, this will fail if the first or last
-        # IP does not match the subnet boundaries.
-        try:
-            subnet_size = (int(pool_network.hostmask) + 1) >> prefixlen_diff
-        except ValueError as e:
-            msg = (
-                f"Invalid IP pool(s) '{pool}'. Each pool and range must be larger than the prefix length of each subnet: {prefixlen}."
-                "IP ranges must also start and end on proper subnet boundaries for this prefix length size."
-            )
-            raise AristaAvdError(msg) from e
-
-        if (remaining_subnet_offset + 1) * subnet_size > pool_network_size:
-            # This pool does not have enough addresses to allocate the requested offset. Subtract the size and try the next pool.
-            remaining_subnet_offset -= 2**prefixlen_diff
-            continue
-
-        # Everything went well so we can take a subnet from this pool.
-        subnet = ipaddress.ip_network((int(pool_network.network_address) + remaining_subnet_offset * subnet_size, prefixlen))
-        break
-
-    if not subnet:
-        msg = f"Unable to get {subnet_offset + 1} /{prefixlen} subnets from pool {pool}"
-        raise AristaAvdError(msg)
-
-    try:
-        if subnet_size > 2:
-            # This is a regular subnet. Skip the network address and raise if we hit the broadcast address.
-            # >= because ip_offset is 0-based.
-            if ip_offset >= (subnet_size - 2):
-                raise IndexError  # noqa: TRY301
-            ip = subnet[ip_offset + 1]
-        else:
-            # This is a linknet (/31 or /127) or a single IP (/32 or /128)
-            ip = subnet[ip_offset]
-
-    except IndexError as e:
-        msg = f"Unable to get {ip_offset + 1} hosts in subnet {subnet} taken from pool {pool}"
-        raise AristaAvdError(msg) from e
-
-    return str(ip)
+    return get_ip_pool(pool).get_ip(prefixlen, subnet_offset, ip_offset)
 
 
 def get_ipv4_networks_from_pool(pool: str) -> Iterator[ipaddress.IPv4Network]:
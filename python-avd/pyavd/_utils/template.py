@@ -27,6 +27,28 @@ def template(template_file: str, template_vars: dict, templar: object) -> str:
     str
         The rendered template
     """
+    j2template = get_template_file_content(template_file, templar)
+
+    with templar.set_temporary_context(available_variables=template_vars):
+        return templar.template(j2template, convert_data=False, escape_backslashes=False)
+
+
+def get_template_file_content(template_file: str, templar: object) -> str:
+    """
+    Return the content of the template file found in the searchpath of the Ansible Templar the same way as `template`.
+
+    Parameters
+    ----------
+    template_file : str
+        Path to Jinja2 template file
+    templar : func
+        Instance of Ansible Templar class
+
+    Returns:
+    -------
+    str
+        The content of the template file
+    """
     if templar is None:
         msg = "Jinja Templating is not implemented in pyavd"
         raise NotImplementedError(msg)
@@ -41,7 +63,4 @@ def template(template_file: str, template_vars: dict, templar: object) -> str:
     searchpath = templar.environment.loader.searchpath
     template_file_path = dataloader.path_dwim_relative_stack(searchpath, "templates", template_file)
     j2template, dummy = dataloader._get_file_contents(template_file_path)
-    j2template = to_text(j2template)
-
-    with templar.set_temporary_context(available_variables=template_vars):
-        return templar.template(j2template, convert_data=False, escape_backslashes=False)
+    return to_text(j2template)
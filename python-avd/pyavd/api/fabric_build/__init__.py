@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyavd.validation_result import ValidationResult
+
+
+class DeviceBuild:
+    """
+    Object containing the build artifacts for one device.
+
+    Attributes:
+        structured_config: Device Structured Configuration as a dictionary. Converted according to the `eos_cli_config_gen` schema.
+        validation_result: Validation result of the structured configuration.
+        config: Device configuration in EOS CLI format. None if the structured configuration failed validation.
+        documentation: Device documentation in Markdown format. None if not requested or if the structured configuration failed validation.
+    """
+
+    structured_config: dict
+    validation_result: ValidationResult
+    config: str | None
+    documentation: str | None = None
+
+    def __init__(self, structured_config: dict, validation_result: ValidationResult, config: str | None = None, documentation: str | None = None) -> None:
+        self.structured_config = structured_config
+        self.validation_result = validation_result
+        self.config = config
+        self.documentation = documentation
+
+
+class FabricBuild:
+    """
+    Object containing the build artifacts for all devices in a fabric.
+
+    Attributes:
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+        devices: Dictionary of DeviceBuild objects keyed by hostname. Ordered like the given inputs.
+        cached_hostnames: List of hostnames for which the DeviceBuild was loaded from the cache instead of being built.
+    """
+
+    avd_facts: dict
+    devices: dict[str, DeviceBuild]
+    cached_hostnames: list[str]
+
+    def __init__(self, avd_facts: dict, devices: dict[str, DeviceBuild] | None = None, cached_hostnames: list[str] | None = None) -> None:
+        self.avd_facts = avd_facts
+        self.devices = devices or {}
+        self.cached_hostnames = cached_hostnames or []
+
+    @property
+    def failed(self) -> bool:
+        """True if the structured configuration of any device failed validation."""
+        return any(device.validation_result.failed for device in self.devices.values())
@@ -7,7 +7,7 @@ from typing import Any
 
 from pyavd._eos_designs.avdfacts import AvdFacts
 from pyavd._errors import AristaAvdError
-from pyavd._utils import get_ip_from_pool
+from pyavd._utils import get_ip_pool
 
 from .utils import UtilsMixin
 
@@ -24,8 +24,8 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
     """
 
     def _ip(self, pool: str, prefixlen: int, subnet_offset: int, ip_offset: int) -> str:
-        """Shortcut to get_ip_from_pool in case any custom subclasses are using this."""
-        return get_ip_from_pool(pool, prefixlen, subnet_offset, ip_offset)
+        """Shortcut to get an IP from the cached IpPool in case any custom subclasses are using this."""
+        return get_ip_pool(pool).get_ip(prefixlen, subnet_offset, ip_offset)
 
     def _template(self, template_path: str, **kwargs: Any) -> str:
         template_vars = ChainMap(kwargs, self._hostvars)
@@ -45,18 +45,18 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         )
         if self.inputs.fabric_ip_addressing.mlag.algorithm == "odd_id":
             offset = self._mlag_odd_id_based_offset
-            return get_ip_from_pool(pool, prefixlen, offset, ip_offset)
+            return get_ip_pool(pool).get_ip(prefixlen, offset, ip_offset)
 
         if self.inputs.fabric_ip_addressing.mlag.algorithm == "same_subnet":
             pool_network = ipaddress.ip_network(pool, strict=False)
             if pool_network.prefixlen != prefixlen:
                 msg = f"MLAG same_subnet addressing requires the pool to be a /{prefixlen}"
                 raise AristaAvdError(msg)
-            return get_ip_from_pool(pool, prefixlen, 0, ip_offset)
+            return get_ip_pool(pool).get_ip(prefixlen, 0, ip_offset)
 
         # Use default first_id
         offset = self._mlag_primary_id - 1
-        return get_ip_from_pool(pool, prefixlen, offset, ip_offset)
+        return get_ip_pool(pool).get_ip(prefixlen, offset, ip_offset)
 
     def mlag_ibgp_peering_ip_primary(self, mlag_ibgp_peering_ipv4_pool: str) -> str:
         """Return IP for L3 Peerings in VRFs for MLAG Primary."""
@@ -176,7 +176,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         prefixlen = self.inputs.fabric_ip_addressing.p2p_uplinks.ipv4_prefix_length
         p2p_ipv4_pool, offset = self._get_p2p_ipv4_pool_and_offset(uplink_switch_index)
 
-        return get_ip_from_pool(p2p_ipv4_pool, prefixlen, offset, 1)
+        return get_ip_pool(p2p_ipv4_pool).get_ip(prefixlen, offset, 1)
 
     def p2p_uplinks_peer_ip(self, uplink_switch_index: int) -> str:
         """Return Parent IP for P2P Uplinks."""
@@ -190,7 +190,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         prefixlen = self.inputs.fabric_ip_addressing.p2p_uplinks.ipv4_prefix_length
         p2p_ipv4_pool, offset = self._get_p2p_ipv4_pool_and_offset(uplink_switch_index)
 
-        return get_ip_from_pool(p2p_ipv4_pool, prefixlen, offset, 0)
+        return get_ip_pool(p2p_ipv4_pool).get_ip(prefixlen, offset, 0)
 
     def p2p_vrfs_uplinks_ip(
         self,
@@ -236,7 +236,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
             )
 
         offset = self._id + self._loopback_ipv4_offset
-        return get_ip_from_pool(self._loopback_ipv4_pool, 32, offset, 0)
+        return get_ip_pool(self._loopback_ipv4_pool).get_ip(32, offset, 0)
 
     def ipv6_router_id(self) -> str:
         """
@@ -246,7 +246,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         Default offset from pool is `id + loopback_ipv6_offset`
         """
         offset = self._id + self._loopback_ipv6_offset
-        return get_ip_from_pool(self._loopback_ipv6_pool, 128, offset, 0)
+        return get_ip_pool(self._loopback_ipv6_pool).get_ip(128, offset, 0)
 
     def vtep_ip_mlag(self) -> str:
         """
@@ -270,7 +270,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
             )
 
         offset = self._mlag_primary_id + self._loopback_ipv4_offset
-        return get_ip_from_pool(self._vtep_loopback_ipv4_pool, 32, offset, 0)
+        return get_ip_pool(self._vtep_loopback_ipv4_pool).get_ip(32, offset, 0)
 
     def vtep_ip(self) -> str:
         """
@@ -292,7 +292,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
             )
 
         offset = self._id + self._loopback_ipv4_offset
-        return get_ip_from_pool(self._vtep_loopback_ipv4_pool, 32, offset, 0)
+        return get_ip_pool(self._vtep_loopback_ipv4_pool).get_ip(32, offset, 0)
 
     def vrf_loopback_ip(self, pool: str) -> str:
         """
@@ -303,7 +303,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         Used for "vtep_diagnostic.loopback".
         """
         offset = self.shared_utils.id + self.shared_utils.node_config.loopback_ipv4_offset
-        return get_ip_from_pool(pool, 32, offset, 0)
+        return get_ip_pool(pool).get_ip(32, offset, 0)
 
     def vrf_loopback_ipv6(self, pool: str) -> str:
         """
@@ -314,7 +314,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         Used for "vtep_diagnostic.loopback".
         """
         offset = self.shared_utils.id + self.shared_utils.node_config.loopback_ipv6_offset
-        return get_ip_from_pool(pool, 128, offset, 0)
+        return get_ip_pool(pool).get_ip(128, offset, 0)
 
     def evpn_underlay_l3_multicast_group(
         self,
@@ -325,7 +325,7 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
     ) -> str:
         """Return IP address to be used for EVPN underlay L3 multicast group."""
         offset = vrf_id - 1 + evpn_underlay_l3_multicast_group_ipv4_pool_offset
-        return get_ip_from_pool(underlay_l3_multicast_group_ipv4_pool, 32, offset, 0)
+        return get_ip_pool(underlay_l3_multicast_group_ipv4_pool).get_ip(32, offset, 0)
 
     def evpn_underlay_l2_multicast_group(
         self,
@@ -335,17 +335,14 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
     ) -> str:
         """Return IP address to be used for EVPN underlay L2 multicast group."""
         offset = vlan_id - 1 + underlay_l2_multicast_group_ipv4_pool_offset
-        return get_ip_from_pool(underlay_l2_multicast_group_ipv4_pool, 32, offset, 0)
+        return get_ip_pool(underlay_l2_multicast_group_ipv4_pool).get_ip(32, offset, 0)
 
     def wan_ha_ip(self) -> str:
         """Return the WAN HA local IP address."""
         wan_ha_ipv4_pool = self.shared_utils.wan_ha_ipv4_pool
         prefixlen = self.inputs.fabric_ip_addressing.wan_ha.ipv4_prefix_length
 
-        if self.shared_utils.is_first_ha_peer:
-            ip_address = get_ip_from_pool(wan_ha_ipv4_pool, prefixlen, 0, 0)
-        else:
-            ip_address = get_ip_from_pool(wan_ha_ipv4_pool, prefixlen, 0, 1)
+        ip_address = get_ip_pool(wan_ha_ipv4_pool).get_ip(prefixlen, 0, 0 if self.shared_utils.is_first_ha_peer else 1)
 
         return f"{ip_address}/{prefixlen}"
 
@@ -354,9 +351,6 @@ class AvdIpAddressing(AvdFacts, UtilsMixin):
         wan_ha_ipv4_pool = self.shared_utils.wan_ha_ipv4_pool
         prefixlen = self.inputs.fabric_ip_addressing.wan_ha.ipv4_prefix_length
 
-        if self.shared_utils.is_first_ha_peer:
-            ip_address = get_ip_from_pool(wan_ha_ipv4_pool, prefixlen, 0, 1)
-        else:
-            ip_address = get_ip_from_pool(wan_ha_ipv4_pool, prefixlen, 0, 0)
+        ip_address = get_ip_pool(wan_ha_ipv4_pool).get_ip(prefixlen, 0, 1 if self.shared_utils.is_first_ha_peer else 0)
 
         return f"{ip_address}/{prefixlen}"
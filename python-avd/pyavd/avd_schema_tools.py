@@ -10,7 +10,7 @@ from typing_extensions import Self
 from .constants import EOS_CLI_CONFIG_GEN_SCHEMA_ID, EOS_DESIGNS_SCHEMA_ID
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Iterable
 
     from .validation_result import ValidationResult
 
@@ -50,6 +50,46 @@ class AvdSchemaTools:
         Returns:
             ValidationResult object with any validation errors or deprecation warnings.
         """
+        # avdschema.convert returns a Generator, so we have to iterate through it to perform the actual conversions.
+        return self._get_conversion_result(self.avdschema.convert(data))
+
+    def validate_data(self, data: dict) -> ValidationResult:
+        """
+        Validate data according to the schema.
+
+        Args:
+            data:
+                Input variables which are to be validated according to the schema.
+
+        Returns:
+            Validation result object with any validation errors or deprecation warnings.
+        """
+        # avdschema.validate returns a Generator, so we have to iterate through it to perform the actual validations.
+        return self._get_validation_result(self.avdschema.validate(data))
+
+    def convert_and_validate(self, data: dict) -> ValidationResult:
+        """
+        Convert and validate data according to the schema.
+
+        The data conversion is done in-place (updating the original "data" dict).
+        For builtin schemas the conversion and validation is done in a single traversal of the data.
+
+        The result is identical to running "convert_data" followed by "validate_data" and merging the results.
+
+        Args:
+            data:
+                Input variables which should be converted and validated according to the schema.
+
+        Returns:
+            ValidationResult object with any validation errors or deprecation warnings.
+        """
+        conversion_exceptions, validation_exceptions = self.avdschema.convert_and_validate(data)
+        result = self._get_conversion_result(conversion_exceptions)
+        result.merge(self._get_validation_result(validation_exceptions))
+        return result
+
+    def _get_conversion_result(self, exceptions: Iterable) -> ValidationResult:
+        """Build ValidationResult from the exceptions returned by the data conversion."""
         # pylint: disable=import-outside-toplevel
         from ._errors import AvdDeprecationWarning
         from .validation_result import ValidationResult
@@ -57,9 +97,6 @@ class AvdSchemaTools:
         # pylint: enable=import-outside-toplevel
 
         result = ValidationResult(failed=False)
-
-        # avdschema.convert returns a Generator, so we have to iterate through it to perform the actual conversions.
-        exceptions: Generator = self.avdschema.convert(data)
         for exception in exceptions:
             # Store but continue for deprecations
             if isinstance(exception, AvdDeprecationWarning):
@@ -77,17 +114,8 @@ class AvdSchemaTools:
 
         return result
 
-    def validate_data(self, data: dict) -> ValidationResult:
-        """
-        Validate data according to the schema.
-
-        Args:
-            data:
-                Input variables which are to be validated according to the schema.
-
-        Returns:
-            Validation result object with any validation errors or deprecation warnings.
-        """
+    def _get_validation_result(self, exceptions: Iterable) -> ValidationResult:
+        """Build ValidationResult from the exceptions returned by the data validation."""
         # pylint: disable=import-outside-toplevel
         from ._errors import AvdDeprecationWarning, AvdValidationError
         from .validation_result import ValidationResult
@@ -95,9 +123,6 @@ class AvdSchemaTools:
         # pylint: enable=import-outside-toplevel
 
         result = ValidationResult(failed=False)
-
-        # avdschema.validate returns a Generator, so we have to iterate through it to perform the actual validations.
-        exceptions: Generator = self.avdschema.validate(data)
         for exception in exceptions:
             # Store and fail but continue for validation errors
             if isinstance(exception, AvdValidationError):
@@ -133,8 +158,7 @@ class AvdSchemaTools:
                 errors : list[Exception]
                     Any data validation issues.
         """
-        validation_result = self.convert_data(data)
-        validation_result.merge(self.validate_data(data))
+        validation_result = self.convert_and_validate(data)
         return {"failed": validation_result.failed, "errors": validation_result.validation_errors}
 
 
@@ -0,0 +1,166 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .api.fabric_build import DeviceBuild, FabricBuild
+
+# avd_facts for the current worker process. Set once per process by '_init_worker' to avoid sending the facts with every task.
+_WORKER_AVD_FACTS: dict = {}
+# Input models shared between the devices built by the current worker process. Cleared by '_init_worker', so they are only shared within one run.
+_WORKER_SHARED_MODELS: dict = {}
+
+
+def build_fabric(all_inputs: dict[str, dict], workers: int | None = None, cache_dir: str | Path | None = None, documentation: bool = False) -> FabricBuild:
+    """
+    Build avd_facts, structured configuration, device configuration and optionally device documentation for all devices in a fabric.
+
+    The avd_facts are computed once in the calling process. Afterwards structured configuration, validation of the structured configuration,
+    device configuration and device documentation are produced per device in a pool of worker processes.
+
+    The result is identical to running the following for each device:
+    ```python
+    avd_facts = pyavd.get_avd_facts(all_inputs)
+    structured_config = pyavd.get_device_structured_config(hostname, all_inputs[hostname], avd_facts)
+    validation_result = pyavd.validate_structured_config(structured_config)
+    config = pyavd.get_device_config(structured_config) if not validation_result.failed else None
+    documentation = pyavd.get_device_doc(structured_config, add_md_toc=True) if documentation and not validation_result.failed else None
+    ```
+
+    When `cache_dir` is set, the build is incremental. The artifacts of each device are stored in the cache directory together with a
+    fingerprint of the inputs and own facts of the device and the facts of all peer devices read while building it.
+    On the next run only devices with a changed fingerprint are built again. The avd_facts are always computed for the full fabric.
+    The fingerprint also covers the PyAVD version, the source files of PyAVD for development versions and the source file of each custom
+    `python_module` set in the inputs, like `templates.ip_addressing.python_module`. Changes to other modules imported by a custom
+    module are not detected, so the cache directory must be cleared after such changes.
+
+    Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
+
+    Note! No support for inline templating or jinja templates for descriptions or ip addressing
+
+    Args:
+        all_inputs: A dictionary where keys are hostnames and values are dictionaries of input variables per device.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        workers: Number of worker processes. Defaults to the number of CPUs. When set to 1, all devices are built in the calling process.
+        cache_dir: Optional path to a directory used to cache the artifacts of each device between runs. Created if missing.
+        documentation: Also render the device documentation with a table of contents for each device.
+
+    Returns:
+        FabricBuild object containing the avd_facts and a DeviceBuild object per device.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ._build_cache import DeviceBuildCache
+    from ._eos_designs.fabric_index import FabricIndex
+    from .api.fabric_build import FabricBuild
+    from .get_avd_facts import get_avd_facts
+
+    # pylint: enable=import-outside-toplevel
+
+    if workers is not None and workers < 1:
+        msg = f"The number of workers must be at least 1. Got {workers}."
+        raise ValueError(msg)
+
+    avd_facts = get_avd_facts(all_inputs)
+    result = FabricBuild(avd_facts=avd_facts)
+
+    cache = DeviceBuildCache(cache_dir) if cache_dir is not None else None
+    host_fingerprints: dict[str, str] = {}
+    device_builds: dict[str, DeviceBuild] = {}
+    if cache is not None:
+        for hostname, inputs in all_inputs.items():
+            host_fingerprints[hostname] = cache.get_host_fingerprint(hostname, inputs, avd_facts)
+            device_build = cache.load(hostname, host_fingerprints[hostname], avd_facts)
+            # Entries stored without documentation are built again if documentation is requested now.
+            if device_build is not None and (not documentation or device_build.validation_result.failed or device_build.documentation is not None):
+                device_builds[hostname] = device_build
+        result.cached_hostnames = list(device_builds)
+
+    inputs_to_build = {hostname: inputs for hostname, inputs in all_inputs.items() if hostname not in device_builds}
+    # The fabric index is built once and shared by all devices built in the same process.
+    build_facts = {**avd_facts, "avd_fabric_index": FabricIndex(avd_facts["avd_switch_facts"])}
+    for hostname, (device_build, peer_names) in _build_devices(inputs_to_build, build_facts, workers, documentation).items():
+        device_builds[hostname] = device_build
+        if cache is not None:
+            cache.store(hostname, host_fingerprints[hostname], avd_facts, peer_names, device_build)
+
+    result.devices = {hostname: device_builds[hostname] for hostname in all_inputs}
+    return result
+
+
+def _build_devices(all_inputs: dict[str, dict], avd_facts: dict, workers: int | None, documentation: bool) -> dict[str, tuple[DeviceBuild, set[str]]]:
+    """
+    Build the given devices either in the calling process or in a pool of worker processes.
+
+    The avd_facts must contain the shared "avd_fabric_index". The index is sent to each worker along with the facts it refers to.
+    Input models loaded from identical data are shared between the devices built in the same process during this call.
+    """
+    if workers == 1 or len(all_inputs) <= 1:
+        shared_models = {}
+        return {hostname: _build_device(hostname, inputs, avd_facts, documentation, shared_models) for hostname, inputs in all_inputs.items()}
+
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    # pylint: enable=import-outside-toplevel
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(avd_facts,)) as executor:
+        futures = {hostname: executor.submit(_build_device_in_worker, hostname, inputs, documentation) for hostname, inputs in all_inputs.items()}
+        return {hostname: future.result() for hostname, future in futures.items()}
+
+
+def _init_worker(avd_facts: dict) -> None:
+    """Store avd_facts in the worker process, so they are only transferred once per worker."""
+    _WORKER_AVD_FACTS.clear()
+    _WORKER_AVD_FACTS.update(avd_facts)
+    _WORKER_SHARED_MODELS.clear()
+
+
+def _build_device_in_worker(hostname: str, inputs: dict, documentation: bool) -> tuple[DeviceBuild, set[str]]:
+    return _build_device(hostname, inputs, _WORKER_AVD_FACTS, documentation, _WORKER_SHARED_MODELS)
+
+
+def _build_device(hostname: str, inputs: dict, avd_facts: dict, documentation: bool = False, shared_models: dict | None = None) -> tuple[DeviceBuild, set[str]]:
+    """
+    Build structured configuration, validation result, device configuration and optionally device documentation for one device.
+
+    Args:
+        hostname: Hostname of device.
+        inputs: Dictionary with inputs for "eos_designs".
+        avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts` with the FabricIndex of the fabric as "avd_fabric_index".
+        documentation: Also render the device documentation.
+        shared_models: Optional dict of input models shared with other devices built in the same run. See EosDesignsRootModel._from_dict.
+
+    Returns:
+        DeviceBuild object for the device and the set of hostnames for which facts were read during the build.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ._build_cache import FabricIndexRecorder, PeerFactsRecorder
+    from .api.fabric_build import DeviceBuild
+    from .get_device_config import get_device_config
+    from .get_device_doc import get_device_doc
+    from .get_device_structured_config import _get_device_structured_config
+    from .validate_structured_config import validate_structured_config
+
+    # pylint: enable=import-outside-toplevel
+
+    peer_facts_recorder = PeerFactsRecorder(avd_facts["avd_switch_facts"])
+    fabric_index_recorder = FabricIndexRecorder(avd_facts["avd_fabric_index"], peer_facts_recorder)
+    structured_config = _get_device_structured_config(
+        hostname, inputs, {**avd_facts, "avd_switch_facts": peer_facts_recorder, "avd_fabric_index": fabric_index_recorder}, shared_models
+    )
+    validation_result = validate_structured_config(structured_config)
+    config = None if validation_result.failed else get_device_config(structured_config)
+    device_doc = get_device_doc(structured_config, add_md_toc=True) if documentation and not validation_result.failed else None
+    device_build = DeviceBuild(structured_config=structured_config, validation_result=validation_result, config=config, documentation=device_doc)
+    return device_build, peer_facts_recorder.accessed
@@ -67,6 +67,7 @@ def _create_avd_switch_facts_instances(all_inputs: dict[str, dict]) -> dict:
     """
     # pylint: disable=import-outside-toplevel
     from ._eos_designs.eos_designs_facts import EosDesignsFacts
+    from ._eos_designs.fabric_index import FabricIndex
     from ._eos_designs.schema import EosDesigns
     from ._eos_designs.shared_utils import SharedUtils
     from .avd_schema_tools import EosDesignsAvdSchemaTools
@@ -74,16 +75,20 @@ def _create_avd_switch_facts_instances(all_inputs: dict[str, dict]) -> dict:
     # pylint: enable=import-outside-toplevel
 
     avd_switch_facts = {}
+    fabric_index = FabricIndex(avd_switch_facts)
+    # Models loaded from identical inputs are shared between the devices of this call only.
+    shared_models = {}
     for hostname, hostvars in all_inputs.items():
         # Set 'inventory_hostname' on the input variables, to keep compatibility with Ansible focused code.
         # Add reference to dict "avd_switch_facts" to access EosDesignsFacts objects of other switches during rendering of one switch.
+        # Add reference to the shared "avd_fabric_index" used for lookups across the facts of all switches.
         mapped_hostvars = ChainMap(
-            {"inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts},
+            {"inventory_hostname": hostname, "avd_switch_facts": avd_switch_facts, "avd_fabric_index": fabric_index},
             hostvars,
         )
 
         # Load input vars into the EosDesigns data class.
-        inputs = EosDesigns._from_dict(hostvars)
+        inputs = EosDesigns._from_dict(hostvars, shared_models=shared_models)
 
         # Initialize SharedUtils class to be passed to each python_module below.
         shared_utils = SharedUtils(hostvars=mapped_hostvars, inputs=inputs, templar=None, schema=EosDesignsAvdSchemaTools().avdschema)
@@ -7,6 +7,8 @@ def get_device_config(structured_config: dict) -> str:
     """
     Render and return the device configuration using AVD eos_cli_config_gen templates.
 
+    The templates are loaded once per process and reused for all following calls.
+
     Args:
         structured_config: Dictionary with structured configuration.
             Variables should be converted and validated according to AVD `eos_cli_config_gen` schema first using `pyavd.validate_structured_config`.
@@ -16,9 +18,52 @@ def get_device_config(structured_config: dict) -> str:
     """
     # pylint: disable=import-outside-toplevel
     from .constants import EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE, EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH
-    from .templater import Templar
+    from .templater import get_templar
 
     # pylint: enable=import-outside-toplevel
 
-    templar = Templar(precompiled_templates_path=EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH)
+    templar = get_templar(EOS_CLI_CONFIG_GEN_JINJA2_PRECOMPILED_TEMPLATE_PATH)
     return templar.render_template_from_file(EOS_CLI_CONFIG_GEN_JINJA2_CONFIG_TEMPLATE, structured_config)
+
+
+def get_device_configs(structured_configs: dict[str, dict], workers: int | None = None) -> dict[str, str]:
+    """
+    Render and return the device configurations for multiple devices using AVD eos_cli_config_gen templates.
+
+    The configurations are rendered in a pool of worker processes. Each worker loads the templates once and reuses them for all the devices
+    it renders. The result is identical to calling `pyavd.get_device_config` for each device.
+
+    Args:
+        structured_configs: A dictionary where keys are hostnames and values are dictionaries of structured configuration per device.
+            Variables should be converted and validated according to AVD `eos_cli_config_gen` schema first using `pyavd.validate_structured_config`.
+            ```python
+            {
+                "<hostname1>": dict,
+                "<hostname2>": dict,
+                ...
+            }
+            ```
+        workers: Number of worker processes. Defaults to the number of CPUs. When set to 1, all devices are rendered in the calling process.
+
+    Returns:
+        Dictionary with device configuration in EOS CLI format per hostname, in the same order as `structured_configs`.
+    """
+    if workers is not None and workers < 1:
+        msg = f"The number of workers must be at least 1. Got {workers}."
+        raise ValueError(msg)
+
+    if workers == 1 or len(structured_configs) <= 1:
+        return {hostname: get_device_config(structured_config) for hostname, structured_config in structured_configs.items()}
+
+    # pylint: disable=import-outside-toplevel
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    # pylint: enable=import-outside-toplevel
+
+    workers = workers or os.cpu_count() or 1
+    # Sending the devices in chunks to limit the overhead per task, while still spreading them over all workers.
+    chunksize = max(1, len(structured_configs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        configs = executor.map(get_device_config, structured_configs.values(), chunksize=chunksize)
+        return dict(zip(structured_configs, configs, strict=True))
@@ -13,10 +13,22 @@ def get_device_structured_config(hostname: str, inputs: dict, avd_facts: dict) -
         inputs: Dictionary with inputs for "eos_designs".
             Variables should be converted and validated according to AVD `eos_designs` schema first using `pyavd.validate_inputs`.
         avd_facts: Dictionary of avd_facts as returned from `pyavd.get_avd_facts`.
+            When building many devices of the same fabric, the FabricIndex of the fabric can be added as "avd_fabric_index",
+            so the lookups across the facts of all devices are only built once.
 
     Returns:
         Device Structured Configuration as a dictionary
     """
+    return _get_device_structured_config(hostname, inputs, avd_facts)
+
+
+def _get_device_structured_config(hostname: str, inputs: dict, avd_facts: dict, shared_models: dict | None = None) -> dict:
+    """
+    Build and return the AVD structured configuration for one device.
+
+    See `get_device_structured_config` for the arguments.
+    The optional shared_models dict is used to share input models with other devices built in the same run. See EosDesignsRootModel._from_dict.
+    """
     # pylint: disable=import-outside-toplevel
     from ._eos_designs.structured_config import get_structured_config
     from ._errors import AristaAvdError
@@ -46,6 +58,7 @@ def get_device_structured_config(hostname: str, inputs: dict, avd_facts: dict) -
         result=result,
         templar=None,
         validate=False,
+        shared_models=shared_models,
     )
     if result.get("failed"):
         msg = f"{[str(error) for error in result['errors']]}"
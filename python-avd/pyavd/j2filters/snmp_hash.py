@@ -3,8 +3,10 @@
 # that can be found in the LICENSE file.
 
 import hashlib
+from functools import lru_cache
 
 _PRIV_KEY_LENGTH = {"des": 128, "aes": 128, "aes192": 192, "aes256": 256}
+_EXPANDED_PASSPHRASE_LENGTH = 1048576
 
 
 def _get_hash_object(auth_type: str) -> object:
@@ -24,12 +26,16 @@ def _get_hash_object(auth_type: str) -> object:
         raise ValueError(msg) from ValueError
 
 
+@lru_cache(maxsize=256)
 def _key_from_passphrase(passphrase: str, auth_type: str) -> str:
     """
     RFC 2574 section A.2 algorithm.
 
     https://www.rfc-editor.org/rfc/rfc2574.html#appendix-A2.
 
+    The passphrase is repeated to fill the 1 MB buffer at once instead of appending one byte at a time.
+    Keys are cached since the same passphrases are used for the SNMP users of many devices.
+
     :param passphrase: the passphrase to use to generate the key
     :param auth_type: a string in [md5|sha|sha224|sha256|sha384|sha512]
 
@@ -42,16 +48,8 @@ def _key_from_passphrase(passphrase: str, auth_type: str) -> str:
     if isinstance(passphrase, str):
         b_passphrase = passphrase.encode("UTF-8", errors="strict")
     hash_object = _get_hash_object(auth_type)
-    count = 0
-    password_index = 0
-    password_length = len(b_passphrase)
-    while count < 1048576:
-        cp = bytearray()
-        for _ in range(64):
-            cp.append(b_passphrase[password_index % password_length])
-            password_index += 1
-        hash_object.update(cp)
-        count += 64
+    repeats = -(-_EXPANDED_PASSPHRASE_LENGTH // len(b_passphrase))
+    hash_object.update((b_passphrase * repeats)[:_EXPANDED_PASSPHRASE_LENGTH])
     return hash_object.hexdigest()
 
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -136,6 +137,17 @@ class Templar:
         self.environment.loader = self.loader
 
 
+@cache
+def get_templar(precompiled_templates_path: str | Path) -> Templar:
+    """
+    Return a Templar for the precompiled templates, shared by all callers in the current process.
+
+    The jinja2 Environment keeps the loaded template modules, so reusing the Templar avoids loading every template again for each rendering.
+    The Templar must not be modified by the callers.
+    """
+    return Templar(precompiled_templates_path=precompiled_templates_path)
+
+
 class ExtensionFileSystemLoader(FileSystemLoader):
     """Custom Jinja2 loader that filters on extensions."""
 
@@ -26,11 +26,5 @@ def validate_inputs(inputs: dict) -> ValidationResult:
 
     # pylint: enable=import-outside-toplevel
 
-    eos_designs_schema_tools = EosDesignsAvdSchemaTools()
-
-    # Inplace conversion of data
-    validation_result = eos_designs_schema_tools.convert_data(inputs)
-
-    # Validate input data
-    validation_result.merge(eos_designs_schema_tools.validate_data(inputs))
-    return validation_result
+    # Inplace conversion and validation of data in a single pass
+    return EosDesignsAvdSchemaTools().convert_and_validate(inputs)
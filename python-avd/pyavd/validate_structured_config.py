@@ -26,10 +26,5 @@ def validate_structured_config(structured_config: dict) -> ValidationResult:
 
     # pylint: enable=import-outside-toplevel
 
-    eos_cli_config_gen_schema_tools = EosCliConfigGenAvdSchemaTools()
-    # Inplace conversion of data
-    validation_result = eos_cli_config_gen_schema_tools.convert_data(structured_config)
-
-    # Validate input data
-    validation_result.merge(eos_cli_config_gen_schema_tools.validate_data(structured_config))
-    return validation_result
+    # Inplace conversion and validation of data in a single pass
+    return EosCliConfigGenAvdSchemaTools().convert_and_validate(structured_config)
@@ -103,13 +103,26 @@ def build_schema_classes() -> None:
         schema = AristaAvdSchema(_resolve_schema=schema_name, **raw_yaml_schema_store[schema_name])
         LOGGER.info("Building Python Classes from schema: %s", schema_name)
         schemasrc = schema._generate_class_src(class_name=generate_class_name(schema_name))
-        src_file_contents = FileSrc(classes=[schemasrc.cls])
-        with python_class_path.open(mode="w", encoding="UTF-8") as file:
-            file.write(str(src_file_contents))
-
-        LOGGER.info("Running 'ruff' for Python class file: %s", python_class_path)
-        subprocess.run(["ruff", "check", "--fix", str(python_class_path)], check=False)  # noqa: S603, S607
-        subprocess.run(["ruff", "format", str(python_class_path)], check=False)  # noqa: S603, S607
+        # The nested classes of the root model are written to one module per field and only imported when used.
+        schemasrc.cls.lazy_classes = True
+        src_files = {python_class_path: FileSrc(classes=[schemasrc.cls])}
+        for module, classes in schemasrc.cls.get_lazy_modules().items():
+            src_files[python_class_path.with_name(f"{module}.py")] = FileSrc(classes=classes)
+
+        # Clean up modules for removed fields.
+        for file in python_class_path.parent.glob("_*.py"):
+            if file not in src_files:
+                LOGGER.info("Deleting file %s", file.absolute())
+                file.unlink()
+
+        for src_file_path, src_file_contents in src_files.items():
+            with src_file_path.open(mode="w", encoding="UTF-8") as file:
+                file.write(str(src_file_contents))
+
+        LOGGER.info("Running 'ruff' for Python class files in: %s", python_class_path.parent)
+        src_file_paths = [str(src_file_path) for src_file_path in src_files]
+        subprocess.run(["ruff", "check", "--fix", *src_file_paths], check=False)  # noqa: S603, S607
+        subprocess.run(["ruff", "format", *src_file_paths], check=False)  # noqa: S603, S607
 
 
 def build_schemas() -> None:
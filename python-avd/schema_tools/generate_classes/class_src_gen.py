@@ -173,9 +173,11 @@ class SrcGenList(SrcGenBase):
         """Returns ListSrc for the given schema to be used for the class definition in the parent object."""
         if self.schema.field_ref:
             # TODO: Currently we only skip resolving ref for indexedlists. Improve this.
+            schema_name = self.schema.field_ref.split("#", maxsplit=1)[0]
             return ListSrc(
                 name=self.get_class_name(),
                 base_class=generate_class_name_from_ref(self.schema.field_ref),
+                imports={f"from pyavd._{schema_name}.schema import {generate_class_name(schema_name)}"},
             )
 
         class_name = self.get_class_name()
@@ -385,6 +387,7 @@ class SrcGenRootDict(SrcGenDict):
                 ModelSrc(
                     name="_CustomStructuredConfigurationsItem",
                     classes=[],
+                    imports={"from pyavd._eos_cli_config_gen.schema import EosCliConfigGen"},
                     fields=[
                         FieldSrc(
                             name="key",
@@ -14,14 +14,15 @@ SRC_HEADER = indent(LICENSE_HEADER + "\n\n", "# ") + "from __future__ import ann
 BASE_IMPORTS = """\
 from typing import TYPE_CHECKING
 
-from pyavd._schema.models.avd_indexed_list import AvdIndexedList
-from pyavd._schema.models.avd_list import AvdList
-from pyavd._schema.models.avd_model import AvdModel
-
 if TYPE_CHECKING:
     from pyavd._utils import Undefined, UndefinedType
 """
 BASE_MODEL_NAME = "AvdModel"
+BASE_CLASS_IMPORTS = {
+    "AvdIndexedList": "from pyavd._schema.models.avd_indexed_list import AvdIndexedList",
+    "AvdList": "from pyavd._schema.models.avd_list import AvdList",
+    "AvdModel": "from pyavd._schema.models.avd_model import AvdModel",
+}
 INDENT = "    "
 
 
@@ -83,12 +84,19 @@ class FieldSrc:
             imports.update(type_hint.get_imports())
         return imports
 
-    def field_as_dict_str(self) -> str:
+    def field_as_dict_str(self, lazy: bool = False) -> str:
         """
         Return a representation of the field to be inserted in a dict string.
 
         Used for _fields classvar
+
+        Args:
+            lazy: Render the field info as LazyFieldInfo, so the type is only loaded when it is read.
         """
+        if lazy:
+            default_src = f", default={self.default_value}" if self.default_value else ""
+            return f'"{self.name}": LazyFieldInfo({self.field_type}{default_src})'
+
         dict_fields_src = [f'"type": {self.field_type}']
         if self.default_value:
             dict_fields_src.append(f'"default": {self.default_value}')
@@ -150,6 +158,12 @@ class ModelSrc:
     base_classes: list[str] | None = None
     description: str | None = None
     allow_extra: bool = False
+    lazy_classes: bool = False
+    """
+    Render the nested classes in separate modules, which are only imported when the class is accessed.
+
+    The modules are returned by get_lazy_modules(). Only supported for the root model.
+    """
 
     def __str__(self) -> str:
         """Renders the Python source code for this class including any nested classes and fields."""
@@ -217,8 +231,59 @@ class ModelSrc:
         if not self.classes:
             return ""
 
+        if self.lazy_classes:
+            return self._render_lazy_classes()
+
         return indent("\n".join(str(cls) for cls in self.classes), INDENT)
 
+    def _render_lazy_classes(self) -> str:
+        """
+        Renders the Python source code for nested classes defined in separate modules.
+
+        The classes are imported for type checkers, while at runtime each class is a LazyClass descriptor importing the module on first access.
+        """
+        lazy_modules = self.get_lazy_modules()
+        src = "if TYPE_CHECKING:\n"
+        for module, classes in lazy_modules.items():
+            src += indent(f"from .{module} import {', '.join(cls.name for cls in classes)}\n", INDENT)
+        src += "else:\n"
+        for module, classes in lazy_modules.items():
+            src += "".join(indent(f'{cls.name} = LazyClass(".{module}")\n', INDENT) for cls in classes)
+
+        return indent(src, INDENT)
+
+    def _get_lazy_class_names(self) -> set[str]:
+        """Returns the names of the nested classes defined in separate modules."""
+        if not self.lazy_classes:
+            return set()
+
+        return {cls.name for cls in self.classes}
+
+    def get_lazy_modules(self) -> dict[str, list[ModelSrc | ListSrc]]:
+        """
+        Returns the nested classes grouped into one module per field.
+
+        The module for each field contains the class used as the field type and any item classes of that class.
+        """
+        classes_by_name = {cls.name: cls for cls in self.classes}
+        lazy_modules = {}
+        for field in self.fields:
+            classes = []
+            class_name = field.field_type
+            while (cls := classes_by_name.pop(class_name, None)) is not None:
+                # Item classes must be defined before the list class using them.
+                classes.insert(0, cls)
+                class_name = cls.item_type if isinstance(cls, ListSrc) else None
+
+            if classes:
+                lazy_modules[field.name if field.name.startswith("_") else f"_{field.name}"] = classes
+
+        if classes_by_name:
+            msg = f"Unable to find the field using the nested classes {list(classes_by_name)} of '{self.name}'."
+            raise ValueError(msg)
+
+        return lazy_modules
+
     def _render_class_vars(self) -> str:
         """Renders the Python source code for any ClassVars."""
         if not self.class_vars:
@@ -231,7 +296,8 @@ class ModelSrc:
         if not self.fields:
             return ""
 
-        fields_types_dict = ", ".join(field.field_as_dict_str() for field in self.fields)
+        lazy_class_names = self._get_lazy_class_names()
+        fields_types_dict = ", ".join(field.field_as_dict_str(lazy=field.field_type in lazy_class_names) for field in self.fields)
         src = f"    _fields: ClassVar[dict] = {{{fields_types_dict}}}\n"
 
         if field_to_key_map := {field.name: field.key for field in self.fields if field.name and field.key and field.name != field.key}:
@@ -265,13 +331,18 @@ class ModelSrc:
     def get_imports(self) -> set:
         """Returns Python import statements required for this class including any nested classes and fields."""
         imports = self.imports or set()
+        if not self.base_classes:
+            imports.add(BASE_CLASS_IMPORTS[BASE_MODEL_NAME])
         if self.fields:
             imports.add("from typing import ClassVar")
         if self.class_vars:
             for class_var in self.class_vars:
                 imports.update(class_var.get_imports())
-        for cls in self.classes:
-            imports.update(cls.get_imports())
+        if self.lazy_classes:
+            imports.add("from pyavd._schema.models.lazy_class import LazyClass, LazyFieldInfo")
+        else:
+            for cls in self.classes:
+                imports.update(cls.get_imports())
         for field in self.fields:
             imports.update(field.get_imports())
         return imports
@@ -324,6 +395,8 @@ class ListSrc:
     def get_imports(self) -> set:
         """Returns Python import statements required for this class including any nested classes and fields."""
         imports = self.imports or set()
+        if base_class_import := BASE_CLASS_IMPORTS.get(self.base_class.split("[", maxsplit=1)[0]):
+            imports.add(base_class_import)
         if self.class_vars:
             for class_var in self.class_vars:
                 imports.update(class_var.get_imports())
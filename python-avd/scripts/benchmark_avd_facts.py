@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Benchmark the rendering of avd_facts and the structured config of the spines on a generated L3LS fabric.
+
+The spines read the facts of every leaf in the fabric, so this exercises the lookups through `EosDesignsFacts.get()`.
+Usage: benchmark_avd_facts.py [<number of leaf pairs>] [<runs>]
+"""
+
+from copy import deepcopy
+from pathlib import Path
+from statistics import median
+from sys import argv, path
+from time import perf_counter
+
+# Override global path to load pyavd from source instead of any installed version.
+path.insert(0, str(Path(__file__).parents[1]))
+
+from pyavd import get_avd_facts, get_device_structured_config, validate_inputs
+from pyavd._eos_designs.fabric_index import FabricIndex
+
+SPINES = 4
+
+
+def get_fabric_inputs(leaf_pairs: int) -> dict[str, dict]:
+    """Return the inputs for a fabric with four spines and the given number of MLAG leaf pairs."""
+    fabric_inputs = {
+        "fabric_name": "FABRIC",
+        "underlay_routing_protocol": "ebgp",
+        "overlay_routing_protocol": "ebgp",
+        "spine": {
+            "defaults": {"loopback_ipv4_pool": "10.0.0.0/24", "bgp_as": "65000"},
+            "nodes": [{"name": f"spine{spine}", "id": spine} for spine in range(1, SPINES + 1)],
+        },
+        "l3leaf": {
+            "defaults": {
+                "loopback_ipv4_pool": "10.1.0.0/16",
+                "vtep_loopback_ipv4_pool": "10.2.0.0/16",
+                "uplink_ipv4_pool": "10.3.0.0/16",
+                "mlag_peer_ipv4_pool": "10.4.0.0/16",
+                "mlag_peer_l3_ipv4_pool": "10.5.0.0/16",
+                "uplink_switches": [f"spine{spine}" for spine in range(1, SPINES + 1)],
+                "uplink_interfaces": [f"Ethernet{spine}" for spine in range(1, SPINES + 1)],
+                "mlag_interfaces": ["Ethernet51", "Ethernet52"],
+                "virtual_router_mac_address": "00:1c:73:00:dc:01",
+            },
+            "node_groups": [
+                {
+                    "group": f"pair{pair}",
+                    "bgp_as": str(65100 + pair),
+                    "nodes": [
+                        {"name": f"leaf{pair}{side}", "id": node_id, "uplink_switch_interfaces": [f"Ethernet{node_id}"] * SPINES}
+                        for side, node_id in (("a", pair * 2 - 1), ("b", pair * 2))
+                    ],
+                }
+                for pair in range(1, leaf_pairs + 1)
+            ],
+        },
+    }
+    all_inputs = {f"spine{spine}": {**deepcopy(fabric_inputs), "type": "spine"} for spine in range(1, SPINES + 1)}
+    for pair in range(1, leaf_pairs + 1):
+        for side in ("a", "b"):
+            all_inputs[f"leaf{pair}{side}"] = {**deepcopy(fabric_inputs), "type": "l3leaf"}
+
+    for inputs in all_inputs.values():
+        validate_inputs(inputs)
+
+    return all_inputs
+
+
+def run(all_inputs: dict[str, dict]) -> tuple[float, float]:
+    """Return the time spent in seconds for get_avd_facts and for the structured config of the spines."""
+    start = perf_counter()
+    avd_facts = get_avd_facts(all_inputs)
+    facts_time = perf_counter() - start
+
+    start = perf_counter()
+    # Sharing one fabric index for all devices like build_fabric.
+    avd_facts = {**avd_facts, "avd_fabric_index": FabricIndex(avd_facts["avd_switch_facts"])}
+    for spine in range(1, SPINES + 1):
+        get_device_structured_config(f"spine{spine}", all_inputs[f"spine{spine}"], avd_facts)
+    return facts_time, perf_counter() - start
+
+
+if __name__ == "__main__":
+    leaf_pairs = int(argv[1]) if len(argv) > 1 else 100
+    runs = int(argv[2]) if len(argv) > 2 else 5
+
+    all_inputs = get_fabric_inputs(leaf_pairs)
+    # Warm up to import all modules and load all schema classes.
+    run(all_inputs)
+
+    timings = [run(all_inputs) for _ in range(runs)]
+    print(f"Fabric with {SPINES} spines and {leaf_pairs * 2} leafs")
+    for name, values in (("get_avd_facts", [t[0] for t in timings]), ("structured config of spines", [t[1] for t in timings])):
+        print(f"{name:<30} min {min(values) * 1000:8.1f} ms    median {median(values) * 1000:8.1f} ms")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Benchmark deploy_to_cv against a local CloudVision stand-in with a generated set of devices.
+
+Every device gets a configlet, two device tags and interface tags on four interfaces. The Workspace is submitted and the Change Control completed.
+The stand-in runs in a separate process, so it does not compete with the workflow for the GIL.
+Usage: benchmark_deploy_to_cv.py [<number of devices>] [<latency per API call in ms>] [<number of CloudVision nodes>]
+"""
+
+import asyncio
+import warnings
+from multiprocessing import Pipe, get_context
+from multiprocessing.connection import Connection
+from pathlib import Path
+from sys import argv, path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+# Override global path to load pyavd from source instead of any installed version.
+path.insert(0, str(Path(__file__).parents[1]))
+
+from pyavd._cv.standin import CVStandIn
+from pyavd._cv.workflows.deploy_to_cv import deploy_to_cv
+from pyavd._cv.workflows.models import CloudVision, CVChangeControl, CVDevice, CVDeviceTag, CVEosConfig, CVInterfaceTag
+
+INTERFACES = 4
+
+
+def get_device_tuples(devices: int) -> list[tuple[str, str, str]]:
+    """Return tuples of (<serial number>, <hostname>, <system mac address>) for the given number of devices."""
+    return [(f"SN{index:06}", f"leaf{index}", f"00:1c:73:{index >> 16 & 255:02x}:{index >> 8 & 255:02x}:{index & 255:02x}") for index in range(devices)]
+
+
+def run_standin(connection: Connection, hosts: list[str], latency: float, devices: int) -> None:
+    """Run the stand-in until told to stop through the connection. Sends the port after starting and the API call counts after stopping."""
+    with CVStandIn(hosts=hosts, latency=latency) as standin:
+        standin.add_devices(get_device_tuples(devices))
+        connection.send(standin.port)
+        connection.recv()
+    connection.send(standin.call_counts)
+
+
+async def run(hosts: list[str], port: int, devices: int, config_dir: Path) -> tuple[float, dict[str, float], bool]:
+    """Return a tuple of (<total time in seconds>, <stage timings>, <failed>)."""
+    cv_devices = [CVDevice(hostname) for _serial_number, hostname, _system_mac_address in get_device_tuples(devices)]
+    configs = []
+    for device in cv_devices:
+        config_file = config_dir / f"{device.hostname}.cfg"
+        config_file.write_text(f"hostname {device.hostname}\n" + "".join(f"interface Ethernet{interface}\n   no shutdown\n" for interface in range(1, 49)))
+        configs.append(CVEosConfig(file=str(config_file), device=device))
+
+    start = perf_counter()
+    result = await deploy_to_cv(
+        cloudvision=CloudVision(servers=hosts, token="token", verify_certs=False, port=port),  # noqa: S106
+        change_control=CVChangeControl(requested_state="completed"),
+        configs=configs,
+        device_tags=[CVDeviceTag(label, value, device) for device in cv_devices for label, value in (("Role", "leaf"), ("DC", "DC1"))],
+        interface_tags=[
+            CVInterfaceTag("peer_device", f"spine{interface}", device, f"Ethernet{interface}")
+            for device in cv_devices
+            for interface in range(1, INTERFACES + 1)
+        ],
+    )
+    return perf_counter() - start, result.stage_timings, result.failed
+
+
+if __name__ == "__main__":
+    devices = int(argv[1]) if len(argv) > 1 else 2000
+    latency = float(argv[2]) / 1000 if len(argv) > 2 else 0.0
+    hosts = [f"127.0.0.{node}" for node in range(1, (int(argv[3]) if len(argv) > 3 else 1) + 1)]
+
+    # The stand-in uses a self-signed certificate.
+    warnings.filterwarnings("ignore", message="Unverified HTTPS request")
+
+    connection, standin_connection = Pipe()
+    standin_process = get_context("spawn").Process(target=run_standin, args=(standin_connection, hosts, latency, devices))
+    standin_process.start()
+    port = connection.recv()
+    try:
+        with TemporaryDirectory() as tmp_dir:
+            total_time, stage_timings, failed = asyncio.run(run(hosts, port, devices, Path(tmp_dir)))
+    finally:
+        connection.send("stop")
+        call_counts = connection.recv()
+        standin_process.join()
+
+    print(f"deploy_to_cv with {devices} devices, {latency * 1000:.1f} ms latency and {len(hosts)} CloudVision nodes{' FAILED' if failed else ''}")
+    print(f"{'total':<32} {total_time * 1000:10.1f} ms")
+    for stage, stage_time in stage_timings.items():
+        print(f"{stage:<32} {stage_time * 1000:10.1f} ms")
+    print(f"{'API calls':<32} {sum(call_counts.values()):10}")
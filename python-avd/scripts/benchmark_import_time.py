@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+"""
+Benchmark the cold import time of the generated schema classes.
+
+Each scenario is timed in a new Python interpreter, so nothing is reused between runs except the compiled bytecode.
+The "all classes" scenario loads every lazily imported class, which is the cost of defining all the classes up front.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+
+PYAVD_DIR = Path(__file__).parents[1]
+
+TIMED_SCRIPT = """
+from time import perf_counter
+
+start = perf_counter()
+{code}
+print(perf_counter() - start)
+"""
+
+SCENARIOS = {
+    "import schemas": """
+from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._eos_designs.schema import EosDesigns
+""",
+    "import schemas and load structured config": """
+from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._eos_designs.schema import EosDesigns
+EosCliConfigGen._from_dict({"hostname": "leaf1", "ethernet_interfaces": [{"name": "Ethernet1"}], "router_bgp": {"as": "65001"}})
+""",
+    "import schemas and load all classes": """
+from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._eos_designs.schema import EosDesigns
+from pyavd._schema.models.lazy_class import LazyClass
+for cls in (EosCliConfigGen, EosDesigns):
+    [lazy_class.load() for lazy_class in list(vars(cls).values()) if isinstance(lazy_class, LazyClass)]
+""",
+}
+
+
+def time_scenario(code: str) -> float:
+    """Run the code in a new interpreter and return the time spent in seconds."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", TIMED_SCRIPT.format(code=code)], cwd=PYAVD_DIR, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    # Warm up to make sure the bytecode is compiled.
+    time_scenario(SCENARIOS["import schemas and load all classes"])
+
+    for name, code in SCENARIOS.items():
+        timings = [time_scenario(code) for _ in range(runs)]
+        print(f"{name:<45} min {min(timings) * 1000:8.1f} ms    median {median(timings) * 1000:8.1f} ms")
@@ -0,0 +1,192 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from inspect import signature
+from unittest.mock import AsyncMock
+
+import pytest
+from grpclib.client import Channel
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.client.async_decorators import channel_failover, grpc_msg_size_handler, limit_concurrency
+from pyavd._cv.client.channel_pool import ChannelPool, is_connection_error
+from pyavd._cv.client.concurrency import AdaptiveConcurrencyLimiter
+from pyavd._cv.client.exceptions import CVResourceNotFound
+
+SERVERS = ["cv1", "cv2", "cv3"]
+
+
+class CvClass:
+    def __init__(self, channel_pool: ChannelPool, down_servers: set[str], exception: Exception) -> None:
+        self._concurrency_limiter = AdaptiveConcurrencyLimiter()
+        self._channel_pool = channel_pool
+        self.down_servers = down_servers
+        self.exception = exception
+        self.called_servers = []
+
+    @limit_concurrency
+    @channel_failover
+    async def call(self, *, channel: Channel) -> str:
+        server = channel._host
+        self.called_servers.append(server)
+        if server in self.down_servers:
+            raise self.exception
+        return server
+
+    @channel_failover
+    async def call_without_limit(self, *, channel: Channel) -> str:
+        self.called_servers.append(channel._host)
+        if channel._host in self.down_servers:
+            raise self.exception
+        return channel._host
+
+    @grpc_msg_size_handler("items")
+    @limit_concurrency
+    @channel_failover
+    async def call_with_list(self, items: list, *, channel: Channel) -> list:
+        return [(channel._host, item) for item in items]
+
+
+def set_probe_result(channel_pool: ChannelPool, server: str, exception: Exception | None) -> AsyncMock:
+    """Set the result of connecting the channels to the given server when probing it."""
+    connect = AsyncMock(side_effect=exception)
+    for channel_server, channel in channel_pool._channels:
+        if channel_server == server:
+            channel.__connect__ = connect
+    return connect
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_round_robin() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True, connections_per_server=2)
+    channels = [await channel_pool.get_channel() for _ in range(6)]
+
+    # Consecutive calls go to different servers and all connections are used.
+    assert [channel._host for channel in channels] == SERVERS * 2
+    assert len({id(channel) for channel in channels}) == 6
+    assert await channel_pool.get_channel() is channels[0]
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_unhealthy_servers() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True, failure_cooldown=60.0)
+
+    channel = await channel_pool.get_channel()
+    assert channel._host == "cv1"
+    assert channel_pool.mark_channel_failed(channel) is True
+    assert [(await channel_pool.get_channel())._host for _ in range(4)] == ["cv2", "cv3", "cv2", "cv3"]
+    channel = await channel_pool.get_channel()
+    assert channel._host == "cv2"
+    assert channel_pool.mark_channel_failed(channel) is True
+    channel = await channel_pool.get_channel()
+    assert channel._host == "cv3"
+    assert channel_pool.mark_channel_failed(channel) is False
+
+    # With all servers unhealthy, the server recovering first is used without probing it.
+    connect = set_probe_result(channel_pool, "cv1", ConnectionRefusedError("Connection refused"))
+    assert (await channel_pool.get_channel())._host == "cv1"
+    connect.assert_not_called()
+
+    # Channels not handed out by the pool are ignored.
+    assert channel_pool.mark_channel_failed(Channel(host="other", port=443)) is False
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_pool_probe() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True, failure_cooldown=60.0)
+    channel = await channel_pool.get_channel()
+    channel_pool.mark_channel_failed(channel)
+
+    # Servers are only probed after the cooldown. A failed probe starts a new cooldown.
+    connect = set_probe_result(channel_pool, "cv1", ConnectionRefusedError("Connection refused"))
+    assert [(await channel_pool.get_channel())._host for _ in range(2)] == ["cv2", "cv3"]
+    connect.assert_not_called()
+    channel_pool._unhealthy_until["cv1"] = 0.0
+    assert (await channel_pool.get_channel())._host == "cv2"
+    connect.assert_awaited_once()
+    assert channel_pool._unhealthy_until["cv1"] > 0.0
+    assert (await channel_pool.get_channel())._host == "cv3"
+
+    # The server is used again once the probe succeeds.
+    connect = set_probe_result(channel_pool, "cv1", None)
+    channel_pool._unhealthy_until["cv1"] = 0.0
+    assert (await channel_pool.get_channel())._host == "cv1"
+    connect.assert_awaited_once()
+    assert "cv1" not in channel_pool._unhealthy_until
+    assert [(await channel_pool.get_channel())._host for _ in range(3)] == ["cv2", "cv3", "cv1"]
+    connect.assert_awaited_once()
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failover() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True, failure_cooldown=60.0)
+    cv_client = CvClass(channel_pool, down_servers={"cv1", "cv2"}, exception=ConnectionRefusedError("Connection refused"))
+
+    assert await cv_client.call() == "cv3"
+    assert cv_client.called_servers == ["cv1", "cv2", "cv3"]
+
+    # Failing servers are skipped for the following calls.
+    assert await cv_client.call() == "cv3"
+    assert cv_client.called_servers == ["cv1", "cv2", "cv3", "cv3"]
+
+    # The error is raised when all servers failed.
+    cv_client.down_servers.add("cv3")
+    with pytest.raises(ConnectionRefusedError):
+        await cv_client.call()
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failover_without_limit_concurrency() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True, failure_cooldown=60.0)
+    cv_client = CvClass(channel_pool, down_servers={"cv1"}, exception=GRPCError(Status.UNAVAILABLE, "Unavailable"))
+
+    assert await cv_client.call_without_limit() == "cv2"
+    assert cv_client.called_servers == ["cv1", "cv2"]
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_no_failover_on_other_errors() -> None:
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True)
+    cv_client = CvClass(channel_pool, down_servers={"cv1"}, exception=CVResourceNotFound("Not found"))
+
+    with pytest.raises(CVResourceNotFound):
+        await cv_client.call()
+    assert cv_client.called_servers == ["cv1"]
+    channel_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_failover_signature() -> None:
+    """The channel argument is hidden from the signature, so it can be combined with grpc_msg_size_handler."""
+    channel_pool = ChannelPool(SERVERS, port=443, ssl=True)
+    cv_client = CvClass(channel_pool, down_servers=set(), exception=Exception())
+
+    assert "channel" not in signature(CvClass.call).parameters
+    assert await cv_client.call_with_list(items=[1, 2]) == [("cv1", 1), ("cv1", 2)]
+    channel_pool.close()
+
+
+def test_channel_failover_invalid_function() -> None:
+    async def call() -> None:
+        pass
+
+    with pytest.raises(TypeError, match="Expected a keyword-only argument 'channel'"):
+        channel_failover(call)
+
+
+def test_is_connection_error() -> None:
+    assert is_connection_error(ConnectionResetError()) is True
+    assert is_connection_error(GRPCError(Status.UNAVAILABLE, "Unavailable")) is True
+    assert is_connection_error(GRPCError(Status.NOT_FOUND, "Not found")) is False
+    assert is_connection_error(FileNotFoundError()) is False
+
+
+def test_invalid_connections_per_server() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        ChannelPool(SERVERS, port=443, ssl=True, connections_per_server=0)
@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from asyncio import gather, sleep
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.client.async_decorators import limit_concurrency
+from pyavd._cv.client.concurrency import AdaptiveConcurrencyLimiter, is_overload_error
+from pyavd._cv.client.exceptions import CVResourceNotFound, CVTimeoutError
+
+
+class CvClass:
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter) -> None:
+        self._concurrency_limiter = limiter
+        self.max_in_flight = 0
+        self.started = []
+
+    @limit_concurrency
+    async def call(self, index: int, delay: float = 0.01) -> int:
+        self.started.append(index)
+        self.max_in_flight = max(self.max_in_flight, self._concurrency_limiter.in_flight)
+        await sleep(delay)
+        return index
+
+    @limit_concurrency
+    async def nested_call(self, index: int) -> int:
+        return await self.call(index)
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    cv_client = CvClass(limiter)
+
+    assert await gather(*(cv_client.call(index) for index in range(20))) == list(range(20))
+    assert cv_client.max_in_flight == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency_keeps_slots_busy() -> None:
+    """Test that a slow call does not hold back the following calls, like with fixed batches."""
+    cv_client = CvClass(AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2))
+
+    async def slow_call() -> None:
+        await cv_client.call(0, delay=0.5)
+        assert len(cv_client.started) == 11
+
+    await gather(slow_call(), *(cv_client.call(index, delay=0.01) for index in range(1, 11)))
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency_nested() -> None:
+    """Test that nested calls reuse the slot of the caller instead of waiting for a free slot."""
+    cv_client = CvClass(AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1))
+
+    assert await gather(*(cv_client.nested_call(index) for index in range(3))) == [0, 1, 2]
+
+
+def test_adaptive_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+
+    # Stable latency increases the limit by about one per window of calls, up to the max.
+    for _ in range(5):
+        limiter._on_success("call", 0.1)
+    assert limiter.limit == 5
+    for _ in range(100):
+        limiter._on_success("call", 0.1)
+    assert limiter.limit == 8
+
+    # Overload errors halve the limit once per window of calls.
+    limiter._on_error(GRPCError(Status.RESOURCE_EXHAUSTED, "Rate limited"))
+    limiter._on_error(CVTimeoutError("Timed out"))
+    assert limiter.limit == 4
+
+    # Other errors do not change the limit.
+    for _ in range(10):
+        limiter._on_error(CVResourceNotFound("Not found"))
+    assert limiter.limit == 4
+
+    # Increased latency decreases the limit.
+    limiter._on_success("call", 1.0)
+    assert limiter.limit == 3
+
+
+def test_adaptive_limit_latency_per_key() -> None:
+    """Test that the latency of slow RPCs is not compared with the latency of fast RPCs."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+
+    for _ in range(5):
+        limiter._on_success("fast_call", 0.1)
+    assert limiter.limit == 5
+    limiter._on_success("slow_call", 10.0)
+    limiter._on_success("fast_call", 0.1)
+    assert limiter.limit == 5
+    assert limiter._long_latency == {"fast_call": pytest.approx(0.1), "slow_call": 10.0}
+
+    # Increased latency for the same key still decreases the limit.
+    limiter._on_success("slow_call", 100.0)
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency_latency_per_method() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=4)
+    cv_client = CvClass(limiter)
+
+    await cv_client.call(0)
+    await cv_client.nested_call(1)
+
+    # Nested calls are part of the latency of the outer call.
+    assert set(limiter._long_latency) == {"call", "nested_call"}
+
+
+def test_is_overload_error() -> None:
+    assert is_overload_error(CVTimeoutError("Timed out")) is True
+    assert is_overload_error(GRPCError(Status.UNAVAILABLE, "Unavailable")) is True
+    assert is_overload_error(GRPCError(Status.NOT_FOUND, "Not found")) is False
+    assert is_overload_error(CVResourceNotFound("Not found")) is False
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="Invalid concurrency limits"):
+        AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
@@ -0,0 +1,185 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from pyavd._cv.api.arista.inventory.v1 import Device, DeviceKey
+from pyavd._cv.api.arista.tag.v2 import ElementType, TagConfig, TagKey
+from pyavd._cv.client import CVClient, tag
+from pyavd._cv.client.concurrency import _HOLDING_SLOT
+from pyavd._cv.standin import CVStandIn
+from pyavd._cv.standin.store import ResourceStore, matches_partial_eq_filter
+from pyavd._cv.workflows.deploy_to_cv import deploy_to_cv
+from pyavd._cv.workflows.models import CloudVision, CVChangeControl, CVDevice, CVDeviceTag, CVEosConfig, CVInterfaceTag, DeployToCvResult
+
+# The stand-in uses a self-signed certificate.
+pytestmark = pytest.mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning")
+
+TOKEN = "token"  # noqa: S105 Not used for authentication by the stand-in.
+DEVICES = [(f"SN{index}", f"leaf{index}", f"00:1c:73:00:00:{index:02x}") for index in range(20)]
+
+
+@pytest.fixture(name="standin")
+def fixture_standin() -> Iterator[CVStandIn]:
+    with CVStandIn(latency=0.001, seed=1) as standin:
+        standin.add_devices(DEVICES)
+        yield standin
+
+
+def test_matches_partial_eq_filter() -> None:
+    tag = TagConfig(key=TagKey(workspace_id="ws", element_type=ElementType.DEVICE, label="role", value="leaf"))
+
+    assert matches_partial_eq_filter(tag, TagConfig(key=TagKey(workspace_id="ws", element_type=ElementType.DEVICE))) is True
+    assert matches_partial_eq_filter(tag, TagConfig()) is True
+    # The empty string for mainline is a value like any other for wrapped fields.
+    assert matches_partial_eq_filter(tag, TagConfig(key=TagKey(workspace_id=""))) is False
+    assert matches_partial_eq_filter(tag, TagConfig(key=TagKey(element_type=ElementType.INTERFACE))) is False
+    assert matches_partial_eq_filter(tag, TagConfig(remove=True)) is False
+
+
+def test_resource_store_find() -> None:
+    store = ResourceStore()
+    for serial_number, hostname, system_mac_address in DEVICES:
+        store.set(Device(key=DeviceKey(device_id=serial_number), hostname=hostname, system_mac_address=system_mac_address))
+
+    def find(*partial_eq_filters: Device) -> list[str]:
+        return sorted(device.key.device_id for device, _time in store.find(partial_eq_filters))
+
+    assert len(find()) == len(DEVICES)
+    # Complete keys, other fields and a mix of both.
+    assert find(Device(key=DeviceKey(device_id="SN1")), Device(key=DeviceKey(device_id="SN42"))) == ["SN1"]
+    assert find(Device(key=DeviceKey(device_id="SN1"), hostname="leaf2")) == []
+    assert find(Device(hostname="leaf2"), Device(hostname="leaf3"), Device(key=DeviceKey(device_id="SN4"))) == ["SN2", "SN3", "SN4"]
+    assert find(Device(hostname="leaf5", system_mac_address="00:1c:73:00:00:05"), Device(hostname="leaf6", system_mac_address="wrong")) == ["SN5"]
+
+
+@pytest.mark.asyncio
+async def test_deploy_to_cv(standin: CVStandIn, tmp_path: Path) -> None:
+    devices = [CVDevice(hostname) for _serial_number, hostname, _system_mac_address in DEVICES]
+    configs = []
+    for device in devices:
+        config_file = tmp_path / f"{device.hostname}.cfg"
+        config_file.write_text(f"hostname {device.hostname}\n")
+        configs.append(CVEosConfig(file=str(config_file), device=device))
+
+    result = await deploy_to_cv(
+        cloudvision=CloudVision(servers=standin.hosts, token=TOKEN, verify_certs=False, port=standin.port),
+        change_control=CVChangeControl(requested_state="completed"),
+        configs=configs,
+        device_tags=[CVDeviceTag(label="role", value="leaf", device=device) for device in devices],
+        interface_tags=[CVInterfaceTag(label="peer", value="spine1", device=device, interface="Ethernet1") for device in devices],
+    )
+
+    assert result.failed is False, result.errors
+    assert result.workspace.state == "submitted"
+    assert result.change_control.state == "completed"
+    assert [device.serial_number for device in devices] == [serial_number for serial_number, _hostname, _system_mac_address in DEVICES]
+    assert len(result.deployed_configs) == len(DEVICES)
+    assert len(result.deployed_device_tags) == len(DEVICES)
+    assert len(standin.get_store("arista.configlet.v1.ConfigletConfigService")) == len(DEVICES)
+    assert len(standin.get_store("arista.tag.v2.TagAssignmentConfigService")) == 2 * len(DEVICES)
+    assert standin.call_counts["GET /cvpservice/cvpInfo/getCvpInfo.do"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deploy_to_cv_unchanged_configs(standin: CVStandIn, tmp_path: Path) -> None:
+    for _serial_number, hostname, _system_mac_address in DEVICES:
+        (tmp_path / f"{hostname}.cfg").write_text(f"hostname {hostname}\n")
+
+    async def deploy() -> DeployToCvResult:
+        return await deploy_to_cv(
+            cloudvision=CloudVision(servers=standin.hosts, token=TOKEN, verify_certs=False, port=standin.port),
+            configs=[
+                CVEosConfig(file=str(tmp_path / f"{hostname}.cfg"), device=CVDevice(hostname)) for _serial_number, hostname, _system_mac_address in DEVICES
+            ],
+        )
+
+    result = await deploy()
+    assert result.failed is False, result.errors
+    assert len(result.deployed_configs) == len(DEVICES)
+
+    (tmp_path / "leaf3.cfg").write_text("hostname leaf3\nip routing\n")
+    result = await deploy()
+    assert result.failed is False, result.errors
+    assert [config.device.hostname for config in result.deployed_configs] == ["leaf3"]
+    assert len(result.unchanged_configs) == len(DEVICES) - 1
+    assert result.skipped_configs == []
+    # Only the changed configlet was uploaded in the second Workspace.
+    assert len(standin.get_store("arista.configlet.v1.ConfigletConfigService")) == len(DEVICES) + 1
+
+
+@pytest.mark.asyncio
+async def test_deploy_to_cv_changed_tags(standin: CVStandIn) -> None:
+    async def deploy(peer: str) -> DeployToCvResult:
+        return await deploy_to_cv(
+            cloudvision=CloudVision(servers=standin.hosts, token=TOKEN, verify_certs=False, port=standin.port),
+            device_tags=[CVDeviceTag(label="role", value="leaf", device=CVDevice(hostname)) for _serial_number, hostname, _system_mac_address in DEVICES],
+            interface_tags=[
+                CVInterfaceTag(label="peer", value=peer, device=CVDevice(hostname), interface="Ethernet1")
+                for _serial_number, hostname, _system_mac_address in DEVICES
+            ],
+        )
+
+    result = await deploy("spine1")
+    assert result.failed is False, result.errors
+    assert len(standin.get_store("arista.tag.v2.TagAssignmentService")) == 2 * len(DEVICES)
+
+    result = await deploy("spine2")
+    assert result.failed is False, result.errors
+    assert len(result.deployed_interface_tags) == len(DEVICES)
+    assert [(tag.value, tag.interface) for tag in result.removed_interface_tags] == [("spine1", "Ethernet1")] * len(DEVICES)
+    assert result.removed_device_tags == []
+    # Existing assignments are streamed once per deployment and tag type.
+    assert standin.call_counts["arista.tag.v2.TagAssignmentService/GetAll"] == 4
+    assert len(standin.get_store("arista.tag.v2.TagAssignmentService")) == 2 * len(DEVICES)
+
+
+@pytest.mark.asyncio
+async def test_stream_tag_assignments_pages(standin: CVStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    result = await deploy_to_cv(
+        cloudvision=CloudVision(servers=standin.hosts, token=TOKEN, verify_certs=False, port=standin.port),
+        device_tags=[
+            tag
+            for _serial_number, hostname, _system_mac_address in DEVICES
+            for tag in (CVDeviceTag(label="role", value="leaf", device=CVDevice(hostname)), CVDeviceTag(label="dc", value="dc1", device=CVDevice(hostname)))
+        ],
+    )
+    assert result.failed is False, result.errors
+    monkeypatch.setattr(tag, "TAG_ASSIGNMENTS_PAGE_SIZE", 8)
+    get_all_calls = standin.call_counts["arista.tag.v2.TagAssignmentService/GetAll"]
+
+    async with CVClient(servers=standin.hosts, token=TOKEN, port=standin.port, verify_certs=False) as cv_client:
+        device_ids = [serial_number for serial_number, _hostname, _system_mac_address in DEVICES]
+        tag_assignments = []
+        async for tag_assignment in cv_client.stream_tag_assignments(
+            workspace_id="", element_type="device", creator_type="user", labels=["role"], device_ids=device_ids
+        ):
+            # The consumer runs between the pages without holding a slot, so other calls are limited as usual.
+            assert _HOLDING_SLOT.get() is False
+            assert cv_client._concurrency_limiter.in_flight == 0
+            tag_assignments.append(tag_assignment)
+
+    # Labels are filtered by the client, since the server only filters on the devices.
+    assert sorted((tag_assignment.key.label, tag_assignment.key.device_id) for tag_assignment in tag_assignments) == sorted(
+        ("role", device_id) for device_id in device_ids
+    )
+    # One request per page of up to 8 devices.
+    assert standin.call_counts["arista.tag.v2.TagAssignmentService/GetAll"] - get_all_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_deploy_to_cv_errors(standin: CVStandIn) -> None:
+    standin.error_rate = 1.0
+    standin.error_status = Status.PERMISSION_DENIED
+
+    with pytest.raises(GRPCError, match="Injected error for arista.workspace.v1.WorkspaceService/GetOne"):
+        await deploy_to_cv(
+            cloudvision=CloudVision(servers=standin.hosts, token=TOKEN, verify_certs=False, port=standin.port),
+            device_tags=[CVDeviceTag(label="role", value="leaf", device=CVDevice("leaf1"))],
+        )
+    assert standin.call_counts["arista.workspace.v1.WorkspaceService/GetOne"] == 1
@@ -0,0 +1,62 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from collections.abc import AsyncIterator
+
+import pytest
+
+from pyavd._cv.api.arista.tag.v2 import ElementType, TagAssignment, TagAssignmentKey
+from pyavd._cv.workflows.deploy_tags_to_cv import reconcile_tag_assignments
+
+ASSIGNMENTS = [
+    ("peer", "spine1", "SN1", "Ethernet1"),
+    ("peer", "spine2", "SN1", "Ethernet2"),
+    ("peer", "spine1", "SN2", "Ethernet1"),
+]
+
+
+async def stream_tag_assignments(assignments: list[tuple[str, str, str, str | None]], events: list[str]) -> AsyncIterator[TagAssignment]:
+    for label, value, device_id, interface in assignments:
+        events.append(f"streamed {value}")
+        yield TagAssignment(
+            key=TagAssignmentKey(
+                workspace_id="",
+                element_type=ElementType.INTERFACE,
+                label=label,
+                value=value,
+                device_id=device_id,
+                interface_id=f"{interface}@{device_id}" if interface is not None else None,
+            )
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("strict", "expected_removals"),
+    [
+        pytest.param(False, [("peer", "spine3", "SN1", "Ethernet3")], id="not_strict"),
+        pytest.param(True, [("peer", "spine3", "SN1", "Ethernet3"), ("description", "uplink", "SN2", "Ethernet1")], id="strict"),
+    ],
+)
+async def test_reconcile_tag_assignments(strict: bool, expected_removals: list[tuple[str, str, str, str | None]]) -> None:
+    events = []
+    existing_assignments = [
+        ASSIGNMENTS[0],
+        ("peer", "spine3", "SN1", "Ethernet3"),
+        ("description", "uplink", "SN2", "Ethernet1"),
+        # Assignments on other devices are never removed.
+        ("peer", "spine3", "SN3", "Ethernet1"),
+        ASSIGNMENTS[2],
+    ]
+
+    removals = []
+    additions = []
+    async for delta, assignment in reconcile_tag_assignments(stream_tag_assignments(existing_assignments, events), ASSIGNMENTS, strict):
+        events.append(f"{delta} {assignment[1]}")
+        (additions if delta == "add" else removals).append(assignment)
+
+    assert removals == expected_removals
+    assert additions == [ASSIGNMENTS[1]]
+    # Removals are yielded while the existing assignments are streamed.
+    assert events.index("remove spine3") < events.index("streamed spine1", 1)
+    assert events[-1] == "add spine2"
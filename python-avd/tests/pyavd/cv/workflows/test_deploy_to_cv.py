@@ -0,0 +1,65 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from asyncio import sleep
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from pyavd._cv.client.exceptions import CVClientException
+from pyavd._cv.workflows.deploy_to_cv import run_stages
+
+
+def get_stage(name: str, events: list[str], delay: float, exception: Exception | None = None) -> Callable[[], Awaitable[None]]:
+    async def stage() -> None:
+        events.append(f"{name} started")
+        await sleep(delay)
+        if exception is not None:
+            raise exception
+        events.append(f"{name} done")
+
+    return stage
+
+
+@pytest.mark.asyncio
+async def test_run_stages() -> None:
+    events = []
+    stage_timings = {}
+    await run_stages(
+        {
+            "verify": (get_stage("verify", events, 0.01), set()),
+            "tags": (get_stage("tags", events, 0.05), {"verify"}),
+            "configs": (get_stage("configs", events, 0.02), {"verify"}),
+            "studio_inputs": (get_stage("studio_inputs", events, 0.01), set()),
+            "metadata": (get_stage("metadata", events, 0.01), {"verify", "studio_inputs"}),
+        },
+        stage_timings,
+    )
+
+    # Stages without prerequisites start right away and the others start as soon as their prerequisites are done.
+    assert events[:2] == ["verify started", "studio_inputs started"]
+    assert events.index("tags started") > events.index("verify done")
+    assert events.index("configs started") < events.index("tags done")
+    assert events.index("metadata started") > max(events.index("verify done"), events.index("studio_inputs done"))
+    assert events[-1] == "tags done"
+    assert set(stage_timings) == {"verify", "tags", "configs", "studio_inputs", "metadata"}
+    assert stage_timings["tags"] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_run_stages_failure() -> None:
+    events = []
+    stage_timings = {}
+    with pytest.raises(CVClientException, match="verify failed"):
+        await run_stages(
+            {
+                "verify": (get_stage("verify", events, 0.01, CVClientException("verify failed")), set()),
+                "tags": (get_stage("tags", events, 0.01), {"verify"}),
+                "studio_inputs": (get_stage("studio_inputs", events, 1), set()),
+            },
+            stage_timings,
+        )
+
+    # Dependent stages are never started and running stages are cancelled.
+    assert events == ["verify started", "studio_inputs started"]
+    assert stage_timings == {}
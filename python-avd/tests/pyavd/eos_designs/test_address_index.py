@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from ipaddress import IPv4Network, IPv6Network, ip_network
+
+import pytest
+
+from pyavd._eos_designs.fabric_documentation_facts.address_index import AddressIndex
+
+ADDRESSES = [
+    # Both ends of two P2P links.
+    IPv4Network("10.0.0.0/31"),
+    IPv4Network("10.0.0.0/31"),
+    IPv4Network("10.0.0.4/31"),
+    IPv4Network("10.0.0.4/31"),
+    IPv4Network("10.0.1.1/32"),
+    IPv4Network("10.255.0.1/32"),
+    IPv6Network("2001:db8::1/128"),
+]
+
+
+@pytest.mark.parametrize(
+    "network",
+    ["10.0.0.0/24", "10.0.0.0/30", "10.0.0.0/31", "10.0.0.0/32", "10.0.0.0/16", "10.0.0.0/8", "10.1.0.0/16", "2001:db8::/64", "2001:db8::/127"],
+)
+def test_address_index_count(network: str) -> None:
+    network = ip_network(network)
+    address_index = AddressIndex(ADDRESSES)
+    assert address_index.count(network) == len([address for address in ADDRESSES if address.version == network.version and address.subnet_of(network)])
+
+
+def test_address_index_get_free_blocks() -> None:
+    address_index = AddressIndex(ADDRESSES)
+    assert address_index.get_free_blocks(IPv4Network("10.0.0.0/29")) == [IPv4Network("10.0.0.2/31"), IPv4Network("10.0.0.6/31")]
+    assert address_index.get_free_blocks(IPv4Network("10.0.1.0/30")) == [IPv4Network("10.0.1.0/32"), IPv4Network("10.0.1.2/31")]
+    assert address_index.get_free_blocks(IPv4Network("10.0.0.0/31")) == []
+    assert address_index.get_free_blocks(IPv4Network("10.1.0.0/16")) == [IPv4Network("10.1.0.0/16")]
+    assert address_index.get_free_blocks(IPv6Network("2001:db8::/126")) == [IPv6Network("2001:db8::/128"), IPv6Network("2001:db8::2/127")]
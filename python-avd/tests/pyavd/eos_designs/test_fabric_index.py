@@ -0,0 +1,43 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from pyavd._build_cache import FabricIndexRecorder, PeerFactsRecorder
+from pyavd._eos_designs.fabric_index import FabricIndex
+
+AVD_SWITCH_FACTS = {
+    "spine1": {"switch": {"dc_name": "DC1", "mpls_overlay_role": "server"}},
+    "leaf1": {"switch": {"dc_name": "DC1", "uplink_peers": ["spine1"], "vtep_ip": "10.0.0.1", "vlans": "10-12"}},
+    "leaf2": {"switch": {"dc_name": "DC2", "uplink_peers": ["spine1"], "vtep_ip": "10.0.0.2", "mpls_overlay_role": "client"}},
+    "leaf3": {"switch": {"uplink_peers": ["leaf1", "spine1"], "evpn_role": "client", "overlay": {"evpn_mpls": True}}},
+}
+
+
+def test_fabric_index() -> None:
+    fabric_index = FabricIndex(AVD_SWITCH_FACTS)
+
+    assert fabric_index.hostnames == {"spine1", "leaf1", "leaf2", "leaf3"}
+    assert fabric_index.get_downstream_switches("spine1") == ["leaf1", "leaf2", "leaf3"]
+    assert fabric_index.get_downstream_switches("leaf1") == ["leaf3"]
+    assert fabric_index.get_downstream_switches("leaf3") == []
+    assert fabric_index.vteps == ["leaf1", "leaf2"]
+    assert fabric_index.vteps_per_dc == {"DC1": ["leaf1"], "DC2": ["leaf2"]}
+    assert fabric_index.mpls_clients == ["leaf2", "leaf3"]
+    assert fabric_index.get_vlans("leaf1") == [10, 11, 12]
+    assert fabric_index.get_vlans("leaf2") == []
+
+
+def test_fabric_index_recorder() -> None:
+    """Lookups across the fabric depend on the facts of all devices, so they must all be recorded for the build cache."""
+    fabric_index = FabricIndex(AVD_SWITCH_FACTS)
+    recorder = PeerFactsRecorder(AVD_SWITCH_FACTS)
+    fabric_index_recorder = FabricIndexRecorder(fabric_index, recorder)
+    assert fabric_index_recorder.hostnames == fabric_index.hostnames
+    assert fabric_index_recorder.get_vlans("leaf1") == [10, 11, 12]
+    assert recorder.accessed == {"leaf1"}
+    assert fabric_index_recorder.vteps == ["leaf1", "leaf2"]
+    assert recorder.accessed == set(AVD_SWITCH_FACTS)
+
+    # The lookups of the shared index are recorded again for the next device.
+    other_recorder = PeerFactsRecorder(AVD_SWITCH_FACTS)
+    assert FabricIndexRecorder(fabric_index, other_recorder).get_downstream_switches("leaf1") == ["leaf3"]
+    assert other_recorder.accessed == set(AVD_SWITCH_FACTS)
@@ -0,0 +1,54 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from collections import ChainMap
+from copy import deepcopy
+
+from pyavd import get_avd_facts
+from pyavd._eos_designs.schema import EosDesigns
+from pyavd._eos_designs.shared_utils import SharedUtils
+
+VRF = {
+    "name": "VRF1",
+    "vrf_id": 1,
+    "svis": [{"id": 10, "name": "SVI10", "description": "general", "nodes": [{"node": "leaf1", "description": "leaf1 specific"}]}],
+}
+INPUTS = {
+    "fabric_name": "test",
+    "type": "l3leaf",
+    "l3leaf": {
+        "defaults": {"loopback_ipv4_pool": "192.168.0.0/24", "vtep_loopback_ipv4_pool": "192.168.1.0/24", "bgp_as": "65000"},
+        "nodes": [{"name": "leaf1", "id": 1}, {"name": "leaf2", "id": 2}],
+    },
+    "tenants": [
+        {"name": "TENANT1", "evpn_vlan_bundle": "BUNDLE1", "l2vlans": [{"id": 20, "name": "L2VLAN20"}], "vrfs": [VRF]},
+        {"name": "TENANT2", "l2vlans": [{"id": 20, "name": "L2VLAN20"}]},
+    ],
+}
+
+
+def test_filtered_tenants_shared_inputs() -> None:
+    """Test that input items are shared between devices, while the filtered tenants of each device are changed in isolation."""
+    all_inputs = {hostname: deepcopy(INPUTS) for hostname in ("leaf1", "leaf2")}
+    avd_facts = get_avd_facts(all_inputs)
+    shared_models = {}
+    shared_utils = {}
+    for hostname, inputs in all_inputs.items():
+        hostvars = ChainMap({"inventory_hostname": hostname, "switch": avd_facts["avd_switch_facts"][hostname]["switch"]}, avd_facts, inputs)
+        shared_utils[hostname] = SharedUtils(hostvars=hostvars, inputs=EosDesigns._from_dict(hostvars, shared_models=shared_models), templar=None, schema=None)
+
+    leaf1_tenants = shared_utils["leaf1"].inputs._dynamic_keys.network_services["tenants"].value
+    leaf2_tenants = shared_utils["leaf2"].inputs._dynamic_keys.network_services["tenants"].value
+    assert leaf2_tenants is leaf1_tenants
+
+    for hostname, description in (("leaf1", "leaf1 specific"), ("leaf2", "general")):
+        filtered_tenants = shared_utils[hostname].filtered_tenants
+        assert filtered_tenants["TENANT1"].vrfs["VRF1"].svis[0].description == description
+        assert filtered_tenants["TENANT1"].vrfs["VRF1"].svis[0].evpn_vlan_bundle == "BUNDLE1"
+        assert filtered_tenants["TENANT1"].l2vlans[0].evpn_vlan_bundle == "BUNDLE1"
+        assert [tenant.l2vlans[0]._tenant for tenant in filtered_tenants] == ["TENANT1", "TENANT2"]
+        assert filtered_tenants["TENANT2"].l2vlans[0].evpn_vlan_bundle is None
+
+    # The shared inputs are unchanged.
+    assert leaf1_tenants._as_list() == EosDesigns._from_dict(deepcopy(INPUTS))._dynamic_keys.network_services["tenants"].value._as_list()
+    assert not hasattr(leaf1_tenants["TENANT1"].l2vlans[0], "_tenant")
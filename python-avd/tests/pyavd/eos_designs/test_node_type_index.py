@@ -0,0 +1,51 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+
+from pyavd._eos_designs.schema import EosDesigns
+from pyavd._eos_designs.shared_utils import SharedUtils
+
+INPUTS = {
+    "fabric_name": "test",
+    "type": "l3leaf",
+    "l3leaf": {
+        "defaults": {"platform": "vEOS-lab", "bgp_as": "65100", "filter": {"tags": ["blue"]}},
+        "node_groups": [
+            {"group": "POD1", "bgp_as": "65101", "nodes": [{"name": "leaf1", "id": 1}, {"name": "leaf2", "id": 2, "bgp_as": "65102"}]},
+            {"group": "POD2", "nodes": [{"name": "leaf1", "id": 11}]},
+        ],
+        "nodes": [{"name": "leaf3", "id": 3}],
+    },
+}
+
+
+def get_shared_utils(hostname: str, shared_models: dict) -> SharedUtils:
+    inputs = deepcopy(INPUTS)
+    return SharedUtils(
+        hostvars={"inventory_hostname": hostname, **inputs}, inputs=EosDesigns._from_dict(inputs, shared_models=shared_models), templar=None, schema=None
+    )
+
+
+def test_node_type_index_shared() -> None:
+    shared_models = {}
+    leaf1, leaf2, leaf3 = (get_shared_utils(hostname, shared_models) for hostname in ("leaf1", "leaf2", "leaf3"))
+
+    assert leaf2.node_type_index is leaf1.node_type_index
+    assert leaf3.node_type_index is leaf1.node_type_index
+    # The index is stored on the shared node type config, and not shared with devices loaded without the shared models.
+    assert leaf1.node_type_config._node_type_index is leaf1.node_type_index
+    assert get_shared_utils("leaf1", {}).node_type_index is not leaf1.node_type_index
+    # The first node group wins if a node is in multiple node groups.
+    assert leaf1.node_group_config.group == "POD1"
+    assert leaf3.node_group_config is None
+    assert leaf1.node_type_index.get_inherited_node_group("POD1") is leaf2.node_type_index.get_inherited_node_group("POD1")
+
+    assert (leaf1.node_config.id, leaf1.node_config.bgp_as, leaf1.node_config.platform) == (1, "65101", "vEOS-lab")
+    assert (leaf2.node_config.id, leaf2.node_config.bgp_as, leaf2.node_config.platform) == (2, "65102", "vEOS-lab")
+    assert (leaf3.node_config.id, leaf3.node_config.bgp_as, leaf3.node_config.platform) == (3, "65100", "vEOS-lab")
+
+    # Adding the group to the filter tags must not change the shared inputs.
+    assert leaf1.filter_tags == ["blue", "POD1"]
+    assert leaf2.filter_tags == ["blue", "POD1"]
+    assert leaf3.filter_tags == ["blue"]
@@ -33,6 +33,9 @@ KEY_FROM_PASSPHRASE_TEST_CASES = [
         does_not_raise(),
     ),
     ("testauth", "toto", None, pytest.raises(ValueError)),  # noqa: PT011
+    # RFC 2574 section A.3 test vectors
+    ("maplesyrup", "md5", "9faf3283884e92834ebc9847d8edd963", does_not_raise()),
+    ("maplesyrup", "sha", "9fb5cc0381497b3793528939ff788d5d79145211", does_not_raise()),
 ]
 
 LOCALIZE_PASSPHRASE_TEST_CASES = [
@@ -58,6 +61,9 @@ LOCALIZE_PASSPHRASE_TEST_CASES = [
         does_not_raise(),
     ),
     ("testauth", "toto", "424242424242424242", None, None, pytest.raises(ValueError)),  # noqa: PT011
+    # RFC 2574 section A.3 test vectors
+    ("maplesyrup", "md5", "000000000000000000000002", None, "526f5eed9fcce26f8964c2930787d82b", does_not_raise()),
+    ("maplesyrup", "sha", "000000000000000000000002", None, "6695febc9288e36282235fc7151f128497b38f3f", does_not_raise()),
     # only testing priv with one auth algorithm, the longest, to verify key length
     ("testpriv", "sha512", "424242424242424242", "des", "ca5e54b5c49e7addba0046c591f8f541", does_not_raise()),
     ("testpriv", "sha512", "424242424242424242", "aes", "ca5e54b5c49e7addba0046c591f8f541", does_not_raise()),
@@ -0,0 +1,111 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pyavd import build_fabric, get_device_config, get_device_doc, validate_inputs, validate_structured_config
+from pyavd._build_cache import DeviceBuildCache, get_module_source_digest
+from pyavd._eos_designs.fabric_index import FabricIndex
+from tests.models import MoleculeScenario
+
+
+@pytest.mark.molecule_scenarios(
+    "eos_designs_l2l2",
+    "example-campus-fabric",
+    "example-single-dc-l3ls",
+)
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_fabric(molecule_scenario: MoleculeScenario, workers: int) -> None:
+    """Test build_fabric against the expected structured configs and the serial device config rendering."""
+    all_inputs = {host.name: deepcopy(host.hostvars) for host in molecule_scenario.hosts}
+    for inputs in all_inputs.values():
+        validate_inputs(inputs)
+
+    fabric_build = build_fabric(all_inputs, workers=workers, documentation=True)
+
+    assert fabric_build.failed is False
+    assert list(fabric_build.devices) == list(all_inputs)
+    for host in molecule_scenario.hosts:
+        device_build = fabric_build.devices[host.name]
+        expected_structured_config = deepcopy(host.structured_config)
+        validate_structured_config(expected_structured_config)
+
+        assert device_build.validation_result.failed is False
+        assert device_build.structured_config == expected_structured_config
+        assert device_build.config == get_device_config(expected_structured_config)
+        assert device_build.documentation == get_device_doc(expected_structured_config, add_md_toc=True)
+
+
+@pytest.mark.molecule_scenarios("example-single-dc-l3ls")
+def test_build_fabric_shares_fabric_index(molecule_scenario: MoleculeScenario) -> None:
+    """Test that the fabric index is only built once for the facts and once for the structured config of all devices."""
+    all_inputs = {host.name: deepcopy(host.hostvars) for host in molecule_scenario.hosts}
+    for inputs in all_inputs.values():
+        validate_inputs(inputs)
+
+    with patch.object(FabricIndex, "__init__", autospec=True, side_effect=FabricIndex.__init__) as fabric_index_init:
+        build_fabric(all_inputs, workers=1)
+
+    assert fabric_index_init.call_count == 2
+
+
+def test_host_fingerprint_custom_python_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the host fingerprint changes with the source of a custom python_module set in the inputs."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    custom_module = tmp_path / "custom_ip_addressing_for_fingerprint.py"
+    custom_module.write_text("OFFSET = 1\n", encoding="UTF-8")
+    inputs = {"node_type_keys": [{"key": "leaf", "ip_addressing": {"python_module": "custom_ip_addressing_for_fingerprint"}}]}
+    avd_facts = {"avd_switch_facts": {"leaf1": {"switch": {}}}, "avd_topology_peers": {}, "avd_overlay_peers": {}}
+
+    get_module_source_digest.cache_clear()
+    host_fingerprint = DeviceBuildCache.get_host_fingerprint("leaf1", inputs, avd_facts)
+    assert DeviceBuildCache.get_host_fingerprint("leaf1", inputs, avd_facts) == host_fingerprint
+
+    custom_module.write_text("OFFSET = 2\n", encoding="UTF-8")
+    get_module_source_digest.cache_clear()
+    assert DeviceBuildCache.get_host_fingerprint("leaf1", inputs, avd_facts) != host_fingerprint
+
+
+def test_build_fabric_invalid_workers() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        build_fabric({}, workers=0)
+
+
+@pytest.mark.molecule_scenarios("example-single-dc-l3ls")
+def test_build_fabric_with_cache(molecule_scenario: MoleculeScenario, tmp_path: Path) -> None:
+    """Test that build_fabric only rebuilds devices with changed fingerprints when using the cache."""
+    all_inputs = {host.name: deepcopy(host.hostvars) for host in molecule_scenario.hosts}
+    for inputs in all_inputs.values():
+        validate_inputs(inputs)
+
+    first_build = build_fabric(deepcopy(all_inputs), workers=1, cache_dir=tmp_path)
+    assert first_build.cached_hostnames == []
+
+    second_build = build_fabric(deepcopy(all_inputs), workers=1, cache_dir=tmp_path)
+    assert second_build.cached_hostnames == list(all_inputs)
+    for hostname, device_build in second_build.devices.items():
+        assert device_build.structured_config == first_build.devices[hostname].structured_config
+        assert device_build.config == first_build.devices[hostname].config
+
+    # Changing an input only relevant for one device
+    changed_hostname = next(iter(all_inputs))
+    all_inputs[changed_hostname]["mgmt_gateway"] = "192.0.2.1"
+    third_build = build_fabric(deepcopy(all_inputs), workers=1, cache_dir=tmp_path)
+    assert changed_hostname not in third_build.cached_hostnames
+    assert len(third_build.cached_hostnames) == len(all_inputs) - 1
+    uncached_build = build_fabric(deepcopy(all_inputs), workers=1)
+    assert third_build.devices[changed_hostname].structured_config == uncached_build.devices[changed_hostname].structured_config
+    assert third_build.devices[changed_hostname].config == uncached_build.devices[changed_hostname].config
+    assert "192.0.2.1" in third_build.devices[changed_hostname].config
+    assert third_build.devices[changed_hostname].documentation is None
+
+    # Entries without documentation are built again when documentation is requested.
+    fourth_build = build_fabric(deepcopy(all_inputs), workers=1, cache_dir=tmp_path, documentation=True)
+    assert fourth_build.cached_hostnames == []
+    fifth_build = build_fabric(deepcopy(all_inputs), workers=1, cache_dir=tmp_path, documentation=True)
+    assert fifth_build.cached_hostnames == list(all_inputs)
+    assert fifth_build.devices[changed_hostname].documentation == fourth_build.devices[changed_hostname].documentation
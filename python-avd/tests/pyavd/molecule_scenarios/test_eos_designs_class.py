@@ -9,6 +9,7 @@ import pytest
 from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
 from pyavd._eos_designs.schema import EosDesigns
 from pyavd._schema.store import create_store
+from pyavd._utils import Undefined
 from tests.models import MoleculeHost
 
 SCHEMA = create_store()["eos_designs"]
@@ -60,6 +61,75 @@ def test_eos_designs_custom_structured_configuration(prefix: str | None, expecte
     assert repr(loaded_model._custom_structured_configurations) == repr(expected_data)
 
 
+def test_eos_designs_shared_inputs_loaded_once() -> None:
+    """Test that identical dicts and lists in the inputs of different devices are only loaded once."""
+    data = {
+        "fabric_name": "test",
+        "svi_profiles": [{"profile": "PROFILE1", "mtu": 1500, "_custom_key": {"values": [1]}}],
+        "tenants": [{"name": "TENANT1", "vrfs": [{"name": "VRF1", "vrf_id": 1}]}],
+    }
+    shared_models = {}
+    first_model = EosDesigns._from_dict(deepcopy(data), shared_models=shared_models)
+    second_model = EosDesigns._from_dict(deepcopy(data), shared_models=shared_models)
+    assert second_model.svi_profiles is first_model.svi_profiles
+    assert second_model._dynamic_keys.network_services["tenants"].value is first_model._dynamic_keys.network_services["tenants"].value
+
+    # Shared models are frozen. Default values are returned without changing the shared model.
+    svi_profile = first_model.svi_profiles["PROFILE1"]
+    assert svi_profile.enabled is None
+    assert svi_profile._get_defined_attr("enabled") is Undefined
+    with pytest.raises(TypeError, match="frozen"):
+        svi_profile.mtu = 9214
+    with pytest.raises(TypeError, match="frozen"):
+        first_model.svi_profiles.append(EosDesigns.SviProfilesItem(profile="PROFILE2"))
+    with pytest.raises(TypeError, match="frozen"):
+        svi_profile.structured_config.description = "foo"
+    thawed_svi_profile = svi_profile._thawed()
+    thawed_svi_profile.mtu = 9214
+    assert svi_profile.mtu == 1500
+    copied_svi_profile = svi_profile._deepcopy()
+    copied_svi_profile.structured_config.description = "foo"
+    assert svi_profile.structured_config.description is None
+
+    # Dicts of frozen models are returned as copies.
+    svi_profile._custom_data["_custom_key"]["values"].append(2)
+    thawed_svi_profile._custom_data["_custom_key"]["values"].append(3)
+    assert thawed_svi_profile._custom_data == {"_custom_key": {"values": [1, 3]}}
+    assert svi_profile._custom_data == {"_custom_key": {"values": [1]}}
+    assert svi_profile._as_dict()["_custom_key"] == {"values": [1]}
+    with pytest.raises(TypeError, match="frozen"):
+        svi_profile._custom_data = {}
+
+    data["svi_profiles"][0]["mtu"] = 9214
+    third_model = EosDesigns._from_dict(deepcopy(data), shared_models=shared_models)
+    assert third_model.svi_profiles is not first_model.svi_profiles
+    assert third_model.svi_profiles["PROFILE1"].mtu == 9214
+
+    # Models are only shared with the given shared_models.
+    assert EosDesigns._from_dict(deepcopy(data), shared_models={}).svi_profiles is not third_model.svi_profiles
+    unshared_model = EosDesigns._from_dict(deepcopy(data))
+    assert not unshared_model.svi_profiles._frozen
+    assert not unshared_model._dynamic_keys.network_services["tenants"].value._frozen
+
+
+def test_eos_designs_shared_list_items_loaded_once() -> None:
+    """Test that identical items are shared between devices, also when other items in the same list are different."""
+    tenants = [{"name": "TENANT1", "vrfs": [{"name": "VRF1", "vrf_id": 1}]}, {"name": "TENANT2", "vrfs": [{"name": "VRF2", "vrf_id": 2}]}]
+    shared_models = {}
+    first_model = EosDesigns._from_dict({"fabric_name": "test", "tenants": deepcopy(tenants)}, shared_models=shared_models)
+    tenants[1]["vrfs"][0]["vrf_id"] = 3
+    second_model = EosDesigns._from_dict({"fabric_name": "test", "tenants": deepcopy(tenants)}, shared_models=shared_models)
+
+    first_tenants = first_model._dynamic_keys.network_services["tenants"].value
+    second_tenants = second_model._dynamic_keys.network_services["tenants"].value
+    assert second_tenants is not first_tenants
+    assert second_tenants["TENANT1"] is first_tenants["TENANT1"]
+    assert second_tenants["TENANT2"] is not first_tenants["TENANT2"]
+    assert second_tenants["TENANT2"].vrfs["VRF2"].vrf_id == 3
+    assert second_tenants._frozen
+    assert second_tenants["TENANT2"]._frozen
+
+
 # eos_cli_config_gen inputs are validated by `validate_structured_config` in another file.
 @pytest.mark.molecule_scenarios(
     "eos_designs_unit_tests",
@@ -0,0 +1,42 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+
+import pytest
+
+from pyavd import get_device_config, get_device_configs, validate_structured_config
+from pyavd._utils import get
+from tests.models import MoleculeScenario
+
+
+@pytest.mark.molecule_scenarios(
+    "eos_designs_l2l2",
+    "example-campus-fabric",
+    "example-single-dc-l3ls",
+)
+@pytest.mark.parametrize("workers", [1, 2])
+def test_get_device_configs(molecule_scenario: MoleculeScenario, workers: int) -> None:
+    """Test get_device_configs against the expected device configs."""
+    structured_configs = {}
+    for host in molecule_scenario.hosts:
+        # See test_get_device_config for why inputs are included.
+        structured_config: dict = deepcopy(host.hostvars)
+        structured_config.update(deepcopy(host.structured_config))
+        if not get(structured_config, "eos_cli_config_gen_configuration.enable", default=True):
+            continue
+        validate_structured_config(structured_config)
+        structured_configs[host.name] = structured_config
+
+    device_configs = get_device_configs(structured_configs, workers=workers)
+
+    assert list(device_configs) == list(structured_configs)
+    for host in molecule_scenario.hosts:
+        if host.name in structured_configs:
+            assert device_configs[host.name] == host.config
+            assert device_configs[host.name] == get_device_config(structured_configs[host.name])
+
+
+def test_get_device_configs_invalid_workers() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        get_device_configs({}, workers=0)
@@ -3,14 +3,13 @@
 # that can be found in the LICENSE file.
 
 from __future__ import annotations
+from pyavd._schema.models.avd_indexed_list import AvdIndexedList
 from pyavd._schema.models.eos_cli_config_gen_root_model import EosCliConfigGenRootModel
-from typing import ClassVar
 from typing import Any
-from typing import TYPE_CHECKING
-
-from pyavd._schema.models.avd_indexed_list import AvdIndexedList
 from pyavd._schema.models.avd_list import AvdList
+from typing import ClassVar
 from pyavd._schema.models.avd_model import AvdModel
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyavd._utils import Undefined, UndefinedType
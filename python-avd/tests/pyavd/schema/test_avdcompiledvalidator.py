@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+from copy import deepcopy
+from typing import Any
+
+import pytest
+
+from pyavd._schema.avdcompiledvalidator import AvdCompiledValidator, get_compiled_validator
+from pyavd._schema.avddataconverter import AvdDataConverter
+from pyavd._schema.avdschema import AvdSchema
+from pyavd._schema.avdvalidator import AvdValidator
+
+TEST_SCHEMA = {
+    "type": "dict",
+    "keys": {
+        "name": {"type": "str", "required": True, "pattern": r"^[a-z]+$", "min_length": 2, "max_length": 8},
+        "pool": {"type": "str", "format": "ipv4_pool"},
+        "mac": {"type": "str", "format": "mac"},
+        "ip": {"type": "str", "format": "ipv4"},
+        "node_types": {
+            "type": "list",
+            "primary_key": "key",
+            "items": {"type": "dict", "keys": {"key": {"type": "str"}, "role": {"type": "str", "valid_values": ["leaf", "spine"]}}},
+        },
+        "default_node_type": {"type": "str", "valid_values": ["l2leaf"], "dynamic_valid_values": ["node_types.key"]},
+        "other_node_type": {"type": "str", "dynamic_valid_values": ["node_types.key"]},
+        "vlans": {
+            "type": "list",
+            "primary_key": "id",
+            "unique_keys": ["name", "members.interface"],
+            "items": {
+                "type": "dict",
+                "keys": {
+                    "id": {"type": "int", "min": 1, "max": 4094, "convert_types": ["str"]},
+                    "name": {"type": "str"},
+                    "members": {"type": "list", "items": {"type": "dict", "keys": {"interface": {"type": "str", "convert_to_lower_case": True}}}},
+                },
+            },
+        },
+        "relaxed": {
+            "type": "dict",
+            "relaxed_validation": True,
+            "keys": {
+                "required_key": {"type": "str", "required": True},
+                "nested": {"type": "dict", "keys": {"required_key": {"type": "str", "required": True}}},
+            },
+        },
+        "flag": {"type": "bool", "convert_types": ["int", "str"]},
+        "mode": {"type": "str", "convert_to_lower_case": True, "valid_values": ["access", "trunk"]},
+        "ids": {"type": "list", "items": {"type": "int", "convert_types": ["str"], "max": 10}},
+        "old_name": {"type": "str", "deprecation": {"new_key": "name", "remove_in_version": "6.0.0"}},
+        "old_flag": {"type": "bool", "deprecation": {"new_key": "flag", "remove_in_version": "6.0.0"}},
+        "removed_key": {"type": "str", "deprecation": {"removed": True, "remove_in_version": "5.0.0"}},
+        "old_vlans": {
+            "type": "list",
+            "items": {"type": "dict", "keys": {"id": {"type": "int"}}, "deprecation": {"new_key": "vlans", "remove_in_version": "6.0.0"}},
+        },
+    },
+    "dynamic_keys": {
+        "node_types.key": {
+            "type": "dict",
+            "keys": {"id": {"type": "int", "max": 10, "required": True, "convert_types": ["str"]}},
+        },
+    },
+}
+
+TEST_DATA = [
+    {},
+    None,
+    "string",
+    {"name": "abc"},
+    {"name": "ABC", "pool": "10.0.0.0/24,foo", "mac": "01:02:03", "ip": "not an ip", "flag": 1},
+    {"name": "a" * 10, "extra_key": True, "_private_key": True},
+    {
+        "name": "abc",
+        "node_types": [{"key": "leaf", "role": "leaf"}, {"key": "spine", "role": "border"}, {"role": "leaf"}, {"key": "leaf"}],
+        "default_node_type": "spine",
+        "other_node_type": "l2leaf",
+        "leaf": {"id": 20},
+        "spine": {},
+    },
+    {"name": "abc", "default_node_type": "l2leaf", "other_node_type": "l2leaf"},
+    {
+        "name": "abc",
+        "vlans": [
+            {"id": 1, "name": "a", "members": [{"interface": "Ethernet1"}, {"interface": "Ethernet2"}]},
+            {"id": 1, "name": "a", "members": [{"interface": "Ethernet2"}]},
+            {"id": 5000},
+            {"name": "b"},
+            "not a dict",
+        ],
+    },
+    {"name": "abc", "relaxed": {"nested": {}}},
+    {"name": "abc", "relaxed": {"required_key": 1, "nested": {"required_key": True}}},
+    {"name": "abc", "flag": "true", "mode": "TRUNK", "ids": ["1", 2, "20", "x", None], "old_name": "abc", "old_flag": True, "removed_key": None},
+    {"name": "abc", "node_types": [{"key": "leaf"}], "leaf": {"id": "5"}, "vlans": [{"id": "10", "members": [{"interface": "ETHERNET1"}, {"interface": 1}]}]},
+]
+
+_SHARED_DICT = {"id": "12"}
+# The same dict used in two places with different conversions.
+TEST_DATA.append({"name": "abc", "node_types": [{"key": "leaf"}], "leaf": _SHARED_DICT, "vlans": [_SHARED_DICT]})
+
+
+@pytest.mark.parametrize("test_data", TEST_DATA)
+def test_compiled_validator_matches_validator(test_data: Any) -> None:
+    expected_errors = [str(error) for error in AvdValidator(TEST_SCHEMA).validate(test_data)]
+    compiled_validator = AvdCompiledValidator(TEST_SCHEMA)
+    assert [str(error) for error in compiled_validator.validate(test_data)] == expected_errors
+    # Validating again using the already compiled validators.
+    assert [str(error) for error in compiled_validator.validate(test_data)] == expected_errors
+
+
+@pytest.mark.parametrize("test_data", TEST_DATA)
+def test_compiled_validator_convert_and_validate(test_data: Any) -> None:
+    """Test that converting and validating in one pass gives the same result as converting followed by validation."""
+    expected_data = deepcopy(test_data)
+    expected_conversions = [str(conversion) for conversion in AvdDataConverter(TEST_SCHEMA).convert_data(expected_data)]
+    expected_errors = [str(error) for error in AvdValidator(TEST_SCHEMA).validate(expected_data)]
+
+    compiled_validator = AvdCompiledValidator(TEST_SCHEMA)
+    for _ in range(2):
+        data = deepcopy(test_data)
+        conversions, errors = compiled_validator.convert_and_validate(data)
+        assert [str(conversion) for conversion in conversions] == expected_conversions
+        assert [str(error) for error in errors] == expected_errors
+        assert data == expected_data
+
+
+def test_compiled_validator_convert_and_validate_memo() -> None:
+    """Test that the results for top-level keys are reused for identical data before or after conversion."""
+    test_data = {"name": "abc", "vlans": [{"id": "10", "name": "a"}, {"id": "10"}], "relaxed": {"nested": {}}}
+    expected_data = deepcopy(test_data)
+    expected_conversions = [str(conversion) for conversion in AvdDataConverter(TEST_SCHEMA).convert_data(expected_data)]
+    expected_errors = [str(error) for error in AvdValidator(TEST_SCHEMA).validate(expected_data)]
+
+    compiled_validator = AvdCompiledValidator(TEST_SCHEMA)
+    first_data = deepcopy(test_data)
+    compiled_validator.convert_and_validate(first_data)
+    assert compiled_validator._memo
+
+    # Identical unconverted data and already converted data.
+    for data in (deepcopy(test_data), deepcopy(first_data)):
+        conversions, errors = compiled_validator.convert_and_validate(data)
+        assert [str(conversion) for conversion in conversions] == expected_conversions
+        assert [str(error) for error in errors] == expected_errors
+        assert data == expected_data
+        assert data["vlans"] is not first_data["vlans"]
+
+
+def test_compiled_validator_convert_and_validate_memo_siblings() -> None:
+    """Test that results depending on other top-level keys are not reused for identical data with different sibling keys."""
+    compiled_validator = AvdCompiledValidator(TEST_SCHEMA)
+    # The deprecation of the list items checks for the new key in the parent dict of the list.
+    for test_data in ({"name": "abc", "old_vlans": [{"id": 1}], "vlans": [{"id": 1}]}, {"name": "abc", "old_vlans": [{"id": 1}]}):
+        expected_data = deepcopy(test_data)
+        expected_conversions = [str(conversion) for conversion in AvdDataConverter(TEST_SCHEMA).convert_data(expected_data)]
+        expected_errors = [str(error) for error in AvdValidator(TEST_SCHEMA).validate(expected_data)]
+
+        conversions, errors = compiled_validator.convert_and_validate(test_data)
+        assert [str(conversion) for conversion in conversions] == expected_conversions
+        assert [str(error) for error in errors] == expected_errors
+
+
+def test_compiled_validator_unresolved_ref() -> None:
+    with pytest.raises(NotImplementedError, match="must be resolved"):
+        list(AvdCompiledValidator({"type": "dict", "$ref": "eos_designs#/keys/foo"}).validate({}))
+
+
+def test_avd_schema_uses_compiled_validator_for_schema_id() -> None:
+    avdschema = AvdSchema(schema_id="eos_designs")
+    assert avdschema._validator is get_compiled_validator("eos_designs")
+    assert isinstance(AvdSchema(TEST_SCHEMA)._validator, AvdValidator)
+
+    errors = [str(error) for error in avdschema.validate({"fabric_name": 1, "unknown_key": True, "mgmt_gateway": "10.0.0.1"})]
+    assert errors == ["'Validation Error: fabric_name': Invalid type 'int'. Expected a 'str'."]
@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Arista Networks, Inc.
+# Use of this source code is governed by the Apache License 2.0
+# that can be found in the LICENSE file.
+import subprocess
+import sys
+
+from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._schema.models.lazy_class import LazyClass, LazyFieldInfo
+
+LAZY_IMPORT_SCRIPT = """
+import sys
+
+from pyavd._eos_cli_config_gen.schema import EosCliConfigGen
+from pyavd._eos_designs.schema import EosDesigns
+
+loaded_modules = [module for module in sys.modules if module.startswith(("pyavd._eos_cli_config_gen.schema.", "pyavd._eos_designs.schema."))]
+assert loaded_modules == [], loaded_modules
+
+EosCliConfigGen._from_dict({"hostname": "leaf1", "router_bgp": {"as": "65001"}})
+assert "pyavd._eos_cli_config_gen.schema._router_bgp" in sys.modules
+assert "pyavd._eos_cli_config_gen.schema._ethernet_interfaces" not in sys.modules
+"""
+
+
+def test_lazy_import() -> None:
+    """Test that the modules with nested classes are only imported when used. Running in a new interpreter, since other tests import all modules."""
+    subprocess.run([sys.executable, "-c", LAZY_IMPORT_SCRIPT], check=True)  # noqa: S603
+
+
+def test_lazy_class() -> None:
+    router_bgp_class = EosCliConfigGen.RouterBgp
+    assert router_bgp_class.__module__ == "pyavd._eos_cli_config_gen.schema._router_bgp"
+    # The descriptor is replaced by the class on first access.
+    assert EosCliConfigGen.__dict__["RouterBgp"] is router_bgp_class
+    assert EosCliConfigGen._fields["router_bgp"]["type"] is router_bgp_class
+    assert EosCliConfigGen.RouterBgp.VrfsItem is router_bgp_class.VrfsItem
+
+
+def test_lazy_field_info() -> None:
+    class TestModel:
+        RouterBgp = LazyClass("pyavd._eos_cli_config_gen.schema._router_bgp")
+
+    field_info = LazyFieldInfo(TestModel.__dict__["RouterBgp"], default=1)
+    loaded_field_info = {"type": EosCliConfigGen.RouterBgp, "default": 1}
+    assert "type" not in field_info
+    assert field_info == loaded_field_info
+    assert field_info["type"] is EosCliConfigGen.RouterBgp
+    assert not field_info != loaded_field_info  # noqa: SIM202
@@ -4,7 +4,7 @@
 import pytest
 
 from pyavd._errors import AristaAvdError
-from pyavd._utils import get_ip_from_pool
+from pyavd._utils import IpPool, get_ip_from_pool, get_ip_pool
 
 # default values for testcases
 
@@ -110,3 +110,28 @@ def test_get_ip_from_pool_valid(pool: str, prefixlen: int, subnet_offset: int, i
     """Valid cases for get_ip_from_pool with default values."""
     resp = get_ip_from_pool(pool, prefixlen, subnet_offset, ip_offset)
     assert resp == expected
+
+
+def test_ip_pool_allocate() -> None:
+    """Bulk allocation returns the same addresses as get_ip_from_pool for each offset."""
+    offsets = [(0, 0), (0, 1), (1, 0), (1, 1), (257, 0), (257, 1)]
+    assert IpPool(POOLS_AND_RANGES).allocate(31, offsets[:4]) == [get_ip_from_pool(POOLS_AND_RANGES, 31, *offset) for offset in offsets[:4]]
+    assert IpPool("2001:db8::/127, 2001:db8:1::/127").allocate(128, [(0, 0), (1, 0), (2, 0), (3, 0)]) == [
+        "2001:db8::",
+        "2001:db8::1",
+        "2001:db8:1::",
+        "2001:db8:1::1",
+    ]
+    with pytest.raises(AristaAvdError, match="Unable to get 258 /31 subnets"):
+        IpPool(POOLS_AND_RANGES).allocate(31, offsets)
+
+
+def test_get_ip_pool_cached() -> None:
+    """Pools are cached and lazily parsed, so an invalid range is only reported once reached, but then every time."""
+    pool = "10.1.0.0/24,1.1.1.1-0.0.0.0"
+    assert get_ip_pool(pool) is get_ip_pool(pool)
+    assert get_ip_pool(pool).get_ip(32, 1, 0) == "10.1.0.1"
+    for _attempt in range(2):
+        with pytest.raises(AristaAvdError, match="Unable to load '1.1.1.1-0.0.0.0' as an IP range"):
+            get_ip_pool(pool).get_ip(32, 256, 0)
+    assert get_ip_pool(pool).get_ip(32, 255, 0) == "10.1.0.255"
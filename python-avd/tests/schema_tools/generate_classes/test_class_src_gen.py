@@ -68,3 +68,32 @@ def test_import_and_load_model(schema_name: str, data_file: str | None, artifact
     model = cls._from_dict(data)
 
     assert isinstance(model, pyavd._schema.models.avd_model.AvdModel)
+
+
+@pytest.mark.parametrize(("schema_name", "data_file"), TEST_DATA)
+def test_generate_and_load_lazy_class_src(schema_name: str, data_file: str | None, artifacts_path: Path, tmp_path: Path) -> None:
+    """Builds Python classes with one module per root field, and checks that the modules are only imported when used."""
+    schema = AristaAvdSchema(_resolve_schema=schema_name, **STORE[schema_name])
+    schemasrc = schema._generate_class_src(class_name=generate_class_name(schema_name))
+    schemasrc.cls.lazy_classes = True
+    package_path = tmp_path.joinpath(f"lazy_{schema_name}")
+    package_path.mkdir()
+    package_path.joinpath("__init__.py").write_text(str(FileSrc(classes=[schemasrc.cls])), encoding="UTF-8")
+    for module_name, classes in schemasrc.cls.get_lazy_modules().items():
+        package_path.joinpath(f"{module_name}.py").write_text(str(FileSrc(classes=classes)), encoding="UTF-8")
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        module = import_module(f"lazy_{schema_name}")
+        cls = getattr(module, generate_class_name(schema_name))
+        assert not [module_name for module_name in sys.modules if module_name.startswith(f"lazy_{schema_name}.")]
+
+        data = {} if data_file is None else load_data_file(artifacts_path.joinpath(data_file))
+        model = cls._from_dict(data)
+
+        assert isinstance(model, pyavd._schema.models.avd_model.AvdModel)
+        assert model._as_dict() == cls._from_dict(data)._as_dict()
+    finally:
+        sys.path.remove(str(tmp_path))
+        for module_name in [module_name for module_name in sys.modules if module_name.split(".", maxsplit=1)[0] == f"lazy_{schema_name}"]:
+            del sys.modules[module_name]